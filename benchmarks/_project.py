@@ -0,0 +1,84 @@
+"""Synthetic dbt project generator shared by the benchmarks."""
+
+from pathlib import Path
+
+from dbt_conceptual.yaml_io import dump_yaml
+
+
+def generate_project(
+    root: Path,
+    files: int = 500,
+    models_per_file: int = 8,
+    columns_per_model: int = 25,
+    concepts: int = 200,
+) -> Path:
+    """Write a synthetic dbt project with a conceptual.yml and gold schema files.
+
+    Args:
+        root: Directory to create the project in
+        files: Number of schema files under models/marts
+        models_per_file: Models declared in each schema file
+        columns_per_model: Columns (with tests) declared on each model
+        concepts: Number of concepts in conceptual.yml
+
+    Returns:
+        The project directory
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "dbt_project.yml").write_text("name: bench\nversion: '1.0.0'\n")
+
+    conceptual = {
+        "config": {"scan": {"gold": ["models/marts/**/*.yml"]}},
+        "domains": {
+            f"domain_{d}": {"name": f"Domain {d}", "color": "#4a9eff"}
+            for d in range(10)
+        },
+        "concepts": {
+            f"concept_{c}": {
+                "name": f"Concept {c}",
+                "domain": f"domain_{c % 10}",
+                "owner": "@data-team",
+                "definition": f"Definition of concept {c}.\n",
+            }
+            for c in range(concepts)
+        },
+        "relationships": [
+            {
+                "from": f"concept_{c}",
+                "verb": "relates_to",
+                "to": f"concept_{(c + 1) % concepts}",
+                "cardinality": "1:N",
+            }
+            for c in range(concepts)
+        ],
+    }
+    with open(root / "conceptual.yml", "w") as f:
+        dump_yaml(conceptual, f)
+
+    model_id = 0
+    for i in range(files):
+        schema_dir = root / "models" / "marts" / f"area_{i % 20}"
+        schema_dir.mkdir(parents=True, exist_ok=True)
+        models = []
+        for _ in range(models_per_file):
+            models.append(
+                {
+                    "name": f"dim_model_{model_id}",
+                    "description": f"Model {model_id}",
+                    "meta": {"concept": f"concept_{model_id % concepts}"},
+                    "config": {"tags": ["domain:sales", "owner:team"]},
+                    "columns": [
+                        {
+                            "name": f"column_{c}",
+                            "description": f"Column {c} of model {model_id}",
+                            "tests": ["not_null", {"unique": {"severity": "warn"}}],
+                        }
+                        for c in range(columns_per_model)
+                    ],
+                }
+            )
+            model_id += 1
+        with open(schema_dir / f"schema_{i}.yml", "w") as f:
+            dump_yaml({"version": 2, "models": models}, f)
+
+    return root
@@ -0,0 +1,88 @@
+"""Benchmark partial schema extraction against a full YAML load.
+
+Usage:
+    python benchmarks/bench_extract.py [--files 200] [--columns 60]
+
+Generates column-heavy schema files, then extracts the models of each file
+with a full ``load_yaml`` and with ``schema_yaml.load_schema_models``,
+reporting total time and the tracemalloc peak of the largest file.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _project import generate_project  # noqa: E402
+
+from dbt_conceptual.scanner import _extract_models  # noqa: E402
+from dbt_conceptual.schema_yaml import load_schema_models  # noqa: E402
+from dbt_conceptual.yaml_io import load_yaml  # noqa: E402
+
+
+def _extract_all(
+    contents: list[tuple[Path, bytes]], project: Path, load: Callable[[bytes], Any]
+) -> list[dict]:
+    models: list[dict] = []
+    for path, data in contents:
+        models.extend(_extract_models(load(data) or {}, path, project))
+    return models
+
+
+def _peak(load: Callable[[bytes], Any], data: bytes) -> int:
+    tracemalloc.start()
+    try:
+        load(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=60)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmpdir:
+        project = generate_project(
+            Path(tmpdir) / "project", files=args.files, columns_per_model=args.columns
+        )
+        paths = sorted((project / "models").rglob("*.yml"))
+        contents = [(path, path.read_bytes()) for path in paths]
+        total_bytes = sum(len(data) for _, data in contents)
+        print(f"{len(paths)} schema files, {total_bytes / 1e6:.1f} MB\n")
+
+        full = _extract_all(contents, project, load_yaml)
+        partial = _extract_all(contents, project, load_schema_models)
+        assert partial == full, "partial extraction differs from full load"
+
+        largest = max(contents, key=lambda item: len(item[1]))[1]
+        results = {}
+        for label, load in (
+            ("full load_yaml", load_yaml),
+            ("load_schema_models", load_schema_models),
+        ):
+            start = time.perf_counter()
+            _extract_all(contents, project, load)
+            elapsed = time.perf_counter() - start
+            peak = _peak(load, largest)
+            results[label] = (elapsed, peak)
+            print(
+                f"  {label:<20} {elapsed * 1000:9.1f} ms"
+                f"   peak {peak / 1024:8.1f} KiB (largest file)"
+            )
+
+        (slow, slow_peak), (fast, fast_peak) = results.values()
+        print(
+            f"\n  speedup: {slow / fast:.1f}x, peak memory: {slow_peak / fast_peak:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
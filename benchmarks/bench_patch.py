@@ -0,0 +1,97 @@
+"""Benchmark element-level PATCH saves against whole-model POST saves.
+
+Usage:
+    python benchmarks/bench_patch.py [--concepts 5000] [--repeat 10]
+
+Generates a project with a large conceptual.yml and edits one concept's
+definition through the web server (Flask's test client, no network),
+once by POSTing the whole state as the UI used to and once with a PATCH
+/api/state operation. Each save is followed by the read the UI needs to
+redraw: a full GET /api/state after the POST, nothing after the PATCH,
+whose response already holds the changed elements. Reports the latency
+and the request and response sizes of both.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _project import generate_project  # noqa: E402
+
+from dbt_conceptual.server import create_app  # noqa: E402
+
+
+def _report(label: str, times: list[float], sent: int, received: int) -> None:
+    print(
+        f"  {label:<6} {statistics.median(times) * 1000:8.1f} ms"
+        f"  sent {sent / 1024:9.1f} KiB  received {received / 1024:9.1f} KiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp:
+        project = generate_project(
+            Path(tmp) / "project", files=20, concepts=args.concepts
+        )
+        client = create_app(project).test_client()
+        state = client.get("/api/state").get_json()
+        print(f"{args.concepts} concepts, {len(state['relationships'])} relationships")
+
+        times = []
+        sent = received = 0
+        for i in range(args.repeat):
+            state["concepts"]["concept_42"]["definition"] = f"POST edit {i}"
+            body = json.dumps(state).encode()
+            start = time.perf_counter()
+            response = client.post(
+                "/api/state", data=body, content_type="application/json"
+            )
+            assert response.status_code == 200, response.get_json()
+            reloaded = client.get("/api/state")
+            times.append(time.perf_counter() - start)
+            sent, received = len(body), len(response.data) + len(reloaded.data)
+            state = reloaded.get_json()
+        _report("POST", times, sent, received)
+
+        times = []
+        version = state["version"]
+        concept = state["concepts"]["concept_42"]
+        for i in range(args.repeat):
+            concept["definition"] = f"PATCH edit {i}"
+            body = json.dumps(
+                {
+                    "baseVersion": version,
+                    "operations": [
+                        {
+                            "op": "upsert",
+                            "type": "concept",
+                            "id": "concept_42",
+                            "data": concept,
+                        }
+                    ],
+                }
+            ).encode()
+            start = time.perf_counter()
+            response = client.patch(
+                "/api/state", data=body, content_type="application/json"
+            )
+            times.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.get_json()
+            version = response.get_json()["version"]
+            sent, received = len(body), len(response.data)
+        _report("PATCH", times, sent, received)
+
+
+if __name__ == "__main__":
+    main()
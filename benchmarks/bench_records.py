@@ -0,0 +1,107 @@
+"""Measure the memory held by scanned model records.
+
+Usage:
+    python benchmarks/bench_records.py [--models 100000] [--models-per-file 8]
+
+Builds the records for ``--models`` models with the previous dict-per-model
+extraction and with the ScannedModel records, and reports the memory they
+retain according to tracemalloc. The parsed schema content is allocated
+before tracing starts, so only the records themselves (plus the strings
+and containers they create) are counted.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from dbt_conceptual.scanner import _extract_models
+
+
+def dict_extract_models(
+    schema_data: dict, file_path: Path, project_dir: Path
+) -> list[dict]:
+    """The extraction used before ScannedModel (one dict per model)."""
+    models: list[dict] = []
+    rel_path = file_path.relative_to(project_dir)
+    for model in schema_data.get("models", []):
+        config = model.get("config", {})
+        tags = model.get("tags", []) or config.get("tags", [])
+        databricks_tags = config.get("databricks_tags", {})
+        models.append(
+            {
+                "name": model.get("name"),
+                "description": model.get("description"),
+                "meta": model.get("meta", {}),
+                "path": str(rel_path),
+                "file": str(file_path),
+                "tags": tags,
+                "databricks_tags": databricks_tags,
+            }
+        )
+    return models
+
+
+def synthetic_schemas(
+    models: int, models_per_file: int, project_dir: Path
+) -> list[tuple[dict, Path]]:
+    """Parsed schema content shaped like a typical marts project."""
+    schemas = []
+    for start in range(0, models, models_per_file):
+        file_path = project_dir / "models" / "marts" / f"area_{start % 20}"
+        file_path = file_path / f"schema_{start // models_per_file}.yml"
+        entries: list[dict[str, Any]] = []
+        for i in range(start, min(start + models_per_file, models)):
+            entry: dict[str, Any] = {
+                "name": f"dim_model_{i}",
+                "description": f"Model {i}",
+            }
+            if i % 3:
+                entry["meta"] = {"concept": f"concept_{i % 200}"}
+            if i % 2:
+                entry["config"] = {"tags": ["domain:sales", "owner:team"]}
+            entries.append(entry)
+        schemas.append(({"version": 2, "models": entries}, file_path))
+    return schemas
+
+
+def retained(
+    build: Callable[[dict, Path, Path], list[Any]],
+    schemas: list[tuple[dict, Path]],
+    project_dir: Path,
+) -> int:
+    """Bytes still allocated after building all records."""
+    gc.collect()
+    tracemalloc.start()
+    records = []
+    for schema_data, file_path in schemas:
+        records.extend(build(schema_data, file_path, project_dir))
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=100_000)
+    parser.add_argument("--models-per-file", type=int, default=8)
+    args = parser.parse_args()
+
+    project_dir = Path("/project")
+    schemas = synthetic_schemas(args.models, args.models_per_file, project_dir)
+
+    as_dicts = retained(dict_extract_models, schemas, project_dir)
+    as_records = retained(_extract_models, schemas, project_dir)
+
+    python = sys.version.split()[0]
+    print(f"{args.models} models, {len(schemas)} schema files (Python {python})")
+    print(f"  dict records       {as_dicts / 1e6:8.1f} MB")
+    print(f"  ScannedModel       {as_records / 1e6:8.1f} MB")
+    print(f"  reduction: {as_dicts / as_records:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Load-test the web server's read endpoints with and without the state cache.
+
+Usage:
+    python benchmarks/bench_server.py [--files 200] [--clients 5]
+        [--requests 40]
+
+Generates a synthetic project, serves it with waitress on a free local port
+and has ``--clients`` threads each send ``--requests`` requests, cycling
+through GET /api/state, /api/coverage, /api/bus-matrix and /api/models.
+The uncached run invalidates the state cache before every request, which
+rebuilds the state per request as the server did before the cache. The
+revalidated run sends each endpoint's ETag back in If-None-Match, as a
+browser reloading unchanged data does, and gets 304 responses. Reports
+p50/p99 latency and throughput for each run.
+
+The sync runs have every client POST /api/sync at once after each change
+to the project, as when several users press sync together. They are run
+with single-flight coalescing of builds and sync computations, and with
+it disabled, where each request runs its own.
+"""
+
+import argparse
+import http.client
+import logging
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _project import generate_project  # noqa: E402
+
+from dbt_conceptual.server import create_app  # noqa: E402
+
+ENDPOINTS = ["/api/state", "/api/coverage", "/api/bus-matrix", "/api/models"]
+
+
+def _load(
+    port: int, clients: int, requests: int, revalidate: bool = False
+) -> tuple[list[float], float]:
+    """Send the requests from client threads; return latencies and wall time."""
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def client(offset: int) -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        etags: dict[str, str] = {}
+        for i in range(requests):
+            endpoint = ENDPOINTS[(offset + i) % len(ENDPOINTS)]
+            headers = {}
+            if revalidate and endpoint in etags:
+                headers["If-None-Match"] = etags[endpoint]
+            start = time.perf_counter()
+            conn.request("GET", endpoint, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            assert response.status in (200, 304), response.status
+            if response.getheader("ETag"):
+                etags[endpoint] = response.getheader("ETag")
+            with lock:
+                latencies.append(time.perf_counter() - start)
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start
+
+
+def _sync_bursts(
+    port: int, clients: int, rounds: int, change: Callable[[], None]
+) -> tuple[list[float], float]:
+    """Have all clients POST /api/sync together after each change."""
+    latencies: list[float] = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(clients + 1)
+
+    def client() -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        for _ in range(rounds):
+            barrier.wait()
+            start = time.perf_counter()
+            conn.request("POST", "/api/sync")
+            response = conn.getresponse()
+            response.read()
+            assert response.status == 200, response.status
+            with lock:
+                latencies.append(time.perf_counter() - start)
+            barrier.wait()
+        conn.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for _ in range(rounds):
+        change()
+        barrier.wait()  # Release the clients
+        barrier.wait()  # Wait for their responses
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start
+
+
+def _report(label: str, latencies: list[float], elapsed: float) -> None:
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"  {label:<11} p50 {cuts[49] * 1000:8.1f} ms  p99 {cuts[98] * 1000:8.1f} ms"
+        f"  {len(latencies) / elapsed:7.1f} req/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=40)
+    args = parser.parse_args()
+
+    from waitress.server import create_server
+
+    # Waitress warns about queued requests, which is the point here
+    logging.getLogger("waitress.queue").setLevel(logging.ERROR)
+
+    with TemporaryDirectory() as tmp:
+        project = generate_project(Path(tmp) / "project", files=args.files)
+        app = create_app(project)
+        cache = app.config["STATE_CACHE"]
+        uncached = threading.Event()
+
+        @app.before_request
+        def rebuild() -> None:
+            if uncached.is_set():
+                cache.invalidate()
+
+        server = create_server(app, host="127.0.0.1", port=0, threads=args.clients)
+        threading.Thread(target=server.run, daemon=True).start()
+        port = server.effective_port  # type: ignore[union-attr]
+
+        print(
+            f"{args.files} schema files, {args.clients} clients x "
+            f"{args.requests} requests"
+        )
+        uncached.set()
+        _report("uncached", *_load(port, args.clients, args.requests))
+        uncached.clear()
+        _report("cached", *_load(port, args.clients, args.requests))
+        _report("revalidated", *_load(port, args.clients, args.requests, True))
+        print(f"  cache: {cache.builds} builds, {cache.hits} hits")
+
+        def change() -> None:
+            # A same-size rewrite would keep the fingerprint; invalidate too
+            cache.invalidate()
+
+        rounds = max(args.requests // 4, 1)
+        before = cache.stats()
+        _report("sync", *_sync_bursts(port, args.clients, rounds, change))
+        after = cache.stats()
+        print(
+            f"  cache: {after['builds'] - before['builds']} builds,"
+            f" {after['coalesced'] - before['coalesced']} coalesced,"
+            f" {after['computations'] - before['computations']} syncs,"
+            f" {after['derived_coalesced'] - before['derived_coalesced']} coalesced"
+        )
+
+        # Without single-flight, every request runs its own build and sync
+        for flight in (cache._refreshes, cache._computations):
+            flight.do = lambda key, fn: fn()  # type: ignore[method-assign]
+        before = cache.stats()
+        _report("uncoalesced", *_sync_bursts(port, args.clients, rounds, change))
+        after = cache.stats()
+        print(
+            f"  cache: {after['builds'] - before['builds']} builds,"
+            f" {after['computations'] - before['computations']} syncs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Measure the memory held by a large ProjectState.
+
+Usage:
+    python benchmarks/bench_state.py [--concepts 10000] [--relationships 50000]
+        [--models 200000]
+
+Builds the same state twice, once from copies of the plain dataclasses
+that ``dbt_conceptual.state`` used before the slotted classes and once from
+the current ones, and reports the memory each retains according to
+tracemalloc. Identifier strings are created per occurrence, as YAML parsing
+does, so interning is measured too; model names and schema paths come
+pre-interned and are allocated before tracing, as the scanner's
+ScannedModel records provide them. The current state includes its
+StateIndex.
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+
+from dbt_conceptual import state as current
+
+
+@dataclass
+class ConceptState:
+    name: str
+    domain: Optional[str] = None
+    owner: Optional[str] = None
+    definition: Optional[str] = None
+    color: Optional[str] = None
+    models: list[str] = field(default_factory=list)
+    is_ghost: bool = False
+    validation_status: str = "valid"
+    validation_messages: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RelationshipState:
+    verb: str
+    from_concept: str
+    to_concept: str
+    cardinality: str = "1:N"
+    definition: Optional[str] = None
+    owner: Optional[str] = None
+    validation_status: str = "valid"
+    validation_messages: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DomainState:
+    name: str
+    display_name: str
+    color: Optional[str] = None
+    owner: Optional[str] = None
+
+
+@dataclass
+class ModelInfo:
+    name: str
+    concept: Optional[str] = None
+    domain_tags: list[str] = field(default_factory=list)
+    owner_tag: Optional[str] = None
+    path: Optional[str] = None
+
+
+@dataclass
+class OrphanModel:
+    name: str
+    description: Optional[str] = None
+    domain: Optional[str] = None
+    path: Optional[str] = None
+
+
+@dataclass
+class ProjectState:
+    concepts: dict[str, ConceptState] = field(default_factory=dict)
+    relationships: dict[str, RelationshipState] = field(default_factory=dict)
+    domains: dict[str, DomainState] = field(default_factory=dict)
+    orphan_models: list[OrphanModel] = field(default_factory=list)
+    models: dict[str, ModelInfo] = field(default_factory=dict)
+
+
+previous = SimpleNamespace(
+    ConceptState=ConceptState,
+    RelationshipState=RelationshipState,
+    DomainState=DomainState,
+    ModelInfo=ModelInfo,
+    OrphanModel=OrphanModel,
+    ProjectState=ProjectState,
+)
+
+
+def fresh(*parts: Any) -> str:
+    """A new string object, like each occurrence parsed from YAML."""
+    return "".join(str(p) for p in parts)
+
+
+def scanned_names(models: int) -> list[tuple[str, str]]:
+    """Model names and paths, interned like ScannedModel records."""
+    return [
+        (
+            sys.intern(fresh("dim_model_", m)),
+            sys.intern(fresh("models/marts/area_", m % 50, "/schema_", m // 8, ".yml")),
+        )
+        for m in range(models)
+    ]
+
+
+def build_state(
+    classes: Any, concepts: int, relationships: int, scanned: list[tuple[str, str]]
+) -> Any:
+    """Build a state shaped like StateBuilder output."""
+    rng = random.Random(0)
+    state = classes.ProjectState()
+    for d in range(20):
+        state.domains[fresh("domain_", d)] = classes.DomainState(
+            name=fresh("domain_", d),
+            display_name=fresh("Domain ", d),
+            owner=fresh("@team_", d % 5),
+        )
+    for c in range(concepts):
+        state.concepts[fresh("concept_", c)] = classes.ConceptState(
+            name=fresh("Concept ", c),
+            domain=fresh("domain_", c % 20),
+            owner=fresh("@team_", c % 5),
+            definition=fresh("Definition of concept ", c),
+        )
+    for _ in range(relationships):
+        a, b = rng.randrange(concepts), rng.randrange(concepts)
+        verb = fresh("verb_", rng.randrange(10))
+        rel_id = fresh("concept_", a, ":", verb, ":concept_", b)
+        state.relationships[rel_id] = classes.RelationshipState(
+            verb=verb,
+            from_concept=fresh("concept_", a),
+            to_concept=fresh("concept_", b),
+            owner=fresh("@team_", a % 5),
+        )
+    concept_list = list(state.concepts.values())
+    for m, (name, path) in enumerate(scanned):
+        concept_id = None
+        if m % 3:
+            concept_id = fresh("concept_", m % concepts)
+            concept_list[m % concepts].models.append(name)
+        else:
+            state.orphan_models.append(
+                classes.OrphanModel(
+                    name=name, domain=fresh("domain_", m % 20), path=path
+                )
+            )
+        state.models[name] = classes.ModelInfo(
+            name=name,
+            concept=concept_id,
+            domain_tags=[fresh("domain_", m % 20)],
+            owner_tag=fresh("team_", m % 5),
+            path=path,
+        )
+    return state
+
+
+def retained(build: Callable[[], Any]) -> int:
+    """Bytes still allocated after building a state."""
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    current_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return current_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=10_000)
+    parser.add_argument("--relationships", type=int, default=50_000)
+    parser.add_argument("--models", type=int, default=200_000)
+    args = parser.parse_args()
+    sizes = (args.concepts, args.relationships, scanned_names(args.models))
+
+    before = retained(lambda: build_state(previous, *sizes))
+    after = retained(lambda: build_state(current, *sizes))
+
+    python = sys.version.split()[0]
+    print(
+        f"{args.concepts} concepts, {args.relationships} relationships, "
+        f"{args.models} models (Python {python})"
+    )
+    print(f"  plain dataclasses  {before / 1e6:8.1f} MB")
+    print(f"  current state      {after / 1e6:8.1f} MB")
+    print(f"  reduction: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
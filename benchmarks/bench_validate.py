@@ -0,0 +1,105 @@
+"""Benchmark incremental validation against a full Validator run.
+
+Usage:
+    python benchmarks/bench_validate.py [--concepts 20000] [--orphans 50000]
+
+Builds a large state (one relationship per concept, a third of the
+concepts without definitions, orphan models), validates it once, then
+times a full validate() against revalidate() after editing one concept,
+clearing one concept's domain and adding one relationship.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.state import (
+    ConceptState,
+    DomainState,
+    OrphanModel,
+    ProjectState,
+    RelationshipState,
+)
+from dbt_conceptual.validator import ValidationIssue, Validator
+
+
+def _build_state(concepts: int, orphans: int) -> ProjectState:
+    state = ProjectState()
+    for d in range(10):
+        state.domains[f"domain_{d}"] = DomainState(
+            name=f"domain_{d}", display_name=f"Domain {d}"
+        )
+    for c in range(concepts):
+        state.concepts[f"concept_{c}"] = ConceptState(
+            name=f"Concept {c}",
+            domain=f"domain_{c % 10}" if c % 7 else None,
+            owner="@data-team",
+            definition=f"Definition of concept {c}." if c % 3 else None,
+            models=[f"dim_model_{c}"] if c % 5 else [],
+        )
+    for c in range(concepts):
+        rel = RelationshipState(
+            verb="relates_to",
+            from_concept=f"concept_{c}",
+            to_concept=f"concept_{(c + 1) % concepts}",
+        )
+        state.relationships[rel.name] = rel
+    state.orphan_models.extend(
+        OrphanModel(name=f"stg_model_{o}", path=f"models/marts/schema_{o % 500}.yml")
+        for o in range(orphans)
+    )
+    return state
+
+
+def _time(label: str, func: Callable[[], list[ValidationIssue]]) -> float:
+    start = time.perf_counter()
+    issues = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed * 1000:9.1f} ms  {len(issues):7d} issues")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=20000)
+    parser.add_argument("--orphans", type=int, default=50000)
+    args = parser.parse_args()
+
+    config = Config(project_dir=Path("."))
+    state = _build_state(args.concepts, args.orphans)
+    validator = Validator(config, state)
+    validator.validate()
+
+    def edit_definition() -> dict[str, list[str]]:
+        state.concepts["concept_42"].definition = None
+        return {"concepts": ["concept_42"]}
+
+    def move_domain() -> dict[str, list[str]]:
+        state.concepts["concept_43"].domain = None
+        return {"concepts": ["concept_43"]}
+
+    def add_relationship() -> dict[str, list[str]]:
+        rel = RelationshipState(
+            verb="owns", from_concept="concept_1", to_concept="missing"
+        )
+        state.relationships[rel.name] = rel
+        return {"relationships": [rel.name]}
+
+    for label, edit in (
+        ("edit definition", edit_definition),
+        ("remove domain", move_domain),
+        ("add relationship", add_relationship),
+    ):
+        print(label)
+        delta = edit()
+        incremental = _time(
+            "revalidate", lambda delta=delta: validator.revalidate(**delta)
+        )
+        full = _time("full validate", lambda: Validator(config, state).validate())
+        print(f"  speedup: {full / incremental:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark gold path discovery: pruned walker vs per-pattern glob.
+
+Usage:
+    python benchmarks/bench_walker.py [--files 500] [--noise 5000]
+
+Generates a synthetic project plus ``--noise`` files spread over target/,
+dbt_packages/, logs/ and node_modules/ (the trees a real checkout carries
+after ``dbt build``), then times finding the schema files for a few gold
+path configurations with the previous glob/rglob + resolve() discovery and
+with dbt_conceptual.walker.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _project import generate_project  # noqa: E402
+
+from dbt_conceptual.walker import walk_schema_files  # noqa: E402
+
+CONFIGS = {
+    "marts glob": ["models/marts/**/*.yml"],
+    "marts dir + glob": ["models/marts", "models/marts/**/*.yml"],
+    "any marts dir": ["**/marts/**/*.yml"],
+}
+
+
+def glob_schema_files(project_dir: Path, patterns: list[str]) -> list[Path]:
+    """The discovery used before the walker (glob per pattern, resolve dedupe)."""
+
+    def find() -> Iterator[Path]:
+        for pattern in patterns:
+            if "*" in pattern:
+                yield from project_dir.glob(pattern)
+            else:
+                full_path = project_dir / pattern
+                if full_path.is_file():
+                    yield full_path
+                elif full_path.is_dir():
+                    yield from full_path.rglob("*.yml")
+                    yield from full_path.rglob("*.yaml")
+
+    files: list[Path] = []
+    seen: set[Path] = set()
+    for path in find():
+        resolved = path.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            files.append(path)
+    return files
+
+
+def add_noise(project: Path, count: int) -> None:
+    """Populate the directories a dbt checkout accumulates outside models/."""
+    trees = ["target/compiled/bench/models/marts", "target/run/bench/models/marts"]
+    trees += [f"dbt_packages/pkg_{p}/models/marts" for p in range(5)]
+    trees += ["logs", "node_modules/some-tool/lib"]
+    for i in range(count):
+        directory = project / trees[i % len(trees)] / f"sub_{i % 50}"
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = ".yml" if i % 3 == 0 else ".sql"
+        (directory / f"file_{i}{suffix}").write_text("select 1\n")
+
+
+def _time(func: object, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()  # type: ignore[operator]
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--noise", type=int, default=5000)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmpdir:
+        project = generate_project(
+            Path(tmpdir) / "project", files=args.files, columns_per_model=1
+        )
+        add_noise(project, args.noise)
+        print(f"{args.files} schema files, {args.noise} files outside models/\n")
+
+        for label, patterns in CONFIGS.items():
+            old_files = glob_schema_files(project, patterns)
+            new_files = list(walk_schema_files(project, patterns))
+            slow = _time(lambda p=patterns: glob_schema_files(project, p))
+            fast = _time(lambda p=patterns: list(walk_schema_files(project, p)))
+            print(f"{label}: {patterns}")
+            print(f"  glob + resolve   {slow * 1000:8.1f} ms  {len(old_files)} files")
+            print(f"  pruned walker    {fast * 1000:8.1f} ms  {len(new_files)} files")
+            print(f"  speedup: {slow / fast:.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark libyaml-backed YAML I/O against the pure-Python loader/dumper.
+
+Usage:
+    python benchmarks/bench_yaml_io.py [--files 500]
+
+Generates a synthetic project, then times parsing every schema file and
+conceptual.yml (and dumping conceptual.yml back out) with both
+implementations.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _project import generate_project  # noqa: E402
+
+from dbt_conceptual import yaml_io  # noqa: E402
+
+
+def _time(label: str, func: object) -> float:
+    start = time.perf_counter()
+    func()  # type: ignore[operator]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:10.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=500)
+    args = parser.parse_args()
+
+    if not yaml_io.HAS_LIBYAML:
+        print("PyYAML was built without libyaml; nothing to compare.")
+        return
+
+    with TemporaryDirectory() as tmpdir:
+        project = generate_project(Path(tmpdir) / "project", files=args.files)
+        schema_files = sorted((project / "models").rglob("*.yml"))
+        conceptual = project / "conceptual.yml"
+        data = yaml_io.load_yaml_file(conceptual)
+        total_bytes = sum(p.stat().st_size for p in schema_files)
+        print(f"{len(schema_files)} schema files, {total_bytes / 1e6:.1f} MB\n")
+
+        def load_all(loader: type) -> None:
+            for path in [*schema_files, conceptual]:
+                with open(path, "rb") as f:
+                    yaml.load(f, Loader=loader)
+
+        def dump_many(dumper: type) -> None:
+            for _ in range(20):
+                yaml.dump(data, Dumper=dumper, sort_keys=False)
+
+        print("load")
+        slow = _time("pure-Python SafeLoader", lambda: load_all(yaml.SafeLoader))
+        fast = _time("libyaml CSafeLoader", lambda: load_all(yaml_io.SafeLoader))
+        print(f"  speedup: {slow / fast:.1f}x\n")
+
+        print("dump conceptual.yml x20")
+        slow = _time("pure-Python SafeDumper", lambda: dump_many(yaml.SafeDumper))
+        fast = _time("libyaml CSafeDumper", lambda: dump_many(yaml_io.SafeDumper))
+        print(f"  speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
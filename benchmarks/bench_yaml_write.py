@@ -0,0 +1,115 @@
+"""Benchmark in-place YAML patching against rewriting the whole file.
+
+Usage:
+    python benchmarks/bench_yaml_write.py [--concepts 5000] [--repeat 20]
+
+Generates a large conceptual.yml, then times the writes the CLI and the
+UI make (edit one concept, add a stub concept, change the scan settings)
+with a full ``dump_yaml`` and with ``write_yaml_file``. Each write starts
+from the same file, already loaded through the document cache as the
+callers do; the report shows the latency and how many lines the write
+changed.
+"""
+
+import argparse
+import copy
+import difflib
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _project import generate_project  # noqa: E402
+
+from dbt_conceptual.yaml_io import document_cache, dump_yaml, load_yaml  # noqa: E402
+from dbt_conceptual.yaml_patch import write_yaml_file  # noqa: E402
+
+
+def _edit_concept(data: dict[str, Any]) -> None:
+    data["concepts"]["concept_42"]["definition"] = "Edited in the UI"
+
+
+def _add_stub(data: dict[str, Any]) -> None:
+    data["concepts"]["stub"] = {"name": "Stub", "domain": "domain_1"}
+
+
+def _change_settings(data: dict[str, Any]) -> None:
+    data["config"]["scan"]["gold"] = ["models/gold/**/*.yml"]
+
+
+def _full_dump(path: Path, data: Any) -> None:
+    with open(path, "w") as f:
+        dump_yaml(data, f)
+
+
+def _changed_lines(before: str, after: str) -> int:
+    return sum(
+        1
+        for line in difflib.unified_diff(
+            before.splitlines(), after.splitlines(), n=0, lineterm=""
+        )
+        if line[:1] in "+-" and line[:3] not in ("+++", "---")
+    )
+
+
+def _time(
+    path: Path, original: str, data: Any, write: Callable[[Path, Any], Any], n: int
+) -> tuple[float, int]:
+    elapsed = 0.0
+    for _ in range(n):
+        path.write_text(original)
+        # Callers load the document to edit it before writing it back
+        document_cache.load(path)
+        start = time.perf_counter()
+        write(path, data)
+        elapsed += time.perf_counter() - start
+    return elapsed / n, _changed_lines(original, path.read_text())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmpdir:
+        project = generate_project(
+            Path(tmpdir) / "project", files=1, concepts=args.concepts
+        )
+        conceptual = project / "conceptual.yml"
+        # Hand-maintained files carry comments a full dump would drop
+        original = "# Conceptual model, maintained by the data team\n" + (
+            conceptual.read_text()
+        )
+        data = load_yaml(original)
+        print(
+            f"conceptual.yml: {original.count(chr(10))} lines, "
+            f"{len(original) / 1e6:.1f} MB\n"
+        )
+
+        print(f"{'':<18}{'full dump':>22}{'in-place patch':>26}")
+        for label, edit in (
+            ("edit concept", _edit_concept),
+            ("add stub concept", _add_stub),
+            ("change settings", _change_settings),
+        ):
+            edited = copy.deepcopy(data)
+            edit(edited)
+            full, full_lines = _time(
+                conceptual, original, edited, _full_dump, args.repeat
+            )
+            patch, patch_lines = _time(
+                conceptual, original, edited, write_yaml_file, args.repeat
+            )
+            print(
+                f"{label:<18}{full * 1000:9.1f} ms {full_lines:5d} lines"
+                f"{patch * 1000:13.1f} ms {patch_lines:5d} lines"
+            )
+
+
+if __name__ == "__main__":
+    main()
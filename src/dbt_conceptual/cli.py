@@ -8,7 +8,7 @@ This CLI uses the following exit code patterns:
   Results in exit code 1 with "Aborted!" message.
 
 - SystemExit(0/1): Validation/check commands where the exit code
-  signals pass/fail to CI systems. Used by `validate` command.
+  signals pass/fail to CI systems. Used by `validate` and `merge-results`.
 
 - click.exceptions.Exit(1): Commands that signal changes exist
   (for CI workflows that need to detect changes). Used by `diff --format github`.
@@ -16,9 +16,11 @@ This CLI uses the following exit code patterns:
 - Normal return: Informational commands that complete successfully.
 """
 
+import io
+import json
 import logging
 import sys
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, TextIO
@@ -28,10 +30,13 @@ from rich.console import Console
 
 from dbt_conceptual.cli_utils import (
     ConceptualFileNotFound,
+    build_state,
     load_project_state,
     project_options,
+    scan_options,
+    snapshot_option,
 )
-from dbt_conceptual.config import Config
+from dbt_conceptual.config import SERVER_THREADS, Config
 from dbt_conceptual.git import (
     GitNotFoundError,
     NotAGitRepoError,
@@ -39,8 +44,9 @@ from dbt_conceptual.git import (
     compute_diff_from_ref,
 )
 from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.snapshot import DEFAULT_SNAPSHOT_PATH
 from dbt_conceptual.state import ConceptState, ProjectState
-from dbt_conceptual.validator import Severity, Validator
+from dbt_conceptual.validator import Severity, ValidationIssue, Validator
 
 console = Console()
 
@@ -111,12 +117,20 @@ def main(ctx: click.Context, verbose: int, quiet: bool) -> None:
 def status(
     project_dir: Optional[Path],
     gold_paths: tuple[str, ...],
+    jobs: Optional[int],
+    no_cache: bool,
+    manifest: Optional[str],
+    from_snapshot: Optional[str],
 ) -> None:
     """Show status of conceptual model coverage."""
     try:
         state, _config = load_project_state(
             project_dir=project_dir,
             gold_paths=list(gold_paths) if gold_paths else None,
+            jobs=jobs,
+            no_cache=no_cache,
+            manifest=manifest,
+            from_snapshot=from_snapshot,
         )
     except ConceptualFileNotFound as e:
         console.print(f"[red]Error: conceptual.yml not found at {e.path}[/red]")
@@ -133,7 +147,8 @@ def status(
         for domain_id, domain in state.domains.items():
             # Count concepts in this domain
             domain_concepts = [
-                (cid, c) for cid, c in state.concepts.items() if c.domain == domain_id
+                (cid, state.concepts[cid])
+                for cid in state.index.concepts_in_domain(domain_id)
             ]
 
             console.print(
@@ -144,7 +159,9 @@ def status(
                 _print_concept_status(concept_id, concept)
 
     # Show concepts without domain
-    no_domain = [(cid, c) for cid, c in state.concepts.items() if not c.domain]
+    no_domain = [
+        (cid, state.concepts[cid]) for cid in state.index.concepts_in_domain(None)
+    ]
     if no_domain:
         console.print("\n[cyan]No Domain[/cyan]")
         for concept_id, concept in no_domain:
@@ -249,6 +266,10 @@ def _print_concept_status(concept_id: str, concept: ConceptState) -> None:
 def orphans(
     project_dir: Optional[Path],
     gold_paths: tuple[str, ...],
+    jobs: Optional[int],
+    no_cache: bool,
+    manifest: Optional[str],
+    from_snapshot: Optional[str],
 ) -> None:
     """List models with no meta.concept tag.
 
@@ -259,6 +280,10 @@ def orphans(
         state, _config = load_project_state(
             project_dir=project_dir,
             gold_paths=list(gold_paths) if gold_paths else None,
+            jobs=jobs,
+            no_cache=no_cache,
+            manifest=manifest,
+            from_snapshot=from_snapshot,
         )
     except ConceptualFileNotFound as e:
         console.print(f"[red]Error: conceptual.yml not found at {e.path}[/red]")
@@ -286,14 +311,32 @@ def orphans(
     )
 
 
+def _parse_shard(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[tuple[int, int]]:
+    """Parse a --shard I/N value."""
+    if value is None:
+        return None
+    index, _, count = value.partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        raise click.BadParameter("expected I/N, e.g. 2/4") from None
+    if not 1 <= shard[0] <= shard[1]:
+        raise click.BadParameter("I must be between 1 and N")
+    return shard
+
+
 @main.command()
 @project_options
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["human", "github", "markdown"], case_sensitive=False),
+    type=click.Choice(
+        ["human", "github", "markdown", "json", "jsonl"], case_sensitive=False
+    ),
     default="human",
-    help="Output format: human (default), github (GitHub Actions annotations), or markdown (job summary)",
+    help="Output format: human (default), github (GitHub Actions annotations), markdown (job summary), json, or jsonl (one issue per line, written as found)",
 )
 @click.option(
     "--no-drafts",
@@ -301,39 +344,117 @@ def orphans(
     default=False,
     help="Fail if any concepts or relationships are incomplete (stub/draft status)",
 )
+@click.option(
+    "--shard",
+    metavar="I/N",
+    callback=_parse_shard,
+    default=None,
+    help="Validate only shard I of N (concepts, relationships and orphan "
+    "models are split by a stable hash); combine the --format json reports "
+    "with 'merge-results'",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    default=False,
+    help="Stop at the first error",
+)
+@click.option(
+    "--max-issues",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Report at most N issues (the summary still counts all of them)",
+)
 def validate(
     project_dir: Optional[Path],
     gold_paths: tuple[str, ...],
+    jobs: Optional[int],
+    no_cache: bool,
+    manifest: Optional[str],
+    from_snapshot: Optional[str],
     output_format: str,
     no_drafts: bool,
+    shard: Optional[tuple[int, int]],
+    fail_fast: bool,
+    max_issues: Optional[int],
 ) -> None:
     """Validate conceptual model correspondence (for CI)."""
+    streaming = output_format == "jsonl" or fail_fast or max_issues is not None
+    if streaming and shard is not None and output_format == "json":
+        raise click.UsageError(
+            "--fail-fast and --max-issues can't be used with sharded JSON reports"
+        )
+
     try:
         state, config = load_project_state(
             project_dir=project_dir,
             gold_paths=list(gold_paths) if gold_paths else None,
+            jobs=jobs,
+            no_cache=no_cache,
+            manifest=manifest,
+            from_snapshot=from_snapshot,
         )
     except ConceptualFileNotFound as e:
         if output_format == "github":
             print(f"::error file={e.path}::conceptual.yml not found")
+        elif output_format in ("json", "jsonl"):
+            print(f"Error: conceptual.yml not found at {e.path}", file=sys.stderr)
         else:
             console.print(f"[red]Error: conceptual.yml not found at {e.path}[/red]")
             console.print("\nRun 'dbt-conceptual init' to create it.")
         raise click.Abort() from None
 
     # Run validation
-    validator = Validator(config, state, no_drafts=no_drafts)
-    issues = validator.validate()
+    validator = Validator(config, state, no_drafts=no_drafts, shard=shard)
+    limiter = _IssueLimiter(max_issues)
+    summary = limiter.summary
+    issues: Iterable[ValidationIssue]
+    if streaming:
+        # Issues are counted as they are found; only the reported ones are
+        # kept (github and jsonl print them instead)
+        issues = limiter.limit(validator.iter_issues(fail_fast=fail_fast))
+        if output_format not in ("github", "jsonl"):
+            issues = list(issues)
+    else:
+        issues = validator.validate()
+        summary = validator.get_summary()
 
-    if output_format == "github":
-        _output_github_format(config, validator, issues)
+    if output_format == "json":
+        from dbt_conceptual.exporter import (
+            export_validation_json,
+            export_validation_shard_json,
+        )
+
+        if shard is None:
+            export_validation_json(validator, list(issues), sys.stdout, summary)
+        else:
+            export_validation_shard_json(validator, list(issues), sys.stdout)
+    elif output_format == "jsonl":
+        from dbt_conceptual.exporter import export_validation_jsonl
+
+        export_validation_jsonl(issues, sys.stdout)
+        record = {"passed": not summary["errors"], "summary": summary}
+        print(json.dumps({**record, "omitted": limiter.omitted}))
+    elif output_format == "github":
+        _output_github_format(config, summary, issues)
     elif output_format == "markdown":
-        _output_markdown_format(config, validator, issues)
+        _output_markdown_format(config, summary, list(issues))
     else:
-        _output_human_format(config, state, validator, issues)
+        _output_human_format(config, state, summary, list(issues))
+
+    notes = []
+    if limiter.omitted:
+        notes.append(f"{limiter.omitted} more issues not shown (--max-issues)")
+    if fail_fast and summary["errors"]:
+        notes.append("Stopped at the first error (--fail-fast)")
+    for note in notes:
+        if output_format == "human":
+            console.print(f"[dim]{note}[/dim]")
+        elif output_format == "markdown":
+            print(f"_{note}_\n")
 
     # Exit with appropriate code
-    if validator.has_errors():
+    if summary["errors"]:
         if output_format == "human":
             console.print("\n[red]FAILED[/red]")
         raise SystemExit(1)
@@ -343,10 +464,87 @@ def validate(
         raise SystemExit(0)
 
 
+@main.command("merge-results")
+@click.argument(
+    "reports",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    help="Output file (default: stdout)",
+)
+def merge_results(reports: tuple[Path, ...], output: Optional[Path]) -> None:
+    """Merge the JSON reports of a sharded validate run.
+
+    Pass the reports of every shard written by
+    'validate --shard I/N --format json'. The merged report is the one an
+    unsharded 'validate --format json' would write, and the exit code is
+    1 if it has errors.
+
+    \b
+    Example:
+        dbt-conceptual validate --shard 1/2 --format json > shard-1.json
+        dbt-conceptual validate --shard 2/2 --format json > shard-2.json
+        dbt-conceptual merge-results shard-*.json -o validation.json
+    """
+    from dbt_conceptual.exporter import merge_validation_json
+
+    shards = []
+    for path in reports:
+        try:
+            with open(path) as f:
+                shards.append(json.load(f))
+        except json.JSONDecodeError as e:
+            console.print(f"[red]Error: {path} is not a JSON report: {e}[/red]")
+            raise click.Abort() from None
+
+    merged = io.StringIO()
+    try:
+        passed = merge_validation_json(shards, merged)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort() from None
+    with _get_output_stream(output) as out:
+        out.write(merged.getvalue())
+
+    raise SystemExit(0 if passed else 1)
+
+
+_SUMMARY_KEYS = {
+    Severity.ERROR: "errors",
+    Severity.WARNING: "warnings",
+    Severity.INFO: "info",
+}
+
+
+class _IssueLimiter:
+    """Counts issues by severity while passing on at most max_issues."""
+
+    def __init__(self, max_issues: Optional[int]):
+        self.max_issues = max_issues
+        self.summary = {"errors": 0, "warnings": 0, "info": 0}
+        self.omitted = 0
+
+    def limit(self, issues: Iterable[ValidationIssue]) -> Iterator[ValidationIssue]:
+        """Count issues as they are consumed, yielding the first max_issues."""
+        reported = 0
+        for issue in issues:
+            self.summary[_SUMMARY_KEYS[issue.severity]] += 1
+            if self.max_issues is not None and reported >= self.max_issues:
+                self.omitted += 1
+                continue
+            reported += 1
+            yield issue
+
+
 def _output_github_format(
     config: Config,
-    validator: Validator,
-    issues: list,
+    summary: dict[str, int],
+    issues: Iterable[ValidationIssue],
 ) -> None:
     """Output validation results in GitHub Actions annotation format."""
     conceptual_file = str(config.conceptual_file)
@@ -362,8 +560,7 @@ def _output_github_format(
         # GitHub Actions annotation format: ::level file=path::message
         print(f"::{level} file={conceptual_file}::[{issue.code}] {issue.message}")
 
-    # Print summary
-    summary = validator.get_summary()
+    # Print summary (issues may be a stream; it is complete by now)
     print(
         f"Validation complete: {summary['errors']} errors, "
         f"{summary['warnings']} warnings, {summary['info']} info"
@@ -372,13 +569,11 @@ def _output_github_format(
 
 def _output_markdown_format(
     config: Config,
-    validator: Validator,
-    issues: list,
+    summary: dict[str, int],
+    issues: list[ValidationIssue],
 ) -> None:
     """Output validation results in GitHub-flavored markdown format."""
-    summary = validator.get_summary()
-
-    if validator.has_errors():
+    if summary["errors"]:
         print("## ❌ Validation Failed\n")
     else:
         print("## ✅ Validation Passed\n")
@@ -427,8 +622,8 @@ def _output_markdown_format(
 def _output_human_format(
     config: Config,
     state: ProjectState,
-    validator: Validator,
-    issues: list,
+    summary: dict[str, int],
+    issues: list[ValidationIssue],
 ) -> None:
     """Output validation results in human-readable format."""
     # Display concept coverage
@@ -494,7 +689,6 @@ def _output_human_format(
                 console.print(f"  [{issue.code}] {issue.message}")
 
     # Summary
-    summary = validator.get_summary()
     console.print(
         f"\n[bold]Summary:[/bold] "
         f"{summary['errors']} errors, "
@@ -536,6 +730,8 @@ config:
   scan:
     gold:
       - models/marts/**/*.yml
+    # jobs: 0          # parallel scan workers (0 = one per CPU)
+    # exclude: [target, dbt_packages, logs, node_modules]  # never walked
 
   validation:
     defaults:
@@ -599,10 +795,20 @@ relationships:
     "--model",
     help="Sync only a specific model by name",
 )
-def sync(project_dir: Optional[Path], create_stubs: bool, model: Optional[str]) -> None:
+@scan_options
+def sync(
+    project_dir: Optional[Path],
+    create_stubs: bool,
+    model: Optional[str],
+    jobs: Optional[int],
+    no_cache: bool,
+    manifest: Optional[str],
+) -> None:
     """Discover dbt models and sync with conceptual model."""
     # Load configuration
-    config = Config.load(project_dir=project_dir)
+    config = Config.load(
+        project_dir=project_dir, jobs=jobs, no_cache=no_cache, manifest=manifest
+    )
 
     # Check if conceptual.yml exists
     if not config.conceptual_file.exists():
@@ -625,7 +831,7 @@ def sync(project_dir: Optional[Path], create_stubs: bool, model: Optional[str])
             orphans = [o for o in orphans if o.name == model]
         else:
             console.print(f"[yellow]Model '{model}' is not an orphan[/yellow]")
-            if model in [m for c in state.concepts.values() for m in c.models]:
+            if state.index.concepts_for_model(model):
                 console.print(f"Model '{model}' is already mapped to a concept")
             else:
                 console.print(f"Model '{model}' not found in project")
@@ -648,11 +854,11 @@ def sync(project_dir: Optional[Path], create_stubs: bool, model: Optional[str])
         return
 
     # Create stubs
-    import yaml
+    from dbt_conceptual.yaml_io import load_yaml_document
+    from dbt_conceptual.yaml_patch import write_yaml_file
 
     # Read existing conceptual.yml
-    with open(config.conceptual_file) as f:
-        conceptual_data = yaml.safe_load(f) or {}
+    conceptual_data = load_yaml_document(config.conceptual_file, copy=True) or {}
 
     if "concepts" not in conceptual_data:
         conceptual_data["concepts"] = {}
@@ -668,8 +874,8 @@ def sync(project_dir: Optional[Path], create_stubs: bool, model: Optional[str])
                 concept_id = concept_id[len(prefix) :]
                 break
 
-        # Check if concept already exists
-        if concept_id in conceptual_data["concepts"]:
+        # Check if concept already exists (here or in a fragment file)
+        if concept_id in conceptual_data["concepts"] or concept_id in state.concepts:
             console.print(
                 f"[yellow]Skipping {orphan.name}: concept '{concept_id}' already exists[/yellow]"
             )
@@ -697,9 +903,8 @@ def sync(project_dir: Optional[Path], create_stubs: bool, model: Optional[str])
         console.print("[yellow]No stubs created (concepts already exist)[/yellow]")
         return
 
-    # Write back to file
-    with open(config.conceptual_file, "w") as f:
-        yaml.dump(conceptual_data, f, default_flow_style=False, sort_keys=False)
+    # Write back to file, keeping comments and formatting of the other entries
+    write_yaml_file(config.conceptual_file, conceptual_data)
 
     console.print(f"\n[green]✓ Created {len(stubs_created)} stub concept(s):[/green]")
     for model_name, concept_id in stubs_created:
@@ -792,6 +997,8 @@ def _validate_export_combination(export_type: str, export_format: str) -> None:
     default=None,
     help="Base git ref for diff (required when --type diff)",
 )
+@scan_options
+@snapshot_option
 def export(
     project_dir: Optional[Path],
     export_type: str,
@@ -799,6 +1006,10 @@ def export(
     output: Optional[Path],
     no_drafts: bool,
     base: Optional[str],
+    jobs: Optional[int],
+    no_cache: bool,
+    manifest: Optional[str],
+    from_snapshot: Optional[str],
 ) -> None:
     """Export conceptual model to various formats.
 
@@ -850,7 +1061,9 @@ def export(
         )
         raise click.Abort()
 
-    config = Config.load(project_dir=project_dir)
+    config = Config.load(
+        project_dir=project_dir, jobs=jobs, no_cache=no_cache, manifest=manifest
+    )
 
     # Check conceptual.yml exists
     if not config.conceptual_file.exists():
@@ -863,8 +1076,7 @@ def export(
         raise click.Abort()
 
     # Build state
-    builder = StateBuilder(config)
-    state = builder.build()
+    state = build_state(config, from_snapshot)
 
     # Warn about SVG to stdout
     if export_type == "diagram" and export_format == "svg" and output is None:
@@ -920,7 +1132,9 @@ def export(
             elif export_type == "diff":
                 # Diff requires computing against base ref
                 try:
-                    diff_result = compute_diff_from_ref(config, base)  # type: ignore
+                    diff_result = compute_diff_from_ref(
+                        config, base, current_state=state  # type: ignore[arg-type]
+                    )
                 except GitNotFoundError:
                     console.print(
                         "[red]Error: git not found. This command requires git.[/red]"
@@ -1001,7 +1215,18 @@ def _get_output_stream(output: Optional[Path]) -> Generator[TextIO, None, None]:
     default=False,
     help="Launch with a self-contained demo project (no dbt project required)",
 )
-def serve(project_dir: Optional[Path], host: str, port: int, demo: bool) -> None:
+@click.option(
+    "--threads",
+    default=SERVER_THREADS,
+    type=click.IntRange(min=1),
+    help=(
+        "Worker threads; each open browser tab holds one "
+        f"(default: {SERVER_THREADS})"
+    ),
+)
+def serve(
+    project_dir: Optional[Path], host: str, port: int, demo: bool, threads: int
+) -> None:
     """Launch the interactive web UI for editing conceptual models.
 
     This starts a local web server with a visual editor for your conceptual
@@ -1060,11 +1285,114 @@ def serve(project_dir: Optional[Path], host: str, port: int, demo: bool) -> None
     console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
     try:
-        run_server(project_dir or Path.cwd(), host=host, port=port, demo_mode=demo)
+        run_server(
+            project_dir or Path.cwd(),
+            host=host,
+            port=port,
+            demo_mode=demo,
+            threads=threads,
+        )
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped[/yellow]")
 
 
+@main.group()
+def cache() -> None:
+    """Manage the persistent schema-scan cache."""
+
+
+@cache.command("clear")
+@click.option(
+    "--project-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Path to dbt project directory (default: current directory)",
+)
+def cache_clear(project_dir: Optional[Path]) -> None:
+    """Delete the scan cache so the next run re-parses every schema file."""
+    from dbt_conceptual.scan_cache import clear_cache
+
+    config = Config.load(project_dir=project_dir)
+    if clear_cache(config):
+        _print(f"✓ Cleared scan cache at {config.cache_dir}", "green")
+    else:
+        _print(f"No scan cache at {config.cache_dir}", "dim")
+
+
+@main.command()
+@click.option(
+    "--project-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Path to dbt project directory (default: current directory)",
+)
+@click.option(
+    "--gold-paths",
+    multiple=True,
+    help="Override gold layer paths",
+)
+@scan_options
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Snapshot file (relative paths resolve against the project "
+    f"directory; default: {DEFAULT_SNAPSHOT_PATH})",
+)
+def snapshot(
+    project_dir: Optional[Path],
+    gold_paths: tuple[str, ...],
+    jobs: Optional[int],
+    no_cache: bool,
+    manifest: Optional[str],
+    output: Optional[str],
+) -> None:
+    """Build the project state once and save it to a snapshot file.
+
+    Other commands load it with --from-snapshot instead of scanning the
+    project, and rebuild it when conceptual.yml or a schema file changed.
+
+    \b
+    Examples:
+        dbt-conceptual snapshot
+        dbt-conceptual validate --from-snapshot
+        dbt-conceptual snapshot -o state.snapshot
+        dbt-conceptual export --type coverage --format json --from-snapshot state.snapshot
+    """
+    from dbt_conceptual.snapshot import source_fingerprints, write_snapshot
+
+    config = Config.load(
+        project_dir=project_dir,
+        gold_paths=list(gold_paths) if gold_paths else None,
+        jobs=jobs,
+        no_cache=no_cache,
+        manifest=manifest,
+    )
+    if not config.conceptual_file.exists():
+        console.print(
+            f"[red]Error: conceptual.yml not found at {config.conceptual_file}[/red]"
+        )
+        console.print("\nRun 'dbt-conceptual init' to create it.")
+        raise click.Abort()
+
+    # Fingerprint first: files edited during the build make the snapshot stale
+    sources = source_fingerprints(config)
+    state = StateBuilder(config).build()
+    try:
+        path = write_snapshot(state, config, output, sources)
+    except OSError as e:
+        console.print(f"[red]Error: could not write snapshot: {e}[/red]")
+        raise click.Abort() from e
+
+    _print(
+        f"✓ Wrote snapshot of {len(state.concepts)} concepts, "
+        f"{len(state.relationships)} relationships and {len(state.models)} models "
+        f"({len(sources)} source files) to {path}",
+        "green",
+    )
+
+
 @main.command()
 @click.option(
     "--base",
@@ -1083,7 +1411,10 @@ def serve(project_dir: Optional[Path], host: str, port: int, demo: bool) -> None
     default=None,
     help="Path to dbt project directory (default: current directory)",
 )
-def diff(base: str, format: str, project_dir: Optional[Path]) -> None:
+@snapshot_option
+def diff(
+    base: str, format: str, project_dir: Optional[Path], from_snapshot: Optional[str]
+) -> None:
     """Compare conceptual model against a base git ref.
 
     Shows what concepts, relationships, and domains have been added, removed,
@@ -1119,8 +1450,11 @@ def diff(base: str, format: str, project_dir: Optional[Path]) -> None:
         raise click.Abort()
 
     # Compute diff against base ref
+    current_state = build_state(config, from_snapshot) if from_snapshot else None
     try:
-        conceptual_diff = compute_diff_from_ref(config, base)
+        conceptual_diff = compute_diff_from_ref(
+            config, base, current_state=current_state
+        )
     except GitNotFoundError:
         console.print("[red]Error: git not found. This command requires git.[/red]")
         raise click.Abort() from None
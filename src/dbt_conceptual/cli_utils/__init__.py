@@ -2,13 +2,19 @@
 
 from dbt_conceptual.cli_utils.helpers import (
     ConceptualFileNotFound,
+    build_state,
     load_project_state,
     project_options,
     require_conceptual_yml,
+    scan_options,
+    snapshot_option,
 )
 
 __all__ = [
     "ConceptualFileNotFound",
+    "scan_options",
+    "snapshot_option",
+    "build_state",
     "load_project_state",
     "project_options",
     "require_conceptual_yml",
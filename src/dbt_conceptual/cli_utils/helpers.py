@@ -8,6 +8,7 @@ import click
 
 from dbt_conceptual.config import Config
 from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.snapshot import DEFAULT_SNAPSHOT_PATH, load_or_build
 from dbt_conceptual.state import ProjectState
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -24,12 +25,21 @@ class ConceptualFileNotFound(Exception):
 def load_project_state(
     project_dir: Optional[Path] = None,
     gold_paths: Optional[list[str]] = None,
+    jobs: Optional[int] = None,
+    no_cache: bool = False,
+    manifest: Optional[str] = None,
+    from_snapshot: Optional[str] = None,
 ) -> tuple[ProjectState, Config]:
     """Load project configuration and state.
 
     Args:
         project_dir: Path to dbt project directory (default: current directory)
         gold_paths: Override gold layer paths
+        jobs: Override the number of parallel scan workers
+        no_cache: Bypass the persistent scan cache
+        manifest: Read models from this dbt manifest.json instead of YAML
+        from_snapshot: Load the state from this snapshot file, rebuilding
+            it when stale (relative paths resolve against the project)
 
     Returns:
         Tuple of (ProjectState, Config)
@@ -40,23 +50,93 @@ def load_project_state(
     config = Config.load(
         project_dir=project_dir,
         gold_paths=gold_paths,
+        jobs=jobs,
+        no_cache=no_cache,
+        manifest=manifest,
     )
 
     if not config.conceptual_file.exists():
         raise ConceptualFileNotFound(config.conceptual_file)
 
-    builder = StateBuilder(config)
-    state = builder.build()
+    state = build_state(config, from_snapshot)
 
     return state, config
 
 
+def build_state(config: Config, from_snapshot: Optional[str] = None) -> ProjectState:
+    """Build the project state, or load it from a snapshot.
+
+    Args:
+        config: Configuration object
+        from_snapshot: Snapshot file to load (see dbt_conceptual.snapshot);
+            None scans the project
+
+    Returns:
+        ProjectState
+    """
+    if from_snapshot is None:
+        return StateBuilder(config).build()
+    return load_or_build(config, from_snapshot)
+
+
+def scan_options(f: F) -> F:
+    """Decorator that adds schema-scan tuning options to a command.
+
+    Adds:
+        --jobs: Number of parallel scan workers
+        --no-cache: Bypass the persistent scan cache
+        --manifest: Read models from dbt's manifest.json
+    """
+    f = click.option(
+        "--manifest",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Read models from a dbt manifest.json instead of scanning schema "
+        "YAML (relative paths resolve against the project directory)",
+    )(f)
+    f = click.option(
+        "--no-cache",
+        is_flag=True,
+        default=False,
+        help="Re-parse every schema file instead of using the scan cache",
+    )(f)
+    return click.option(  # type: ignore[no-any-return]
+        "--jobs",
+        "-j",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Parallel workers for scanning schema files (0 = one per CPU)",
+    )(f)
+
+
+def snapshot_option(f: F) -> F:
+    """Decorator that adds the --from-snapshot option to a command.
+
+    Given without a value, the option uses the default snapshot location
+    (.dbt_conceptual/state.snapshot).
+    """
+    return click.option(  # type: ignore[no-any-return]
+        "--from-snapshot",
+        type=click.Path(dir_okay=False),
+        is_flag=False,
+        flag_value=DEFAULT_SNAPSHOT_PATH,
+        default=None,
+        help="Load the project state from a snapshot written by "
+        "'dbt-conceptual snapshot' instead of scanning; rebuilt when stale "
+        f"(default path: {DEFAULT_SNAPSHOT_PATH})",
+    )(f)
+
+
 def project_options(f: F) -> F:
     """Decorator that adds common project options to a command.
 
     Adds:
         --project-dir: Path to dbt project directory
         --gold-paths: Override gold layer paths (multiple)
+        --jobs: Number of parallel scan workers
+        --no-cache: Bypass the persistent scan cache
+        --manifest: Read models from dbt's manifest.json
+        --from-snapshot: Load the state from a snapshot file
     """
 
     @click.option(
@@ -70,6 +150,8 @@ def project_options(f: F) -> F:
         multiple=True,
         help="Override gold layer paths",
     )
+    @scan_options
+    @snapshot_option
     @wraps(f)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         return f(*args, **kwargs)
@@ -100,6 +182,10 @@ def require_conceptual_yml(f: F) -> F:
             state, config = load_project_state(
                 project_dir=project_dir,
                 gold_paths=list(gold_paths) if gold_paths else None,
+                jobs=kwargs.get("jobs"),
+                no_cache=kwargs.get("no_cache", False),
+                manifest=kwargs.get("manifest"),
+                from_snapshot=kwargs.get("from_snapshot"),
             )
         except ConceptualFileNotFound as e:
             console.print(f"[red]Error: conceptual.yml not found at {e.path}[/red]")
@@ -8,7 +8,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from dbt_conceptual.yaml_io import load_yaml_document
+
+# Default waitress worker threads of ``serve``. Each open /api/events
+# stream holds one.
+SERVER_THREADS = 16
 
 
 class RuleSeverity(Enum):
@@ -73,6 +77,16 @@ class Config:
     gold_paths: list[str] = field(default_factory=lambda: ["models/marts/**/*.yml"])
     validation: ValidationConfig = field(default_factory=ValidationConfig)
 
+    # Scan parallelism: 1 = serial, 0 = one worker per CPU
+    scan_jobs: int = 1
+    scan_executor: str = "thread"  # 'thread' or 'process'
+    scan_cache: bool = True  # Persistent per-file scan cache
+    scan_source: str = "yaml"  # 'yaml' (schema files) or 'manifest'
+    manifest_path: str = "target/manifest.json"
+    # Directory names (or project-relative globs) never walked for gold_paths;
+    # None excludes walker.DEFAULT_EXCLUDE at the project root only
+    scan_exclude: Optional[list[str]] = None
+
     @property
     def conceptual_file(self) -> Path:
         """Get the path to conceptual.yml in project root."""
@@ -83,11 +97,24 @@ class Config:
         """Get the path to conceptual_layout.json."""
         return self.project_dir / "conceptual_layout.json"
 
+    @property
+    def manifest_file(self) -> Path:
+        """Get the path to dbt's manifest.json (for manifest scans)."""
+        return self.project_dir / self.manifest_path
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the directory for the persistent scan cache."""
+        return self.project_dir / ".dbt_conceptual" / "cache"
+
     @classmethod
     def load(
         cls,
         project_dir: Optional[Path] = None,
         gold_paths: Optional[list[str]] = None,
+        jobs: Optional[int] = None,
+        no_cache: bool = False,
+        manifest: Optional[str] = None,
     ) -> "Config":
         """Load configuration from conceptual.yml.
 
@@ -96,6 +123,9 @@ class Config:
         Args:
             project_dir: Project directory (defaults to cwd)
             gold_paths: CLI override for gold layer paths
+            jobs: CLI override for the number of scan workers
+            no_cache: CLI flag to bypass the persistent scan cache
+            manifest: CLI path to manifest.json; switches to manifest scans
 
         Returns:
             Config instance
@@ -108,12 +138,17 @@ class Config:
         # Start with defaults
         config_gold_paths: list[str] = ["models/marts/**/*.yml"]
         validation_config = ValidationConfig()
+        scan_jobs = 1
+        scan_executor = "thread"
+        scan_cache = True
+        scan_source = "yaml"
+        manifest_path = "target/manifest.json"
+        scan_exclude: Optional[list[str]] = None
 
         # Try to load from conceptual.yml
         conceptual_file = project_dir / "conceptual.yml"
         if conceptual_file.exists():
-            with open(conceptual_file) as f:
-                data = yaml.safe_load(f)
+            data = load_yaml_document(conceptual_file)
 
             if data and "config" in data:
                 config_section = data["config"]
@@ -124,9 +159,24 @@ class Config:
                     if "gold" in scan_config:
                         gold_val = scan_config["gold"]
                         if isinstance(gold_val, list):
-                            config_gold_paths = gold_val
+                            config_gold_paths = list(gold_val)
                         elif isinstance(gold_val, str):
                             config_gold_paths = [gold_val]
+                    if "jobs" in scan_config:
+                        scan_jobs = cls._parse_jobs(scan_config["jobs"])
+                    if scan_config.get("executor") in ("thread", "process"):
+                        scan_executor = scan_config["executor"]
+                    if "cache" in scan_config:
+                        scan_cache = bool(scan_config["cache"])
+                    if scan_config.get("source") in ("yaml", "manifest"):
+                        scan_source = scan_config["source"]
+                    if isinstance(scan_config.get("manifest"), str):
+                        manifest_path = scan_config["manifest"]
+                    exclude_val = scan_config.get("exclude")
+                    if isinstance(exclude_val, list):
+                        scan_exclude = [str(e) for e in exclude_val]
+                    elif isinstance(exclude_val, str):
+                        scan_exclude = [exclude_val]
 
                 # Parse validation config
                 if "validation" in config_section:
@@ -137,13 +187,45 @@ class Config:
         # Apply CLI overrides
         if gold_paths is not None:
             config_gold_paths = gold_paths
+        if jobs is not None:
+            scan_jobs = cls._parse_jobs(jobs)
+        if no_cache:
+            scan_cache = False
+        if manifest is not None:
+            scan_source = "manifest"
+            manifest_path = manifest
 
         return cls(
             project_dir=project_dir,
             gold_paths=config_gold_paths,
             validation=validation_config,
+            scan_jobs=scan_jobs,
+            scan_executor=scan_executor,
+            scan_cache=scan_cache,
+            scan_source=scan_source,
+            manifest_path=manifest_path,
+            scan_exclude=scan_exclude,
         )
 
+    @staticmethod
+    def _parse_jobs(value: object) -> int:
+        """Parse a scan worker count.
+
+        Args:
+            value: Raw value from YAML or CLI ('auto' means one per CPU)
+
+        Returns:
+            Non-negative worker count (0 = one per CPU, 1 = serial)
+        """
+        if isinstance(value, str) and value.strip().lower() == "auto":
+            return 0
+        if not isinstance(value, (int, str)):
+            return 1
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            return 1
+
     @classmethod
     def _parse_validation_config(cls, data: dict) -> ValidationConfig:
         """Parse validation config from YAML data.
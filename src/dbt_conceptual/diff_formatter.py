@@ -1,6 +1,7 @@
 """Formatters for diff output."""
 
 import json
+from dataclasses import fields
 from typing import Any
 
 from .differ import ConceptualDiff
@@ -199,16 +200,14 @@ def format_json(diff: ConceptualDiff) -> str:
 
         if change.old_value:
             result["old_value"] = {
-                k: v
-                for k, v in change.old_value.__dict__.items()
-                if not k.startswith("_") and not callable(v)
+                f.name: getattr(change.old_value, f.name)
+                for f in fields(change.old_value)
             }
 
         if change.new_value:
             result["new_value"] = {
-                k: v
-                for k, v in change.new_value.__dict__.items()
-                if not k.startswith("_") and not callable(v)
+                f.name: getattr(change.new_value, f.name)
+                for f in fields(change.new_value)
             }
 
         if change.modified_fields:
@@ -0,0 +1,211 @@
+"""Element-level edits of the conceptual model.
+
+The web UI used to save by sending the whole model, which was rewritten
+section by section. An edit is instead a list of operations, each adding,
+replacing or deleting one domain, concept or relationship. They are
+written with fragments.save_elements(), which touches only the affected
+YAML entries, and applied to the existing ProjectState, so the state
+matches a rebuild from the written files without rebuilding it.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from dbt_conceptual.fragments import load_model, relationship_id, save_elements
+from dbt_conceptual.incremental import IncrementalStateBuilder
+from dbt_conceptual.parser import (
+    concept_from_yaml,
+    domain_from_yaml,
+    relationship_from_yaml,
+)
+from dbt_conceptual.state import ProjectState
+
+# Operation.kind -> ProjectState attribute and conceptual.yml section
+KIND_SECTIONS = {
+    "domain": "domains",
+    "concept": "concepts",
+    "relationship": "relationships",
+}
+
+
+class EditError(ValueError):
+    """Raised when an operation can't be applied to the current model."""
+
+
+@dataclass
+class Operation:
+    """One upsert or delete of a domain, concept or relationship.
+
+    Attributes:
+        op: "upsert" or "delete"
+        kind: "domain", "concept" or "relationship"
+        id: Element to replace or delete. Relationships are identified by
+            their ``from:verb:to`` id, and an upsert without an id adds one.
+        entry: conceptual.yml entry to write (None for deletes); for
+            relationships with ``from``, ``to`` and optionally ``verb``
+    """
+
+    op: Literal["upsert", "delete"]
+    kind: Literal["domain", "concept", "relationship"]
+    id: Optional[str] = None
+    entry: Optional[dict[str, Any]] = None
+
+    @property
+    def section(self) -> str:
+        """Section of the element in conceptual.yml and ProjectState."""
+        return KIND_SECTIONS[self.kind]
+
+    @property
+    def target(self) -> Optional[str]:
+        """Id of the element after the operation (None after a delete)."""
+        if self.entry is None:
+            return None
+        if self.kind == "relationship":
+            return relationship_id(self.entry)
+        return self.id
+
+
+def check_operations(state: ProjectState, operations: Sequence[Operation]) -> None:
+    """Check that operations apply, in order, to a state.
+
+    Args:
+        state: State the operations will be applied to
+        operations: Operations to check
+
+    Raises:
+        EditError: For the first operation that can't be applied
+    """
+    # Ids added (True) or deleted (False) by the operations checked so far
+    overlay: dict[tuple[str, str], bool] = {}
+
+    def exists(section: str, element_id: str) -> bool:
+        known = overlay.get((section, element_id))
+        return element_id in getattr(state, section) if known is None else known
+
+    for number, operation in enumerate(operations, start=1):
+        where = f"Operation {number}"
+        if operation.op not in ("upsert", "delete"):
+            raise EditError(f"{where}: unknown op '{operation.op}'")
+        if operation.kind not in KIND_SECTIONS:
+            raise EditError(f"{where}: unknown element type '{operation.kind}'")
+        section = operation.section
+        if operation.op == "delete" or operation.kind != "relationship":
+            if not operation.id:
+                raise EditError(f"{where}: an id is required")
+        if operation.op == "delete":
+            if not exists(section, operation.id or ""):
+                raise EditError(f"{where}: {operation.kind} '{operation.id}' not found")
+            overlay[(section, operation.id or "")] = False
+            continue
+
+        if not isinstance(operation.entry, dict):
+            raise EditError(f"{where}: data must be an object")
+        if operation.kind == "relationship":
+            if not (operation.entry.get("from") and operation.entry.get("to")):
+                raise EditError(f"{where}: a relationship needs 'from' and 'to'")
+            target = operation.target or ""
+            replaced = operation.id and operation.id != target
+            if replaced and not exists(section, operation.id or ""):
+                raise EditError(f"{where}: relationship '{operation.id}' not found")
+            if target != operation.id and exists(section, target):
+                raise EditError(f"{where}: relationship '{target}' already exists")
+            if operation.id:
+                overlay[(section, operation.id)] = False
+            overlay[(section, target)] = True
+        else:
+            overlay[(section, operation.id or "")] = True
+
+
+def save_operations(
+    builder: IncrementalStateBuilder, operations: Sequence[Operation]
+) -> list[Path]:
+    """Write operations to conceptual.yml and its fragments.
+
+    Args:
+        builder: Builder of the state the operations were checked against
+        operations: Checked operations
+
+    Returns:
+        Files that were rewritten
+    """
+    return save_elements(
+        builder.config,
+        [(op.section, op.id or op.target or "", op.entry) for op in operations],
+    )
+
+
+def apply_operations(
+    builder: IncrementalStateBuilder, operations: Sequence[Operation]
+) -> dict[str, list[str]]:
+    """Apply saved operations to the builder's state, in place.
+
+    Concepts are linked to their models from the builder's recorded scan.
+    When elements were added in a position a rebuild wouldn't put them in
+    (before a later fragment's elements, or a replaced relationship), the
+    affected dicts are put back in file order.
+
+    Args:
+        builder: Builder whose state the operations were saved for
+        operations: Operations passed to save_operations()
+
+    Returns:
+        Ids of the changed elements (including deleted ones) per section
+    """
+    state = builder.state
+    assert state is not None
+    changed: dict[str, dict[str, None]] = {
+        section: {} for section in KIND_SECTIONS.values()
+    }
+    added: set[str] = set()
+
+    for operation in operations:
+        section = operation.section
+        elements = getattr(state, section)
+        element_id = operation.id or ""
+        target = operation.target
+        if element_id:
+            changed[section][element_id] = None
+
+        if target is None:
+            del elements[element_id]
+            continue
+        changed[section][target] = None
+        if target not in elements or (element_id and element_id != target):
+            added.add(section)
+        entry = operation.entry
+        assert entry is not None
+        if operation.kind == "domain":
+            elements[target] = domain_from_yaml(target, entry)
+        elif operation.kind == "concept":
+            elements[target] = concept_from_yaml(target, entry)
+            builder.link_concept(target)
+        else:
+            if element_id and element_id != target:
+                del elements[element_id]
+            elements[target] = relationship_from_yaml(entry)[1]
+
+    if added:
+        _restore_order(builder, state, added)
+    return {section: list(ids) for section, ids in changed.items()}
+
+
+def _restore_order(
+    builder: IncrementalStateBuilder, state: ProjectState, sections: set[str]
+) -> None:
+    """Reorder state dicts to the order of the (cached) model files."""
+    data = load_model(builder.config).data
+    for section in sections:
+        elements = getattr(state, section)
+        if section == "relationships":
+            order = list(
+                dict.fromkeys(relationship_id(r) for r in data.get(section, []))
+            )
+        else:
+            order = list(data.get(section, {}))
+        if list(elements) == order:
+            continue
+        ordered = {element_id: elements[element_id] for element_id in order}
+        elements.clear()
+        elements.update(ordered)
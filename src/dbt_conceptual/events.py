@@ -0,0 +1,267 @@
+"""Change events for the web UI's server-sent event stream.
+
+Open tabs used to see edits made in an editor, or pulled with git, only
+after pressing sync, which rebuilt the state and sent all of it. A
+ChangeFeed instead polls the server's StateCache from one background
+thread while anyone is subscribed. When the state version changes, it
+diffs the state against the previous one, revalidates only the changed
+elements and renders one event, which is queued for every subscriber.
+
+The diff compares a signature (the field values) of every domain,
+concept and relationship, so it also catches changes made by a full
+rebuild. Concepts whose models changed are included, and orphan models
+are compared by name.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Optional
+
+from dbt_conceptual.state import ProjectState
+from dbt_conceptual.state_cache import StateCache
+from dbt_conceptual.validator import Validator
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two checks of the source files
+POLL_INTERVAL = 1.0
+
+
+@dataclass
+class StateChange:
+    """Difference between two versions of the cached state.
+
+    Attributes:
+        version: State version after the change
+        domains: Ids of added, modified and deleted domains
+        concepts: Ids of added, modified (including their models) and
+            deleted concepts
+        relationships: Ids of added, modified and deleted relationships
+        new_orphans: Names of models that became orphans
+        removed_orphans: Names of models that are no longer orphans
+        validation: Issue counts by severity, if they changed
+    """
+
+    version: str
+    domains: list[str] = field(default_factory=list)
+    concepts: list[str] = field(default_factory=list)
+    relationships: list[str] = field(default_factory=list)
+    new_orphans: list[str] = field(default_factory=list)
+    removed_orphans: list[str] = field(default_factory=list)
+    validation: Optional[dict[str, int]] = None
+
+
+def format_event(event: str, data: Any, event_id: Optional[str] = None) -> str:
+    """Format one server-sent event.
+
+    Args:
+        event: Event type
+        data: JSON-serializable payload
+        event_id: Optional event id, sent back by browsers on reconnect
+
+    Returns:
+        The event in text/event-stream format
+    """
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+class ChangeFeed:
+    """Publishes state changes to subscribers from one polling thread.
+
+    Attributes:
+        polls: Number of checks of the source files
+        events: Number of change events published
+    """
+
+    def __init__(
+        self,
+        cache: StateCache,
+        render: Callable[[ProjectState, StateChange], str],
+        interval: float = POLL_INTERVAL,
+    ):
+        """Initialize the feed; polling starts with the first subscriber.
+
+        Args:
+            cache: State cache to watch
+            render: Formats a change, from the state after it, as the
+                event queued for subscribers (called once per change)
+            interval: Seconds between two checks of the source files
+        """
+        self.cache = cache
+        self.render = render
+        self.interval = interval
+        self.polls = 0
+        self.events = 0
+        self._subscribers: list[queue.SimpleQueue[str]] = []
+        # Taken before _lock: serializes poll() and baselines
+        self._poll_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._version = ""
+        self._signatures: dict[str, dict[str, tuple[Any, ...]]] = {}
+        self._orphans: set[str] = set()
+        self._validator: Optional[Validator] = None
+        self._summary: dict[str, int] = {}
+
+    @property
+    def version(self) -> str:
+        """State version of the last published (or baseline) event."""
+        return self._version
+
+    def subscribe(self) -> "queue.SimpleQueue[str]":
+        """Register a subscriber and start polling if needed.
+
+        When polling starts, the current state is taken as the baseline
+        that changes are published against.
+
+        Returns:
+            Queue receiving the rendered events
+        """
+        subscription: queue.SimpleQueue[str] = queue.SimpleQueue()
+        with self._poll_lock, self._lock:
+            if self._thread is None:
+                with self.cache.read() as state:
+                    self._diff(state)
+                self._thread = threading.Thread(
+                    target=self._run, name="dbt-conceptual-events", daemon=True
+                )
+                self._thread.start()
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: "queue.SimpleQueue[str]") -> None:
+        """Remove a subscriber; polling stops after the last one leaves.
+
+        Args:
+            subscription: Queue returned by subscribe()
+        """
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    @property
+    def subscribers(self) -> int:
+        """Number of current subscribers."""
+        with self._lock:
+            return len(self._subscribers)
+
+    def poll(self) -> Optional[StateChange]:
+        """Refresh the cache and publish a change event if the state changed.
+
+        Returns:
+            The published change, or None if the version is unchanged
+        """
+        with self._poll_lock:
+            self.polls += 1
+            self.cache.refresh()
+            if self.cache.version == self._version:
+                return None
+            with self.cache.read() as state:
+                change = self._diff(state)
+                event = self.render(state, change)
+            with self._lock:
+                for subscription in self._subscribers:
+                    subscription.put(event)
+            self.events += 1
+            return change
+
+    def _run(self) -> None:
+        """Poll until the last subscriber leaves."""
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._subscribers:
+                    # The next subscriber starts over with a new baseline
+                    self._thread = None
+                    return
+            try:
+                self.poll()
+            except Exception:
+                # Keep serving: a half-written file fails now and parses later
+                logger.exception("Could not check the project for changes")
+
+    def _diff(self, state: ProjectState) -> StateChange:
+        """Compare the state with the last one seen and remember it."""
+        change = StateChange(self.cache.version)
+        changed: dict[str, list[str]] = {}
+        for section in ("domains", "concepts", "relationships"):
+            elements = getattr(state, section)
+            previous = self._signatures.get(section, {})
+            current = {
+                element_id: _signature(element, state)
+                for element_id, element in elements.items()
+            }
+            changed[section] = [
+                element_id
+                for element_id, signature in current.items()
+                if previous.get(element_id) != signature
+            ] + [element_id for element_id in previous if element_id not in current]
+            self._signatures[section] = current
+        change.domains = changed["domains"]
+        change.concepts = changed["concepts"]
+        change.relationships = changed["relationships"]
+
+        orphans = {orphan.name for orphan in state.orphan_models}
+        change.new_orphans = sorted(orphans - self._orphans)
+        change.removed_orphans = sorted(self._orphans - orphans)
+        self._orphans = orphans
+
+        summary = self._validate(state, changed)
+        if summary != self._summary:
+            change.validation = summary
+        self._summary = summary
+        self._version = change.version
+        return change
+
+    def _validate(
+        self, state: ProjectState, changed: dict[str, list[str]]
+    ) -> dict[str, int]:
+        """Validate the state, rechecking only changed elements if possible."""
+        validator = self._validator
+        if validator is None or validator.state is not state:
+            # A rebuilt state is a new object: validate it from scratch
+            validator = Validator(self.cache.config, state)
+            validator.validate()
+            self._validator = validator
+        else:
+            validator.revalidate(
+                concepts=changed["concepts"],
+                relationships=changed["relationships"],
+                domains=changed["domains"],
+            )
+        return validator.get_summary()
+
+
+# Field names per element type, excluding validation results
+_FIELDS: dict[type, tuple[str, ...]] = {}
+
+
+def _signature(element: Any, state: ProjectState) -> tuple[Any, ...]:
+    """Values of an element's fields, with its derived status."""
+    names = _FIELDS.get(type(element))
+    if names is None:
+        names = tuple(
+            f.name for f in fields(element) if not f.name.startswith("validation_")
+        )
+        _FIELDS[type(element)] = names
+    values = [_frozen(getattr(element, name)) for name in names]
+    if hasattr(element, "get_status"):
+        values.append(element.get_status(state.concepts))
+    elif hasattr(element, "status"):
+        values.append(element.status)
+    return tuple(values)
+
+
+def _frozen(value: Any) -> Any:
+    """Copy mutable field values, which updates change in place."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
@@ -12,7 +12,10 @@ from dbt_conceptual.exporter.formats import (
     export_status_json,
     export_status_markdown,
     export_validation_json,
+    export_validation_jsonl,
     export_validation_markdown,
+    export_validation_shard_json,
+    merge_validation_json,
 )
 from dbt_conceptual.exporter.svg import export_diagram_svg
 
@@ -28,6 +31,9 @@ __all__ = [
     "export_status_json",
     "export_orphans_json",
     "export_validation_json",
+    "export_validation_jsonl",
+    "export_validation_shard_json",
+    "merge_validation_json",
     # Markdown exporters
     "export_coverage_markdown",
     "export_bus_matrix_markdown",
@@ -49,11 +49,10 @@ def export_coverage(state: ProjectState, output: TextIO) -> None:
 
     # Group concepts by domain
     domain_groups: dict[str, list[tuple[str, ConceptState]]] = {}
-    for concept_id, concept in state.concepts.items():
-        domain = concept.domain or "uncategorized"
-        if domain not in domain_groups:
-            domain_groups[domain] = []
-        domain_groups[domain].append((concept_id, concept))
+    for domain in state.index.concept_domains():
+        domain_groups.setdefault(domain or "uncategorized", []).extend(
+            (cid, state.concepts[cid]) for cid in state.index.concepts_in_domain(domain)
+        )
 
     # Find attention items
     incomplete_concepts = [
@@ -6,7 +6,8 @@ v1.0: Simplified model - single models[] array, no realized_by.
 """
 
 import json
-from typing import Any, TextIO
+from collections.abc import Iterable
+from typing import Any, Optional, TextIO
 
 from dbt_conceptual.state import ProjectState
 from dbt_conceptual.validator import ValidationIssue, Validator
@@ -76,19 +77,19 @@ def export_coverage_json(state: ProjectState, output: TextIO) -> None:
 
     # Add concept details
     concepts_by_domain: dict[str, list[dict[str, Any]]] = {}
-    for concept_id, concept in state.concepts.items():
-        domain = concept.domain or "uncategorized"
-        if domain not in concepts_by_domain:
-            concepts_by_domain[domain] = []
-        concepts_by_domain[domain].append(
-            {
-                "id": concept_id,
-                "name": concept.name,
-                "status": concept.status,
-                "owner": concept.owner,
-                "models": concept.models,
-            }
-        )
+    for domain in state.index.concept_domains():
+        entries = concepts_by_domain.setdefault(domain or "uncategorized", [])
+        for concept_id in state.index.concepts_in_domain(domain):
+            concept = state.concepts[concept_id]
+            entries.append(
+                {
+                    "id": concept_id,
+                    "name": concept.name,
+                    "status": concept.status,
+                    "owner": concept.owner,
+                    "models": concept.models,
+                }
+            )
 
     data = {
         "summary": stats,
@@ -347,24 +348,17 @@ def export_orphans_markdown(state: ProjectState, output: TextIO) -> None:
 # ============================================================================
 
 
-def export_validation_json(
-    validator: Validator, issues: list[ValidationIssue], output: TextIO
-) -> None:
-    """Export validation results as JSON."""
-    summary = validator.get_summary()
+def _validation_report(
+    validator: Validator,
+    issues_data: list[dict[str, Any]],
+    summary: Optional[dict[str, int]] = None,
+) -> dict[str, Any]:
+    """Build the validation JSON report."""
+    if summary is None:
+        summary = validator.get_summary()
 
-    issues_data = [
-        {
-            "code": issue.code,
-            "severity": issue.severity.value,
-            "message": issue.message,
-            "context": issue.context,
-        }
-        for issue in issues
-    ]
-
-    data = {
-        "passed": not validator.has_errors(),
+    return {
+        "passed": not summary["errors"],
         "summary": {
             "errors": summary["errors"],
             "warnings": summary["warnings"],
@@ -373,8 +367,124 @@ def export_validation_json(
         "issues": issues_data,
     }
 
+
+def _issue_data(issue: ValidationIssue) -> dict[str, Any]:
+    return {
+        "code": issue.code,
+        "severity": issue.severity.value,
+        "message": issue.message,
+        "context": issue.context,
+    }
+
+
+def export_validation_json(
+    validator: Validator,
+    issues: list[ValidationIssue],
+    output: TextIO,
+    summary: Optional[dict[str, int]] = None,
+) -> None:
+    """Export validation results as JSON.
+
+    Args:
+        validator: Validator that produced the issues
+        issues: Issues to list
+        output: Stream to write to
+        summary: Counts by severity, when issues is not every issue of
+            validator.issues (default: validator.get_summary())
+    """
+    data = _validation_report(
+        validator, [_issue_data(issue) for issue in issues], summary
+    )
+
+    json.dump(data, output, indent=2)
+    output.write("\n")
+
+
+def export_validation_jsonl(issues: Iterable[ValidationIssue], output: TextIO) -> None:
+    """Export validation issues as JSON Lines, one object per issue.
+
+    Each issue is written as soon as the iterable produces it, so a
+    generator such as Validator.iter_issues() streams with flat memory.
+    """
+    for issue in issues:
+        output.write(json.dumps(_issue_data(issue)))
+        output.write("\n")
+
+
+def export_validation_shard_json(
+    validator: Validator, issues: list[ValidationIssue], output: TextIO
+) -> None:
+    """Export the validation results of one shard as JSON.
+
+    The report is the one export_validation_json() writes, plus the shard
+    ("shard": {"index", "count"}) and a sort key per issue ("key"), which
+    merge_validation_json() needs to restore the order of a single run.
+    """
+    assert validator.shard is not None
+    keys = validator.issue_keys()
+    data = _validation_report(
+        validator,
+        [{**_issue_data(issue), "key": list(key)} for issue, key in zip(issues, keys)],
+    )
+    data["shard"] = {"index": validator.shard[0], "count": validator.shard[1]}
+
+    json.dump(data, output, indent=2)
+    output.write("\n")
+
+
+def merge_validation_json(shards: list[dict[str, Any]], output: TextIO) -> bool:
+    """Merge the JSON reports of all shards of a validation run.
+
+    Writes exactly what export_validation_json() writes for an unsharded
+    run of the same project.
+
+    Args:
+        shards: Reports written by export_validation_shard_json(), one per
+            shard, in any order
+        output: Stream to write the merged report to
+
+    Returns:
+        True if the merged run passed (no errors)
+
+    Raises:
+        ValueError: If a report is not a shard report, or the reports are
+            not exactly the shards 1..N of one run
+    """
+    if not shards:
+        raise ValueError("No shard reports to merge")
+    try:
+        counts = {shard["shard"]["count"] for shard in shards}
+        indexes = sorted(shard["shard"]["index"] for shard in shards)
+    except (KeyError, TypeError):
+        raise ValueError(
+            "Not a shard report (run 'validate --shard I/N --format json')"
+        ) from None
+    if len(counts) != 1:
+        raise ValueError(f"Reports come from different shard counts: {sorted(counts)}")
+    (count,) = counts
+    if indexes != list(range(1, count + 1)):
+        raise ValueError(f"Expected shards 1..{count}, got {indexes}")
+
+    keyed = [
+        (tuple(issue.pop("key")), shard["shard"]["index"], n, issue)
+        for shard in shards
+        for n, issue in enumerate(shard["issues"])
+    ]
+    # An element is in one shard, so equal keys come from the same shard
+    keyed.sort(key=lambda item: item[:3])
+    summary = {"errors": 0, "warnings": 0, "info": 0}
+    for shard in shards:
+        for severity, total in shard["summary"].items():
+            summary[severity] += total
+    data = {
+        "passed": not summary["errors"],
+        "summary": summary,
+        "issues": [issue for *_, issue in keyed],
+    }
+
     json.dump(data, output, indent=2)
     output.write("\n")
+    return bool(data["passed"])
 
 
 def export_validation_markdown(
@@ -0,0 +1,432 @@
+"""Conceptual models split across fragment files.
+
+Besides ``conceptual.yml``, a project may keep part of its conceptual model
+in a ``conceptual/`` directory next to it. Every ``*.yml``/``*.yaml`` file
+below that directory is a fragment with the same ``domains``, ``concepts``
+and ``relationships`` sections as conceptual.yml; typically one fragment per
+domain. Settings (``config``) and file-level ``metadata`` are only read
+from conceptual.yml.
+
+Documents are parsed concurrently through the shared document cache
+(dbt_conceptual.yaml_io), so an unchanged fragment is never parsed twice in
+one process. They are merged in a fixed order (conceptual.yml, then the
+fragments sorted by path). Defining the same domain, concept or
+relationship in two files is an error.
+
+save_sections() writes an edited model back: every element stays in the
+file that defines it, new elements go next to their domain (concepts) or
+source concept (relationships), and only files whose content changed are
+rewritten, patched in place so comments and untouched entries are kept.
+save_elements() does the same for a few individual elements, without
+rebuilding any section from the whole model.
+"""
+
+import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.yaml_io import document_cache, load_yaml_document
+from dbt_conceptual.yaml_patch import write_yaml_file
+
+logger = logging.getLogger(__name__)
+
+FRAGMENT_DIR = "conceptual"
+
+FRAGMENT_SUFFIXES = (".yml", ".yaml")
+
+SECTIONS = ("domains", "concepts", "relationships")
+
+
+class FragmentConflictError(ValueError):
+    """Raised when two files define the same domain, concept or relationship."""
+
+    def __init__(self, conflicts: list[str]):
+        self.conflicts = conflicts
+        super().__init__(
+            "Conflicting conceptual model definitions:\n  " + "\n  ".join(conflicts)
+        )
+
+
+@dataclass
+class MergedModel:
+    """Conceptual model merged from conceptual.yml and its fragments.
+
+    Attributes:
+        data: conceptual.yml's document with the merged sections
+        sources: File defining each element, per section
+            (``sources["concepts"]["customer"]``); relationships are keyed
+            on their ``from:verb:to`` id
+    """
+
+    data: dict[str, Any] = field(default_factory=dict)
+    sources: dict[str, dict[str, Path]] = field(
+        default_factory=lambda: {section: {} for section in SECTIONS}
+    )
+
+
+def relationship_id(rel: dict[str, Any]) -> str:
+    """Get the id of a relationship entry, as the parser builds it.
+
+    Args:
+        rel: Relationship mapping from a conceptual model file
+
+    Returns:
+        ``from:verb:to`` id
+    """
+    return f"{rel.get('from')}:{rel.get('verb', 'relates_to')}:{rel.get('to')}"
+
+
+def fragment_dir(config: Config) -> Path:
+    """Get the fragment directory of a project."""
+    return config.project_dir / FRAGMENT_DIR
+
+
+def fragment_files(config: Config) -> list[Path]:
+    """List the fragment files of a project, sorted by path.
+
+    Hidden files and directories are skipped.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Fragment file paths (empty when there is no fragment directory)
+    """
+    root = fragment_dir(config)
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        files.extend(
+            Path(dirpath, name)
+            for name in filenames
+            if name.endswith(FRAGMENT_SUFFIXES) and not name.startswith(".")
+        )
+    return sorted(files, key=lambda p: p.relative_to(root).parts)
+
+
+def is_fragment_path(config: Config, path: Path) -> bool:
+    """Check whether a path is (or would be) a fragment file.
+
+    Args:
+        config: Configuration object
+        path: Absolute path, or path relative to the project directory
+
+    Returns:
+        True for YAML files below the fragment directory
+    """
+    if not path.is_absolute():
+        path = config.project_dir / path
+    try:
+        parts = path.relative_to(fragment_dir(config)).parts
+    except ValueError:
+        return False
+    return (
+        bool(parts)
+        and path.name.endswith(FRAGMENT_SUFFIXES)
+        and not any(part.startswith(".") for part in parts)
+    )
+
+
+def load_documents(config: Config) -> list[tuple[Path, Any]]:
+    """Parse conceptual.yml and every fragment.
+
+    Fragments are parsed on a thread pool through the shared document
+    cache. The returned documents are shared with the cache and must not
+    be modified.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        (path, document) pairs: conceptual.yml first (with a None document
+        when it doesn't exist), then the fragments in path order
+    """
+    paths = fragment_files(config)
+    if config.conceptual_file.exists():
+        paths.insert(0, config.conceptual_file)
+    elif not paths:
+        return [(config.conceptual_file, None)]
+
+    if len(paths) < 2:
+        documents = [(path, load_yaml_document(path)) for path in paths]
+    else:
+        with ThreadPoolExecutor(thread_name_prefix="dbt-conceptual-fragments") as pool:
+            documents = list(zip(paths, pool.map(load_yaml_document, paths)))
+    if paths[0] != config.conceptual_file:
+        documents.insert(0, (config.conceptual_file, None))
+    return documents
+
+
+def merge_documents(documents: Sequence[tuple[Path, Any]]) -> MergedModel:
+    """Merge parsed conceptual model documents.
+
+    Args:
+        documents: (path, document) pairs; the first is conceptual.yml
+
+    Returns:
+        MergedModel; ``data`` keeps the first document's other keys
+
+    Raises:
+        FragmentConflictError: If two files define the same element
+    """
+    merged = MergedModel()
+    domains: dict[str, Any] = {}
+    concepts: dict[str, Any] = {}
+    relationships: list[Any] = []
+    conflicts = []
+
+    for position, (path, document) in enumerate(documents):
+        if not isinstance(document, dict):
+            continue
+        if position == 0:
+            merged.data = {k: v for k, v in document.items() if k not in SECTIONS}
+
+        for section, target in (("domains", domains), ("concepts", concepts)):
+            for element_id, element in (document.get(section) or {}).items():
+                seen = merged.sources[section].get(element_id)
+                if seen is not None and seen != path:
+                    conflicts.append(f"{section} '{element_id}': {seen} and {path}")
+                    continue
+                merged.sources[section][element_id] = path
+                target[element_id] = element
+
+        rel_sources = merged.sources["relationships"]
+        for rel in document.get("relationships") or []:
+            if not isinstance(rel, dict):
+                relationships.append(rel)
+                continue
+            rel_id = relationship_id(rel)
+            seen = rel_sources.get(rel_id)
+            if seen is not None and seen != path:
+                conflicts.append(f"relationships '{rel_id}': {seen} and {path}")
+                continue
+            rel_sources[rel_id] = path
+            relationships.append(rel)
+
+    if conflicts:
+        raise FragmentConflictError(conflicts)
+
+    if domains:
+        merged.data["domains"] = domains
+    if concepts:
+        merged.data["concepts"] = concepts
+    if relationships:
+        merged.data["relationships"] = relationships
+    return merged
+
+
+def load_model(config: Config) -> MergedModel:
+    """Load the merged conceptual model of a project.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        MergedModel (with empty ``data`` when there is nothing to load)
+
+    Raises:
+        FragmentConflictError: If two files define the same element
+    """
+    return merge_documents(load_documents(config))
+
+
+def save_sections(
+    config: Config,
+    domains: Optional[dict[str, Any]] = None,
+    concepts: Optional[dict[str, Any]] = None,
+    relationships: Optional[list[dict[str, Any]]] = None,
+) -> list[Path]:
+    """Write edited model sections back to conceptual.yml and fragments.
+
+    Each element is written to the file that currently defines it. New
+    concepts go to the file defining their domain, new relationships to the
+    file of their ``from`` concept, anything else to conceptual.yml. Files
+    whose content doesn't change are left untouched.
+
+    Args:
+        config: Configuration object
+        domains: New domains section (None leaves domains as they are)
+        concepts: New concepts section (None leaves concepts as they are)
+        relationships: New relationships (None leaves them as they are)
+
+    Returns:
+        Files that were rewritten
+
+    Raises:
+        FragmentConflictError: If the files on disk already conflict
+    """
+    documents = load_documents(config)
+    sources = merge_documents(documents).sources
+    main_file = config.conceptual_file
+    current = {
+        path: document if isinstance(document, dict) else {}
+        for path, document in documents
+    }
+
+    # Sections given as None keep each file's own entries
+    placed: dict[Path, dict[str, Any]] = {
+        path: {
+            section: document.get(section)
+            for section, value in zip(SECTIONS, (domains, concepts, relationships))
+            if value is None and document.get(section) is not None
+        }
+        for path, document in current.items()
+    }
+
+    def place(path: Path, section: str, key: Optional[str], element: Any) -> None:
+        target = placed[path]
+        if section == "relationships":
+            target.setdefault(section, []).append(element)
+        else:
+            target.setdefault(section, {})[key] = element
+
+    if domains is not None:
+        for domain_id, domain in domains.items():
+            path = sources["domains"].get(domain_id, main_file)
+            place(path, "domains", domain_id, domain)
+
+    concept_files = dict(sources["concepts"])
+    if concepts is not None:
+        for concept_id, concept in concepts.items():
+            path = concept_files.get(concept_id) or sources["domains"].get(
+                concept.get("domain"), main_file
+            )
+            concept_files[concept_id] = path
+            place(path, "concepts", concept_id, concept)
+
+    if relationships is not None:
+        for rel in relationships:
+            path = sources["relationships"].get(
+                relationship_id(rel)
+            ) or concept_files.get(str(rel.get("from")), main_file)
+            place(path, "relationships", None, rel)
+
+    written = []
+    for path, document in current.items():
+        updated = _with_sections(document, placed[path])
+        if updated == document:
+            continue
+        write_yaml_file(path, updated)
+        written.append(path)
+        logger.debug("Rewrote %s", path)
+    return written
+
+
+def save_elements(
+    config: Config,
+    changes: Sequence[tuple[str, str, Optional[dict[str, Any]]]],
+) -> list[Path]:
+    """Write individual domains, concepts and relationships to their files.
+
+    Only the sections holding a changed element are copied (shallowly) and
+    only the changed entries differ, so write_yaml_file() patches just
+    those. Elements are placed as save_sections() places them, and a
+    replaced relationship keeps its position. The written documents go
+    into the document cache, so a following edit doesn't parse the files
+    again.
+
+    Args:
+        config: Configuration object
+        changes: (section, element id, entry) triples, applied in order. An
+            entry of None deletes the element. Relationships are identified
+            by their ``from:verb:to`` id; an entry with another id replaces
+            the relationship.
+
+    Returns:
+        Files that were rewritten
+
+    Raises:
+        KeyError: If an element to delete doesn't exist
+        FragmentConflictError: If the files on disk already conflict
+    """
+    documents = load_documents(config)
+    sources = merge_documents(documents).sources
+    main_file = config.conceptual_file
+    current = {
+        path: document if isinstance(document, dict) else {}
+        for path, document in documents
+    }
+    edited: dict[Path, dict[str, Any]] = {}
+
+    def section_of(path: Path, section: str) -> Any:
+        """The file's copy of a section, made on first use."""
+        sections = edited.setdefault(path, {})
+        if section not in sections:
+            value = current[path].get(section)
+            if section == "relationships":
+                sections[section] = list(value or [])
+            else:
+                sections[section] = dict(value or {})
+        return sections[section]
+
+    for section, element_id, entry in changes:
+        located = sources[section]
+        path = located.get(element_id)
+        if path is None and entry is None:
+            raise KeyError(f"{section} '{element_id}' not found")
+
+        if section != "relationships":
+            if path is None:
+                path = main_file
+                if section == "concepts" and entry is not None:
+                    path = sources["domains"].get(str(entry.get("domain")), path)
+            if entry is None:
+                del section_of(path, section)[element_id]
+                del located[element_id]
+            else:
+                section_of(path, section)[element_id] = entry
+                located[element_id] = path
+            continue
+
+        if path is None:
+            # New relationship: next to its source concept
+            assert entry is not None
+            path = sources["concepts"].get(str(entry.get("from")), main_file)
+            section_of(path, section).append(entry)
+            located[relationship_id(entry)] = path
+            continue
+        items = section_of(path, section)
+        position = next(
+            i
+            for i, item in enumerate(items)
+            if isinstance(item, dict) and relationship_id(item) == element_id
+        )
+        del located[element_id]
+        if entry is None:
+            del items[position]
+        else:
+            items[position] = entry
+            located[relationship_id(entry)] = path
+
+    written = []
+    for path, sections in edited.items():
+        document = current[path]
+        updated = _with_sections(
+            document, {**{s: document.get(s) for s in SECTIONS}, **sections}
+        )
+        if updated == document:
+            continue
+        write_yaml_file(path, updated)
+        document_cache.store(path, updated)
+        written.append(path)
+        logger.debug("Rewrote %s", path)
+    return written
+
+
+def _with_sections(document: dict[str, Any], sections: dict[str, Any]) -> dict:
+    """Replace a document's sections, keeping its other keys and key order."""
+    updated = {}
+    for key, value in document.items():
+        if key not in SECTIONS or not (value or sections.get(key)):
+            updated[key] = value  # Other keys, and sections left empty
+        elif sections.get(key):
+            updated[key] = sections[key]
+    for section in SECTIONS:
+        if section not in updated and sections.get(section):
+            updated[section] = sections[section]
+    return updated
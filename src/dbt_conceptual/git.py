@@ -5,10 +5,8 @@ Provides utilities for loading project state from git refs and computing diffs.
 
 import subprocess
 import tempfile
-from pathlib import Path
-from typing import TYPE_CHECKING
-
-import yaml
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, Optional
 
 from dbt_conceptual.state import (
     ConceptState,
@@ -16,6 +14,7 @@ from dbt_conceptual.state import (
     ProjectState,
     RelationshipState,
 )
+from dbt_conceptual.yaml_io import load_yaml, load_yaml_file
 
 if TYPE_CHECKING:
     from dbt_conceptual.config import Config
@@ -104,8 +103,9 @@ def load_state_from_git_ref(config: "Config", base_ref: str) -> ProjectState:
         temp_path = Path(temp_file.name)
 
     try:
-        with open(temp_path) as f:
-            base_data = yaml.safe_load(f) or {}
+        base_data = _merge_base_fragments(
+            config, base_ref, load_yaml_file(temp_path) or {}
+        )
 
         base_state = ProjectState()
 
@@ -149,12 +149,77 @@ def load_state_from_git_ref(config: "Config", base_ref: str) -> ProjectState:
         temp_path.unlink()
 
 
-def compute_diff_from_ref(config: "Config", base_ref: str) -> "ConceptualDiff":
+def _merge_base_fragments(
+    config: "Config", base_ref: str, base_data: Any
+) -> dict[str, Any]:
+    """Merge the fragment files present at a git ref into its conceptual.yml.
+
+    Args:
+        config: Project configuration
+        base_ref: Git ref the documents come from
+        base_data: conceptual.yml document at the ref
+
+    Returns:
+        Merged conceptual model document
+
+    Raises:
+        RefNotFoundError: If a listed fragment can't be read
+    """
+    from dbt_conceptual.fragments import (
+        FRAGMENT_DIR,
+        FRAGMENT_SUFFIXES,
+        merge_documents,
+    )
+
+    # Paths are listed relative to the project directory
+    listing = subprocess.run(
+        ["git", "ls-tree", "-r", "-z", "--name-only", base_ref, "--", FRAGMENT_DIR],
+        cwd=config.project_dir,
+        capture_output=True,
+        text=True,
+    )
+    if listing.returncode != 0:
+        return base_data if isinstance(base_data, dict) else {}
+
+    # Same selection and order as fragment_files() on a working tree
+    fragments = sorted(
+        (
+            PurePosixPath(name)
+            for name in listing.stdout.split("\0")
+            if name.endswith(FRAGMENT_SUFFIXES)
+            and not any(part.startswith(".") for part in PurePosixPath(name).parts)
+        ),
+        key=lambda path: path.parts,
+    )
+
+    documents: list[tuple[Path, Any]] = [(config.conceptual_file, base_data)]
+    for fragment in fragments:
+        result = subprocess.run(
+            ["git", "show", f"{base_ref}:./{fragment}"],
+            cwd=config.project_dir,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RefNotFoundError(
+                ref=base_ref, file_path=str(fragment), stderr=result.stderr.strip()
+            )
+        documents.append((config.project_dir / fragment, load_yaml(result.stdout)))
+
+    return merge_documents(documents).data
+
+
+def compute_diff_from_ref(
+    config: "Config",
+    base_ref: str,
+    current_state: Optional[ProjectState] = None,
+) -> "ConceptualDiff":
     """Compute diff between current state and base git ref.
 
     Args:
         config: Project configuration
         base_ref: Base git ref to compare against
+        current_state: Already built current state (default: build it)
 
     Returns:
         ConceptualDiff object with changes
@@ -168,8 +233,8 @@ def compute_diff_from_ref(config: "Config", base_ref: str) -> "ConceptualDiff":
     from dbt_conceptual.parser import StateBuilder
 
     # Load current state
-    builder = StateBuilder(config)
-    current_state = builder.build()
+    if current_state is None:
+        current_state = StateBuilder(config).build()
 
     # Load base state from git ref
     base_state = load_state_from_git_ref(config, base_ref)
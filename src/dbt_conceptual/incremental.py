@@ -0,0 +1,337 @@
+"""Incremental ProjectState maintenance from schema file changes.
+
+StateBuilder.build() rebuilds the whole state from every schema file. When
+a watcher or the server knows which files changed, IncrementalStateBuilder
+applies just those file-level deltas to an existing state.
+
+It records which models (and so which ModelInfo, OrphanModel and
+concept-model links) came from which schema file. Applying a delta re-reads
+only the changed files and recomputes only the entries they touch:
+
+- ``state.models`` entries for model names declared in the changed files
+- ``concept.models`` of concepts referenced by the changed files
+- the changed files' slice of ``state.orphan_models``
+
+The result is identical (including ordering) to a full rebuild. Changes to
+conceptual.yml or its fragments, and manifest-based scans, fall back to a
+full rebuild. In manifest mode all models are recorded as coming from one
+source.
+
+``changed_concepts`` lists the concepts whose models the last
+apply_changes() recomputed, so a watcher can pass them on to
+Validator.revalidate() (orphan models are picked up by the validator
+itself). After a full rebuild apply_changes() returns a new state, which
+needs a full validation.
+"""
+
+import bisect
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional, Union
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.fragments import is_fragment_path
+from dbt_conceptual.parser import (
+    StateBuilder,
+    model_info_from_scanned,
+    orphan_from_scanned,
+)
+from dbt_conceptual.scanned_model import ScannedModel
+from dbt_conceptual.state import ProjectState
+from dbt_conceptual.walker import GoldPathMatcher, is_schema_file
+
+# Schema files are ordered the way the walker yields them
+FileKey = tuple[str, ...]
+
+
+class IncrementalStateBuilder(StateBuilder):
+    """StateBuilder that can update its state from changed schema files."""
+
+    def __init__(self, config: Config):
+        """Initialize the builder.
+
+        Args:
+            config: Configuration object
+        """
+        super().__init__(config)
+        self.state: Optional[ProjectState] = None
+        self.changed_concepts: set[str] = set()
+        self._matcher = GoldPathMatcher(config.gold_paths)
+        self._reset()
+
+    def _reset(self) -> None:
+        # Provenance: models per file, and the files each name/concept occurs in
+        self._file_keys: list[FileKey] = []
+        self._file_models: dict[FileKey, list[ScannedModel]] = {}
+        self._orphan_counts: list[int] = []
+        self._name_files: dict[str, list[FileKey]] = {}
+        self._concept_files: dict[str, list[FileKey]] = {}
+
+    @property
+    def incremental(self) -> bool:
+        """Whether file deltas can be applied (False in manifest mode)."""
+        return self.config.scan_source != "manifest"
+
+    @property
+    def file_models(self) -> tuple[list[FileKey], dict[FileKey, list[ScannedModel]]]:
+        """The state's schema files in scan order, and the models of each.
+
+        build() replaces both containers and apply_changes() updates them
+        in place, so a reference taken after a build describes that state
+        until the next build.
+        """
+        return self._file_keys, self._file_models
+
+    def build(self) -> ProjectState:
+        """Build the complete project state, recording model provenance.
+
+        Returns:
+            ProjectState identical to StateBuilder.build()
+        """
+        self._reset()
+        state = self.parser.parse()
+        for schema_file, models in self.scanner.iter_file_models():
+            if not self.incremental:
+                # Every change rebuilds: keep the models as one source
+                if not self._file_keys:
+                    self._file_keys.append(())
+                    self._file_models[()] = []
+                    self._orphan_counts.append(0)
+                self._file_models[()].extend(models)
+            else:
+                key = self._file_key(schema_file)
+                if key is None or key in self._file_models:
+                    continue
+                self._file_keys.append(key)
+                self._file_models[key] = models
+                self._orphan_counts.append(0)
+                self._index_file(key, models)
+
+            for model in models:
+                meta = model.meta
+                if "concept" in meta:
+                    concept_id = meta["concept"]
+                    concept = state.concepts.get(concept_id)
+                    if concept is not None and not state.index.concept_has_model(
+                        concept_id, model.name
+                    ):
+                        concept.models.append(model.name)
+                else:
+                    state.orphan_models.append(orphan_from_scanned(model))
+                    self._orphan_counts[-1] += 1
+                state.models[model.name] = model_info_from_scanned(model)
+
+        self.state = state
+        return state
+
+    def apply_changes(
+        self,
+        changed: Iterable[Union[str, Path]] = (),
+        deleted: Iterable[Union[str, Path]] = (),
+    ) -> ProjectState:
+        """Apply file-level deltas to the state built by build().
+
+        Args:
+            changed: Added or modified files (project-relative or absolute)
+            deleted: Removed files
+
+        Returns:
+            The updated state (the same object, unless a full rebuild was
+            needed)
+        """
+        self.changed_concepts = set()
+        if self.state is None:
+            return self.build()
+
+        paths = [Path(p) for p in changed]
+        deleted_paths = [Path(p) for p in deleted]
+        conceptual_file = self._file_key(self.config.conceptual_file)
+        if not self.incremental or any(
+            self._file_key(p) == conceptual_file or is_fragment_path(self.config, p)
+            for p in [*paths, *deleted_paths]
+        ):
+            return self.build()
+
+        for path in deleted_paths:
+            key = self._file_key(path)
+            if key is not None:
+                self._update_file(key, None)
+
+        for path in paths:
+            key = self._file_key(path)
+            if key is None:
+                continue
+            full_path = self.config.project_dir.joinpath(*key)
+            if full_path.is_file() and is_schema_file(
+                self._matcher, key, self.config.scan_exclude
+            ):
+                self._update_file(key, self.scanner.scan_file(full_path))
+            else:
+                self._update_file(key, None)
+
+        return self.state
+
+    def link_concept(self, concept_id: str) -> None:
+        """Re-link a concept added or replaced in the state to its models.
+
+        The models come from the schema files recorded by the last build,
+        without re-reading any file.
+
+        Args:
+            concept_id: Concept whose ``models`` to recompute
+        """
+        self._refresh_concept(concept_id)
+
+    def _file_key(self, path: Path) -> Optional[FileKey]:
+        """Get the sort key of a file: its path components in the project."""
+        project_dir = self.config.project_dir
+        if not path.is_absolute():
+            return path.parts
+        for base in (project_dir, project_dir.resolve()):
+            try:
+                return path.relative_to(base).parts
+            except ValueError:
+                continue
+        try:
+            return path.resolve().relative_to(project_dir.resolve()).parts
+        except ValueError:
+            return None
+
+    def _index_file(self, key: FileKey, models: list[ScannedModel]) -> None:
+        """Record the files each model name and concept occurs in."""
+        for name in {m.name for m in models}:
+            bisect.insort(self._name_files.setdefault(name, []), key)
+        for concept_id in _concept_ids(models):
+            bisect.insort(self._concept_files.setdefault(concept_id, []), key)
+
+    def _unindex_file(self, key: FileKey, models: list[ScannedModel]) -> None:
+        for index, ids in (
+            (self._name_files, {m.name for m in models}),
+            (self._concept_files, _concept_ids(models)),
+        ):
+            for item in ids:
+                keys = index[item]
+                del keys[bisect.bisect_left(keys, key)]
+                if not keys:
+                    del index[item]
+
+    def _update_file(self, key: FileKey, models: Optional[list[ScannedModel]]) -> None:
+        """Replace (or, with None, remove) the models of one schema file."""
+        assert self.state is not None
+        old_models = self._file_models.get(key)
+        if old_models is None and models is None:
+            return
+        old = old_models or []
+        new = models or []
+
+        position = bisect.bisect_left(self._file_keys, key)
+        orphan_start = sum(self._orphan_counts[:position])
+        old_orphans = self._orphan_counts[position] if old_models is not None else 0
+        first_before = self._first_declared(key, old)
+
+        # Swap the file's models and provenance
+        self._unindex_file(key, old)
+        if models is None:
+            del self._file_keys[position]
+            del self._file_models[key]
+            del self._orphan_counts[position]
+        else:
+            if old_models is None:
+                self._file_keys.insert(position, key)
+                self._orphan_counts.insert(position, 0)
+            self._file_models[key] = models
+            self._index_file(key, models)
+
+        # Orphans: replace the file's slice of the scan-ordered list
+        new_orphans = [orphan_from_scanned(m) for m in new if "concept" not in m.meta]
+        self.state.orphan_models[orphan_start : orphan_start + old_orphans] = (
+            new_orphans
+        )
+        if models is not None:
+            self._orphan_counts[position] = len(new_orphans)
+
+        self._refresh_models(key, old, new, first_before)
+        for concept_id in _concept_ids(old) | _concept_ids(new):
+            self._refresh_concept(concept_id)
+
+    def _first_declared(self, key: FileKey, models: list[ScannedModel]) -> list[str]:
+        """Names whose first declaration in scan order is in this file."""
+        return [n for n in _unique_names(models) if self._name_files[n][0] == key]
+
+    def _refresh_models(
+        self,
+        key: FileKey,
+        old: list[ScannedModel],
+        new: list[ScannedModel],
+        first_before: list[str],
+    ) -> None:
+        """Recompute state.models entries for the names declared in a file.
+
+        An entry comes from the last declaration of the name in scan order,
+        its dict position from the first. Editing existing declarations
+        only replaces entries in place. When names are added out of order or
+        their first declaration moves to another file, the dict is
+        re-ordered once to match a full rebuild.
+        """
+        assert self.state is not None
+        models = self.state.models
+
+        inserted = []
+        for name in _unique_names([*new, *old]):
+            keys = self._name_files.get(name)
+            if not keys:
+                del models[name]
+                continue
+            last = next(
+                m for m in reversed(self._file_models[keys[-1]]) if m.name == name
+            )
+            if name not in models:
+                inserted.append(name)
+            models[name] = model_info_from_scanned(last)
+
+        # Where the file's first declarations sit in the dict
+        first_after = self._first_declared(key, new)
+        kept = [n for n in first_before if n in self._name_files]
+        if first_after == kept:
+            return
+        # New names declared after the existing ones in the last file were
+        # appended in declaration order above, which is where they belong
+        if (
+            self._file_keys[-1] == key
+            and first_after[: len(kept)] == kept
+            and first_after[len(kept) :] == inserted
+        ):
+            return
+
+        ordered = {}
+        for file_key in self._file_keys:
+            for model in self._file_models[file_key]:
+                if model.name not in ordered:
+                    ordered[model.name] = models[model.name]
+        models.clear()
+        models.update(ordered)
+
+    def _refresh_concept(self, concept_id: str) -> None:
+        """Recompute the models linked to a concept, in scan order."""
+        assert self.state is not None
+        self.changed_concepts.add(concept_id)
+        concept = self.state.concepts.get(concept_id)
+        if concept is None or concept.is_ghost:
+            return  # A full build only links concepts defined in conceptual.yml
+        linked: dict[str, None] = {}
+        for key in self._concept_files.get(concept_id, ()):
+            for model in self._file_models[key]:
+                meta = model.meta
+                if "concept" in meta and meta["concept"] == concept_id:
+                    linked.setdefault(model.name)
+        concept.models[:] = list(linked)
+
+
+def _concept_ids(models: Iterable[ScannedModel]) -> set[str]:
+    """Concepts referenced through meta.concept by the given models."""
+    return {m.meta["concept"] for m in models if "concept" in m.meta}
+
+
+def _unique_names(models: Iterable[ScannedModel]) -> list[str]:
+    """Model names in declaration order, without repeats."""
+    return list(dict.fromkeys(m.name for m in models))
@@ -0,0 +1,294 @@
+"""Model discovery from dbt's target/manifest.json.
+
+dbt already resolves each model's meta, tags and config (including meta set
+through ``dbt_project.yml`` ``+meta`` or SQL ``config()`` blocks) into the
+manifest. Reading it avoids re-parsing the schema YAML and picks up meta the
+YAML scan cannot see.
+
+Manifests of large projects run to hundreds of MB, so the document is read
+incrementally: sections other than ``nodes`` are skipped without being
+decoded, and each node is decoded on its own and discarded once its model
+record has been emitted.
+"""
+
+import json
+import logging
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any, Callable, Optional
+
+from dbt_conceptual.scanned_model import EMPTY_MAPPING, EMPTY_TAGS, ScannedModel
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_STRUCTURE_RE = re.compile(r'[\[\]{}"]')
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR_RE = re.compile(r"[^,\]}\s]+")
+
+
+class ManifestError(ValueError):
+    """Raised when manifest.json is not valid JSON of the expected shape."""
+
+
+class _JsonStream:
+    """Minimal pull reader over a JSON document.
+
+    Only the unconsumed tail of the input is buffered, so skipping a large
+    value costs a scan over its bytes but no memory beyond one chunk.
+    """
+
+    def __init__(self, f: IO[str], chunk_size: int = _CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed input. False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            match = _WHITESPACE_RE.match(self._buf, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the given structural character."""
+        if self.peek() != char:
+            raise ManifestError(f"Expected {char!r} in manifest")
+        self._pos += 1
+
+    def accept(self, char: str) -> bool:
+        """Consume the given character if it is next."""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def read_string(self) -> str:
+        """Decode the next JSON string."""
+        if self.peek() != '"':
+            raise ManifestError("Expected a string in manifest")
+        value: str = json.loads(self._skip_string())
+        return value
+
+    def read_value(self) -> Any:
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                # Most likely the value continues past the buffered input
+                if not self._fill():
+                    raise ManifestError(f"Invalid JSON in manifest: {e}") from None
+                continue
+            # A bare scalar may have been cut at the chunk boundary
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Consume the next JSON value without decoding it."""
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+        elif char in "{[":
+            self._skip_container()
+        else:
+            while True:
+                match = _SCALAR_RE.match(self._buf, self._pos)
+                if match is None:
+                    raise ManifestError("Invalid value in manifest")
+                if match.end() == len(self._buf) and self._fill():
+                    continue
+                self._pos = match.end()
+                return
+
+    def _skip_string(self) -> str:
+        """Consume the next string, returning its raw JSON text."""
+        while True:
+            match = _STRING_RE.match(self._buf, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return match.group()
+            if not self._fill():
+                raise ManifestError("Unterminated string in manifest")
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            match = _STRUCTURE_RE.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ManifestError("Unexpected end of manifest")
+                continue
+            self._pos = match.start()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+                continue
+            self._pos += 1
+            depth += 1 if char in "{[" else -1
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate the keys of the next JSON object.
+
+        After each key is yielded, the caller must consume its value with
+        read_value() or skip_value() before advancing the iterator.
+        """
+        self.expect("{")
+        if self.accept("}"):
+            return
+        while True:
+            key = self.read_string()
+            self.expect(":")
+            yield key
+            if self.accept(","):
+                continue
+            self.expect("}")
+            return
+
+
+def iter_manifest_nodes(
+    manifest_file: Path,
+    on_metadata: Optional[Callable[[dict], None]] = None,
+) -> Iterator[tuple[str, dict]]:
+    """Iterate the entries of a manifest's ``nodes`` section.
+
+    Args:
+        manifest_file: Path to manifest.json
+        on_metadata: Optional callback receiving the ``metadata`` section
+            (dbt writes it before ``nodes``)
+
+    Yields:
+        (unique_id, node) pairs in document order
+
+    Raises:
+        ManifestError: If the document is not a valid manifest
+    """
+    with open(manifest_file, encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        for key in stream.iter_object():
+            if key == "nodes":
+                for unique_id in stream.iter_object():
+                    node = stream.read_value()
+                    if isinstance(node, dict):
+                        yield unique_id, node
+            elif key == "metadata" and on_metadata is not None:
+                metadata = stream.read_value()
+                if isinstance(metadata, dict):
+                    on_metadata(metadata)
+            else:
+                stream.skip_value()
+
+
+def _strip_project_prefix(patch_path: str) -> str:
+    """Turn 'project://models/x.yml' into 'models/x.yml'."""
+    return patch_path.split("://", 1)[1] if "://" in patch_path else patch_path
+
+
+def model_record_from_node(node: dict, project_dir: Path) -> ScannedModel:
+    """Build a scanner model record from a manifest model node.
+
+    The record is the same ScannedModel the schema YAML scan produces. ``path`` is the schema YAML documenting the model when there is
+    one, otherwise the model's SQL file.
+
+    Args:
+        node: Manifest node with resource_type 'model'
+        project_dir: Project root
+
+    Returns:
+        ScannedModel record
+    """
+    config = node.get("config") or {}
+    patch_path = node.get("patch_path")
+    path = (
+        _strip_project_prefix(patch_path)
+        if patch_path
+        else node.get("original_file_path", "")
+    )
+
+    meta = node.get("meta") or config.get("meta") or {}
+    tags = node.get("tags") or config.get("tags") or EMPTY_TAGS
+    if not isinstance(tags, list):
+        tags = EMPTY_TAGS
+    databricks_tags = config.get("databricks_tags") or EMPTY_MAPPING
+    if not isinstance(databricks_tags, dict):
+        databricks_tags = EMPTY_MAPPING
+
+    return ScannedModel(
+        name=node.get("name", ""),
+        # dbt writes "" for undocumented models; the YAML scan yields None
+        description=node.get("description") or None,
+        meta=meta,
+        path=path,
+        file=str(project_dir / path),
+        tags=tags,
+        databricks_tags=databricks_tags,
+    )
+
+
+def iter_manifest_models(
+    manifest_file: Path,
+    project_dir: Path,
+    matches: Callable[[str], bool],
+    project_name: Optional[str] = None,
+) -> Iterator[ScannedModel]:
+    """Iterate model records from a manifest, filtered to gold paths.
+
+    Args:
+        manifest_file: Path to manifest.json
+        project_dir: Project root
+        matches: Predicate telling whether a project-relative path is gold
+        project_name: Root project name; models from installed packages are
+            skipped. Defaults to the manifest's metadata.project_name.
+
+    Yields:
+        Model records in manifest order
+    """
+    root_package = [project_name]
+
+    def remember_project(metadata: dict) -> None:
+        if root_package[0] is None:
+            root_package[0] = metadata.get("project_name")
+
+    for _unique_id, node in iter_manifest_nodes(manifest_file, remember_project):
+        if node.get("resource_type") != "model" or not node.get("name"):
+            continue
+        if root_package[0] and node.get("package_name") not in (
+            None,
+            root_package[0],
+        ):
+            continue
+
+        patch_path = node.get("patch_path")
+        candidates = [node.get("original_file_path") or ""]
+        if patch_path:
+            candidates.insert(0, _strip_project_prefix(patch_path))
+        if not any(path and matches(path) for path in candidates):
+            continue
+
+        yield model_record_from_node(node, project_dir)
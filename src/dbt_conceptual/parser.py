@@ -3,11 +3,12 @@
 v1.0: Simplified parser with flat model lists and no lineage inference.
 """
 
+from copy import deepcopy
 from typing import Optional
 
-import yaml
-
 from dbt_conceptual.config import Config
+from dbt_conceptual.fragments import load_model
+from dbt_conceptual.scanned_model import ScannedModel
 from dbt_conceptual.scanner import DbtProjectScanner
 from dbt_conceptual.state import (
     ConceptState,
@@ -35,77 +36,174 @@ class ConceptualModelParser:
     def parse(self) -> ProjectState:
         """Parse the conceptual model file and build initial state.
 
+        Fragments in the ``conceptual/`` directory are merged into
+        conceptual.yml (see dbt_conceptual.fragments).
+
         Returns:
             ProjectState with concepts, relationships, and domains
+
+        Raises:
+            FragmentConflictError: If two files define the same element
         """
         state = ProjectState()
 
-        conceptual_file = self.config.conceptual_file
-        if not conceptual_file.exists():
-            return state
-
-        with open(conceptual_file) as f:
-            data = yaml.safe_load(f)
+        # conceptual.yml merged with the fragments in conceptual/
+        data = load_model(self.config).data
 
         if not data:
             return state
 
         # Parse metadata
         if "metadata" in data:
-            state.metadata = data["metadata"]
+            # The document is shared through the cache; the state gets its own
+            state.metadata = deepcopy(data["metadata"])
 
         # Parse domains
         if "domains" in data:
             for domain_id, domain_data in data["domains"].items():
-                state.domains[domain_id] = DomainState(
-                    name=domain_id,
-                    display_name=domain_data.get(
-                        "display_name", domain_data.get("name", domain_id)
-                    ),
-                    color=domain_data.get("color"),
-                    owner=domain_data.get("owner"),
-                )
+                state.domains[domain_id] = domain_from_yaml(domain_id, domain_data)
 
         # Parse concepts
         if "concepts" in data:
             for concept_id, concept_data in data["concepts"].items():
-                state.concepts[concept_id] = ConceptState(
-                    name=concept_data.get("name", concept_id),
-                    domain=concept_data.get("domain"),
-                    owner=concept_data.get("owner"),
-                    definition=concept_data.get("definition"),
-                    color=concept_data.get("color"),
-                    # models list populated by StateBuilder, not from YAML
-                )
+                state.concepts[concept_id] = concept_from_yaml(concept_id, concept_data)
 
         # Parse relationships
         if "relationships" in data:
             for rel in data["relationships"]:
-                verb = rel.get("verb", "relates_to")
-                from_concept = rel["from"]
-                to_concept = rel["to"]
-
-                # Create relationship ID using verb
-                rel_id = f"{from_concept}:{verb}:{to_concept}"
-
-                # Default cardinality to 1:N if not specified
-                cardinality = rel.get("cardinality", "1:N")
-                # Validate cardinality - only 1:1 and 1:N allowed
-                if cardinality not in ("1:1", "1:N"):
-                    cardinality = "1:N"
-
-                state.relationships[rel_id] = RelationshipState(
-                    verb=verb,
-                    from_concept=from_concept,
-                    to_concept=to_concept,
-                    cardinality=cardinality,
-                    definition=rel.get("definition"),
-                    owner=rel.get("owner"),
-                )
+                rel_id, relationship = relationship_from_yaml(rel)
+                state.relationships[rel_id] = relationship
 
         return state
 
 
+def domain_from_yaml(domain_id: str, data: dict) -> DomainState:
+    """Build a domain from its conceptual.yml entry.
+
+    Args:
+        domain_id: Key of the entry
+        data: Entry mapping
+
+    Returns:
+        DomainState for the entry
+    """
+    return DomainState(
+        name=domain_id,
+        display_name=data.get("display_name", data.get("name", domain_id)),
+        color=data.get("color"),
+        owner=data.get("owner"),
+    )
+
+
+def concept_from_yaml(concept_id: str, data: dict) -> ConceptState:
+    """Build a concept from its conceptual.yml entry.
+
+    Args:
+        concept_id: Key of the entry
+        data: Entry mapping
+
+    Returns:
+        ConceptState without models (StateBuilder links those)
+    """
+    return ConceptState(
+        name=data.get("name", concept_id),
+        domain=data.get("domain"),
+        owner=data.get("owner"),
+        definition=data.get("definition"),
+        color=data.get("color"),
+    )
+
+
+def relationship_from_yaml(data: dict) -> tuple[str, RelationshipState]:
+    """Build a relationship from its conceptual.yml entry.
+
+    Args:
+        data: Entry mapping with ``from``, ``to`` and optionally ``verb``
+
+    Returns:
+        (``from:verb:to`` id, RelationshipState) pair
+    """
+    verb = data.get("verb", "relates_to")
+    from_concept = data["from"]
+    to_concept = data["to"]
+
+    # Default cardinality to 1:N if not specified
+    cardinality = data.get("cardinality", "1:N")
+    # Validate cardinality - only 1:1 and 1:N allowed
+    if cardinality not in ("1:1", "1:N"):
+        cardinality = "1:N"
+
+    return f"{from_concept}:{verb}:{to_concept}", RelationshipState(
+        verb=verb,
+        from_concept=from_concept,
+        to_concept=to_concept,
+        cardinality=cardinality,
+        definition=data.get("definition"),
+        owner=data.get("owner"),
+    )
+
+
+def orphan_from_scanned(model: ScannedModel) -> OrphanModel:
+    """Build the orphan entry for a model without meta.concept.
+
+    Args:
+        model: Scanned model
+
+    Returns:
+        OrphanModel for the model
+    """
+    return OrphanModel(
+        name=model.name,
+        description=model.description,
+        domain=model.meta.get("domain"),
+        path=model.path,
+    )
+
+
+def model_info_from_scanned(model: ScannedModel) -> ModelInfo:
+    """Build the ModelInfo used for validation from a scanned model.
+
+    Args:
+        model: Scanned model
+
+    Returns:
+        ModelInfo with concept, domain tags and owner tag
+    """
+    tags = model.tags
+    databricks_tags = model.databricks_tags
+
+    # Extract domain and owner tags
+    domain_tags = []
+    owner_tag = None
+
+    # Standard format: tags like "domain:party", "owner:team"
+    for tag in tags:
+        if isinstance(tag, str):
+            if tag.startswith("domain:"):
+                domain_tags.append(tag[7:])  # Strip "domain:" prefix
+            elif tag.startswith("owner:"):
+                owner_tag = tag[6:]  # Strip "owner:" prefix
+
+    # Databricks format: databricks_tags dict
+    if databricks_tags:
+        if "domain" in databricks_tags:
+            domain_val = databricks_tags["domain"]
+            if isinstance(domain_val, list):
+                domain_tags.extend(domain_val)
+            elif domain_val:
+                domain_tags.append(str(domain_val))
+        if "owner" in databricks_tags:
+            owner_tag = str(databricks_tags["owner"])
+
+    return ModelInfo(
+        name=model.name,
+        concept=model.meta.get("concept"),
+        domain_tags=domain_tags,
+        owner_tag=owner_tag,
+        path=model.path,
+    )
+
+
 class StateBuilder:
     """Builds complete ProjectState by combining conceptual model and dbt models."""
 
@@ -128,67 +226,29 @@ class StateBuilder:
         # Start with conceptual model
         state = self.parser.parse()
 
-        # Scan dbt models (gold layer only)
-        models = self.scanner.scan()
-
-        # Process each model
-        for model in models:
-            meta = model.get("meta", {})
-            model_name = model["name"]
+        # Stream dbt models (gold layer only) straight into the state, so
+        # parsing overlaps with state construction and the full scan result
+        # is never held as one list
+        for model in self.scanner.iter_models():
+            meta = model.meta
+            model_name = model.name
 
             # Handle concept linkage via meta.concept
             if "concept" in meta:
                 concept_id = meta["concept"]
-                if concept_id in state.concepts:
-                    concept = state.concepts[concept_id]
-                    if model_name not in concept.models:
-                        concept.models.append(model_name)
+                concept = state.concepts.get(concept_id)
+                if concept is not None and not state.index.concept_has_model(
+                    concept_id, model_name
+                ):
+                    concept.models.append(model_name)
                 # else: validation will catch unknown concept references
 
             # Track orphan models (models without concept tag)
             if "concept" not in meta:
-                orphan = OrphanModel(
-                    name=model_name,
-                    description=model.get("description"),
-                    domain=meta.get("domain"),
-                    path=model.get("path"),
-                )
-                state.orphan_models.append(orphan)
+                state.orphan_models.append(orphan_from_scanned(model))
 
             # Build ModelInfo for validation
-            tags = model.get("tags", [])
-            databricks_tags = model.get("databricks_tags", {})
-
-            # Extract domain and owner tags
-            domain_tags = []
-            owner_tag = None
-
-            # Standard format: tags like "domain:party", "owner:team"
-            for tag in tags:
-                if isinstance(tag, str):
-                    if tag.startswith("domain:"):
-                        domain_tags.append(tag[7:])  # Strip "domain:" prefix
-                    elif tag.startswith("owner:"):
-                        owner_tag = tag[6:]  # Strip "owner:" prefix
-
-            # Databricks format: databricks_tags dict
-            if databricks_tags:
-                if "domain" in databricks_tags:
-                    domain_val = databricks_tags["domain"]
-                    if isinstance(domain_val, list):
-                        domain_tags.extend(domain_val)
-                    elif domain_val:
-                        domain_tags.append(str(domain_val))
-                if "owner" in databricks_tags:
-                    owner_tag = str(databricks_tags["owner"])
-
-            state.models[model_name] = ModelInfo(
-                name=model_name,
-                concept=meta.get("concept"),
-                domain_tags=domain_tags,
-                owner_tag=owner_tag,
-                path=model.get("path"),
-            )
+            state.models[model_name] = model_info_from_scanned(model)
 
         return state
 
@@ -0,0 +1,69 @@
+"""Restricted unpickling for the files the tool writes into a project.
+
+The scan cache and state snapshots are pickles stored under
+``.dbt_conceptual/``, which sits inside the checkout: anyone who can put a
+file there (a commit, a pull request, a downloaded CI artifact) decides
+what gets unpickled. A plain ``pickle.load`` imports and calls whatever
+the file names, so these files are read with an Unpickler that resolves
+only the classes a caller allows, plus plain builtin containers and the
+date and time types that YAML values can hold. Anything else raises
+``pickle.UnpicklingError`` before it is imported.
+"""
+
+import io
+import pickle
+from collections.abc import Iterable
+from typing import Any
+
+# Types that parsed YAML values are made of
+SAFE_GLOBALS = frozenset(
+    [
+        ("builtins", "bool"),
+        ("builtins", "bytearray"),
+        ("builtins", "bytes"),
+        ("builtins", "complex"),
+        ("builtins", "dict"),
+        ("builtins", "float"),
+        ("builtins", "frozenset"),
+        ("builtins", "int"),
+        ("builtins", "list"),
+        ("builtins", "set"),
+        ("builtins", "str"),
+        ("builtins", "tuple"),
+        ("datetime", "date"),
+        ("datetime", "datetime"),
+        ("datetime", "time"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+    ]
+)
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """Unpickler that refuses every global not explicitly allowed."""
+
+    def __init__(self, file: io.BytesIO, allowed: frozenset[tuple[str, str]]):
+        super().__init__(file)
+        self._allowed = allowed
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in self._allowed:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed here")
+        return super().find_class(module, name)
+
+
+def restricted_loads(data: bytes, allowed: Iterable[tuple[str, str]] = ()) -> Any:
+    """Unpickle data that may only reference known classes.
+
+    Args:
+        data: Pickled bytes
+        allowed: (module, name) pairs of the classes the data may hold,
+            in addition to SAFE_GLOBALS
+
+    Returns:
+        The unpickled object
+
+    Raises:
+        pickle.UnpicklingError: If the data references any other global
+    """
+    return _RestrictedUnpickler(io.BytesIO(data), SAFE_GLOBALS.union(allowed)).load()
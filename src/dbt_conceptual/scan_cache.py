@@ -0,0 +1,230 @@
+"""Persistent on-disk cache of scanned schema files.
+
+The scanner stores the model records extracted from each schema file in
+``.dbt_conceptual/cache/``. Entries are keyed on the file path and
+validated against its mtime and size; when those change, the file's
+content hash decides whether it really has to be parsed again (a fresh
+git checkout touches every mtime without changing any content).
+
+The whole cache is invalidated when the tool version, the cache format or
+the scan configuration (project directory, gold paths) changes.
+
+The cache is a local, machine-specific artifact and is written with
+pickle so that arbitrary YAML values in ``meta`` round-trip exactly. It
+should never be committed; a ``.gitignore`` is dropped next to it. As it
+lives inside the checkout anyway, it is read with a restricted unpickler
+(see safe_pickle) that resolves only the cache's own record types: a
+tampered file is discarded like a corrupt one instead of running code.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from dbt_conceptual import __version__
+from dbt_conceptual.config import Config
+from dbt_conceptual.safe_pickle import restricted_loads
+from dbt_conceptual.scanned_model import ScannedModel
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the shape of cached model records changes
+CACHE_FORMAT_VERSION = 2
+
+CACHE_FILE_NAME = "scan.pickle"
+
+# Classes a cache file may contain besides plain YAML values
+_CACHE_GLOBALS = (
+    ("dbt_conceptual.scan_cache", "CacheEntry"),
+    ("dbt_conceptual.scanned_model", "ScannedModel"),
+)
+
+
+class CacheEntry(NamedTuple):
+    """Cached scan result for one schema file."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    models: list[ScannedModel]
+
+
+def content_digest(data: bytes) -> str:
+    """Hash file content for cache validation.
+
+    Args:
+        data: Raw file bytes
+
+    Returns:
+        Hex digest of the content
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def cache_key(config: Config) -> str:
+    """Compute the key that invalidates the whole cache when it changes.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Hex digest over tool version, format version and scan settings
+    """
+    parts = [
+        __version__,
+        str(CACHE_FORMAT_VERSION),
+        str(Path(config.project_dir).resolve()),
+        *config.gold_paths,
+    ]
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+class ScanCache:
+    """Per-file cache of extracted model records."""
+
+    def __init__(self, cache_dir: Path, key: str):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache file
+            key: Cache key from cache_key(); a mismatch discards all entries
+        """
+        self.cache_dir = cache_dir
+        self.key = key
+        self.entries: dict[str, CacheEntry] = {}
+        self._dirty = False
+
+    @property
+    def cache_file(self) -> Path:
+        """Get the path of the cache file."""
+        return self.cache_dir / CACHE_FILE_NAME
+
+    @classmethod
+    def load(cls, config: Config) -> "ScanCache":
+        """Load the scan cache for a project.
+
+        A missing, unreadable or outdated cache file yields an empty cache,
+        as does one that references any class other than the cache's own
+        record types.
+
+        Args:
+            config: Configuration object
+
+        Returns:
+            ScanCache instance
+        """
+        cache = cls(config.cache_dir, cache_key(config))
+        try:
+            payload: Any = restricted_loads(
+                cache.cache_file.read_bytes(), _CACHE_GLOBALS
+            )
+        except FileNotFoundError:
+            return cache
+        except Exception as e:
+            logger.debug("Ignoring unreadable scan cache %s: %s", cache.cache_file, e)
+            return cache
+
+        if (
+            isinstance(payload, dict)
+            and payload.get("format") == CACHE_FORMAT_VERSION
+            and payload.get("key") == cache.key
+            and isinstance(payload.get("entries"), dict)
+        ):
+            cache.entries = payload["entries"]
+        else:
+            logger.debug("Scan cache is outdated, starting fresh")
+        return cache
+
+    def get(self, path: str) -> Optional[CacheEntry]:
+        """Get the cache entry for a file, if any.
+
+        Args:
+            path: Schema file path as scanned
+
+        Returns:
+            CacheEntry or None
+        """
+        return self.entries.get(path)
+
+    def put(self, path: str, entry: CacheEntry) -> None:
+        """Store the scan result for a file.
+
+        Args:
+            path: Schema file path as scanned
+            entry: Entry to store
+        """
+        if self.entries.get(path) != entry:
+            self.entries[path] = entry
+            self._dirty = True
+
+    def prune(self, keep: set[str]) -> None:
+        """Drop entries for files that are no longer scanned.
+
+        Args:
+            keep: Paths that were part of the latest scan
+        """
+        stale = [path for path in self.entries if path not in keep]
+        for path in stale:
+            del self.entries[path]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed.
+
+        The file is written to a temporary name and renamed into place so
+        that concurrent runs never observe a half-written cache.
+        """
+        if not self._dirty:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            gitignore = self.cache_dir.parent / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("# Created by dbt-conceptual\n*\n")
+
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".scan-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        {
+                            "format": CACHE_FORMAT_VERSION,
+                            "key": self.key,
+                            "entries": self.entries,
+                        },
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(tmp_name, self.cache_file)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            # A read-only checkout must not break the scan itself
+            logger.warning("Could not write scan cache %s: %s", self.cache_file, e)
+            return
+
+        self._dirty = False
+
+
+def clear_cache(config: Config) -> bool:
+    """Delete the on-disk cache directory for a project.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        True if a cache directory was removed
+    """
+    if not config.cache_dir.exists():
+        return False
+    shutil.rmtree(config.cache_dir)
+    return True
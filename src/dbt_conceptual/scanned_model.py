@@ -0,0 +1,143 @@
+"""Compact record type for models found by the scanner.
+
+Projects with 100k models produce 100k records per scan, so the record is a
+``__slots__`` class rather than a dict: no per-instance ``__dict__``, path
+and tag strings interned so that every model in a file shares them, and
+missing ``meta``/``tags``/``databricks_tags`` pointing at shared immutable
+empty sentinels instead of fresh containers.
+
+For compatibility with code written against the old dict records, a
+ScannedModel is also a read-only Mapping over its field names
+(``model["name"]``, ``model.get("meta")``). Use ``to_dict()`` for JSON.
+"""
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, Optional
+
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+EMPTY_TAGS: tuple[Any, ...] = ()
+
+_FIELDS = ("name", "description", "meta", "path", "file", "tags", "databricks_tags")
+
+# Distinct tag combinations are few, so models share one tuple per combination
+_TAG_TUPLES: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def intern_tags(tags: Iterable[Any]) -> tuple[Any, ...]:
+    """Convert a tag list to an interned tuple.
+
+    Args:
+        tags: Tags as parsed (non-string entries are kept as they are)
+
+    Returns:
+        Tuple of tags, shared between equal all-string tag lists;
+        EMPTY_TAGS when there are none
+    """
+    interned = tuple(sys.intern(t) if type(t) is str else t for t in tags)
+    if not interned:
+        return EMPTY_TAGS
+    if all(type(t) is str for t in interned):
+        return _TAG_TUPLES.setdefault(interned, interned)
+    return interned
+
+
+class ScannedModel(Mapping[str, Any]):
+    """A dbt model found in a schema file (or manifest).
+
+    Attributes:
+        name: Model name
+        description: Model description, if any
+        meta: The model's meta mapping as parsed
+        path: Schema file path relative to the project (interned)
+        file: Schema file path as scanned (interned)
+        tags: Model tags (or config.tags)
+        databricks_tags: config.databricks_tags mapping
+    """
+
+    __slots__ = _FIELDS
+
+    name: str
+    description: Optional[str]
+    meta: Any
+    path: str
+    file: str
+    tags: tuple[Any, ...]
+    databricks_tags: Mapping[str, Any]
+
+    def __init__(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        meta: Any = EMPTY_MAPPING,
+        path: str = "",
+        file: str = "",
+        tags: Iterable[Any] = EMPTY_TAGS,
+        databricks_tags: Mapping[str, Any] = EMPTY_MAPPING,
+    ):
+        """Initialize the record.
+
+        Empty ``meta``/``databricks_tags`` dicts and empty tag lists are
+        replaced by the shared sentinels; strings are interned.
+        """
+        self.name = sys.intern(name) if type(name) is str else name
+        self.description = description
+        self.meta = EMPTY_MAPPING if type(meta) is dict and not meta else meta
+        self.path = sys.intern(path)
+        self.file = sys.intern(file)
+        self.tags = tags if type(tags) is tuple else intern_tags(tags)
+        self.databricks_tags = databricks_tags or EMPTY_MAPPING
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        # MappingProxyType sentinels can't be pickled; rebuilding through
+        # __init__ restores them and re-interns the strings on load
+        return (
+            ScannedModel,
+            (
+                self.name,
+                self.description,
+                dict(self.meta) if self.meta is EMPTY_MAPPING else self.meta,
+                self.path,
+                self.file,
+                self.tags,
+                dict(self.databricks_tags),
+            ),
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ScannedModel):
+            return all(getattr(self, f) == getattr(other, f) for f in _FIELDS)
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ScannedModel(name={self.name!r}, path={self.path!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain, JSON-serializable dict.
+
+        Returns:
+            Dict with the record fields (tags as a list)
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "meta": dict(self.meta) if self.meta is EMPTY_MAPPING else self.meta,
+            "path": self.path,
+            "file": self.file,
+            "tags": list(self.tags),
+            "databricks_tags": dict(self.databricks_tags),
+        }
@@ -5,15 +5,202 @@ v1.0: Only scans gold layer paths for models.
 
 import fnmatch
 import logging
+import os
+import re
+import sys
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-
-import yaml
+from typing import NamedTuple, Optional
 
 from dbt_conceptual.config import Config
+from dbt_conceptual.manifest import ManifestError, iter_manifest_models
+from dbt_conceptual.scan_cache import CacheEntry, ScanCache, content_digest
+from dbt_conceptual.scanned_model import EMPTY_MAPPING, EMPTY_TAGS, ScannedModel
+from dbt_conceptual.schema_yaml import load_schema_models
+from dbt_conceptual.walker import walk_schema_files
+from dbt_conceptual.yaml_io import YAMLError, load_yaml_file
 
 logger = logging.getLogger(__name__)
 
+# A block-style top-level "models:" key (optionally quoted, after a BOM)
+_MODELS_KEY_RE = re.compile(
+    rb"^(?:\xef\xbb\xbf)?[\"']?models[\"']?[ \t]*:", re.MULTILINE
+)
+# First character of the first line that is not blank, a comment or a directive
+_FIRST_CONTENT_RE = re.compile(
+    rb"\A(?:\xef\xbb\xbf)?(?:(?:[ \t]*(?:#.*)?|%.*|---[ \t]*)\r?\n)*(.)"
+)
+_MERGE_KEY_RE = re.compile(rb"^<<[ \t]*:", re.MULTILINE)
+
+# Parallel scans: files per process-pool task, and tasks in flight per worker
+_PROCESS_BATCH = 16
+_BATCHES_PER_WORKER = 4
+
+
+def _extract_models(
+    schema_data: dict, file_path: Path, project_dir: Path
+) -> list[ScannedModel]:
+    """Extract model records from parsed schema content.
+
+    Module-level so that process-pool workers can call it without
+    pickling a scanner instance.
+    """
+    models: list[ScannedModel] = []
+    if "models" not in schema_data:
+        return models
+
+    # Calculate relative path from project root
+    try:
+        rel_path = file_path.relative_to(project_dir)
+    except ValueError:
+        rel_path = file_path
+
+    # Shared by every model in the file
+    path = sys.intern(str(rel_path))
+    file = sys.intern(str(file_path))
+
+    for model in schema_data.get("models", []):
+        if not isinstance(model, dict):
+            continue
+
+        model_name = model.get("name")
+        if not model_name:
+            continue
+
+        meta = model.get("meta", EMPTY_MAPPING)
+        description = model.get("description")
+
+        # Extract tags for databricks support
+        config = model.get("config", EMPTY_MAPPING)
+        tags = model.get("tags") or config.get("tags", EMPTY_TAGS)
+        if not isinstance(tags, (list, tuple)):
+            tags = EMPTY_TAGS
+
+        # Extract databricks_tags for Unity Catalog format
+        databricks_tags = config.get("databricks_tags", EMPTY_MAPPING)
+        if not isinstance(databricks_tags, dict):
+            databricks_tags = EMPTY_MAPPING
+
+        models.append(
+            ScannedModel(
+                name=model_name,
+                description=description,
+                meta=meta,
+                path=path,
+                file=file,
+                tags=tags,
+                databricks_tags=databricks_tags,
+            )
+        )
+
+    return models
+
+
+def _may_declare_models(data: bytes) -> bool:
+    """Cheaply check whether schema file content can declare any models.
+
+    Files that are only ``sources:``, ``exposures:``, ``metrics:`` etc. are
+    rejected without a YAML parse. The check is conservative: any layout a
+    line-based look at the bytes cannot rule out (UTF-16/32 encodings,
+    flow-style or indented top-level mappings, merge keys) counts as a
+    possible ``models:`` file and gets parsed.
+
+    Args:
+        data: Raw file bytes
+
+    Returns:
+        False only if the file certainly has no top-level ``models`` key
+    """
+    if data[:2] in (b"\xff\xfe", b"\xfe\xff") or b"\x00" in data[:4]:
+        return True
+    if b"models" not in data:
+        return False
+    if _MODELS_KEY_RE.search(data) or _MERGE_KEY_RE.search(data):
+        return True
+    first = _FIRST_CONTENT_RE.match(data)
+    return first is not None and first.group(1) in b" \t{[&!?-"
+
+
+class _FileResult(NamedTuple):
+    """Outcome of scanning one schema file.
+
+    models is None when the content hash matched the caller's known digest,
+    meaning the cached records are still valid and nothing was parsed.
+    """
+
+    models: Optional[list[ScannedModel]]
+    digest: Optional[str]
+    error: Optional[str]
+    skipped: bool = False  # Rejected by the models pre-filter, not parsed
+
+
+def _scan_schema_file(
+    schema_file: Path, project_dir: Path, known_digest: Optional[str] = None
+) -> _FileResult:
+    """Parse one schema file and extract its models.
+
+    Errors are returned rather than raised so that a single bad file never
+    aborts a scan, and so workers in another process can report them back
+    to the parent for logging.
+
+    Args:
+        schema_file: Path to the schema file
+        project_dir: Project root for relative paths
+        known_digest: Content digest of a cached entry; parsing is skipped
+            if the file still hashes to it
+
+    Returns:
+        _FileResult with the models, content digest and error (if any)
+    """
+    try:
+        with open(schema_file, "rb") as f:
+            data = f.read()
+        digest = content_digest(data)
+        if digest == known_digest:
+            return _FileResult(None, digest, None)
+        if not _may_declare_models(data):
+            return _FileResult([], digest, None, skipped=True)
+        schema_data = load_schema_models(data) or {}
+        return _FileResult(
+            _extract_models(schema_data, schema_file, project_dir), digest, None
+        )
+    except YAMLError as e:
+        return _FileResult([], None, f"Failed to parse {schema_file}: {e}")
+    except Exception as e:
+        return _FileResult([], None, f"Error processing {schema_file}: {e}")
+
+
+def _scan_schema_batch(
+    schema_files: list[Path],
+    project_dir: Path,
+    known_digests: list[Optional[str]],
+) -> list[_FileResult]:
+    """Scan several schema files in one worker call (see _scan_schema_file)."""
+    return [
+        _scan_schema_file(schema_file, project_dir, known_digest)
+        for schema_file, known_digest in zip(schema_files, known_digests)
+    ]
+
+
+@dataclass
+class ScanStats:
+    """Counters describing the most recent scan."""
+
+    files: int = 0  # Unique schema files found
+    parsed: int = 0  # Files actually parsed
+    skipped: int = 0  # Files without a models key, never parsed
+    cache_hits: int = 0
+    cache_misses: int = 0
+
 
 class DbtProjectScanner:
     """Scans a dbt project for model files in gold layer paths."""
@@ -25,29 +212,22 @@ class DbtProjectScanner:
             config: Configuration object
         """
         self.config = config
+        self.stats = ScanStats()
 
     def find_schema_files(self) -> Iterator[Path]:
         """Find all schema.yml files matching gold layer paths.
 
+        The project is walked once for all patterns, skipping the
+        directories in ``config.scan_exclude`` (see dbt_conceptual.walker).
+
         Yields:
-            Path objects for each found schema YAML file
+            Path objects for each found schema YAML file, without duplicates
         """
-        project_dir = self.config.project_dir
-
-        for pattern in self.config.gold_paths:
-            # Handle glob patterns
-            if "*" in pattern:
-                # Use glob to find matching files
-                yield from project_dir.glob(pattern)
-            else:
-                # Direct path
-                full_path = project_dir / pattern
-                if full_path.is_file():
-                    yield full_path
-                elif full_path.is_dir():
-                    # Find all .yml and .yaml files in directory
-                    yield from full_path.rglob("*.yml")
-                    yield from full_path.rglob("*.yaml")
+        yield from walk_schema_files(
+            self.config.project_dir,
+            self.config.gold_paths,
+            exclude=self.config.scan_exclude,
+        )
 
     def load_schema_file(self, schema_file: Path) -> dict:
         """Load and parse a schema YAML file.
@@ -58,13 +238,11 @@ class DbtProjectScanner:
         Returns:
             Parsed YAML content as a dictionary
         """
-        with open(schema_file) as f:
-            content = yaml.safe_load(f)
-            return content or {}
+        return load_yaml_file(schema_file) or {}
 
     def extract_models_from_schema(
         self, schema_data: dict, file_path: Path
-    ) -> list[dict]:
+    ) -> list[ScannedModel]:
         """Extract model definitions from a parsed schema file.
 
         Args:
@@ -72,80 +250,256 @@ class DbtProjectScanner:
             file_path: Path to the schema file (for computing relative paths)
 
         Returns:
-            List of model dictionaries with name, meta, and path information
+            List of ScannedModel records with name, meta, and path information
         """
-        models: list[dict] = []
-        if "models" not in schema_data:
-            return models
+        return _extract_models(schema_data, file_path, self.config.project_dir)
 
-        # Calculate relative path from project root
-        try:
-            rel_path = file_path.relative_to(self.config.project_dir)
-        except ValueError:
-            rel_path = file_path
-
-        for model in schema_data.get("models", []):
-            if not isinstance(model, dict):
-                continue
-
-            model_name = model.get("name")
-            if not model_name:
-                continue
-
-            meta = model.get("meta", {})
-            description = model.get("description")
-
-            # Extract tags for databricks support
-            config = model.get("config", {})
-            tags = model.get("tags", []) or config.get("tags", [])
-            if not isinstance(tags, list):
-                tags = []
-
-            # Extract databricks_tags for Unity Catalog format
-            databricks_tags = config.get("databricks_tags", {})
-            if not isinstance(databricks_tags, dict):
-                databricks_tags = {}
-
-            models.append(
-                {
-                    "name": model_name,
-                    "description": description,
-                    "meta": meta,
-                    "path": str(rel_path),
-                    "file": str(file_path),
-                    "tags": tags,
-                    "databricks_tags": databricks_tags,
-                }
-            )
+    def unique_schema_files(self) -> list[Path]:
+        """List schema files in discovery order, without duplicates.
 
-        return models
+        Glob patterns may overlap and symlinks may point at the same file;
+        the walker deduplicates on (st_dev, st_ino), keeping the first path.
+
+        Returns:
+            Ordered list of schema file paths
+        """
+        return list(self.find_schema_files())
 
-    def scan(self) -> list[dict]:
+    def scan(self) -> list[ScannedModel]:
         """Scan the dbt project for models in gold layer paths.
 
+        Collects iter_models() into a list; see there for how files are
+        read.
+
         Returns:
             List of all models found with their metadata
         """
-        all_models = []
-        seen_files: set[Path] = set()
-
-        for schema_file in self.find_schema_files():
-            # Avoid processing the same file twice (glob patterns may overlap)
-            resolved = schema_file.resolve()
-            if resolved in seen_files:
-                continue
-            seen_files.add(resolved)
-
-            try:
-                schema_data = self.load_schema_file(schema_file)
-                models = self.extract_models_from_schema(schema_data, schema_file)
-                all_models.extend(models)
-            except yaml.YAMLError as e:
-                logger.warning("Failed to parse %s: %s", schema_file, e)
-            except Exception as e:
-                logger.warning("Error processing %s: %s", schema_file, e)
-
-        return all_models
+        return list(self.iter_models())
+
+    def iter_models(self) -> Iterator[ScannedModel]:
+        """Yield the models in gold layer paths, file by file.
+
+        Unchanged files are served from the persistent scan cache (unless
+        ``config.scan_cache`` is off). The remaining files are parsed
+        serially, or on a thread (or process) pool when ``config.scan_jobs``
+        asks for more than one worker. Either way the models come back in
+        file discovery order, so the result is identical to a serial scan.
+
+        Files are parsed lazily: a serial scan holds one file's content at a
+        time, and a parallel scan keeps at most a few files per worker in
+        flight ahead of the consumer. A file that fails to parse is logged
+        and contributes no models. Scan statistics and the cache are
+        finalised once the generator is exhausted.
+
+        Yields:
+            ScannedModel records in discovery order
+        """
+        for _source, models in self.iter_file_models():
+            yield from models
+
+    def iter_file_models(self) -> Iterator[tuple[Path, list[ScannedModel]]]:
+        """Yield the models of each unique schema file in discovery order.
+
+        Same scan as iter_models(), grouped by source file. In manifest
+        mode the source of every model is the manifest file.
+
+        Yields:
+            (schema file, models declared in it) pairs
+        """
+        if self.config.scan_source == "manifest":
+            if self.config.manifest_file.is_file():
+                yield from self._scan_manifest()
+                return
+            logger.warning(
+                "Manifest %s not found, falling back to scanning schema files",
+                self.config.manifest_file,
+            )
+
+        stats = self.stats = ScanStats()
+        cache = ScanCache.load(self.config) if self.config.scan_cache else None
+        project_dir = self.config.project_dir
+        schema_files = self.unique_schema_files()
+        stats.files = len(schema_files)
+
+        # Look every file up in the cache first; only misses are parsed
+        lookups: list[tuple[Path, Optional[os.stat_result], Optional[CacheEntry]]]
+        lookups = []
+        misses: list[Path] = []
+        known_digests: list[Optional[str]] = []
+        for schema_file in schema_files:
+            st, entry = self._cache_lookup(cache, schema_file)
+            if cache is not None and st is not None and entry is not None:
+                if entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                    stats.cache_hits += 1
+                    lookups.append((schema_file, None, entry))
+                    continue
+            lookups.append((schema_file, st, entry))
+            misses.append(schema_file)
+            known_digests.append(entry.digest if entry is not None else None)
+
+        jobs = self._effective_jobs(len(misses))
+        executor = self._make_executor(jobs) if jobs > 1 else None
+        try:
+            if executor is None:
+                results: Iterator[_FileResult] = map(
+                    _scan_schema_file, misses, repeat(project_dir), known_digests
+                )
+            else:
+                results = self._parallel_results(executor, jobs, misses, known_digests)
+
+            for schema_file, st, entry in lookups:
+                if st is None and entry is not None:
+                    yield schema_file, entry.models  # Cache hit on stat alone
+                    continue
+                yield schema_file, self._resolve(
+                    cache, schema_file, st, entry, next(results)
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        if cache is not None:
+            cache.prune({str(schema_file) for schema_file in schema_files})
+            cache.save()
+            logger.info(
+                "Scanned %d schema files: %d cache hits, %d misses, %d skipped",
+                stats.files,
+                stats.cache_hits,
+                stats.cache_misses,
+                stats.skipped,
+            )
+
+    def _parallel_results(
+        self,
+        executor: Executor,
+        jobs: int,
+        misses: list[Path],
+        known_digests: list[Optional[str]],
+    ) -> Iterator[_FileResult]:
+        """Parse files on the pool, yielding results in submission order.
+
+        Only a bounded window of batches is submitted ahead of the consumer,
+        so results don't pile up in memory when the consumer is slower than
+        the workers. Process workers get batches of files to amortise the
+        pickling round trip.
+        """
+        batch_size = 1 if self.config.scan_executor == "thread" else _PROCESS_BATCH
+        window: deque[Future[list[_FileResult]]] = deque()
+        project_dir = self.config.project_dir
+
+        for start in range(0, len(misses), batch_size):
+            window.append(
+                executor.submit(
+                    _scan_schema_batch,
+                    misses[start : start + batch_size],
+                    project_dir,
+                    known_digests[start : start + batch_size],
+                )
+            )
+            if len(window) >= jobs * _BATCHES_PER_WORKER:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
+
+    def scan_file(self, schema_file: Path) -> list[ScannedModel]:
+        """Parse a single schema file, bypassing the scan cache.
+
+        Args:
+            schema_file: Path to the schema file
+
+        Returns:
+            Models declared in the file (empty if it can't be read or parsed,
+            which is logged)
+        """
+        result = _scan_schema_file(schema_file, self.config.project_dir)
+        if result.error is not None:
+            logger.warning("%s", result.error)
+        return result.models or []
+
+    def _scan_manifest(self) -> Iterator[tuple[Path, list[ScannedModel]]]:
+        """Yield gold models from dbt's manifest.json, one node at a time."""
+        self.stats = ScanStats(files=1, parsed=1)
+        try:
+            for model in iter_manifest_models(
+                self.config.manifest_file,
+                self.config.project_dir,
+                self._matches_gold_paths,
+                project_name=self._dbt_project_name(),
+            ):
+                yield self.config.manifest_file, [model]
+        except (ManifestError, OSError) as e:
+            logger.warning("Failed to read %s: %s", self.config.manifest_file, e)
+
+    def _dbt_project_name(self) -> Optional[str]:
+        """Get the root project name from dbt_project.yml, if readable."""
+        dbt_project = self.config.project_dir / "dbt_project.yml"
+        try:
+            data = load_yaml_file(dbt_project) or {}
+        except (OSError, YAMLError):
+            return None
+        name = data.get("name") if isinstance(data, dict) else None
+        return str(name) if name else None
+
+    @staticmethod
+    def _cache_lookup(
+        cache: Optional[ScanCache], schema_file: Path
+    ) -> tuple[Optional[os.stat_result], Optional[CacheEntry]]:
+        """Stat a schema file and fetch its cache entry (if caching)."""
+        if cache is None:
+            return None, None
+        try:
+            st = os.stat(schema_file)
+        except OSError:
+            return None, None
+        return st, cache.get(str(schema_file))
+
+    def _resolve(
+        self,
+        cache: Optional[ScanCache],
+        schema_file: Path,
+        st: Optional[os.stat_result],
+        entry: Optional[CacheEntry],
+        result: _FileResult,
+    ) -> list[ScannedModel]:
+        """Turn a worker result into models, updating cache and stats."""
+        if result.error is not None:
+            logger.warning("%s", result.error)
+
+        if result.models is None and entry is not None:
+            # Touched but unchanged: refresh the stat fields only
+            self.stats.cache_hits += 1
+            if cache is not None and st is not None:
+                cache.put(str(schema_file), entry._replace(mtime_ns=st.st_mtime_ns))
+            return entry.models
+
+        models = result.models or []
+        if result.skipped:
+            self.stats.skipped += 1
+        else:
+            self.stats.parsed += 1
+        if cache is not None:
+            self.stats.cache_misses += 1
+            if st is not None and result.digest is not None:
+                cache.put(
+                    str(schema_file),
+                    CacheEntry(st.st_mtime_ns, st.st_size, result.digest, models),
+                )
+        return models
+
+    def _effective_jobs(self, file_count: int) -> int:
+        """Resolve the configured worker count for a scan of file_count files."""
+        jobs = self.config.scan_jobs
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        return max(1, min(jobs, file_count))
+
+    def _make_executor(self, jobs: int) -> Executor:
+        """Create the pool used for parallel scans."""
+        if self.config.scan_executor == "process":
+            return ProcessPoolExecutor(max_workers=jobs)
+        return ThreadPoolExecutor(
+            max_workers=jobs, thread_name_prefix="dbt-conceptual-scan"
+        )
 
     def _matches_gold_paths(self, path: str) -> bool:
         """Check if a path matches any gold layer pattern.
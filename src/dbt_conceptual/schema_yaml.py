@@ -0,0 +1,230 @@
+"""Partial loading of dbt schema YAML.
+
+The scanner only reads a handful of fields per model (``name``,
+``description``, ``meta``, ``tags`` and ``config``), while most of the
+bytes in a schema file are ``columns``, ``tests`` and docs. Loading the
+whole document builds a Python object for every one of those.
+
+``load_schema_models`` drives the YAML event stream directly: it composes
+nodes only for ``models[*]`` and the fields above, consumes the events of
+every other subtree without building anything, then runs the regular safe
+constructor over the pruned node tree. Values therefore come out exactly as
+``load_yaml`` would produce them. Documents that the pruning cannot handle
+faithfully (an alias into a skipped subtree, a non-standard tag, a
+top-level merge key, ...) fall back to a full load.
+"""
+
+from typing import Any, Union
+
+from yaml.events import (
+    AliasEvent,
+    CollectionStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from dbt_conceptual.yaml_io import SafeLoader, load_yaml
+
+# Model fields read by the scanner; every other key's value is skipped
+MODEL_FIELDS = frozenset({"name", "description", "meta", "tags", "config"})
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class _Unsupported(Exception):
+    """The document needs a full load to be read faithfully."""
+
+
+class _PruningComposer:
+    """Composes the node tree of a schema document minus unread subtrees.
+
+    Mirrors yaml.composer.Composer, but over an existing loader's event
+    API so that the libyaml parser is used when available.
+    """
+
+    def __init__(self, loader: Any):
+        self.loader = loader
+        self.anchors: dict[str, Node] = {}
+        self.skipped_anchors: set[str] = set()
+
+    def compose_document(self) -> Union[Node, None]:
+        """Compose the pruned root node (None for an empty stream)."""
+        loader = self.loader
+        loader.get_event()  # StreamStart
+        if loader.check_event(StreamEndEvent):
+            return None
+        loader.get_event()  # DocumentStart
+
+        if not loader.check_event(MappingStartEvent):
+            raise _Unsupported
+        root = self._compose_mapping(self._compose_models_key_value)
+
+        loader.get_event()  # DocumentEnd
+        if not loader.check_event(StreamEndEvent):
+            raise _Unsupported  # Multiple documents: let load_yaml raise
+        return root
+
+    def _compose_models_key_value(self, key: Node) -> Union[Node, None]:
+        """Top level: keep only ``models``."""
+        if not isinstance(key, ScalarNode):
+            return None
+        if key.tag == _MERGE_TAG:
+            raise _Unsupported
+        if key.tag != _STR_TAG or key.value != "models":
+            return None
+        if not self.loader.check_event(SequenceStartEvent):
+            raise _Unsupported
+        return self._compose_models()
+
+    def _compose_models(self) -> Node:
+        """Compose the models sequence, pruning each model mapping."""
+        loader = self.loader
+        node = self._start_collection(SequenceNode)
+        while not loader.check_event(SequenceEndEvent):
+            if loader.check_event(MappingStartEvent):
+                node.value.append(self._compose_mapping(self._model_field_value))
+            else:
+                node.value.append(self._compose_node())
+        node.end_mark = loader.get_event().end_mark
+        return node
+
+    def _model_field_value(self, key: Node) -> Union[Node, None]:
+        """Model level: keep the fields the scanner reads, and merge keys."""
+        if isinstance(key, ScalarNode) and (
+            key.tag == _MERGE_TAG or (key.tag == _STR_TAG and key.value in MODEL_FIELDS)
+        ):
+            return self._compose_node()
+        return None
+
+    def _compose_mapping(self, compose_value: Any) -> Node:
+        """Compose a mapping, keeping the pairs compose_value returns a node for.
+
+        compose_value receives each key node and either composes the value
+        or returns None, in which case the value is skipped.
+        """
+        loader = self.loader
+        node = self._start_collection(MappingNode)
+        while not loader.check_event(MappingEndEvent):
+            key = self._compose_node()
+            if not isinstance(key, ScalarNode):
+                raise _Unsupported  # Complex keys: let the constructor decide
+            value = compose_value(key)
+            if value is None:
+                self._skip_node()
+            else:
+                node.value.append((key, value))
+        node.end_mark = loader.get_event().end_mark
+        return node
+
+    def _start_collection(self, node_class: Any) -> Node:
+        event = self.loader.get_event()
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = self.loader.resolve(node_class, None, event.implicit)
+        node: Node = node_class(
+            tag, [], event.start_mark, None, flow_style=event.flow_style
+        )
+        self._register(event.anchor, node)
+        return node
+
+    def _register(self, anchor: Union[str, None], node: Node) -> None:
+        if anchor is not None:
+            self._check_anchor(anchor)
+            self.anchors[anchor] = node
+
+    def _check_anchor(self, anchor: str) -> None:
+        if anchor in self.anchors or anchor in self.skipped_anchors:
+            raise _Unsupported  # Duplicate anchor: let load_yaml raise
+
+    def _compose_node(self) -> Node:
+        """Compose a complete subtree (same as Composer.compose_node)."""
+        loader = self.loader
+        if loader.check_event(AliasEvent):
+            anchor = loader.get_event().anchor
+            if anchor not in self.anchors:
+                raise _Unsupported  # Undefined, or defined in a skipped subtree
+            return self.anchors[anchor]
+
+        if loader.check_event(ScalarEvent):
+            event = loader.get_event()
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = loader.resolve(ScalarNode, event.value, event.implicit)
+            scalar = ScalarNode(
+                tag, event.value, event.start_mark, event.end_mark, style=event.style
+            )
+            self._register(event.anchor, scalar)
+            return scalar
+
+        is_sequence = loader.check_event(SequenceStartEvent)
+        node = self._start_collection(SequenceNode if is_sequence else MappingNode)
+        end_event = SequenceEndEvent if is_sequence else MappingEndEvent
+        while not loader.check_event(end_event):
+            if is_sequence:
+                node.value.append(self._compose_node())
+            else:
+                key = self._compose_node()
+                node.value.append((key, self._compose_node()))
+        node.end_mark = loader.get_event().end_mark
+        return node
+
+    def _skip_node(self) -> None:
+        """Consume the events of one subtree without building nodes."""
+        get_event = self.loader.get_event
+        depth = 0
+        while True:
+            event = get_event()
+            tag = getattr(event, "tag", None)
+            if (
+                tag is not None
+                and tag != "!"
+                and tag not in SafeLoader.yaml_constructors
+            ):
+                # A full load would reject the tag, even a standard one
+                # like !!python/object that only the unsafe loader knows
+                raise _Unsupported
+            if isinstance(event, (ScalarEvent, CollectionStartEvent)):
+                # Aliases to skipped anchors are caught in _compose_node
+                if event.anchor is not None:
+                    self._check_anchor(event.anchor)
+                    self.skipped_anchors.add(event.anchor)
+                if isinstance(event, CollectionStartEvent):
+                    depth += 1
+            elif isinstance(event, (SequenceEndEvent, MappingEndEvent)):
+                depth -= 1
+            if depth == 0:
+                return
+
+
+def load_schema_models(data: Union[str, bytes]) -> Any:
+    """Load the parts of a schema YAML document the scanner reads.
+
+    Args:
+        data: YAML text or bytes
+
+    Returns:
+        ``{"models": [...]}`` with each model mapping reduced to
+        MODEL_FIELDS (``{}`` when there is no models key, None for an
+        empty document), or the full document when it had to be loaded
+        in full
+
+    Raises:
+        YAMLError: If the document is not valid YAML
+    """
+    loader = SafeLoader(data)
+    try:
+        root = _PruningComposer(loader).compose_document()
+        if root is None:
+            return None
+        return loader.construct_document(root)
+    except _Unsupported:
+        pass
+    finally:
+        loader.dispose()
+    return load_yaml(data)
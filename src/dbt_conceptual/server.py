@@ -4,17 +4,44 @@ v1.0: Simplified API with flat models[], no realized_by.
 """
 
 import json
+import pickle
+import queue
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Callable, Optional, Union
 
-import yaml
 from flask import Flask, Response, jsonify, request, send_from_directory
 
-from dbt_conceptual.config import Config
+from dbt_conceptual.config import SERVER_THREADS, Config
+from dbt_conceptual.edits import EditError, Operation
+from dbt_conceptual.events import ChangeFeed, StateChange, format_event
 from dbt_conceptual.exporter.bus_matrix import export_bus_matrix
 from dbt_conceptual.exporter.coverage import export_coverage
+from dbt_conceptual.fragments import load_model, save_sections
 from dbt_conceptual.parser import StateBuilder
-from dbt_conceptual.scanner import DbtProjectScanner
+from dbt_conceptual.state import (
+    ConceptState,
+    DomainState,
+    ProjectState,
+    RelationshipState,
+    ValidationState,
+)
+from dbt_conceptual.state_cache import (
+    NO_LAYOUT,
+    EditResult,
+    StaleVersionError,
+    StateCache,
+)
+from dbt_conceptual.yaml_io import load_yaml_document
+from dbt_conceptual.yaml_patch import write_yaml_file
+
+# Read endpoints may be stored by the browser, but only reused after
+# revalidating their ETag
+CACHE_CONTROL = "no-cache"
+
+# Seconds between comments keeping an idle /api/events stream open; a
+# closed tab is noticed (and its worker thread freed) on the next write
+KEEPALIVE_INTERVAL = 15.0
 
 
 def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
@@ -43,13 +70,27 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     def after_request(response: Response) -> Response:
         if app.debug:
             response.headers.add("Access-Control-Allow-Origin", "*")
-            response.headers.add("Access-Control-Allow-Headers", "Content-Type")
-            response.headers.add("Access-Control-Allow-Methods", "GET,POST,OPTIONS")
+            response.headers.add(
+                "Access-Control-Allow-Headers", "Content-Type, If-Match, If-None-Match"
+            )
+            response.headers.add("Access-Control-Expose-Headers", "ETag")
+            response.headers.add(
+                "Access-Control-Allow-Methods", "GET,POST,PUT,PATCH,DELETE,OPTIONS"
+            )
         return response
 
     # Load config
     config = Config.load(project_dir=project_dir)
 
+    # One state per process, shared by all requests and rebuilt only when
+    # conceptual.yml, a fragment or a schema file changes
+    cache = StateCache(config)
+    app.config["STATE_CACHE"] = cache
+
+    # One polling thread serves the event streams of all open tabs
+    feed = ChangeFeed(cache, _change_event)
+    app.config["CHANGE_FEED"] = feed
+
     @app.route("/")
     def index() -> Union[str, Response]:
         """Serve the main UI page."""
@@ -83,73 +124,14 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     def get_state() -> Any:
         """Get current conceptual model state as JSON."""
         try:
-            builder = StateBuilder(config)
-            state = builder.build()
-
-            # Check for integrity issues (relationships referencing missing concepts)
-            missing_refs = []
-            for _rel_id, rel in state.relationships.items():
-                if rel.from_concept not in state.concepts:
-                    missing_refs.append(rel.from_concept)
-                if rel.to_concept not in state.concepts:
-                    missing_refs.append(rel.to_concept)
-            has_integrity_errors = len(missing_refs) > 0
-
-            # Load positions from conceptual_layout.json
-            layout_file = config.layout_file
-            positions = {}
-            if layout_file.exists():
-                with open(layout_file) as f:
-                    layout_data = json.load(f) or {}
-                    positions = layout_data.get("positions", {})
-
-            # Convert state to JSON-serializable format (v1.0 simplified)
-            response = {
-                "domains": {
-                    domain_id: {
-                        "name": domain.name,
-                        "display_name": domain.display_name,
-                        "color": domain.color,
-                    }
-                    for domain_id, domain in state.domains.items()
-                },
-                "concepts": {
-                    concept_id: {
-                        "name": concept.name,
-                        "definition": concept.definition,
-                        "domain": concept.domain,
-                        "owner": concept.owner,
-                        "status": concept.status,  # Derived at runtime
-                        "color": concept.color,
-                        "models": concept.models,  # Flat list
-                        # Validation fields
-                        "isGhost": concept.is_ghost,
-                        "validationStatus": concept.validation_status,
-                        "validationMessages": concept.validation_messages,
-                    }
-                    for concept_id, concept in state.concepts.items()
-                },
-                "relationships": {
-                    rel_id: {
-                        "name": rel.name,  # Derived
-                        "verb": rel.verb,
-                        "from_concept": rel.from_concept,
-                        "to_concept": rel.to_concept,
-                        "cardinality": rel.cardinality,
-                        "owner": rel.owner,
-                        "definition": rel.definition,
-                        "status": rel.get_status(state.concepts),  # Derived
-                        # Validation fields
-                        "validationStatus": rel.validation_status,
-                        "validationMessages": rel.validation_messages,
-                    }
-                    for rel_id, rel in state.relationships.items()
-                },
-                "positions": positions,  # React Flow node positions
-                "hasIntegrityErrors": has_integrity_errors,
-            }
-
-            return jsonify(response)
+            layout = cache.layout()
+            with cache.read() as state:
+                return _conditional(
+                    f"{cache.version}-{layout.digest}",
+                    lambda: jsonify(
+                        _state_response(state, layout.positions, cache.version)
+                    ),
+                )
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -166,23 +148,12 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             if not conceptual_file.exists():
                 return jsonify({"error": "conceptual.yml not found"}), 404
 
-            # Read existing file to preserve config section
-            with open(conceptual_file) as f:
-                existing_data = yaml.safe_load(f) or {}
-
-            # Start with config section preserved
             yaml_data: dict[str, Any] = {}
-            if "config" in existing_data:
-                yaml_data["config"] = existing_data["config"]
 
             # Domains
             if data.get("domains"):
                 yaml_data["domains"] = {
-                    domain_id: {
-                        k: v
-                        for k, v in domain.items()
-                        if v is not None and k not in ("display_name",)
-                    }
+                    domain_id: _domain_entry(domain)
                     for domain_id, domain in data["domains"].items()
                 }
 
@@ -193,69 +164,140 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
                     # Skip ghost concepts that haven't been properly defined
                     if concept.get("isGhost") and not concept.get("domain"):
                         continue
-                    # Only save fields that belong in YAML (not derived fields)
-                    concept_dict = {
-                        k: v
-                        for k, v in concept.items()
-                        if v is not None
-                        and k
-                        not in (
-                            "status",  # Derived
-                            "models",  # Derived from meta.concept
-                            "isGhost",  # Validation field
-                            "validationStatus",  # Validation field
-                            "validationMessages",  # Validation field
-                        )
-                    }
-                    yaml_data["concepts"][concept_id] = concept_dict
+                    yaml_data["concepts"][concept_id] = _concept_entry(concept)
 
             # Relationships
             if data.get("relationships"):
-                yaml_data["relationships"] = []
-                for rel in data["relationships"].values():
-                    rel_dict = {}
-                    for k, v in rel.items():
-                        if v is None:
-                            continue
-                        # Skip derived and validation fields
-                        if k in (
-                            "name",
-                            "status",
-                            "validationStatus",
-                            "validationMessages",
-                        ):
-                            continue
-                        # Map API field names to YAML field names
-                        if k == "from_concept":
-                            rel_dict["from"] = v
-                        elif k == "to_concept":
-                            rel_dict["to"] = v
-                        else:
-                            rel_dict[k] = v
-                    yaml_data["relationships"].append(rel_dict)
+                yaml_data["relationships"] = [
+                    _relationship_entry(rel) for rel in data["relationships"].values()
+                ]
+
+            # Rewrite only the files (conceptual.yml or fragments) that changed;
+            # other top-level keys such as config are kept
+            written = save_sections(
+                config,
+                domains=yaml_data.get("domains", {}),
+                concepts=yaml_data.get("concepts", {}),
+                relationships=yaml_data.get("relationships", []),
+            )
+            cache.invalidate()
 
-            # Write to file
-            with open(conceptual_file, "w") as f:
-                yaml.dump(yaml_data, f, sort_keys=False, default_flow_style=False)
+            return jsonify(
+                {
+                    "success": True,
+                    "message": "Saved to conceptual.yml",
+                    "files": [
+                        str(path.relative_to(config.project_dir)) for path in written
+                    ],
+                }
+            )
 
-            return jsonify({"success": True, "message": "Saved to conceptual.yml"})
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
 
+    def apply_edit(operations: list[Operation], base_version: Optional[str]) -> Any:
+        """Apply operations through the state cache and respond with a delta."""
+        try:
+            result = cache.edit(operations, base_version)
+        except EditError as e:
+            return jsonify({"error": str(e)}), 400
+        except StaleVersionError as e:
+            return jsonify({"error": str(e), "version": e.version}), 409
+        with cache.read() as state:
+            return jsonify(_delta_response(state, result, config))
+
+    @app.route("/api/state", methods=["PATCH"])
+    def patch_state() -> Any:
+        """Apply upserts and deletes of individual elements.
+
+        The body holds ``operations`` and the ``baseVersion`` (the
+        ``version`` of GET /api/state) they were made against. Only the
+        affected YAML entries are rewritten, and the response lists just
+        the elements that changed.
+        """
+        try:
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                return jsonify({"error": "No data provided"}), 400
+            try:
+                operations = _operations(data.get("operations"))
+            except EditError as e:
+                return jsonify({"error": str(e)}), 400
+            return apply_edit(operations, data.get("baseVersion"))
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @app.route(
+        "/api/<any(domains, concepts, relationships):section>/<path:element_id>",
+        methods=["PUT", "DELETE"],
+    )
+    def edit_element(section: str, element_id: str) -> Any:
+        """Upsert (PUT) or delete (DELETE) one domain, concept or relationship.
+
+        An ``If-Match`` header with the state version makes the edit fail
+        with 409 if the model changed since.
+        """
+        try:
+            operation = {"op": "delete", "type": section[:-1], "id": element_id}
+            if request.method == "PUT":
+                data = request.get_json(silent=True)
+                if not data:
+                    return jsonify({"error": "No data provided"}), 400
+                operation.update(op="upsert", data=data)
+            try:
+                operations = _operations([operation])
+            except EditError as e:
+                return jsonify({"error": str(e)}), 400
+            base_version = next(iter(request.if_match), None)
+            return apply_edit(operations, base_version)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    @app.route("/api/events", methods=["GET"])
+    def stream_events() -> Response:
+        """Stream changes to the model as server-sent events.
+
+        A ``ready`` event carries the current state version. Each change
+        to the files on disk, or made through the API, then sends one
+        ``change`` event with the new version, the changed domains,
+        concepts (including their models) and relationships, the models
+        that became or stopped being orphans and, if they changed, the
+        validation issue counts.
+        """
+        subscription = feed.subscribe()
+
+        def stream() -> Iterator[str]:
+            try:
+                yield format_event("ready", {"version": feed.version}, feed.version)
+                while True:
+                    try:
+                        yield subscription.get(timeout=KEEPALIVE_INTERVAL)
+                    except queue.Empty:
+                        yield ": keepalive\n\n"
+            finally:
+                feed.unsubscribe(subscription)
+
+        return Response(
+            stream(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @app.route("/api/coverage", methods=["GET"])
     def get_coverage() -> Any:
         """Get coverage report as HTML."""
         try:
             from io import StringIO
 
-            builder = StateBuilder(config)
-            state = builder.build()
-
-            output = StringIO()
-            export_coverage(state, output)
+            def render(state: ProjectState) -> str:
+                output = StringIO()
+                export_coverage(state, output)
+                return output.getvalue()
 
-            return output.getvalue(), 200, {"Content-Type": "text/html"}
+            version, html = cache.versioned("coverage", render)
+            return _conditional(
+                version, lambda: Response(html, 200, {"Content-Type": "text/html"})
+            )
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -265,13 +307,15 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
         try:
             from io import StringIO
 
-            builder = StateBuilder(config)
-            state = builder.build()
-
-            output = StringIO()
-            export_bus_matrix(state, output)
+            def render(state: ProjectState) -> str:
+                output = StringIO()
+                export_bus_matrix(state, output)
+                return output.getvalue()
 
-            return output.getvalue(), 200, {"Content-Type": "text/html"}
+            version, html = cache.versioned("bus-matrix", render)
+            return _conditional(
+                version, lambda: Response(html, 200, {"Content-Type": "text/html"})
+            )
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -279,14 +323,11 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     def get_layout() -> Any:
         """Get layout positions from conceptual_layout.json."""
         try:
-            layout_file = config.layout_file
-            if not layout_file.exists():
+            layout = cache.layout()
+            if layout.digest == NO_LAYOUT:
                 return jsonify({"positions": {}})
 
-            with open(layout_file) as f:
-                layout_data = json.load(f) or {}
-
-            return jsonify(layout_data.get("positions", {}))
+            return _conditional(layout.digest, lambda: jsonify(layout.positions))
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -306,6 +347,7 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             # Write to file
             with open(layout_file, "w") as f:
                 json.dump(layout_data, f, indent=2)
+            cache.invalidate_layout()
 
             return jsonify({"success": True, "message": "Layout saved"})
         except Exception as e:
@@ -315,9 +357,12 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
     def get_models() -> Any:
         """Get available dbt models from gold layer."""
         try:
-            scanner = DbtProjectScanner(config)
-            models = scanner.scan()
-            return jsonify(models)
+            # From the models the cached state was built from: no rescan
+            version, models = cache.versioned(
+                "models",
+                lambda _state: [m.to_dict() for m in cache.scanned_models()],
+            )
+            return _conditional(version, lambda: jsonify(models))
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -330,20 +375,16 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
         runs validation, and returns messages.
         """
         try:
-            # Rebuild state from current dbt project
-            builder = StateBuilder(config)
-            state = builder.build()
 
-            # Run validation and create ghosts
-            validation = builder.validate_and_sync(state)
+            def synced(state: ProjectState) -> tuple[ProjectState, ValidationState]:
+                # Ghosts and validation results go on a private copy, so
+                # GET /api/state keeps serving the state as built
+                copy = pickle.loads(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+                return copy, StateBuilder(config).validate_and_sync(copy)
 
-            # Load positions from conceptual_layout.json
-            layout_file = config.layout_file
-            positions: dict[str, Any] = {}
-            if layout_file.exists():
-                with open(layout_file) as f:
-                    layout_data = json.load(f) or {}
-                    positions = layout_data.get("positions", {})
+            # The synced state is only recomputed when the project changed
+            state, validation = cache.derived("sync", synced)
+            positions = cache.positions()
 
             # Identify ghost concepts
             ghost_concepts = [cid for cid, c in state.concepts.items() if c.is_ghost]
@@ -426,12 +467,11 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             domains_data: dict[str, Any] = {}
 
             if conceptual_file.exists():
-                with open(conceptual_file) as f:
-                    data = yaml.safe_load(f) or {}
-                    if "config" in data:
-                        config_data = data["config"]
-                    if "domains" in data:
-                        domains_data = data["domains"]
+                data = load_yaml_document(conceptual_file) or {}
+                if "config" in data:
+                    config_data = data["config"]
+                # Domains may also be defined in fragment files
+                domains_data = load_model(config).data.get("domains", {})
 
             return jsonify(
                 {
@@ -455,13 +495,12 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             if not conceptual_file.exists():
                 return jsonify({"error": "conceptual.yml not found"}), 404
 
-            # Read existing file
-            with open(conceptual_file) as f:
-                conceptual_data = yaml.safe_load(f) or {}
-
-            # Update domains
+            # Update domains in whichever files define them
             if "domains" in data:
-                conceptual_data["domains"] = data["domains"]
+                save_sections(config, domains=data["domains"])
+
+            # Read existing file
+            conceptual_data = load_yaml_document(conceptual_file, copy=True) or {}
 
             # Update config section
             if "config" not in conceptual_data:
@@ -474,13 +513,8 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
                 conceptual_data["config"]["validation"] = data["validation"]
 
             # Write back
-            with open(conceptual_file, "w") as f:
-                yaml.dump(
-                    conceptual_data,
-                    f,
-                    sort_keys=False,
-                    default_flow_style=False,
-                )
+            write_yaml_file(conceptual_file, conceptual_data)
+            cache.invalidate()
 
             return jsonify({"success": True, "message": "Settings saved"})
         except Exception as e:
@@ -494,8 +528,7 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             if not conceptual_file.exists():
                 return jsonify({"error": "conceptual.yml not found"}), 404
 
-            with open(conceptual_file) as f:
-                data = yaml.safe_load(f) or {}
+            data = load_yaml_document(conceptual_file) or {}
 
             return jsonify(data.get("config", {}))
         except Exception as e:
@@ -513,18 +546,12 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
             if not conceptual_file.exists():
                 return jsonify({"error": "conceptual.yml not found"}), 404
 
-            with open(conceptual_file) as f:
-                conceptual_data = yaml.safe_load(f) or {}
+            conceptual_data = load_yaml_document(conceptual_file, copy=True) or {}
 
             conceptual_data["config"] = data
 
-            with open(conceptual_file, "w") as f:
-                yaml.dump(
-                    conceptual_data,
-                    f,
-                    sort_keys=False,
-                    default_flow_style=False,
-                )
+            write_yaml_file(conceptual_file, conceptual_data)
+            cache.invalidate()
 
             return jsonify({"success": True, "message": "Config saved"})
         except Exception as e:
@@ -535,14 +562,294 @@ def create_app(project_dir: Path, demo_mode: bool = False) -> Flask:
         """Get current mode (demo or normal)."""
         return jsonify({"demoMode": app.config.get("DEMO_MODE", False)})
 
+    @app.route("/api/stats", methods=["GET"])
+    def get_stats() -> Any:
+        """Get the state cache's counters.
+
+        ``builds`` and ``updates`` count full and incremental state updates,
+        ``coalesced`` the requests that shared one of them instead of
+        running their own. ``computations`` and ``derived_coalesced`` do the
+        same for reports and sync results.
+        """
+        return jsonify(cache.stats())
+
     return app
 
 
+def _conditional(etag: str, render: Callable[[], Response]) -> Response:
+    """Answer a GET with 304 Not Modified when the client's copy is current.
+
+    Args:
+        etag: Strong entity tag of the current representation
+        render: Builds the full response; only called when it is needed
+
+    Returns:
+        The 304 or full response, with ETag and Cache-Control set
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = render()
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def _state_response(
+    state: ProjectState, positions: dict[str, Any], version: str = ""
+) -> dict[str, Any]:
+    """Convert a state to the JSON of GET /api/state.
+
+    Args:
+        state: Project state
+        positions: React Flow node positions from the layout file
+        version: State version, the base version of later edits
+
+    Returns:
+        JSON-serializable dict
+    """
+    # Check for integrity issues (relationships referencing missing concepts)
+    missing_refs = []
+    for _rel_id, rel in state.relationships.items():
+        if rel.from_concept not in state.concepts:
+            missing_refs.append(rel.from_concept)
+        if rel.to_concept not in state.concepts:
+            missing_refs.append(rel.to_concept)
+    has_integrity_errors = len(missing_refs) > 0
+
+    # Convert state to JSON-serializable format (v1.0 simplified)
+    return {
+        "domains": {
+            domain_id: _domain_json(domain)
+            for domain_id, domain in state.domains.items()
+        },
+        "concepts": {
+            concept_id: _concept_json(concept)
+            for concept_id, concept in state.concepts.items()
+        },
+        "relationships": {
+            rel_id: _relationship_json(rel, state.concepts)
+            for rel_id, rel in state.relationships.items()
+        },
+        "positions": positions,  # React Flow node positions
+        "hasIntegrityErrors": has_integrity_errors,
+        "version": version,
+    }
+
+
+def _domain_json(domain: DomainState) -> dict[str, Any]:
+    """Convert a domain to its API JSON."""
+    return {
+        "name": domain.name,
+        "display_name": domain.display_name,
+        "color": domain.color,
+    }
+
+
+def _concept_json(concept: ConceptState) -> dict[str, Any]:
+    """Convert a concept to its API JSON."""
+    return {
+        "name": concept.name,
+        "definition": concept.definition,
+        "domain": concept.domain,
+        "owner": concept.owner,
+        "status": concept.status,  # Derived at runtime
+        "color": concept.color,
+        "models": concept.models,  # Flat list
+        # Validation fields
+        "isGhost": concept.is_ghost,
+        "validationStatus": concept.validation_status,
+        "validationMessages": concept.validation_messages,
+    }
+
+
+def _relationship_json(
+    rel: RelationshipState, concepts: dict[str, ConceptState]
+) -> dict[str, Any]:
+    """Convert a relationship to its API JSON."""
+    return {
+        "name": rel.name,  # Derived
+        "verb": rel.verb,
+        "from_concept": rel.from_concept,
+        "to_concept": rel.to_concept,
+        "cardinality": rel.cardinality,
+        "owner": rel.owner,
+        "definition": rel.definition,
+        "status": rel.get_status(concepts),  # Derived
+        # Validation fields
+        "validationStatus": rel.validation_status,
+        "validationMessages": rel.validation_messages,
+    }
+
+
+def _operations(items: Any) -> list[Operation]:
+    """Convert the API's operations to Operation objects.
+
+    Each item has ``op`` (upsert or delete), ``type`` (domain, concept or
+    relationship), ``id`` and, for upserts, ``data`` in the format of
+    GET /api/state.
+
+    Raises:
+        EditError: If an item is malformed
+    """
+    if not isinstance(items, list) or not items:
+        raise EditError("operations must be a non-empty list")
+    operations = []
+    entries = {
+        "domain": _domain_entry,
+        "concept": _concept_entry,
+        "relationship": _relationship_entry,
+    }
+    for number, item in enumerate(items, start=1):
+        if not isinstance(item, dict) or item.get("type") not in entries:
+            raise EditError(f"Operation {number}: unknown element type")
+        if item.get("op") not in ("upsert", "delete"):
+            raise EditError(f"Operation {number}: op must be upsert or delete")
+        data = item.get("data")
+        entry = None
+        if item["op"] == "upsert":
+            if not isinstance(data, dict):
+                raise EditError(f"Operation {number}: data must be an object")
+            entry = entries[item["type"]](data)
+        operations.append(
+            Operation(op=item["op"], kind=item["type"], id=item.get("id"), entry=entry)
+        )
+    return operations
+
+
+def _delta_response(
+    state: ProjectState, result: EditResult, config: Config
+) -> dict[str, Any]:
+    """Build the response to an edit: the changed elements only.
+
+    Deleted elements map to None. Relationships of changed concepts are
+    included, since their status depends on their endpoints.
+
+    Args:
+        state: State after the edit
+        result: Outcome of StateCache.edit()
+        config: Configuration object
+
+    Returns:
+        JSON-serializable dict
+    """
+    changed = result.changed
+    rel_ids = dict.fromkeys(changed.get("relationships", []))
+    for concept_id in changed.get("concepts", []):
+        rel_ids.update(dict.fromkeys(state.index.relationships_for_concept(concept_id)))
+
+    return {
+        "success": True,
+        "version": result.version,
+        "files": [str(path.relative_to(config.project_dir)) for path in result.files],
+        **_elements_json(
+            state, changed.get("domains", []), changed.get("concepts", []), rel_ids
+        ),
+        "hasIntegrityErrors": any(
+            concept_id not in state.concepts
+            for concept_id in state.index.relationship_endpoints()
+        ),
+    }
+
+
+def _change_event(state: ProjectState, change: StateChange) -> str:
+    """Render a ChangeFeed change as a ``change`` server-sent event.
+
+    Args:
+        state: State after the change
+        change: Change found by the feed
+
+    Returns:
+        The event, with the new state version as its id
+    """
+    data = {
+        "version": change.version,
+        **_elements_json(state, change.domains, change.concepts, change.relationships),
+        "newOrphans": change.new_orphans,
+        "removedOrphans": change.removed_orphans,
+    }
+    if change.validation is not None:
+        data["validation"] = change.validation
+    return format_event("change", data, change.version)
+
+
+def _elements_json(
+    state: ProjectState,
+    domain_ids: Iterable[str],
+    concept_ids: Iterable[str],
+    relationship_ids: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Convert elements to their API JSON, with None for deleted ones."""
+    domains: dict[str, Any] = {}
+    for domain_id in domain_ids:
+        domain = state.domains.get(domain_id)
+        domains[domain_id] = _domain_json(domain) if domain else None
+    concepts: dict[str, Any] = {}
+    for concept_id in concept_ids:
+        concept = state.concepts.get(concept_id)
+        concepts[concept_id] = _concept_json(concept) if concept else None
+    relationships: dict[str, Any] = {}
+    for rel_id in relationship_ids:
+        rel = state.relationships.get(rel_id)
+        relationships[rel_id] = _relationship_json(rel, state.concepts) if rel else None
+    return {"domains": domains, "concepts": concepts, "relationships": relationships}
+
+
+def _domain_entry(domain: dict[str, Any]) -> dict[str, Any]:
+    """Convert an API domain to its conceptual.yml entry."""
+    return {
+        k: v for k, v in domain.items() if v is not None and k not in ("display_name",)
+    }
+
+
+def _concept_entry(concept: dict[str, Any]) -> dict[str, Any]:
+    """Convert an API concept to its conceptual.yml entry."""
+    # Only save fields that belong in YAML (not derived fields)
+    return {
+        k: v
+        for k, v in concept.items()
+        if v is not None
+        and k
+        not in (
+            "status",  # Derived
+            "models",  # Derived from meta.concept
+            "isGhost",  # Validation field
+            "validationStatus",  # Validation field
+            "validationMessages",  # Validation field
+        )
+    }
+
+
+def _relationship_entry(rel: dict[str, Any]) -> dict[str, Any]:
+    """Convert an API relationship to its conceptual.yml entry."""
+    rel_dict = {}
+    for k, v in rel.items():
+        if v is None:
+            continue
+        # Skip derived and validation fields
+        if k in (
+            "name",
+            "status",
+            "validationStatus",
+            "validationMessages",
+        ):
+            continue
+        # Map API field names to YAML field names
+        if k == "from_concept":
+            rel_dict["from"] = v
+        elif k == "to_concept":
+            rel_dict["to"] = v
+        else:
+            rel_dict[k] = v
+    return rel_dict
+
+
 def run_server(
     project_dir: Path,
     host: str = "127.0.0.1",
     port: int = 8050,
     demo_mode: bool = False,
+    threads: int = SERVER_THREADS,
 ) -> None:
     """Run the web server using Waitress (production-ready WSGI server).
 
@@ -551,8 +858,10 @@ def run_server(
         host: Host to bind to (default: 127.0.0.1)
         port: Port to bind to (default: 8050)
         demo_mode: Whether running in demo mode (default: False)
+        threads: Worker threads; each open browser tab's event stream
+            holds one (default: SERVER_THREADS)
     """
     from waitress import serve
 
     app = create_app(project_dir, demo_mode=demo_mode)
-    serve(app, host=host, port=port)
+    serve(app, host=host, port=port, threads=threads)
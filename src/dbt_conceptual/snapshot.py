@@ -0,0 +1,366 @@
+"""Binary snapshots of a built ProjectState.
+
+``dbt-conceptual snapshot`` builds the project state once and writes it,
+together with fingerprints of every source it was built from, to a compact
+binary file. Commands run with ``--from-snapshot`` load that file instead
+of scanning and parsing the project, so a CI pipeline can build the state
+in one job and reuse it in ``validate``, ``export`` and ``diff`` jobs.
+
+File layout::
+
+    b"DBTCSNAP"          magic
+    uint16               SNAPSHOT_FORMAT_VERSION (big-endian)
+    uint32               length of the header block
+    header block         zlib-compressed JSON: settings key and source
+                         fingerprints
+    state block          zlib-compressed pickle of the ProjectState
+
+The header is checked before the (much larger) state block is unpickled.
+A snapshot is stale when the tool version, format or scan settings differ,
+or when a source file was added, removed or changed. Sources are
+conceptual.yml and its fragments plus the scanned schema files (or the
+manifest in manifest mode). A file whose mtime differs but whose size
+matches is compared by content hash, so a fresh checkout of the same
+commit still uses the snapshot. Fingerprints use project-relative paths,
+so a snapshot stays valid when the project is checked out somewhere else.
+
+Snapshots are passed between CI jobs, so their content is not trusted:
+the header is plain JSON, and the state block is read with a restricted
+unpickler (see safe_pickle) that resolves only the state classes. A
+crafted file is rejected as unreadable instead of running code.
+"""
+
+import json
+import logging
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+from dbt_conceptual import __version__
+from dbt_conceptual.config import Config
+from dbt_conceptual.fragments import fragment_files
+from dbt_conceptual.safe_pickle import restricted_loads
+from dbt_conceptual.scan_cache import content_digest
+from dbt_conceptual.state import ProjectState
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the file layout or the pickled state classes change
+SNAPSHOT_FORMAT_VERSION = 2
+
+SNAPSHOT_MAGIC = b"DBTCSNAP"
+
+DEFAULT_SNAPSHOT_PATH = ".dbt_conceptual/state.snapshot"
+
+_PREAMBLE = struct.Struct(">8sHI")
+
+# Classes the state block may contain besides plain values
+_STATE_GLOBALS = tuple(
+    ("dbt_conceptual.state", name)
+    for name in (
+        "ConceptState",
+        "DomainState",
+        "Message",
+        "ModelInfo",
+        "OrphanModel",
+        "ProjectState",
+        "RelationshipState",
+        "ValidationState",
+    )
+)
+
+
+class SnapshotError(Exception):
+    """Raised when a file is not a readable snapshot of this format."""
+
+
+class Fingerprint(NamedTuple):
+    """Identity of a source file when the snapshot was built."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+def snapshot_path(config: Config, path: Union[str, Path, None] = None) -> Path:
+    """Resolve the snapshot file location.
+
+    Args:
+        config: Configuration object
+        path: Snapshot file; relative paths resolve against the project
+            directory (default: .dbt_conceptual/state.snapshot)
+
+    Returns:
+        Path of the snapshot file
+    """
+    return config.project_dir / (path or DEFAULT_SNAPSHOT_PATH)
+
+
+def settings_key(config: Config) -> tuple[Any, ...]:
+    """Settings that change the built state without changing any source.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Tuple compared between the snapshot and the current configuration
+    """
+    return (
+        __version__,
+        SNAPSHOT_FORMAT_VERSION,
+        tuple(config.gold_paths),
+        config.scan_source,
+        config.manifest_path,
+        None if config.scan_exclude is None else tuple(config.scan_exclude),
+    )
+
+
+def source_files(config: Config) -> list[Path]:
+    """List the files the project state is built from.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        conceptual.yml and its fragments, followed by the manifest (in
+        manifest mode, when it exists) or the gold schema files
+    """
+    from dbt_conceptual.scanner import DbtProjectScanner
+
+    files = [config.conceptual_file, *fragment_files(config)]
+    if config.scan_source == "manifest" and config.manifest_file.is_file():
+        files.append(config.manifest_file)
+    else:
+        files.extend(DbtProjectScanner(config).find_schema_files())
+    return files
+
+
+def _source_key(config: Config, path: Path) -> str:
+    try:
+        return path.relative_to(config.project_dir).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def source_fingerprints(config: Config) -> dict[str, Fingerprint]:
+    """Fingerprint the current source files.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Fingerprints keyed on project-relative path
+    """
+    fingerprints = {}
+    for path in source_files(config):
+        st = path.stat()
+        fingerprints[_source_key(config, path)] = Fingerprint(
+            st.st_mtime_ns, st.st_size, content_digest(path.read_bytes())
+        )
+    return fingerprints
+
+
+def stale_reason(config: Config, sources: dict[str, Fingerprint]) -> Optional[str]:
+    """Check recorded fingerprints against the files on disk.
+
+    Files are hashed only when their mtime changed but their size did not.
+
+    Args:
+        config: Configuration object
+        sources: Fingerprints recorded in a snapshot
+
+    Returns:
+        Why the snapshot is stale, or None if it is current
+    """
+    current = {_source_key(config, path): path for path in source_files(config)}
+    if current.keys() != sources.keys():
+        added = sorted(current.keys() - sources.keys())
+        if added:
+            return f"{added[0]} was added"
+        return f"{sorted(sources.keys() - current.keys())[0]} was removed"
+
+    for key, path in current.items():
+        recorded = sources[key]
+        try:
+            st = path.stat()
+            if st.st_size != recorded.size or (
+                st.st_mtime_ns != recorded.mtime_ns
+                and content_digest(path.read_bytes()) != recorded.digest
+            ):
+                return f"{key} changed"
+        except OSError:
+            return f"{key} is unreadable"
+    return None
+
+
+def write_snapshot(
+    state: ProjectState,
+    config: Config,
+    path: Union[str, Path, None] = None,
+    sources: Optional[dict[str, Fingerprint]] = None,
+) -> Path:
+    """Write a snapshot of a built state.
+
+    The file is written to a temporary name and renamed into place so that
+    readers never observe a half-written snapshot.
+
+    Args:
+        state: State built from the project
+        config: Configuration the state was built with
+        path: Snapshot file (see snapshot_path())
+        sources: Fingerprints taken before the state was built (default:
+            fingerprint the sources now)
+
+    Returns:
+        Path of the written snapshot
+
+    Raises:
+        OSError: If the snapshot can't be written
+    """
+    target = snapshot_path(config, path)
+    if sources is None:
+        sources = source_fingerprints(config)
+    header = zlib.compress(
+        json.dumps(
+            {"key": settings_key(config), "sources": sources},
+            separators=(",", ":"),
+        ).encode()
+    )
+    body = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.parent == config.project_dir / ".dbt_conceptual":
+        gitignore = target.parent / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("# Created by dbt-conceptual\n*\n")
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=target.parent, prefix=".snapshot-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                _PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header))
+            )
+            f.write(header)
+            f.write(body)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return target
+
+
+def _read(path: Path, config: Config) -> Optional[ProjectState]:
+    """Read a snapshot, returning None when it is stale."""
+    with open(path, "rb") as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise SnapshotError(f"{path} is not a snapshot")
+        magic, version, header_size = _PREAMBLE.unpack(preamble)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{path} is not a snapshot")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            logger.info("Snapshot %s has format %d, rebuilding", path, version)
+            return None
+
+        header = _read_header(path, f.read(header_size))
+        # Tuples come back from JSON as lists
+        if header["key"] != json.loads(json.dumps(settings_key(config))):
+            logger.info(
+                "Snapshot %s was built by another version or with other scan "
+                "settings, rebuilding",
+                path,
+            )
+            return None
+        reason = stale_reason(config, header["sources"])
+        if reason is not None:
+            logger.info("Snapshot %s is stale (%s), rebuilding", path, reason)
+            return None
+
+        try:
+            state = restricted_loads(zlib.decompress(f.read()), _STATE_GLOBALS)
+        except Exception as e:
+            raise SnapshotError(f"{path} has a corrupt state block: {e}") from e
+    if not isinstance(state, ProjectState):
+        raise SnapshotError(f"{path} does not contain a ProjectState")
+    return state
+
+
+def _read_header(path: Path, block: bytes) -> dict[str, Any]:
+    """Decode and check the header block."""
+    try:
+        header = json.loads(zlib.decompress(block))
+        sources = {
+            key: Fingerprint(*fingerprint)
+            for key, fingerprint in header["sources"].items()
+        }
+    except Exception as e:
+        raise SnapshotError(f"{path} has a corrupt header: {e}") from e
+    if not all(
+        type(key) is str
+        and type(fingerprint.mtime_ns) is int
+        and type(fingerprint.size) is int
+        and type(fingerprint.digest) is str
+        for key, fingerprint in sources.items()
+    ):
+        raise SnapshotError(f"{path} has a corrupt header: invalid fingerprints")
+    return {"key": header.get("key"), "sources": sources}
+
+
+def load_snapshot(
+    config: Config, path: Union[str, Path, None] = None
+) -> Optional[ProjectState]:
+    """Load a snapshot if it is current.
+
+    Args:
+        config: Configuration object
+        path: Snapshot file (see snapshot_path())
+
+    Returns:
+        The snapshotted state, or None if the file is missing, unreadable,
+        of another format, or stale
+    """
+    target = snapshot_path(config, path)
+    try:
+        return _read(target, config)
+    except FileNotFoundError:
+        logger.info("No snapshot at %s, rebuilding", target)
+    except (OSError, SnapshotError) as e:
+        logger.warning("Ignoring unreadable snapshot %s: %s", target, e)
+    return None
+
+
+def load_or_build(config: Config, path: Union[str, Path, None] = None) -> ProjectState:
+    """Load the state from a snapshot, rebuilding it when needed.
+
+    When the snapshot can't be used the state is built from the project and
+    the snapshot is rewritten, so the next run starts from it.
+
+    Args:
+        config: Configuration object
+        path: Snapshot file (see snapshot_path())
+
+    Returns:
+        ProjectState identical to StateBuilder.build()
+    """
+    from dbt_conceptual.parser import StateBuilder
+
+    state = load_snapshot(config, path)
+    if state is not None:
+        return state
+
+    sources = source_fingerprints(config)
+    state = StateBuilder(config).build()
+    try:
+        write_snapshot(state, config, path, sources)
+    except OSError as e:
+        # A read-only checkout must not break the command itself
+        logger.warning(
+            "Could not write snapshot %s: %s", snapshot_path(config, path), e
+        )
+    return state
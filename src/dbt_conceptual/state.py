@@ -5,16 +5,141 @@ Simplified v1.0 state model:
 - No `realized_by` on relationships
 - No `deprecated` status
 - No lineage inference
+
+ProjectState keeps a StateIndex of reverse lookups (model -> concepts,
+domain -> concepts, concept -> relationships, owner -> elements). The
+``domains``, ``concepts`` and ``relationships`` dicts, each concept's
+``models`` list and the indexed element fields report their changes to it,
+so the index stays current however the state is mutated. Assigning to
+those attributes stores a tracked copy of the assigned container.
+
+Large projects hold tens of thousands of concepts and relationships and
+hundreds of thousands of models, so the element classes are slotted
+dataclasses (no per-instance ``__dict__``), intern their identifier strings,
+and allocate ``validation_messages`` lists only when first accessed.
 """
 
-from dataclasses import dataclass, field
-from typing import Literal, Optional
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Literal, Optional, TypeVar, Union, cast
 
 # Validation types
 ValidationStatus = Literal["valid", "warning", "error"]
 MessageSeverity = Literal["error", "warning", "info"]
+ElementType = Literal["concept", "relationship", "domain"]
+
+# Owner lookups list domains first, then concepts, then relationships
+_KIND_RANK = {"domain": 0, "concept": 1, "relationship": 2}
+
+# Default of lazily allocated list fields (see _slotted)
+_ALLOCATE_ON_ACCESS: Any = None
+
+_T = TypeVar("_T")
+
+
+def _intern(value: Any) -> Any:
+    """Intern identifier strings; other values are returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _lazy_list(slot: str) -> property:
+    """Property for a list field stored in ``slot``, created on first read."""
+
+    def get(self: Any) -> list[Any]:
+        value: Optional[list[Any]] = getattr(self, slot)
+        if value is None:
+            value = []
+            object.__setattr__(self, slot, value)
+        return value
+
+    def set(self: Any, value: Optional[list[Any]]) -> None:
+        object.__setattr__(self, slot, value)
+
+    return property(get, set)
 
 
+def _slotted(lazy_lists: tuple[str, ...] = ()) -> Callable[[type[_T]], type[_T]]:
+    """Rebuild a dataclass with ``__slots__``.
+
+    ``dataclass(slots=True)`` needs Python 3.10. Fields named in
+    ``lazy_lists`` are stored in a private slot and exposed through a
+    property that allocates the list on first access, so their default
+    must be ``_ALLOCATE_ON_ACCESS``.
+
+    Methods of the rebuilt class must not use zero-argument ``super()``,
+    which would still refer to the original class.
+    """
+
+    def wrap(cls: type[_T]) -> type[_T]:
+        names = [f.name for f in fields(cls)]  # type: ignore[arg-type]
+        namespace = dict(cls.__dict__)
+        for name in names:
+            namespace.pop(name, None)
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        namespace["__slots__"] = tuple(
+            f"_{name}" if name in lazy_lists else name for name in names
+        )
+        for name in lazy_lists:
+            namespace[name] = _lazy_list(f"_{name}")
+        slotted = cast("type[_T]", type(cls.__name__, cls.__bases__, namespace))
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+
+    return wrap
+
+
+class _Indexed:
+    """Mixin for state elements whose fields feed a StateIndex."""
+
+    __slots__ = ("_index_refs", "_status")
+
+    _index_kind: ElementType
+    _indexed_fields: frozenset[str] = frozenset()
+    _interned_fields: frozenset[str] = frozenset()
+
+    # index, key, index, key, ... for every tracked dict holding this
+    # element (flat, so the usual single reference is one small tuple)
+    _index_refs: tuple[Any, ...]
+
+    # Memoized derived status, reset whenever an input changes
+    _status: Any
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        self = object.__new__(cls)
+        object.__setattr__(self, "_index_refs", ())
+        object.__setattr__(self, "_status", None)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._interned_fields:
+            value = _intern(value)
+        if name not in self._indexed_fields:
+            object.__setattr__(self, name, value)
+            return
+        refs = list(self._indexes())
+        for index, key in refs:
+            index._link(self, key, add=False)
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_status", None)
+        for index, key in refs:
+            index._link(self, key)
+
+    def _indexes(self) -> Iterator[tuple["StateIndex", str]]:
+        """The (index, key) pairs this element is reachable under."""
+        refs = self._index_refs
+        return zip(refs[::2], refs[1::2])
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}  # type: ignore[arg-type]
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+@_slotted()
 @dataclass
 class Message:
     """Represents a validation message."""
@@ -22,9 +147,12 @@ class Message:
     id: str
     severity: MessageSeverity
     text: str
-    element_type: Optional[Literal["concept", "relationship", "domain"]] = None
+    element_type: Optional[ElementType] = None
     element_id: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.element_id = _intern(self.element_id)
+
 
 @dataclass
 class ValidationState:
@@ -36,14 +164,105 @@ class ValidationState:
     info_count: int = 0
 
 
+class _TrackedList(list[str]):
+    """A concept's models list that reports membership changes."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(
+        self, items: Iterable[str] = (), owner: Optional["ConceptState"] = None
+    ):
+        super().__init__(items)
+        self._owner = owner
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+    def _before(self) -> tuple[bool, Optional[set[str]]]:
+        owner = self._owner
+        indexed = owner is not None and owner._index_refs
+        return not self, set(self) if indexed else None
+
+    def _after(self, before: tuple[bool, Optional[set[str]]]) -> None:
+        if self._owner is None:
+            return
+        was_empty, members = before
+        if members is None:
+            self._owner._models_changed((), (), was_empty)
+        else:
+            after = set(self)
+            self._owner._models_changed(members - after, after - members, was_empty)
+
+    def _added(self, items: Iterable[str], was_empty: bool) -> None:
+        owner = self._owner
+        if owner is not None:
+            owner._models_changed((), items if owner._index_refs else (), was_empty)
+
+    def append(self, item: str) -> None:
+        was_empty = not self
+        super().append(item)
+        self._added((item,), was_empty)
+
+    def extend(self, items: Iterable[str]) -> None:
+        was_empty = not self
+        items = list(items)
+        super().extend(items)
+        self._added(items, was_empty)
+
+    def insert(self, position: Any, item: str) -> None:
+        was_empty = not self
+        super().insert(position, item)
+        self._added((item,), was_empty)
+
+    def __iadd__(self, items: Iterable[str]) -> "_TrackedList":  # type: ignore[override,misc]
+        self.extend(items)
+        return self
+
+    def __imul__(self, count: Any) -> "_TrackedList":  # type: ignore[misc]
+        before = self._before()
+        super().__imul__(count)
+        self._after(before)
+        return self
+
+    def __setitem__(self, position: Any, value: Any) -> None:
+        before = self._before()
+        super().__setitem__(position, value)
+        self._after(before)
+
+    def __delitem__(self, position: Any) -> None:
+        before = self._before()
+        super().__delitem__(position)
+        self._after(before)
+
+    def remove(self, item: str) -> None:
+        before = self._before()
+        super().remove(item)
+        self._after(before)
+
+    def pop(self, position: Any = -1) -> str:
+        before = self._before()
+        item = super().pop(position)
+        self._after(before)
+        return item
+
+    def clear(self) -> None:
+        before = self._before()
+        super().clear()
+        self._after(before)
+
+
+@_slotted(lazy_lists=("validation_messages",))
 @dataclass
-class ConceptState:
+class ConceptState(_Indexed):
     """Represents the state of a concept.
 
     Status is derived at runtime based on domain and model associations:
     - 'stub': No domain (needs enrichment)
     - 'draft': Has domain but no models
     - 'complete': Has domain AND has models
+
+    The derived status is memoized until ``domain`` or ``models`` change.
+    ``validation_messages`` is allocated on first access.
     """
 
     name: str
@@ -58,7 +277,41 @@ class ConceptState:
     # Validation fields (populated during sync)
     is_ghost: bool = False  # True if referenced but not defined in YAML
     validation_status: ValidationStatus = "valid"
-    validation_messages: list[str] = field(default_factory=list)
+    validation_messages: list[str] = _ALLOCATE_ON_ACCESS
+
+    _index_kind = "concept"
+    _indexed_fields = frozenset({"domain", "owner", "models"})
+    _interned_fields = frozenset({"name", "domain", "owner"})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "models" and not (
+            isinstance(value, _TrackedList) and value._owner is self
+        ):
+            old = getattr(self, "models", None)
+            if isinstance(old, _TrackedList) and old._owner is self:
+                old._owner = None
+            value = _TrackedList(value, owner=self)
+        if name not in ("domain", "is_ghost") or not self._index_refs:
+            _Indexed.__setattr__(self, name, value)
+            return
+        # Relationship status only depends on whether an endpoint is a stub
+        was_stub = self._is_stub_endpoint()
+        _Indexed.__setattr__(self, name, value)
+        if self._is_stub_endpoint() != was_stub:
+            for index, key in self._indexes():
+                index._endpoint_changed(key)
+
+    def _is_stub_endpoint(self) -> bool:
+        """Whether relationships to this concept are stubs."""
+        return self.is_ghost or not self.domain
+
+    def _models_changed(
+        self, removed: Iterable[str], added: Iterable[str], was_empty: bool
+    ) -> None:
+        for index, key in self._indexes():
+            index._models_changed(key, removed, added)
+        if was_empty != (not self.models):
+            object.__setattr__(self, "_status", None)
 
     @property
     def status(self) -> Literal["stub", "draft", "complete"]:
@@ -69,20 +322,31 @@ class ConceptState:
             - 'draft' if has domain but no models
             - 'complete' if has domain and at least one model
         """
-        if not self.domain:
-            return "stub"
-        if not self.models:
-            return "draft"
-        return "complete"
-
-
+        status = self._status
+        if status is None:
+            if not self.domain:
+                status = "stub"
+            elif not self.models:
+                status = "draft"
+            else:
+                status = "complete"
+            object.__setattr__(self, "_status", status)
+        return status  # type: ignore[no-any-return]
+
+
+@_slotted(lazy_lists=("validation_messages",))
 @dataclass
-class RelationshipState:
+class RelationshipState(_Indexed):
     """Represents the state of a relationship between concepts.
 
     Status is derived at runtime:
     - 'stub': Either endpoint is a ghost or stub concept
     - 'complete': Both endpoints are draft or complete concepts
+
+    Within a ProjectState the status is memoized per concepts dict. The
+    state's index drops it when an endpoint concept is added, removed, or
+    becomes (or stops being) a ghost or stub. ``validation_messages`` is
+    allocated on first access.
     """
 
     verb: str
@@ -94,7 +358,13 @@ class RelationshipState:
 
     # Validation fields (populated during sync)
     validation_status: ValidationStatus = "valid"
-    validation_messages: list[str] = field(default_factory=list)
+    validation_messages: list[str] = _ALLOCATE_ON_ACCESS
+
+    _index_kind = "relationship"
+    _indexed_fields = frozenset({"from_concept", "to_concept", "owner"})
+    _interned_fields = frozenset(
+        {"verb", "from_concept", "to_concept", "cardinality", "owner"}
+    )
 
     @property
     def name(self) -> str:
@@ -117,20 +387,29 @@ class RelationshipState:
             - 'stub' if either endpoint is ghost or stub
             - 'complete' otherwise
         """
+        cached = self._status
+        if cached is not None and cached[0] is concepts:
+            return cached[1]  # type: ignore[no-any-return]
+
         from_concept = concepts.get(self.from_concept)
         to_concept = concepts.get(self.to_concept)
 
         # Check if endpoints exist and are not stubs/ghosts
+        status: Literal["stub", "complete"] = "complete"
         if not from_concept or from_concept.is_ghost or from_concept.status == "stub":
-            return "stub"
-        if not to_concept or to_concept.is_ghost or to_concept.status == "stub":
-            return "stub"
+            status = "stub"
+        elif not to_concept or to_concept.is_ghost or to_concept.status == "stub":
+            status = "stub"
 
-        return "complete"
+        # Only memoize for the concepts of a state whose index invalidates it
+        if any(index._concepts is concepts for index in self._index_refs[::2]):
+            object.__setattr__(self, "_status", (concepts, status))
+        return status
 
 
+@_slotted()
 @dataclass
-class DomainState:
+class DomainState(_Indexed):
     """Represents a domain grouping."""
 
     name: str
@@ -138,7 +417,12 @@ class DomainState:
     color: Optional[str] = None
     owner: Optional[str] = None
 
+    _index_kind = "domain"
+    _indexed_fields = frozenset({"owner"})
+    _interned_fields = frozenset({"name", "owner"})
+
 
+@_slotted()
 @dataclass
 class ModelInfo:
     """Represents metadata about a dbt model."""
@@ -149,7 +433,23 @@ class ModelInfo:
     owner_tag: Optional[str] = None  # From tags
     path: Optional[str] = None
 
-
+    def __post_init__(self) -> None:
+        # Inlined: 100k+ instances per build
+        intern = sys.intern
+        if type(self.name) is str:
+            self.name = intern(self.name)
+        if type(self.concept) is str:
+            self.concept = intern(self.concept)
+        if type(self.owner_tag) is str:
+            self.owner_tag = intern(self.owner_tag)
+        if type(self.path) is str:
+            self.path = intern(self.path)
+        tags = self.domain_tags
+        if tags:
+            tags[:] = [intern(t) if type(t) is str else t for t in tags]
+
+
+@_slotted()
 @dataclass
 class OrphanModel:
     """Represents a dbt model not yet linked to a concept."""
@@ -159,6 +459,302 @@ class OrphanModel:
     domain: Optional[str] = None  # From meta.domain
     path: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.name = _intern(self.name)
+        self.domain = _intern(self.domain)
+        self.path = _intern(self.path)
+
+
+class _TrackedDict(dict[str, Any]):
+    """A ProjectState element dict that reports insertions and removals."""
+
+    __slots__ = ("_index", "_kind")
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._index: Optional[StateIndex] = None
+        self._kind: ElementType = "concept"
+
+    def __reduce__(self) -> Any:
+        return (dict, (dict(self),))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        index = self._index
+        if index is None:
+            super().__setitem__(key, value)
+            return
+        if key in self:
+            index._detach(self._kind, key, self[key], forget=False)
+        super().__setitem__(key, value)
+        index._attach(self._kind, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        value = self[key]
+        super().__delitem__(key)
+        if self._index is not None:
+            self._index._detach(self._kind, key, value)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = super().popitem()
+        if self._index is not None:
+            self._index._detach(self._kind, key, value)
+        return key, value
+
+    def clear(self) -> None:
+        while self:
+            self.popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> "_TrackedDict":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+
+# model -> concept ids holds a plain id for the usual single concept
+ModelConcepts = Union[str, dict[str, None]]
+
+
+def _add(mapping: dict[Any, dict[Any, None]], key: Any, member: Any) -> None:
+    mapping.setdefault(key, {})[member] = None
+
+
+def _discard(mapping: dict[Any, dict[Any, None]], key: Any, member: Any) -> None:
+    members = mapping.get(key)
+    if members is not None:
+        members.pop(member, None)
+        if not members:
+            del mapping[key]
+
+
+class StateIndex:
+    """Reverse lookups over a ProjectState.
+
+    Maintained by the state's tracked containers and elements; every lookup
+    returns ids in the order of the corresponding ProjectState dict.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Position of each key in its ProjectState dict (insertion counter)
+        self._positions: dict[str, dict[str, int]] = {kind: {} for kind in _KIND_RANK}
+        self._counter = 0
+        self._model_concepts: dict[str, ModelConcepts] = {}
+        self._domain_concepts: dict[Optional[str], dict[str, None]] = {}
+        self._concept_relationships: dict[str, dict[str, None]] = {}
+        self._owner_elements: dict[ElementType, dict[str, dict[str, None]]] = {
+            kind: {} for kind in _KIND_RANK  # type: ignore[misc]
+        }
+        self._concepts: Optional[_TrackedDict] = None
+        self._relationships: Optional[_TrackedDict] = None
+
+    def concepts_for_model(self, model_name: str) -> list[str]:
+        """Concepts whose models include a model.
+
+        Args:
+            model_name: dbt model name
+
+        Returns:
+            Concept ids, in state order
+        """
+        concepts = self._model_concepts.get(model_name, ())
+        if type(concepts) is str:
+            return [concepts]
+        return self._ordered("concept", concepts)
+
+    def concept_has_model(self, concept_id: str, model_name: str) -> bool:
+        """Check whether a concept's models include a model, in O(1)."""
+        concepts = self._model_concepts.get(model_name)
+        if type(concepts) is str:
+            return concepts == concept_id
+        return concepts is not None and concept_id in concepts
+
+    def concepts_in_domain(self, domain_id: Optional[str]) -> list[str]:
+        """Concepts assigned to a domain.
+
+        Args:
+            domain_id: Domain id, or None for concepts without a domain
+
+        Returns:
+            Concept ids, in state order
+        """
+        return self._ordered("concept", self._domain_concepts.get(domain_id, ()))
+
+    def concept_domains(self) -> list[Optional[str]]:
+        """Domains referenced by concepts, in order of their first concept.
+
+        Returns:
+            Domain ids (None when some concepts have no domain); these may
+            include domains not defined in the state
+        """
+        positions = self._positions["concept"]
+        return sorted(
+            self._domain_concepts,
+            key=lambda d: min(positions[c] for c in self._domain_concepts[d]),
+        )
+
+    def relationships_for_concept(self, concept_id: str) -> list[str]:
+        """Relationships with a concept as either endpoint.
+
+        Args:
+            concept_id: Concept id (need not be defined)
+
+        Returns:
+            Relationship ids, in state order
+        """
+        return self._ordered(
+            "relationship", self._concept_relationships.get(concept_id, ())
+        )
+
+    def relationship_endpoints(self) -> list[str]:
+        """Concept ids referenced by any relationship endpoint."""
+        return list(self._concept_relationships)
+
+    def elements_for_owner(self, owner: str) -> list[tuple[ElementType, str]]:
+        """Domains, concepts and relationships with a given owner.
+
+        Args:
+            owner: Owner value
+
+        Returns:
+            (element type, id) pairs: domains, then concepts, then
+            relationships, each in state order
+        """
+        return [
+            (kind, element_id)
+            for kind, by_owner in self._owner_elements.items()
+            for element_id in self._ordered(kind, by_owner.get(owner, ()))
+        ]
+
+    def owners(self) -> list[str]:
+        """All owners assigned to a domain, concept or relationship."""
+        return list(
+            dict.fromkeys(
+                o for by_owner in self._owner_elements.values() for o in by_owner
+            )
+        )
+
+    def _ordered(self, kind: ElementType, ids: Iterable[str]) -> list[str]:
+        return sorted(ids, key=self._positions[kind].__getitem__)
+
+    def _bind(self, kind: ElementType, old: Any, new: Any) -> "_TrackedDict":
+        """Replace the tracked dict of one element kind."""
+        if isinstance(new, _TrackedDict) and new._index is self:
+            return new
+        if isinstance(old, _TrackedDict) and old._index is self:
+            for key, element in old.items():
+                self._detach(kind, key, element)
+            old._index = None
+        tracked = _TrackedDict()
+        tracked._kind = kind
+        tracked._index = self
+        if kind == "concept":
+            self._concepts = tracked
+        elif kind == "relationship":
+            self._relationships = tracked
+        tracked.update(new)
+        return tracked
+
+    def _attach(self, kind: ElementType, key: str, element: Any) -> None:
+        positions = self._positions[kind]
+        if key not in positions:
+            positions[key] = self._counter
+            self._counter += 1
+        if isinstance(element, _Indexed):
+            object.__setattr__(
+                element, "_index_refs", (*element._index_refs, self, key)
+            )
+            self._link(element, key)
+        if kind == "concept":
+            self._endpoint_changed(key)
+
+    def _detach(
+        self, kind: ElementType, key: str, element: Any, forget: bool = True
+    ) -> None:
+        if forget:
+            del self._positions[kind][key]
+        if isinstance(element, _Indexed):
+            refs = [
+                ref
+                for ref in element._indexes()
+                if not (ref[0] is self and ref[1] == key)
+            ]
+            object.__setattr__(
+                element, "_index_refs", tuple(item for ref in refs for item in ref)
+            )
+            self._link(element, key, add=False)
+        if kind == "concept":
+            self._endpoint_changed(key)
+
+    def _link(self, element: _Indexed, key: str, add: bool = True) -> None:
+        """Add (or remove) an element's entries in the lookups."""
+        update = _add if add else _discard
+        kind = element._index_kind
+        owner = getattr(element, "owner", None)
+        if owner:
+            update(self._owner_elements[kind], owner, key)
+        if isinstance(element, ConceptState):
+            update(self._domain_concepts, element.domain or None, key)
+            if add:
+                self._models_changed(key, (), element.models)
+            else:
+                self._models_changed(key, element.models, ())
+        elif isinstance(element, RelationshipState):
+            update(self._concept_relationships, element.from_concept, key)
+            update(self._concept_relationships, element.to_concept, key)
+
+    def _endpoint_changed(self, concept_id: str) -> None:
+        """Drop the memoized status of relationships incident to a concept."""
+        relationships = self._relationships
+        if relationships is None:
+            return
+        for rel_id in self._concept_relationships.get(concept_id, ()):
+            object.__setattr__(relationships[rel_id], "_status", None)
+
+    def _models_changed(
+        self, concept_id: str, removed: Iterable[str], added: Iterable[str]
+    ) -> None:
+        model_concepts = self._model_concepts
+        for model_name in removed:
+            concepts = model_concepts.get(model_name)
+            if concepts == concept_id:
+                del model_concepts[model_name]
+            elif type(concepts) is dict:
+                concepts.pop(concept_id, None)
+                if len(concepts) == 1:
+                    model_concepts[model_name] = next(iter(concepts))
+        for model_name in added:
+            concepts = model_concepts.setdefault(model_name, concept_id)
+            if concepts == concept_id:
+                continue
+            if isinstance(concepts, str):
+                model_concepts[model_name] = {concepts: None, concept_id: None}
+            else:
+                concepts[concept_id] = None
+
+
+_INDEXED_COLLECTIONS: dict[str, ElementType] = {
+    "domains": "domain",
+    "concepts": "concept",
+    "relationships": "relationship",
+}
+
 
 @dataclass
 class ProjectState:
@@ -172,3 +768,27 @@ class ProjectState:
         default_factory=dict
     )  # Model info for validation
     metadata: dict[str, str] = field(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        kind = _INDEXED_COLLECTIONS.get(name)
+        if kind is not None:
+            value = self.index._bind(kind, self.__dict__.get(name), value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def index(self) -> StateIndex:
+        """Reverse lookups over this state, kept current on mutation."""
+        index: Optional[StateIndex] = self.__dict__.get("_index")
+        if index is None:
+            index = StateIndex()
+            object.__setattr__(self, "_index", index)
+        return index
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop("_index", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
@@ -0,0 +1,552 @@
+"""Process-wide ProjectState cache for the web server.
+
+Every API request used to build the project state from scratch. StateCache
+keeps one state per server process and checks, on each request, whether
+its sources changed: conceptual.yml and its fragments plus the scanned
+schema files (or the manifest) are listed and stat()ed, and their
+``(mtime_ns, size)`` pairs compared with the ones the state was built from.
+Nothing is parsed while they match. Changed, added and removed schema
+files are applied with IncrementalStateBuilder; a change to conceptual.yml
+or a fragment rebuilds the state. The layout file's positions are cached
+the same way.
+
+The cache is shared by waitress' worker threads. Readers hold a shared
+lock for as long as they use the state, and updates, which mutate it in
+place, wait for them behind an exclusive lock. Values computed from the
+state (the ``/api/models`` list, the synced state and validation of
+``/api/sync``, rendered reports) are kept per state version with
+derived().
+
+Concurrent requests that find the same changed files, or the same stale
+derived value, share one build or computation (SingleFlight) instead of
+each running their own; ``coalesced`` and ``derived_coalesced`` count
+the requests that waited for another one's result.
+
+Writers should call invalidate() (or invalidate_layout()) after rewriting
+a file, since a same-size rewrite within the filesystem's timestamp
+resolution keeps the old fingerprint. Element-level edits go through
+edit() instead, which writes the affected YAML entries and updates the
+cached state in place rather than rebuilding it.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Hashable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Generic, NamedTuple, Optional, TypeVar
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.edits import (
+    Operation,
+    apply_operations,
+    check_operations,
+    save_operations,
+)
+from dbt_conceptual.fragments import fragment_files, is_fragment_path
+from dbt_conceptual.incremental import IncrementalStateBuilder
+from dbt_conceptual.scanned_model import ScannedModel
+from dbt_conceptual.snapshot import settings_key
+from dbt_conceptual.state import ProjectState
+from dbt_conceptual.walker import walk_schema_file_stats
+
+T = TypeVar("T")
+
+# (mtime_ns, size) of each source file, keyed on path
+StatFingerprints = dict[str, tuple[int, int]]
+
+
+# Layout.digest when there is no layout file
+NO_LAYOUT = "none"
+
+
+class Layout(NamedTuple):
+    """Node positions read from the layout file."""
+
+    positions: dict[str, Any]
+    digest: str  # SHA-1 of the file content, or NO_LAYOUT
+
+
+class StaleVersionError(Exception):
+    """Raised when an edit is based on another version of the state."""
+
+    def __init__(self, version: str):
+        self.version = version
+        super().__init__(f"The model has changed; the current version is {version}")
+
+
+class EditResult(NamedTuple):
+    """Outcome of StateCache.edit()."""
+
+    version: str
+    files: list[Path]
+    changed: dict[str, list[str]]  # Ids per ProjectState section
+
+
+class ReadWriteLock:
+    """Lock shared by any number of readers or held by one writer.
+
+    Waiting writers block new readers, so a steady stream of requests
+    can't starve an update.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unlocked lock."""
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of the block."""
+        with self._cond:
+            while self._writing or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of the block."""
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+class _Call(Generic[T]):
+    """A SingleFlight call in progress."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """Runs one call per key at a time; concurrent callers share its outcome.
+
+    Attributes:
+        coalesced: Number of calls that waited for another call's result
+            instead of running their own
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in progress."""
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[T]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn, or wait for the call already running for the same key.
+
+        Args:
+            key: Identifies equivalent calls
+            fn: Function to run if no call for key is in progress
+
+        Returns:
+            The result of the call that ran
+
+        Raises:
+            Exception: Whatever that call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+        try:
+            result = fn()
+            call.result = result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
+
+
+def stat_fingerprints_of(paths: Sequence[Path]) -> StatFingerprints:
+    """Stat individual files.
+
+    Args:
+        paths: Existing files
+
+    Returns:
+        ``(mtime_ns, size)`` keyed on path string
+    """
+    fingerprints = {}
+    for path in paths:
+        st = os.stat(path)
+        fingerprints[str(path)] = (st.st_mtime_ns, st.st_size)
+    return fingerprints
+
+
+def stat_fingerprints(config: Config) -> StatFingerprints:
+    """Stat the files the project state is built from.
+
+    Covers the files of snapshot.source_files(), reusing the stat() calls
+    the schema file walk makes anyway. Missing files are skipped.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        ``(mtime_ns, size)`` keyed on path string
+    """
+    fingerprints = {}
+    files = [config.conceptual_file, *fragment_files(config)]
+    manifest = config.scan_source == "manifest" and config.manifest_file.is_file()
+    if manifest:
+        files.append(config.manifest_file)
+    for path in files:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        fingerprints[str(path)] = (st.st_mtime_ns, st.st_size)
+    if not manifest:
+        for path_str, st in walk_schema_file_stats(
+            config.project_dir, config.gold_paths, exclude=config.scan_exclude
+        ):
+            fingerprints[path_str] = (st.st_mtime_ns, st.st_size)
+    return fingerprints
+
+
+class StateCache:
+    """The project state of one server, rebuilt only when its sources change.
+
+    Attributes:
+        builds: Number of full state builds
+        updates: Number of incremental updates from changed schema files
+        hits: Number of reads served without rebuilding or updating
+        computations: Number of derived values computed
+    """
+
+    def __init__(self, config: Config):
+        """Initialize an empty cache; the state is built on first use.
+
+        Args:
+            config: Configuration object
+        """
+        self.config = config
+        self.builds = 0
+        self.updates = 0
+        self.hits = 0
+        self.computations = 0
+        self._refreshes: SingleFlight[bool] = SingleFlight()
+        self._computations: SingleFlight[Any] = SingleFlight()
+        self._builder = IncrementalStateBuilder(config)
+        self._state: Optional[ProjectState] = None
+        self._file_models = self._builder.file_models
+        self._sources: Optional[StatFingerprints] = None
+        self._version = ""
+        # Bumped whenever the state changes, including same-version rebuilds
+        # after invalidate(); keys the derived() values
+        self._generation = 0
+        # Bumped by invalidate() and every edit(); part of the version, so
+        # each write yields a new one even if a same-size rewrite within
+        # the filesystem's timestamp resolution keeps the fingerprints
+        self._invalidations = 0
+        self._lock = ReadWriteLock()
+        # Serializes refreshes and edits; readers of the current state
+        # aren't blocked until an update actually mutates it
+        self._refresh_lock = threading.RLock()
+        self._derived: dict[str, tuple[int, Any]] = {}
+        self._layout: Optional[tuple[Optional[tuple[int, int]], Layout]] = None
+
+    @property
+    def version(self) -> str:
+        """Identifier of the current state, derived from its source fingerprints.
+
+        Every invalidate() and edit() changes it as well. Empty until the
+        state is first built.
+        """
+        return self._version
+
+    @property
+    def coalesced(self) -> int:
+        """Number of refreshes that shared another request's build or update."""
+        return self._refreshes.coalesced
+
+    @property
+    def derived_coalesced(self) -> int:
+        """Number of derived() calls that shared another request's computation."""
+        return self._computations.coalesced
+
+    def stats(self) -> dict[str, int]:
+        """Get the cache's counters.
+
+        Returns:
+            Counter values keyed on attribute name
+        """
+        return {
+            "builds": self.builds,
+            "updates": self.updates,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "computations": self.computations,
+            "derived_coalesced": self.derived_coalesced,
+        }
+
+    @contextmanager
+    def read(self) -> Iterator[ProjectState]:
+        """Use the current state, refreshing it first if a source changed.
+
+        The state must be treated as read-only and not used after the block:
+        updates mutate it in place once all readers have left.
+
+        Yields:
+            The cached ProjectState
+        """
+        self.refresh()
+        with self._lock.read():
+            assert self._state is not None
+            yield self._state
+
+    def refresh(self) -> bool:
+        """Bring the state up to date with the files on disk.
+
+        Concurrent refreshes that find the same files share one build or
+        update.
+
+        Returns:
+            True if the state was rebuilt or updated
+        """
+        current = stat_fingerprints(self.config)
+        if current == self._sources:
+            self.hits += 1
+            return False
+        key = _version(self.config, current, self._invalidations)
+        return self._refreshes.do(key, lambda: self._refresh(current))
+
+    def _refresh(self, current: StatFingerprints) -> bool:
+        """Update or rebuild the state from files with the given fingerprints."""
+        with self._refresh_lock:
+            previous = self._sources
+            if current == previous:
+                # Another thread refreshed to these files meanwhile
+                self.hits += 1
+                return False
+            # Forget the sources while updating: if the update fails, the
+            # next refresh starts over with a full build
+            self._sources = None
+            version = _version(self.config, current, self._invalidations)
+            if previous is None or not self._builder.incremental:
+                self._build(version)
+            else:
+                changed = [p for p, fp in current.items() if previous.get(p) != fp]
+                deleted = [p for p in previous if p not in current]
+                if any(self._needs_build(Path(p)) for p in [*changed, *deleted]):
+                    self._build(version)
+                else:
+                    with self._lock.write():
+                        self._builder.apply_changes(changed=changed, deleted=deleted)
+                        self._publish(self._builder.state, version)
+                    self.updates += 1
+            self._sources = current
+        return True
+
+    def edit(
+        self, operations: Sequence[Operation], base_version: Optional[str] = None
+    ) -> EditResult:
+        """Apply element operations to the model files and the cached state.
+
+        Args:
+            operations: Upserts and deletes, applied in order
+            base_version: Version the edit was made against; None skips the
+                check
+
+        Returns:
+            EditResult with the new version, the rewritten files and the ids
+            of the changed elements
+
+        Raises:
+            StaleVersionError: If base_version isn't the current version
+            EditError: If an operation can't be applied
+        """
+        with self._refresh_lock:
+            # Not through refresh(): a concurrent refresh may be waiting for
+            # this lock, and joining it would deadlock
+            self._refresh(stat_fingerprints(self.config))
+            if base_version is not None and base_version != self._version:
+                raise StaleVersionError(self._version)
+            assert self._state is not None and self._sources is not None
+            check_operations(self._state, operations)
+            sources = dict(self._sources)
+            self._sources = None  # Rebuild if anything below fails
+            # A new version even if a file was only partly written
+            self._invalidations += 1
+            files = save_operations(self._builder, operations)
+
+            if not self._builder.incremental:
+                self._refresh(stat_fingerprints(self.config))
+                changed: dict[str, list[str]] = {}
+                for op in operations:
+                    for element_id in (op.id, op.target):
+                        if element_id:
+                            changed.setdefault(op.section, []).append(element_id)
+                return EditResult(self._version, files, changed)
+
+            sources.update(stat_fingerprints_of(files))
+            version = _version(self.config, sources, self._invalidations)
+            with self._lock.write():
+                changed = apply_operations(self._builder, operations)
+                self._publish(self._state, version)
+            self._sources = sources
+            self.updates += 1
+        return EditResult(version, files, changed)
+
+    def invalidate(self) -> None:
+        """Force a full rebuild on the next read."""
+        with self._refresh_lock:
+            self._sources = None
+            self._invalidations += 1
+
+    def derived(self, name: str, compute: Callable[[ProjectState], T]) -> T:
+        """Get a value computed from the current state, once per state version.
+
+        Args:
+            name: Cache key of the value
+            compute: Function of the (read-only) state producing the value;
+                the result must not reference mutable parts of the state
+
+        Returns:
+            The value for the current state
+        """
+        return self.versioned(name, compute)[1]
+
+    def scanned_models(self) -> list[ScannedModel]:
+        """Get the models the current state was built from, in scan order.
+
+        Taken from the per-file records of the state's builder, so no
+        schema file is read. Call it with read() held, e.g. from a
+        derived() computation.
+
+        Returns:
+            The models a full scan of the same files would return
+        """
+        keys, models = self._file_models
+        return [model for key in keys for model in models[key]]
+
+    def versioned(
+        self, name: str, compute: Callable[[ProjectState], T]
+    ) -> tuple[str, T]:
+        """Like derived(), together with the version it was computed from.
+
+        Args:
+            name: Cache key of the value
+            compute: Function of the (read-only) state producing the value
+
+        Returns:
+            (state version, value) pair
+        """
+        with self.read() as state:
+            generation = self._generation
+            cached = self._derived.get(name)
+            if cached is not None and cached[0] == generation:
+                return self._version, cached[1]
+
+            def run() -> T:
+                value = compute(state)
+                self._derived[name] = (generation, value)
+                self.computations += 1
+                return value
+
+            # Requests for the same value of the same state share one run
+            value = self._computations.do((name, generation), run)
+            return self._version, value
+
+    def positions(self) -> dict[str, Any]:
+        """Get the node positions from the layout file.
+
+        Returns:
+            The ``positions`` of conceptual_layout.json (empty if there is
+            none), shared between callers and so read-only
+        """
+        return self.layout().positions
+
+    def layout(self) -> Layout:
+        """Get the layout file's positions together with its content hash.
+
+        Returns:
+            Layout read when the file last changed
+        """
+        layout_file = self.config.layout_file
+        try:
+            st = os.stat(layout_file)
+            key: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            key = None
+        cached = self._layout
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        layout = Layout({}, NO_LAYOUT)
+        if key is not None:
+            content = layout_file.read_bytes()
+            layout = Layout(
+                (json.loads(content) or {}).get("positions", {}),
+                hashlib.sha1(content).hexdigest(),
+            )
+        self._layout = (key, layout)
+        return layout
+
+    def invalidate_layout(self) -> None:
+        """Re-read the layout file on the next layout() call."""
+        self._layout = None
+
+    def _build(self, version: str) -> None:
+        """Build a new state; readers of the old one aren't blocked."""
+        state = self._builder.build()
+        with self._lock.write():
+            self._publish(state, version)
+        self.builds += 1
+
+    def _publish(self, state: Optional[ProjectState], version: str) -> None:
+        """Make a built or updated state current (under the write lock)."""
+        self._state = state
+        self._file_models = self._builder.file_models
+        self._version = version
+        self._generation += 1
+
+    def _needs_build(self, path: Path) -> bool:
+        """Whether a changed file is conceptual.yml or one of its fragments."""
+        return path == self.config.conceptual_file or is_fragment_path(
+            self.config, path
+        )
+
+
+def _version(config: Config, sources: StatFingerprints, invalidations: int) -> str:
+    """Hash the settings and source fingerprints a state was built from."""
+    digest = hashlib.sha1(repr((settings_key(config), invalidations)).encode())
+    for path in sorted(sources):
+        mtime_ns, size = sources[path]
+        digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode())
+    return digest.hexdigest()
@@ -7,14 +7,25 @@ v1.0 Validation Rules:
 - W104: Missing definition on concept/relationship (configurable)
 - I001: Stub concept needs domain (info)
 - I002: Stub relationship needs verb (info)
+
+A validator can check one shard of the state (see shard_of()), so a large
+model can be validated across several processes or CI runners and the
+results merged.
 """
 
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Any, Literal, Optional
 
 from dbt_conceptual.config import Config, RuleSeverity
-from dbt_conceptual.state import ProjectState
+from dbt_conceptual.state import (
+    ConceptState,
+    OrphanModel,
+    ProjectState,
+    RelationshipState,
+)
 
 
 class Severity(Enum):
@@ -44,21 +55,98 @@ class ValidationIssue:
     context: Optional[dict] = None
 
 
-class Validator:
-    """Validates conceptual model and dbt implementation correspondence."""
+ElementKind = Literal["concept", "relationship", "orphan"]
+
+
+def shard_of(key: str, count: int) -> int:
+    """Assign an element to one of count shards.
+
+    The assignment is a stable hash of the key, the same in every process
+    and Python version (unlike hash()).
+
+    Args:
+        key: Concept id, relationship source concept or orphan model name
+        count: Number of shards
+
+    Returns:
+        Shard number, from 1 to count
+    """
+    return zlib.crc32(key.encode("utf-8")) % count + 1
 
-    def __init__(self, config: Config, state: ProjectState, no_drafts: bool = False):
+
+@dataclass(frozen=True)
+class Rule:
+    """A validation check applied to each element of one kind.
+
+    Attributes:
+        name: Rule name
+        kind: Elements the rule checks; results are cached per element
+        check: Validator method returning the issues of one element
+        depends_on: Other element kinds the check reads; a changed concept
+            re-checks its incident relationships, a changed domain the
+            concepts assigned to it
+        candidates: Validator method narrowing a full run to the elements
+            that can have issues (None checks every element)
+        setting: Validation setting holding the rule's severity; the rule
+            is skipped when it is ignored
+    """
+
+    name: str
+    kind: ElementKind
+    check: Callable[["Validator", Any, Any], list[ValidationIssue]]
+    depends_on: frozenset[str] = frozenset()
+    candidates: Optional[Callable[["Validator"], Iterable[str]]] = None
+    setting: Optional[str] = None
+
+
+class Validator:
+    """Validates conceptual model and dbt implementation correspondence.
+
+    Issues are cached per rule and element. After validate(), revalidate()
+    re-runs only the checks affected by changed elements of the same
+    (mutated) state and returns the same list as a full run.
+
+    With a shard, only the concepts, relationships and orphan models of
+    that shard are checked: concepts by id, relationships by their source
+    concept and orphan models by name. Every element is in exactly one of
+    the shards, so the shards' issues together, ordered by issue_keys(),
+    are the issues of an unsharded run.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        state: ProjectState,
+        no_drafts: bool = False,
+        shard: Optional[tuple[int, int]] = None,
+    ):
         """Initialize the validator.
 
         Args:
             config: Configuration object
             state: Project state to validate
             no_drafts: If True, treat stub/draft concepts as errors
+            shard: (index, count) to check only shard index (1-based) of
+                count; None checks everything
+
+        Raises:
+            ValueError: If the shard is out of range
         """
+        if shard is not None and not 1 <= shard[0] <= shard[1]:
+            raise ValueError(f"Invalid shard {shard[0]}/{shard[1]}")
         self.config = config
         self.state = state
         self.no_drafts = no_drafts
+        self.shard = shard
         self.issues: list[ValidationIssue] = []
+        # Rule name -> element id -> issues, for elements with issues
+        self._results: Optional[dict[str, dict[str, list[ValidationIssue]]]] = None
+        # Rules whose results are no longer in state order
+        self._unordered: set[str] = set()
+        # Orphan models of the last run and the issues of each
+        self._orphans: list[OrphanModel] = []
+        self._orphan_results: list[list[ValidationIssue]] = []
+        self._severities: dict[str, Optional[Severity]] = {}
 
     def validate(self) -> list[ValidationIssue]:
         """Run all validation checks.
@@ -66,222 +154,484 @@ class Validator:
         Returns:
             List of validation issues found
         """
-        self.issues = []
+        self._load_severities()
+        self._results = {rule.name: {} for rule in RULES}
+        self._unordered = set()
+        self._orphans = []
+        self._orphan_results = []
+        for rule in RULES:
+            if self._ignored(rule):
+                continue
+            if rule.kind == "orphan":
+                self._check_orphans(rule)
+                continue
+            check = rule.check
+            # Results follow state order, so _collect() can chain them
+            self._results[rule.name] = {
+                element_id: issues
+                for element_id, element in self._targets(rule)
+                if (issues := check(self, element_id, element))
+            }
+        self.issues = self._collect()
+        return self.issues
+
+    def iter_issues(self, fail_fast: bool = False) -> Iterator[ValidationIssue]:
+        """Run all validation checks, yielding issues as they are found.
 
-        # Hardcoded as errors - unknown refs are always errors
-        self._validate_relationship_endpoints()
+        Yields the issues of validate(), in the same order, without keeping
+        them: self.issues and the cache used by revalidate() are left alone.
 
-        # Configurable rules
-        self._validate_orphan_models()
-        self._validate_unimplemented_concepts()
-        self._validate_missing_definitions()
+        Args:
+            fail_fast: Stop after the first error-level issue
 
-        # Always run - domain references
-        self._validate_domain_references()
+        Yields:
+            Validation issues
+        """
+        self._load_severities()
+        for rule in RULES:
+            if self._ignored(rule):
+                continue
+            check = rule.check
+            if rule.kind == "orphan":
+                elements: Iterable[tuple[Any, Any]] = (
+                    (orphan.name, orphan)
+                    for orphan in self.state.orphan_models
+                    if self._owns("orphan", orphan.name, orphan)
+                )
+            else:
+                elements = self._targets(rule)
+            for element_id, element in elements:
+                for issue in check(self, element_id, element):
+                    yield issue
+                    if fail_fast and issue.severity == Severity.ERROR:
+                        return
+
+    def revalidate(
+        self,
+        concepts: Iterable[str] = (),
+        relationships: Iterable[str] = (),
+        domains: Iterable[str] = (),
+    ) -> list[ValidationIssue]:
+        """Re-run the checks affected by changed elements.
+
+        Orphan models are compared with the previous run automatically.
+        Configuration changes need a full validate().
 
-        # Info/stub checks
-        self._check_stub_concepts()
+        Args:
+            concepts: Ids of concepts added, removed or modified since the
+                last run (including changes to their models)
+            relationships: Ids of relationships added, removed or modified
+            domains: Ids of domains added, removed or modified
 
+        Returns:
+            List of validation issues, identical to validate() on the
+            current state
+        """
+        if self._results is None:
+            return self.validate()
+
+        changed: dict[str, set[str]] = {
+            "concept": set(concepts),
+            "relationship": set(relationships),
+            "domain": set(domains),
+        }
+        index = self.state.index
+        for rule in RULES:
+            if self._ignored(rule):
+                continue
+            if rule.kind == "orphan":
+                self._check_orphans(rule)
+                continue
+            dirty = set(changed[rule.kind])
+            if "concept" in rule.depends_on:
+                for concept_id in changed["concept"]:
+                    dirty.update(index.relationships_for_concept(concept_id))
+            if "domain" in rule.depends_on:
+                for domain_id in changed["domain"]:
+                    dirty.update(index.concepts_in_domain(domain_id))
+            self._check(rule, dirty)
+        self.issues = self._collect()
         return self.issues
 
-    def _validate_relationship_endpoints(self) -> None:
-        """Validate that relationship endpoints reference existing concepts.
+    def _load_severities(self) -> None:
+        validation = self.config.validation
+        self._severities = {
+            rule: _rule_to_severity(validation.get_severity(rule, "gold"))
+            for rule in (
+                "orphan_models",
+                "unimplemented_concepts",
+                "missing_definitions",
+            )
+        }
 
-        E002: Always an error - creates ghost concepts.
+    def _targets(self, rule: Rule) -> Iterator[tuple[str, Any]]:
+        """Concepts or relationships a full run checks, in state order."""
+        candidates = set(rule.candidates(self)) if rule.candidates else None
+        if self.shard is not None:
+            owned = self._owned(rule.kind)
+            candidates = owned if candidates is None else candidates & owned
+        elements = self._elements(rule.kind).items()
+        if candidates is None:
+            return iter(elements)
+        return (item for item in elements if item[0] in candidates)
+
+    def _ignored(self, rule: Rule) -> bool:
+        return rule.setting is not None and self._severities[rule.setting] is None
+
+    def _elements(self, kind: ElementKind) -> dict[str, Any]:
+        if kind == "concept":
+            return self.state.concepts
+        return self.state.relationships
+
+    def _owns(self, kind: ElementKind, key: str, element: Any) -> bool:
+        """Check whether an element is in this validator's shard."""
+        if self.shard is None:
+            return True
+        if kind == "relationship":
+            key = element.from_concept
+        elif kind == "orphan":
+            key = element.name
+        return shard_of(key, self.shard[1]) == self.shard[0]
+
+    def _owned(self, kind: ElementKind) -> set[str]:
+        """Ids of the concepts or relationships in this validator's shard."""
+        return {
+            element_id
+            for element_id, element in self._elements(kind).items()
+            if self._owns(kind, element_id, element)
+        }
+
+    def _check(self, rule: Rule, element_ids: Iterable[str]) -> None:
+        """Re-check elements of a rule's kind, updating the cached results.
+
+        New results (and elements removed and added again, which move to
+        the end of the state) are put back in state order by _collect().
         """
-        for rel_id, rel in self.state.relationships.items():
-            if rel.from_concept not in self.state.concepts:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        code="E002",
-                        message=f"Relationship '{rel_id}' references non-existent concept '{rel.from_concept}'",
-                        context={
-                            "relationship": rel_id,
-                            "missing_concept": rel.from_concept,
-                        },
-                    )
+        assert self._results is not None
+        results = self._results[rule.name]
+        elements = self._elements(rule.kind)
+        check = rule.check
+        found = False
+        for element_id in element_ids:
+            element = elements.get(element_id)
+            if element is not None and not self._owns(rule.kind, element_id, element):
+                element = None
+            issues = check(self, element_id, element) if element is not None else None
+            if issues:
+                found = True
+                results[element_id] = issues
+            else:
+                results.pop(element_id, None)
+        if found:
+            self._unordered.add(rule.name)
+
+    def _check_orphans(self, rule: Rule) -> None:
+        """Check orphan models, reusing the results of unchanged ones."""
+        orphans = list(self.state.orphan_models)
+        if self.shard is not None:
+            orphans = [o for o in orphans if self._owns("orphan", o.name, o)]
+        if orphans == self._orphans:
+            return
+        check = rule.check
+        previous = {
+            (orphan.name, orphan.path): issues
+            for orphan, issues in zip(self._orphans, self._orphan_results)
+        }
+        self._orphans = orphans
+        self._orphan_results = [
+            previous.get((orphan.name, orphan.path)) or check(self, orphan.name, orphan)
+            for orphan in orphans
+        ]
+
+    def _collect(self) -> list[ValidationIssue]:
+        """Assemble cached results in rule order, then state order."""
+        assert self._results is not None
+        issues: list[ValidationIssue] = []
+        for rule in RULES:
+            if rule.kind == "orphan":
+                for found in self._orphan_results:
+                    issues.extend(found)
+                continue
+            results = self._results[rule.name]
+            if rule.name in self._unordered:
+                results = {
+                    element_id: results[element_id]
+                    for element_id in self._elements(rule.kind)
+                    if element_id in results
+                }
+                self._results[rule.name] = results
+                self._unordered.discard(rule.name)
+            for found in results.values():
+                issues.extend(found)
+        return issues
+
+    def issue_keys(self) -> list[tuple[int, int]]:
+        """Sort keys of the issues of the last run.
+
+        An unsharded run lists issues by rule, then by the position of
+        their element in the state. Sorting the issues of all shards by
+        these keys (stably) gives the same list.
+
+        Returns:
+            (rule number, element position) of each issue, in the order of
+            issues
+        """
+        if self._results is None:
+            return []
+        positions = {
+            kind: {element_id: i for i, element_id in enumerate(elements)}
+            for kind, elements in (
+                ("concept", self.state.concepts),
+                ("relationship", self.state.relationships),
+            )
+        }
+        keys: list[tuple[int, int]] = []
+        for number, rule in enumerate(RULES):
+            if rule.kind == "orphan":
+                owned = (
+                    i
+                    for i, orphan in enumerate(self.state.orphan_models)
+                    if self._owns("orphan", orphan.name, orphan)
                 )
+                for position, found in zip(owned, self._orphan_results):
+                    keys.extend([(number, position)] * len(found))
+                continue
+            kind_positions = positions[rule.kind]
+            for element_id, found in self._results[rule.name].items():
+                keys.extend([(number, kind_positions[element_id])] * len(found))
+        return keys
+
+    # Candidates: elements a full run needs to check
+
+    def _endpoint_candidates(self) -> list[str]:
+        """Relationships with an endpoint that is not a concept."""
+        concepts = self.state.concepts
+        index = self.state.index
+        return [
+            rel_id
+            for endpoint in index.relationship_endpoints()
+            if endpoint not in concepts
+            for rel_id in index.relationships_for_concept(endpoint)
+        ]
+
+    def _domain_reference_candidates(self) -> list[str]:
+        """Concepts assigned to a domain that doesn't exist."""
+        index = self.state.index
+        return [
+            concept_id
+            for domain in index.concept_domains()
+            if domain and domain not in self.state.domains
+            for concept_id in index.concepts_in_domain(domain)
+        ]
+
+    def _stub_relationship_candidates(self) -> list[str]:
+        """Relationships incident to a missing, ghost or stub endpoint."""
+        index = self.state.index
+        concepts = self.state.concepts
+        candidates: list[str] = []
+        for endpoint in index.relationship_endpoints():
+            endpoint_concept = concepts.get(endpoint)
+            if (
+                endpoint_concept is None
+                or endpoint_concept.is_ghost
+                or endpoint_concept.status == "stub"
+            ):
+                candidates.extend(index.relationships_for_concept(endpoint))
+        return candidates
+
+    # Checks: the issues of one element
+
+    def _check_relationship_endpoints(
+        self, rel_id: str, rel: RelationshipState
+    ) -> list[ValidationIssue]:
+        """Validate that relationship endpoints reference existing concepts.
 
-            if rel.to_concept not in self.state.concepts:
-                self.issues.append(
+        E002: Always an error - creates ghost concepts.
+        """
+        issues = []
+        for endpoint in (rel.from_concept, rel.to_concept):
+            if endpoint not in self.state.concepts:
+                issues.append(
                     ValidationIssue(
                         severity=Severity.ERROR,
                         code="E002",
-                        message=f"Relationship '{rel_id}' references non-existent concept '{rel.to_concept}'",
+                        message=f"Relationship '{rel_id}' references non-existent concept '{endpoint}'",
                         context={
                             "relationship": rel_id,
-                            "missing_concept": rel.to_concept,
+                            "missing_concept": endpoint,
                         },
                     )
                 )
+        return issues
 
-    def _validate_orphan_models(self) -> None:
+    def _check_orphan_model(
+        self, model_name: str, orphan: OrphanModel
+    ) -> list[ValidationIssue]:
         """Check for models not linked to any concept.
 
         W101: Configurable severity.
         """
-        severity = _rule_to_severity(
-            self.config.validation.get_severity("orphan_models", "gold")
-        )
+        severity = self._severities["orphan_models"]
         if severity is None:
-            return
-
-        if self.state.orphan_models:
-            for orphan in self.state.orphan_models:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=severity,
-                        code="W101",
-                        message=f"Model '{orphan.name}' is not linked to any concept",
-                        context={"model": orphan.name, "path": orphan.path},
-                    )
-                )
-
-    def _validate_unimplemented_concepts(self) -> None:
+            return []
+        return [
+            ValidationIssue(
+                severity=severity,
+                code="W101",
+                message=f"Model '{orphan.name}' is not linked to any concept",
+                context={"model": orphan.name, "path": orphan.path},
+            )
+        ]
+
+    def _check_unimplemented_concept(
+        self, concept_id: str, concept: ConceptState
+    ) -> list[ValidationIssue]:
         """Check for concepts with no implementing models.
 
         W102: Configurable severity.
         """
-        severity = _rule_to_severity(
-            self.config.validation.get_severity("unimplemented_concepts", "gold")
-        )
-        if severity is None:
-            return
-
-        for concept_id, concept in self.state.concepts.items():
-            if concept.is_ghost:
-                continue  # Ghosts are already errors
-
-            if not concept.models:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=severity,
-                        code="W102",
-                        message=f"Concept '{concept_id}' has no implementing models",
-                        context={"concept": concept_id, "status": concept.status},
-                    )
-                )
-
-    def _validate_missing_definitions(self) -> None:
-        """Check for non-stub concepts/relationships missing definitions.
+        severity = self._severities["unimplemented_concepts"]
+        if severity is None or concept.is_ghost or concept.models:
+            return []  # Ghosts are already errors
+        return [
+            ValidationIssue(
+                severity=severity,
+                code="W102",
+                message=f"Concept '{concept_id}' has no implementing models",
+                context={"concept": concept_id, "status": concept.status},
+            )
+        ]
+
+    def _check_concept_definition(
+        self, concept_id: str, concept: ConceptState
+    ) -> list[ValidationIssue]:
+        """Check for non-stub concepts missing definitions.
 
         W104: Configurable severity.
         """
-        severity = _rule_to_severity(
-            self.config.validation.get_severity("missing_definitions", "gold")
-        )
-        if severity is None:
-            return
-
-        # Check concepts
-        for concept_id, concept in self.state.concepts.items():
-            if concept.status == "stub" or concept.is_ghost:
-                continue
-            if not concept.definition:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=severity,
-                        code="W104",
-                        message=f"Concept '{concept_id}' is missing a definition",
-                        context={"concept": concept_id, "status": concept.status},
-                    )
-                )
+        severity = self._severities["missing_definitions"]
+        if (
+            severity is None
+            or concept.status == "stub"
+            or concept.is_ghost
+            or concept.definition
+        ):
+            return []
+        return [
+            ValidationIssue(
+                severity=severity,
+                code="W104",
+                message=f"Concept '{concept_id}' is missing a definition",
+                context={"concept": concept_id, "status": concept.status},
+            )
+        ]
+
+    def _check_relationship_definition(
+        self, rel_id: str, rel: RelationshipState
+    ) -> list[ValidationIssue]:
+        """Check for relationships missing definitions.
 
-        # Check relationships
-        for rel_id, rel in self.state.relationships.items():
-            if not rel.definition:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=severity,
-                        code="W104",
-                        message=f"Relationship '{rel_id}' is missing a definition",
-                        context={"relationship": rel_id},
-                    )
-                )
-
-    def _validate_domain_references(self) -> None:
+        W104: Configurable severity.
+        """
+        severity = self._severities["missing_definitions"]
+        if severity is None or rel.definition:
+            return []
+        return [
+            ValidationIssue(
+                severity=severity,
+                code="W104",
+                message=f"Relationship '{rel_id}' is missing a definition",
+                context={"relationship": rel_id},
+            )
+        ]
+
+    def _check_domain_reference(
+        self, concept_id: str, concept: ConceptState
+    ) -> list[ValidationIssue]:
         """Validate that concept domain references exist.
 
         W001: Warning when domain not found.
         """
-        for concept_id, concept in self.state.concepts.items():
-            if concept.domain and concept.domain not in self.state.domains:
-                self.issues.append(
-                    ValidationIssue(
-                        severity=Severity.WARNING,
-                        code="W001",
-                        message=f"Concept '{concept_id}' references unknown domain '{concept.domain}'",
-                        context={"concept": concept_id, "domain": concept.domain},
-                    )
-                )
-
-    def _check_stub_concepts(self) -> None:
-        """Info messages for stub concepts/relationships (or errors if --no-drafts).
+        if not concept.domain or concept.domain in self.state.domains:
+            return []
+        return [
+            ValidationIssue(
+                severity=Severity.WARNING,
+                code="W001",
+                message=f"Concept '{concept_id}' references unknown domain '{concept.domain}'",
+                context={"concept": concept_id, "domain": concept.domain},
+            )
+        ]
+
+    def _check_stub_concept(
+        self, concept_id: str, concept: ConceptState
+    ) -> list[ValidationIssue]:
+        """Info messages for stub/draft concepts (or errors if --no-drafts).
 
         I001: Stub concept needs enrichment
-        I002: Stub relationship needs enrichment
         """
-        # Check concepts
-        for concept_id, concept in self.state.concepts.items():
-            if concept.is_ghost:
-                continue  # Ghosts have their own errors
-
-            if concept.status in ("stub", "draft"):
-                missing = []
-                if not concept.domain:
-                    missing.append("domain")
-                if not concept.owner:
-                    missing.append("owner")
-                if not concept.definition:
-                    missing.append("definition")
-
-                if missing:
-                    severity = Severity.ERROR if self.no_drafts else Severity.INFO
-                    code = "E201" if self.no_drafts else "I001"
-                    status_label = concept.status.capitalize()
-
-                    self.issues.append(
-                        ValidationIssue(
-                            severity=severity,
-                            code=code,
-                            message=f"{status_label} concept '{concept_id}' needs enrichment: missing {', '.join(missing)}",
-                            context={
-                                "concept": concept_id,
-                                "missing": missing,
-                                "status": concept.status,
-                            },
-                        )
-                    )
+        if concept.is_ghost or concept.status not in ("stub", "draft"):
+            return []  # Ghosts have their own errors
+        missing = []
+        if not concept.domain:
+            missing.append("domain")
+        if not concept.owner:
+            missing.append("owner")
+        if not concept.definition:
+            missing.append("definition")
+        if not missing:
+            return []
+
+        severity = Severity.ERROR if self.no_drafts else Severity.INFO
+        code = "E201" if self.no_drafts else "I001"
+        status_label = concept.status.capitalize()
+        return [
+            ValidationIssue(
+                severity=severity,
+                code=code,
+                message=f"{status_label} concept '{concept_id}' needs enrichment: missing {', '.join(missing)}",
+                context={
+                    "concept": concept_id,
+                    "missing": missing,
+                    "status": concept.status,
+                },
+            )
+        ]
+
+    def _check_stub_relationship(
+        self, rel_id: str, rel: RelationshipState
+    ) -> list[ValidationIssue]:
+        """Info messages for stub relationships (or errors if --no-drafts).
 
-        # Check relationships
-        for _, rel in self.state.relationships.items():
-            status = rel.get_status(self.state.concepts)
-            if status == "stub":
-                missing = []
-                if not rel.definition:
-                    missing.append("definition")
-
-                severity = Severity.ERROR if self.no_drafts else Severity.INFO
-                code = "E202" if self.no_drafts else "I002"
-
-                if missing:
-                    msg = f"Stub relationship '{rel.name}' needs enrichment: missing {', '.join(missing)}"
-                else:
-                    msg = f"Stub relationship '{rel.name}' has stub/ghost endpoint concepts"
-
-                self.issues.append(
-                    ValidationIssue(
-                        severity=severity,
-                        code=code,
-                        message=msg,
-                        context={
-                            "relationship": rel.name,
-                            "missing": missing,
-                            "status": status,
-                        },
-                    )
-                )
+        I002: Stub relationship needs enrichment
+        """
+        status = rel.get_status(self.state.concepts)
+        if status != "stub":
+            return []
+        missing = []
+        if not rel.definition:
+            missing.append("definition")
+
+        severity = Severity.ERROR if self.no_drafts else Severity.INFO
+        code = "E202" if self.no_drafts else "I002"
+
+        if missing:
+            msg = f"Stub relationship '{rel.name}' needs enrichment: missing {', '.join(missing)}"
+        else:
+            msg = f"Stub relationship '{rel.name}' has stub/ghost endpoint concepts"
+
+        return [
+            ValidationIssue(
+                severity=severity,
+                code=code,
+                message=msg,
+                context={
+                    "relationship": rel.name,
+                    "missing": missing,
+                    "status": status,
+                },
+            )
+        ]
 
     def has_errors(self) -> bool:
         """Check if there are any error-level issues.
@@ -312,3 +662,54 @@ class Validator:
                 summary["info"] += 1
 
         return summary
+
+
+# In report order; a full run lists each rule's issues in state order
+RULES: tuple[Rule, ...] = (
+    Rule(
+        "relationship_endpoints",
+        "relationship",
+        Validator._check_relationship_endpoints,
+        depends_on=frozenset({"concept"}),
+        candidates=Validator._endpoint_candidates,
+    ),
+    Rule(
+        "orphan_models",
+        "orphan",
+        Validator._check_orphan_model,
+        setting="orphan_models",
+    ),
+    Rule(
+        "unimplemented_concepts",
+        "concept",
+        Validator._check_unimplemented_concept,
+        setting="unimplemented_concepts",
+    ),
+    Rule(
+        "concept_definitions",
+        "concept",
+        Validator._check_concept_definition,
+        setting="missing_definitions",
+    ),
+    Rule(
+        "relationship_definitions",
+        "relationship",
+        Validator._check_relationship_definition,
+        setting="missing_definitions",
+    ),
+    Rule(
+        "domain_references",
+        "concept",
+        Validator._check_domain_reference,
+        depends_on=frozenset({"domain"}),
+        candidates=Validator._domain_reference_candidates,
+    ),
+    Rule("stub_concepts", "concept", Validator._check_stub_concept),
+    Rule(
+        "stub_relationships",
+        "relationship",
+        Validator._check_stub_relationship,
+        depends_on=frozenset({"concept"}),
+        candidates=Validator._stub_relationship_candidates,
+    ),
+)
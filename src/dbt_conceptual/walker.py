@@ -0,0 +1,331 @@
+"""Discovery of schema files matching the configured gold paths.
+
+All ``gold_paths`` patterns are compiled into one matcher and the project is
+walked once with ``os.scandir``. The walk starts at the literal directory
+prefix of each pattern, never descends into directories that no pattern can
+match below, and skips excluded directories. By default these are the
+build and tooling directories at the project root (``target``,
+``dbt_packages``, ``logs`` ...); a model folder that happens to be called
+``logs`` further down is still walked. Files are deduplicated on
+``(st_dev, st_ino)`` (their real path where the platform reports no inode
+numbers, as ``os.scandir`` does on Windows) so that overlapping patterns
+and symlinks yield each file once.
+
+Pattern semantics follow ``Path.glob`` (``*`` and ``?`` stay within one
+path segment, ``**`` spans any number of directories). As before, a pattern
+without ``*`` names a single file or a directory whose YAML files are all
+included. Glob patterns only ever yield ``.yml``/``.yaml`` files.
+"""
+
+import fnmatch
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Optional, Union
+
+# Project-relative directories excluded when no exclude list is configured
+DEFAULT_EXCLUDE = [
+    "target",
+    "dbt_packages",
+    "dbt_modules",
+    "logs",
+    "node_modules",
+    ".git",
+    ".venv",
+    "__pycache__",
+    ".dbt_conceptual",
+]
+
+YAML_SUFFIXES = (".yml", ".yaml")
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one glob path segment (no '/') to a regex fragment."""
+    parts: list[str] = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        i += 1
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = segment.find("]", i + 1 if segment[i : i + 1] in "!]" else i)
+            if end == -1:
+                parts.append(re.escape(char))
+                continue
+            body = segment[i:end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+class _Pattern:
+    """A compiled gold path pattern."""
+
+    def __init__(self, pattern: str):
+        pattern = pattern.strip("/")
+        self.is_glob = "*" in pattern
+        segments = [s for s in pattern.split("/") if s not in ("", ".")]
+
+        if not self.is_glob:
+            # Literal file, or directory of YAML files
+            self.literal: Optional[str] = "/".join(segments)
+            self.root = segments
+            segments = [*segments, "**", "*.y*ml"]
+        else:
+            self.literal = None
+            self.root = []
+            for segment in segments:
+                if any(c in segment for c in "*?["):
+                    break
+                self.root.append(segment)
+
+        self.segments = [
+            None if s == "**" else re.compile(_translate_segment(s)) for s in segments
+        ]
+
+        regex = ""
+        for index, segment in enumerate(segments):
+            last = index == len(segments) - 1
+            if segment == "**":
+                regex += "(?:[^/]+/)*[^/]+" if last else "(?:[^/]+/)*"
+            else:
+                regex += _translate_segment(segment) + ("" if last else "/")
+        self.regex = re.compile(regex)
+
+    def could_contain(self, parts: tuple[str, ...]) -> bool:
+        """Check whether a directory (given by its parts) may hold matches."""
+        for index, part in enumerate(parts):
+            if index >= len(self.segments):
+                return False
+            segment = self.segments[index]
+            if segment is None:
+                return True
+            # The last segment names files, so no directory can match it
+            if index == len(self.segments) - 1 or not segment.fullmatch(part):
+                return False
+        return True
+
+
+class GoldPathMatcher:
+    """All gold path patterns compiled into a single matcher."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """Compile the patterns.
+
+        Args:
+            patterns: Gold path patterns, relative to the project directory
+        """
+        self.patterns = [_Pattern(p) for p in patterns]
+        self.literals = [p.literal for p in self.patterns if p.literal is not None]
+        alternatives = [p.regex.pattern for p in self.patterns]
+        self._regex = (
+            re.compile("|".join(f"(?:{a})" for a in alternatives))
+            if alternatives
+            else None
+        )
+
+    def matches(self, rel_path: str) -> bool:
+        """Check whether a project-relative POSIX path is a schema file to scan.
+
+        Args:
+            rel_path: Path relative to the project directory, '/' separated
+
+        Returns:
+            True if the path matches any pattern
+        """
+        if rel_path in self.literals:
+            return True
+        if not rel_path.endswith(YAML_SUFFIXES) or self._regex is None:
+            return False
+        return self._regex.fullmatch(rel_path) is not None
+
+    def could_contain(self, parts: tuple[str, ...]) -> bool:
+        """Check whether any pattern can match below a directory."""
+        return any(p.could_contain(parts) for p in self.patterns)
+
+    def roots(self) -> list[tuple[str, ...]]:
+        """Get the minimal set of directories the walk has to start from."""
+        roots = sorted({tuple(p.root) for p in self.patterns})
+        minimal: list[tuple[str, ...]] = []
+        for root in roots:
+            if not any(root[: len(kept)] == kept for kept in minimal):
+                minimal.append(root)
+        return minimal
+
+
+class _Exclusions:
+    """Compiled exclude patterns.
+
+    The defaults only match project-relative paths. Configured patterns
+    match a directory's name at any depth or its project-relative path.
+    """
+
+    def __init__(self, exclude: Optional[Iterable[str]]):
+        self.anchored = list(DEFAULT_EXCLUDE) if exclude is None else []
+        self.anywhere = [] if exclude is None else list(exclude)
+
+    def __call__(self, name: str, rel: str) -> bool:
+        return any(
+            fnmatch.fnmatchcase(rel, pattern) for pattern in self.anchored
+        ) or any(
+            fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(rel, pattern)
+            for pattern in self.anywhere
+        )
+
+
+def _identity(path: str, st: os.stat_result) -> Union[tuple[int, int], str]:
+    """Key identifying a file or directory across paths and symlinks."""
+    if st.st_ino == 0:
+        # os.scandir() on Windows doesn't report inode numbers
+        return os.path.realpath(path)
+    return (st.st_dev, st.st_ino)
+
+
+def is_schema_file(
+    matcher: GoldPathMatcher,
+    parts: tuple[str, ...],
+    exclude: Optional[Iterable[str]] = None,
+) -> bool:
+    """Check whether walk_schema_files would yield a project-relative path.
+
+    Used to classify a single changed file without walking the project.
+
+    Args:
+        matcher: Compiled gold path patterns
+        parts: Path components relative to the project directory
+        exclude: Excluded directories, as for walk_schema_files
+
+    Returns:
+        True if the path matches and no directory on the way is pruned
+    """
+    if not matcher.matches("/".join(parts)):
+        return False
+    is_excluded = _Exclusions(exclude)
+    roots = [root for root in matcher.roots() if parts[: len(root)] == root]
+    if not roots:
+        return False
+    # Directories between the walk root and the file are subject to pruning
+    for depth in range(len(roots[0]) + 1, len(parts)):
+        directory = parts[:depth]
+        if is_excluded(directory[-1], "/".join(directory)):
+            return False
+        if not matcher.could_contain(directory):
+            return False
+    return True
+
+
+def walk_schema_files(
+    project_dir: Path,
+    patterns: Iterable[str],
+    exclude: Optional[Iterable[str]] = None,
+) -> Iterator[Path]:
+    """Find schema files matching gold path patterns in one pruned walk.
+
+    Args:
+        project_dir: Project root the patterns are relative to
+        patterns: Gold path patterns
+        exclude: Directory names (or project-relative paths, glob allowed)
+            never descended into. None excludes the DEFAULT_EXCLUDE
+            directories at the project root only.
+
+    Yields:
+        Paths (project_dir / relative path), each file once, sorted by their
+        relative path components
+    """
+    for parts, _st in _walk(project_dir, patterns, exclude):
+        yield project_dir.joinpath(*parts)
+
+
+def walk_schema_file_stats(
+    project_dir: Path,
+    patterns: Iterable[str],
+    exclude: Optional[Iterable[str]] = None,
+) -> Iterator[tuple[str, os.stat_result]]:
+    """Find schema files like walk_schema_files, with their stat() results.
+
+    The walk stats every file anyway, so this costs no extra system calls.
+    Paths are plain strings, which is cheaper than Path objects when only
+    the files' fingerprints are needed.
+
+    Args:
+        project_dir: Project root the patterns are relative to
+        patterns: Gold path patterns
+        exclude: Excluded directories, as for walk_schema_files
+
+    Yields:
+        (path string, stat result) pairs in walk_schema_files order
+    """
+    base = str(project_dir)
+    for parts, st in _walk(project_dir, patterns, exclude):
+        yield os.path.join(base, *parts), st
+
+
+def _walk(
+    project_dir: Path,
+    patterns: Iterable[str],
+    exclude: Optional[Iterable[str]],
+) -> Iterator[tuple[tuple[str, ...], os.stat_result]]:
+    """Walk the project; yield unique matching files' parts and stat results."""
+    matcher = GoldPathMatcher(patterns)
+    is_excluded = _Exclusions(exclude)
+
+    found: list[tuple[tuple[str, ...], os.stat_result]] = []
+    visited_dirs: set[Union[tuple[int, int], str]] = set()
+
+    for root in matcher.roots():
+        root_path = project_dir.joinpath(*root)
+        try:
+            root_stat = root_path.stat()
+        except OSError:
+            continue
+
+        if not root_path.is_dir():
+            # Literal file pattern
+            if matcher.matches("/".join(root)):
+                found.append((root, root_stat))
+            continue
+
+        stack: list[tuple[tuple[str, ...], Path]] = [(root, root_path)]
+        visited_dirs.add(_identity(str(root_path), root_stat))
+        while stack:
+            parts, directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            for entry in entries:
+                child = (*parts, entry.name)
+                rel = "/".join(child)
+                try:
+                    if entry.is_dir():
+                        if is_excluded(entry.name, rel):
+                            continue
+                        if not matcher.could_contain(child):
+                            continue
+                        key = _identity(entry.path, entry.stat())
+                        if key in visited_dirs:
+                            continue  # Symlink loop or already walked
+                        visited_dirs.add(key)
+                        stack.append((child, Path(entry.path)))
+                    elif matcher.matches(rel):
+                        found.append((child, entry.stat()))
+                except OSError:
+                    continue
+
+    found.sort(key=lambda item: item[0])
+    seen_files: set[Union[tuple[int, int], str]] = set()
+    for parts, st in found:
+        key = _identity(os.path.join(project_dir, *parts), st)
+        if key in seen_files:
+            continue
+        seen_files.add(key)
+        yield parts, st
@@ -0,0 +1,191 @@
+"""YAML reading and writing for dbt-conceptual.
+
+Every YAML read and write in the package goes through this module so that
+the libyaml-backed ``CSafeLoader``/``CSafeDumper`` are used whenever PyYAML
+was built with them. They are typically 5-10x faster than the pure-Python
+implementations. When libyaml is not available the pure-Python safe
+loader/dumper are used instead, with identical results.
+
+Files that are read repeatedly in one process (conceptual.yml is read by
+Config.load, the parser, the CLI and most server endpoints) go through
+the shared document cache: ``load_yaml_document`` parses a file once and
+serves the parsed document until the file's mtime or size changes.
+"""
+
+import copy
+import os
+import threading
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+    HAS_LIBYAML = False
+
+# Re-exported so callers don't need to import yaml just to catch parse errors
+YAMLError = yaml.YAMLError
+
+__all__ = [
+    "HAS_LIBYAML",
+    "SafeDumper",
+    "SafeLoader",
+    "YAMLError",
+    "DocumentCache",
+    "document_cache",
+    "dump_yaml",
+    "load_yaml",
+    "load_yaml_document",
+    "load_yaml_file",
+]
+
+
+def load_yaml(stream: Union[str, bytes, IO[str], IO[bytes]]) -> Any:
+    """Parse a single YAML document with the safe loader.
+
+    Args:
+        stream: YAML text, bytes or an open file
+
+    Returns:
+        Parsed Python object (None for an empty document)
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file with the safe loader.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed Python object (None for an empty file)
+    """
+    # Binary mode lets libyaml detect the encoding and skip text decoding
+    with open(path, "rb") as f:
+        return load_yaml(f)
+
+
+def dump_yaml(data: Any, stream: Optional[IO[str]] = None, **kwargs: Any) -> Any:
+    """Serialize data to YAML with the safe dumper.
+
+    Defaults to block style with insertion-ordered keys, which is how
+    conceptual.yml is written everywhere in dbt-conceptual.
+
+    Args:
+        data: Data to serialize
+        stream: Open text file to write to (returns a string when None)
+        **kwargs: Extra options passed through to ``yaml.dump``
+
+    Returns:
+        YAML string when stream is None, otherwise None
+    """
+    kwargs.setdefault("sort_keys", False)
+    kwargs.setdefault("default_flow_style", False)
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+class DocumentCache:
+    """Parsed YAML documents keyed on (path, mtime_ns, size).
+
+    A file is parsed at most once until it changes on disk. Documents are
+    shared between callers, so they must be treated as read-only; pass
+    ``copy=True`` to get a private deep copy to modify. Writers should call
+    invalidate() after rewriting a file, since a same-size rewrite within
+    the filesystem's timestamp resolution keeps the old key.
+
+    Attributes:
+        parses: Number of files parsed so far (for tests and diagnostics)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[str, tuple[int, int, Any]] = {}
+        self._lock = threading.Lock()
+        # One lock per file: different files parse concurrently, while
+        # concurrent loads of the same file share a single parse
+        self._file_locks: dict[str, threading.Lock] = {}
+        self.parses = 0
+
+    def load(self, path: Path, copy: bool = False) -> Any:
+        """Get the parsed content of a YAML file.
+
+        Args:
+            path: Path to the YAML file
+            copy: Return a deep copy the caller may modify
+
+        Returns:
+            Parsed Python object (None for an empty file)
+
+        Raises:
+            OSError: If the file can't be read
+            YAMLError: If the file isn't valid YAML
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            file_lock = self._file_locks.setdefault(key, threading.Lock())
+        with file_lock:
+            # Stat before reading: a write racing the parse only makes the
+            # next call see a newer mtime and parse again
+            st = os.stat(key)
+            entry = self._entries.get(key)
+            if entry is None or entry[:2] != (st.st_mtime_ns, st.st_size):
+                entry = (st.st_mtime_ns, st.st_size, load_yaml_file(Path(key)))
+                with self._lock:
+                    self._entries[key] = entry
+                    self.parses += 1
+        return _deepcopy(entry[2]) if copy else entry[2]
+
+    def store(self, path: Path, document: Any) -> None:
+        """Record the document a writer just wrote to a file.
+
+        Saves the next load() from parsing the file again. The document must
+        be exactly what the file now parses to, and is shared from here on.
+
+        Args:
+            path: File that was written
+            document: Its parsed content
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        with self._lock:
+            self._entries[key] = (st.st_mtime_ns, st.st_size, document)
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Forget a file's document (or all documents).
+
+        Args:
+            path: File to forget; None clears the whole cache
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+_deepcopy = copy.deepcopy
+
+# Process-wide cache used by load_yaml_document()
+document_cache = DocumentCache()
+
+
+def load_yaml_document(path: Path, copy: bool = False) -> Any:
+    """Parse a YAML file through the shared document cache.
+
+    Args:
+        path: Path to the YAML file
+        copy: Return a deep copy the caller may modify (the default shares
+            the cached document, which must not be mutated)
+
+    Returns:
+        Parsed Python object (None for an empty file)
+    """
+    return document_cache.load(path, copy=copy)
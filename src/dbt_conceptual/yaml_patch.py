@@ -0,0 +1,632 @@
+"""In-place patching of YAML files.
+
+Rewriting conceptual.yml with ``dump_yaml`` after a small edit reformats
+the whole file, drops every comment and turns a one-line change into a
+large diff. ``write_yaml_file`` instead patches the existing text, using
+the source spans of the entries that changed:
+
+- entries and sequence items that are unchanged keep their text
+- changed plain or quoted scalars and flow collections (``[a, b]``) are
+  replaced within their span, so trailing comments on the line survive
+- removed entries and items lose their lines; new ones are rendered with
+  ``dump_yaml`` at the column of their siblings
+- anything that can't be edited precisely (block scalars, compact
+  ``- key:`` items losing their first key, a collection becoming empty,
+  a changed mapping whose keys also moved) re-renders just the enclosing
+  entry
+
+Key order alone is not a change: values are compared like dicts, so data
+that differs from the file only in key order leaves the file as it is,
+and an entry is rendered in the requested order only when it changes
+otherwise. Callers that build entries in a fixed field order therefore
+don't rewrite hand-ordered files.
+
+Parsing the whole file again would cost more than dumping it, so entries
+are first located by their indentation, starting from the document the
+caller already loaded through the document cache. Only changed entries
+are composed into nodes, and each patched entry must load back to exactly
+the requested data. Documents the indentation scan can't follow are
+composed as a whole and the patched text is verified as a whole;
+documents that can't be patched at all (aliases, merge keys, a root that
+is not a block mapping) fall back to a full ``dump_yaml``. Files are
+replaced atomically through a temporary file.
+"""
+
+import functools
+import logging
+import os
+import re
+import stat
+import tempfile
+from collections.abc import Sequence
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Optional
+
+from yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+
+from dbt_conceptual.yaml_io import (
+    SafeLoader,
+    YAMLError,
+    document_cache,
+    dump_yaml,
+    load_yaml,
+)
+
+logger = logging.getLogger(__name__)
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+# Plain (None, or "" from libyaml) and quoted scalars can be replaced inline
+_INLINE_STYLES = (None, "", "'", '"')
+
+# Wide enough that scalars are never folded onto a second line
+_INLINE_WIDTH = 1 << 30
+
+# Collections larger than this (in characters) are split into their
+# entries instead of being composed as a whole
+_SPLIT_SIZE = 4096
+
+# Plain mapping key at the start of a content line, up to its colon
+_KEY = re.compile(r"([^\s#'\"?:\-{}\[\]!&*|>%@`,][^\n]*?):(?:[ \t]|$)", re.M)
+
+# Indentation and first character of the next content line
+_FIRST_CONTENT = re.compile(r"^( *)([^ \n#])", re.M)
+
+# Anchor definitions; patching an anchored node would change its aliases
+_ANCHOR = re.compile(r"(?:^|[\s\[{,])&[^\s\[\]{},]")
+
+
+@functools.cache
+def _lines_at(column: int) -> "re.Pattern[str]":
+    """Pattern matching content lines indented by exactly ``column``."""
+    return re.compile(rf"^ {{{column}}}(?=[^ \n#])", re.M)
+
+
+class _Unpatchable(Exception):
+    """The change can't be made in place; re-render the enclosing entry."""
+
+
+def patch_yaml(text: str, data: Any, current: Any = None) -> str:
+    """Change YAML text so that it loads as ``data``, touching only changes.
+
+    Args:
+        text: Current YAML document
+        data: Data the document should contain
+        current: What ``text`` loads as, when the caller already parsed it
+            (default: parse ``text``)
+
+    Returns:
+        Patched text (``text`` itself when it already loads as ``data``,
+        a full ``dump_yaml(data)`` when it can't be patched)
+    """
+    if current is None:
+        try:
+            current = load_yaml(text)
+        except YAMLError:
+            return str(dump_yaml(data))
+    if _same(current, data):
+        return text
+
+    if (
+        isinstance(current, dict)
+        and current
+        and isinstance(data, dict)
+        and not ("&" in text and _ANCHOR.search(text))
+    ):
+        sections = _SectionPatcher(text)
+        try:
+            sections.mapping(0, len(text), 0, current, data)
+            return sections.apply()
+        except (_Unpatchable, YAMLError):
+            logger.debug("Indentation scan failed, composing the whole document")
+    return _patch_document(text, data)
+
+
+def _patch_document(text: str, data: Any) -> str:
+    """Patch a document through its full node tree, verifying the result."""
+    try:
+        loader = SafeLoader(text)
+        try:
+            root = loader.get_single_node()
+            old = loader.construct_document(root) if root is not None else None
+        finally:
+            loader.dispose()
+    except YAMLError:
+        return str(dump_yaml(data))
+
+    if not (
+        isinstance(root, MappingNode)
+        and not root.flow_style
+        and root.value
+        and isinstance(old, dict)
+        and isinstance(data, dict)
+        and _is_tree(root)
+    ):
+        return str(dump_yaml(data))
+
+    patcher = _Patcher(text)
+    try:
+        patcher.mapping(root, old, data)
+        patched = patcher.apply()
+        if load_yaml(patched) == data:
+            return patched
+    except (_Unpatchable, YAMLError):
+        pass
+    logger.debug("YAML patch not applicable, rewriting the whole document")
+    return str(dump_yaml(data))
+
+
+def write_yaml_file(path: Path, data: Any) -> bool:
+    """Write data to a YAML file, patching its current text in place.
+
+    The file is written to a temporary name and renamed into place, keeping
+    its permissions and line endings. A symlinked file is replaced at its
+    target, so the link stays. Its entry in the shared document cache is
+    dropped.
+
+    Args:
+        path: YAML file (created with ``dump_yaml`` if it doesn't exist)
+        data: Data the file should contain
+
+    Returns:
+        True if the file was written, False if it already held the data
+    """
+    text: Optional[str]
+    newline = "\n"
+    try:
+        # Usually cached already: the caller just loaded the file to edit it
+        current = document_cache.load(path)
+        text, newline = _read_text(path)
+    except FileNotFoundError:
+        text = None
+    except YAMLError:
+        current = None
+        text, newline = _read_text(path)
+
+    if text is None:
+        new_text = str(dump_yaml(data))
+    else:
+        new_text = patch_yaml(text, data, current)
+    if new_text == text:
+        return False
+
+    target = path.resolve()
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(
+        dir=target.parent, prefix=f".{target.name}-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline=newline) as f:
+            f.write(new_text)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    finally:
+        document_cache.invalidate(path)
+    return True
+
+
+def _read_text(path: Path) -> tuple[str, str]:
+    """Read a file with ``\n`` line endings, and the line ending it uses."""
+    with open(path, encoding="utf-8", newline="") as f:
+        raw = f.read()
+    if "\r\n" in raw:
+        return raw.replace("\r\n", "\n"), "\r\n"
+    return raw, "\n"
+
+
+def _same(old: Any, new: Any) -> bool:
+    # 1 == True in Python, but they are different YAML scalars
+    return type(old) is type(new) and old == new
+
+
+def _is_tree(root: Node) -> bool:
+    """Check that no node is shared (aliases) and there are no merge keys."""
+    seen: set[int] = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            return False
+        seen.add(id(node))
+        if isinstance(node, MappingNode):
+            for key, value in node.value:
+                if key.tag == _MERGE_TAG:
+                    return False
+                stack.extend((key, value))
+        elif isinstance(node, SequenceNode):
+            stack.extend(node.value)
+    return True
+
+
+def _content_end(node: Node) -> int:
+    """Index just past the last character of a node's own content.
+
+    Block collections end where the next token starts, which includes
+    trailing comments and blank lines; their content ends with their last
+    value instead.
+    """
+    while isinstance(node, (MappingNode, SequenceNode)) and not node.flow_style:
+        if not node.value:
+            break
+        last = node.value[-1]
+        node = last[1] if isinstance(node, MappingNode) else last
+    return int(node.end_mark.index)
+
+
+def _inline(value: Any) -> str:
+    """Render a scalar or flow collection on a single line."""
+    rendered = str(dump_yaml(value, default_flow_style=True, width=_INLINE_WIDTH))
+    if rendered.endswith("\n...\n"):
+        rendered = rendered[:-5]
+    rendered = rendered.rstrip("\n")
+    if "\n" in rendered:
+        raise _Unpatchable
+    return rendered
+
+
+def _indent(block: str, column: int) -> str:
+    prefix = " " * column
+    return "".join(prefix + line for line in block.splitlines(keepends=True))
+
+
+def _insertion(text: str, index: int, block: str, column: int) -> str:
+    """Render lines inserted at a line boundary of text."""
+    rendered = _indent(block, column)
+    if index == len(text) and not text.endswith("\n"):
+        rendered = "\n" + rendered
+    return rendered
+
+
+def _apply(text: str, edits: list[tuple[int, int, str]]) -> str:
+    """Apply (start, end, replacement) edits; ties keep their order."""
+    parts = []
+    pos = 0
+    for start, end, replacement in sorted(edits, key=lambda edit: edit[:2]):
+        if start < pos:
+            raise _Unpatchable  # Overlapping edits
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _item_changes(old: list, new: list) -> list[tuple[str, int, int, int, int]]:
+    """Diff two sequences into pairwise replacements and insert/deletes.
+
+    Returns:
+        ``("replace", i1, i2, j1, j2)`` for runs of items changed in place
+        (``i2 - i1 == j2 - j1``), ``("splice", ...)`` for old items
+        ``i1:i2`` replaced by new items ``j1:j2``
+    """
+    matcher = SequenceMatcher(
+        a=[repr(v) for v in old], b=[repr(v) for v in new], autojunk=False
+    )
+    changes = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            kind = "replace" if tag == "replace" and i2 - i1 == j2 - j1 else "splice"
+            changes.append((kind, i1, i2, j1, j2))
+    return changes
+
+
+class _Patcher:
+    """Collects text edits turning a document into the requested data."""
+
+    def __init__(self, text: str):
+        self.text = text
+        # (start, end, replacement); applied in order, ties by insertion order
+        self.edits: list[tuple[int, int, str]] = []
+
+    def apply(self) -> str:
+        """Apply the collected edits to the text."""
+        return _apply(self.text, self.edits)
+
+    # Positions
+
+    def line_start(self, index: int) -> int:
+        return self.text.rfind("\n", 0, index) + 1
+
+    def line_end(self, index: int) -> int:
+        """Index after the newline ending the line of the char before index."""
+        if index > 0 and self.text[index - 1] == "\n":
+            return index
+        newline = self.text.find("\n", index)
+        return len(self.text) if newline < 0 else newline + 1
+
+    def starts_line(self, index: int) -> bool:
+        return not self.text[self.line_start(index) : index].strip()
+
+    def dash(self, item: Node) -> int:
+        """Index of the ``-`` indicator of a block sequence item."""
+        index = item.start_mark.index - 1
+        while index >= 0 and self.text[index] == " ":
+            index -= 1
+        if index < 0 or self.text[index] != "-":
+            raise _Unpatchable
+        return index
+
+    def column(self, index: int) -> int:
+        return index - self.line_start(index)
+
+    # Edits
+
+    def delete(self, start: int, node: Node) -> None:
+        """Remove the lines of an entry starting at ``start``."""
+        if not self.starts_line(start):
+            raise _Unpatchable
+        self.edits.append(
+            (self.line_start(start), self.line_end(_content_end(node)), "")
+        )
+
+    def replace(self, start: int, node: Node, block: str) -> None:
+        """Replace an entry with a rendered block at the entry's column."""
+        rendered = _indent(block, self.column(start))
+        end = self.line_end(_content_end(node))
+        self.edits.append((start, end, rendered[self.column(start) :]))
+
+    def insert(self, index: int, block: str, column: int) -> None:
+        """Insert rendered lines at a line boundary."""
+        self.edits.append((index, index, _insertion(self.text, index, block, column)))
+
+    # Nodes
+
+    def value(self, node: Node, old: Any, new: Any) -> None:
+        """Patch a node whose current value is ``old`` to ``new``."""
+        if _same(old, new):
+            return
+        mark = len(self.edits)
+        try:
+            if isinstance(node, MappingNode) and not node.flow_style and node.value:
+                if not (isinstance(old, dict) and isinstance(new, dict)):
+                    raise _Unpatchable
+                self.mapping(node, old, new)
+            elif isinstance(node, SequenceNode) and not node.flow_style and node.value:
+                if not (isinstance(old, list) and isinstance(new, list)):
+                    raise _Unpatchable
+                self.sequence(node, old, new)
+            elif (
+                isinstance(node, ScalarNode)
+                and node.style in _INLINE_STYLES
+                and not isinstance(new, (dict, list))
+            ) or (isinstance(node, (MappingNode, SequenceNode)) and node.flow_style):
+                start, end = node.start_mark.index, node.end_mark.index
+                self.edits.append((start, end, _inline(new)))
+            else:
+                raise _Unpatchable
+        except _Unpatchable:
+            del self.edits[mark:]
+            raise
+
+    def mapping(self, node: MappingNode, old: dict, new: dict) -> None:
+        """Patch the entries of a block mapping."""
+        pairs = node.value
+        if not new or len(pairs) != len(old):
+            raise _Unpatchable  # Empty result, or duplicate keys
+        kept = [key for key in old if key in new]
+        if [key for key in new if key in old] != kept:
+            raise _Unpatchable  # Reordered keys
+
+        for key, (key_node, value_node) in zip(old, pairs):
+            start = key_node.start_mark.index
+            if key not in new:
+                self.delete(start, value_node)
+            elif not _same(old[key], new[key]):
+                try:
+                    self.value(value_node, old[key], new[key])
+                except _Unpatchable:
+                    self.replace(start, value_node, dump_yaml({key: new[key]}))
+
+        added = {key: value for key, value in new.items() if key not in old}
+        if added:
+            column = pairs[0][0].start_mark.column
+            self.insert(
+                self.line_end(_content_end(pairs[-1][1])), dump_yaml(added), column
+            )
+
+    def sequence(self, node: SequenceNode, old: list, new: list) -> None:
+        """Patch the items of a block sequence."""
+        items = node.value
+        if not new or len(items) != len(old):
+            raise _Unpatchable
+        column = self.column(self.dash(items[0]))
+
+        for tag, i1, i2, j1, j2 in _item_changes(old, new):
+            if tag == "replace":
+                for item, old_value, new_value in zip(
+                    items[i1:i2], old[i1:i2], new[j1:j2]
+                ):
+                    try:
+                        self.value(item, old_value, new_value)
+                    except _Unpatchable:
+                        self.replace(self.dash(item), item, dump_yaml([new_value]))
+                continue
+
+            for item in items[i1:i2]:
+                self.delete(self.dash(item), item)
+            if j2 > j1:
+                self.insert(
+                    self._item_boundary(items, i2), dump_yaml(new[j1:j2]), column
+                )
+
+    def _item_boundary(self, items: Sequence[Node], index: int) -> int:
+        """Line boundary before item ``index`` (or after the last item)."""
+        if index < len(items):
+            dash = self.dash(items[index])
+            if not self.starts_line(dash):
+                raise _Unpatchable
+            return self.line_start(dash)
+        return self.line_end(_content_end(items[-1]))
+
+
+class _SectionPatcher:
+    """Patches a document without composing it, one changed entry at a time.
+
+    Entries of block mappings and items of block sequences are located by
+    their indentation, and entries that hold the same data as before are
+    never parsed. Changed entries are composed on their own and patched
+    with _Patcher; large nested collections are split again first, so
+    editing one concept of a large model only parses that concept.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.edits: list[tuple[int, int, str]] = []
+
+    def apply(self) -> str:
+        """Apply the collected edits to the text."""
+        return _apply(self.text, self.edits)
+
+    def lines_at(self, start: int, end: int, column: int) -> list[int]:
+        """Starts of the content lines indented by exactly ``column``."""
+        return [m.start() for m in _lines_at(column).finditer(self.text, start, end)]
+
+    def content_end(self, start: int, end: int) -> int:
+        """End of the last line in [start, end) that isn't blank or a comment."""
+        text = self.text
+        while end > start:
+            line_start = max(text.rfind("\n", start, end - 1) + 1, start)
+            line = text[line_start:end].strip()
+            if line and not line.startswith("#"):
+                return end
+            end = line_start
+        raise _Unpatchable
+
+    def mapping(self, start: int, end: int, column: int, old: dict, new: dict) -> None:
+        """Patch the block mapping whose keys are at ``column`` in [start, end)."""
+        if not new:
+            raise _Unpatchable
+        kept = [key for key in old if key in new]
+        if [key for key in new if key in old] != kept:
+            raise _Unpatchable
+
+        text = self.text
+        # (line start, index after the key's colon, key)
+        entries: list[tuple[int, int, str]] = []
+        for line in self.lines_at(start, end, column):
+            body = line + column
+            if text.startswith("-", body) and text[body + 1 : body + 2] in (
+                " ",
+                "\n",
+            ):
+                if not entries:
+                    raise _Unpatchable
+                continue  # Item of a sequence indented like its key
+            match = _KEY.match(text, body, end)
+            if match is None:
+                raise _Unpatchable
+            entries.append((line, match.end(1) + 1, match.group(1)))
+        if len(entries) != len(old) or any(
+            not isinstance(key, str) or key != entry[2]
+            for key, entry in zip(old, entries)
+        ):
+            raise _Unpatchable
+
+        bounds = [entry[0] for entry in entries[1:]] + [end]
+        for key, (line, colon, _), bound in zip(old, entries, bounds):
+            if key not in new:
+                self.edits.append((line, self.content_end(line, bound), ""))
+            elif not _same(old[key], new[key]):
+                entry_end = self.content_end(line, bound)
+                mark = len(self.edits)
+                try:
+                    self.nested(colon, entry_end, column, old[key], new[key])
+                except _Unpatchable:
+                    del self.edits[mark:]
+                    self.entry(
+                        line, entry_end, column, {key: old[key]}, {key: new[key]}
+                    )
+
+        added = {key: value for key, value in new.items() if key not in old}
+        if added:
+            index = self.content_end(entries[-1][0], end)
+            self.edits.append(
+                (index, index, _insertion(text, index, dump_yaml(added), column))
+            )
+
+    def sequence(self, start: int, end: int, column: int, old: list, new: list) -> None:
+        """Patch the block sequence whose dashes are at ``column`` in [start, end)."""
+        if not new:
+            raise _Unpatchable
+        text = self.text
+        items = self.lines_at(start, end, column)
+        for line in items:
+            body = line + column
+            if text[body] != "-" or text[body + 1 : body + 2] not in (" ", "\n", ""):
+                raise _Unpatchable
+        if len(items) != len(old):
+            raise _Unpatchable
+
+        bounds = items[1:] + [end]
+        for tag, i1, i2, j1, j2 in _item_changes(old, new):
+            if tag == "replace":
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    item_end = self.content_end(items[i], bounds[i])
+                    self.entry(items[i], item_end, column, [old[i]], [new[j]])
+                continue
+
+            for i in range(i1, i2):
+                self.edits.append((items[i], self.content_end(items[i], bounds[i]), ""))
+            if j2 > j1:
+                index = (
+                    items[i2]
+                    if i2 < len(items)
+                    else self.content_end(items[-1], bounds[-1])
+                )
+                block = dump_yaml(new[j1:j2])
+                self.edits.append(
+                    (index, index, _insertion(text, index, block, column))
+                )
+
+    def nested(self, colon: int, end: int, column: int, old: Any, new: Any) -> None:
+        """Patch a large block collection value inside its parent's entry."""
+        if end - colon < _SPLIT_SIZE or type(old) is not type(new):
+            raise _Unpatchable
+        text = self.text
+        line_end = text.find("\n", colon)
+        rest = text[colon:line_end].strip()
+        if line_end < 0 or (rest and not rest.startswith("#")):
+            raise _Unpatchable  # Value on the key's line
+        first = _FIRST_CONTENT.search(text, line_end + 1, end)
+        if first is None:
+            raise _Unpatchable
+        child = len(first.group(1))
+        is_sequence = first.group(2) == "-"
+        if isinstance(old, dict) and child > column and not is_sequence:
+            self.mapping(line_end + 1, end, child, old, new)
+        elif isinstance(old, list) and child >= column and is_sequence:
+            self.sequence(line_end + 1, end, child, old, new)
+        else:
+            raise _Unpatchable
+
+    def entry(self, start: int, end: int, column: int, old: Any, new: Any) -> None:
+        """Compose one entry or item on its own and patch it."""
+        text = self.text[start:end]
+        try:
+            loader = SafeLoader(text)
+            try:
+                node = loader.get_single_node()
+                current = loader.construct_document(node)
+            finally:
+                loader.dispose()
+        except YAMLError as e:
+            raise _Unpatchable from e
+        if node is None or not _same(current, old) or not _is_tree(node):
+            raise _Unpatchable  # The indentation scan split the text wrongly
+
+        patcher = _Patcher(text)
+        try:
+            patcher.value(node, old, new)
+            patched = patcher.apply()
+        except _Unpatchable:
+            patched = _indent(dump_yaml(new), column)
+        if load_yaml(patched) != new:
+            patched = _indent(dump_yaml(new), column)
+        self.edits.append((start, end, patched))
@@ -1,5 +1,6 @@
 """Tests for CLI commands."""
 
+import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -713,3 +714,144 @@ def test_cli_sync_without_conceptual_file() -> None:
 
         assert result.exit_code == 1
         assert "conceptual.yml not found" in result.output
+
+
+def test_cli_status_with_jobs() -> None:
+    """Test status command accepts --jobs for a parallel scan."""
+    runner = CliRunner()
+
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        with open(tmppath / "conceptual.yml", "w") as f:
+            yaml.dump(
+                {
+                    "domains": {"party": {"name": "Party"}},
+                    "concepts": {"customer": {"name": "Customer", "domain": "party"}},
+                },
+                f,
+            )
+
+        gold_dir = tmppath / "models" / "marts"
+        gold_dir.mkdir(parents=True)
+        for name in ("a", "b", "c"):
+            with open(gold_dir / f"{name}.yml", "w") as f:
+                yaml.dump(
+                    {
+                        "models": [
+                            {"name": f"dim_{name}", "meta": {"concept": "customer"}}
+                        ]
+                    },
+                    f,
+                )
+
+        result = runner.invoke(status, ["--project-dir", str(tmppath), "--jobs", "3"])
+
+        assert result.exit_code == 0
+        assert "[3 models]" in result.output
+
+
+def test_cli_merge_sharded_results(tmp_path: Path) -> None:
+    """Test that merged shard reports equal the unsharded JSON report."""
+    with open(tmp_path / "dbt_project.yml", "w") as f:
+        yaml.dump({"name": "test"}, f)
+    concepts = {f"c{i}": {"name": f"C{i}", "domain": "sales"} for i in range(12)}
+    concepts["draft"] = {"name": "Draft"}
+    with open(tmp_path / "conceptual.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 1,
+                "domains": {"sales": {"name": "Sales"}},
+                "concepts": concepts,
+                "relationships": [
+                    {"verb": "has", "from": f"c{i}", "to": f"c{i + 1}"}
+                    for i in range(12)
+                ],
+            },
+            f,
+        )
+    gold_dir = tmp_path / "models" / "marts"
+    gold_dir.mkdir(parents=True)
+    with open(gold_dir / "schema.yml", "w") as f:
+        yaml.dump({"version": 2, "models": [{"name": f"m{i}"} for i in range(8)]}, f)
+
+    runner = CliRunner()
+    args = ["--project-dir", str(tmp_path), "--format", "json"]
+    full = runner.invoke(validate, args)
+    assert full.exit_code == 1  # c12 doesn't exist
+
+    reports = []
+    for index in (3, 1, 2):
+        result = runner.invoke(validate, [*args, "--shard", f"{index}/3"])
+        report = tmp_path / f"shard-{index}.json"
+        report.write_text(result.output)
+        reports.append(str(report))
+
+    merged = runner.invoke(main, ["merge-results", *reports])
+    assert merged.exit_code == 1
+    assert merged.output == full.output
+
+    incomplete = runner.invoke(main, ["merge-results", *reports[:2]])
+    assert incomplete.exit_code == 1
+    assert "Expected shards 1..3" in incomplete.output
+
+
+def _write_noisy_project(root: Path) -> None:
+    with open(root / "dbt_project.yml", "w") as f:
+        yaml.dump({"name": "test"}, f)
+    with open(root / "conceptual.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 1,
+                "concepts": {"customer": {"name": "Customer"}},
+                "relationships": [
+                    {"verb": "places", "from": "customer", "to": "order"},
+                    {"verb": "ships", "from": "customer", "to": "parcel"},
+                ],
+            },
+            f,
+        )
+    gold_dir = root / "models" / "marts"
+    gold_dir.mkdir(parents=True)
+    with open(gold_dir / "schema.yml", "w") as f:
+        yaml.dump({"version": 2, "models": [{"name": f"m{i}"} for i in range(5)]}, f)
+
+
+def test_cli_validate_jsonl_with_limits(tmp_path: Path) -> None:
+    """Test JSON Lines output, --max-issues and --fail-fast."""
+    _write_noisy_project(tmp_path)
+    runner = CliRunner()
+    args = ["--project-dir", str(tmp_path), "--format", "jsonl"]
+
+    result = runner.invoke(validate, args)
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line["code"] for line in lines[:-1]] == ["E002", "E002"] + ["W101"] * 5 + [
+        "W102",
+        "I001",
+        "I002",
+        "I002",
+    ]
+    assert lines[-1] == {
+        "passed": False,
+        "summary": {"errors": 2, "warnings": 6, "info": 3},
+        "omitted": 0,
+    }
+
+    result = runner.invoke(validate, [*args, "--max-issues", "3"])
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert len(lines) == 4
+    assert lines[-1]["summary"] == {"errors": 2, "warnings": 6, "info": 3}
+    assert lines[-1]["omitted"] == 8
+
+    result = runner.invoke(validate, [*args, "--fail-fast"])
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line.get("code") for line in lines] == ["E002", None]
+    assert lines[-1]["summary"] == {"errors": 1, "warnings": 0, "info": 0}
+
+    result = runner.invoke(
+        validate, ["--project-dir", str(tmp_path), "--max-issues", "1"]
+    )
+    assert result.exit_code == 1
+    assert "10 more issues not shown" in result.output
@@ -160,3 +160,32 @@ def test_validation_config_defaults() -> None:
     assert config.orphan_models == RuleSeverity.WARN
     assert config.unimplemented_concepts == RuleSeverity.WARN
     assert config.missing_definitions == RuleSeverity.IGNORE
+
+
+def test_config_scan_jobs() -> None:
+    """Test scan worker settings from conceptual.yml and the CLI override."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        # Serial by default
+        config = Config.load(project_dir=tmppath)
+        assert config.scan_jobs == 1
+        assert config.scan_executor == "thread"
+
+        with open(tmppath / "conceptual.yml", "w") as f:
+            yaml.dump({"config": {"scan": {"jobs": 4, "executor": "process"}}}, f)
+
+        config = Config.load(project_dir=tmppath)
+        assert config.scan_jobs == 4
+        assert config.scan_executor == "process"
+
+        # CLI wins over conceptual.yml
+        config = Config.load(project_dir=tmppath, jobs=2)
+        assert config.scan_jobs == 2
+
+        with open(tmppath / "conceptual.yml", "w") as f:
+            yaml.dump({"config": {"scan": {"jobs": "auto", "executor": "bogus"}}}, f)
+
+        config = Config.load(project_dir=tmppath)
+        assert config.scan_jobs == 0
+        assert config.scan_executor == "thread"
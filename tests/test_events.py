@@ -0,0 +1,141 @@
+"""Tests for the web server's change feed."""
+
+import json
+import time
+from pathlib import Path
+
+import yaml
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.events import ChangeFeed, StateChange, format_event
+from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.state import ProjectState
+from dbt_conceptual.state_cache import StateCache
+from dbt_conceptual.validator import Validator
+
+
+def _write_project(root: Path) -> Config:
+    with open(root / "conceptual.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 1,
+                "domains": {"sales": {"name": "Sales"}},
+                "concepts": {
+                    "customer": {
+                        "name": "Customer",
+                        "domain": "sales",
+                        "definition": "A buyer",
+                    },
+                    "order": {"name": "Order", "domain": "sales"},
+                },
+            },
+            f,
+        )
+    return Config.load(project_dir=root, no_cache=True)
+
+
+def _write_schema(root: Path, models: dict[str, str]) -> None:
+    path = root / "models" / "marts" / "schema.yml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.dump(
+            {
+                "version": 2,
+                "models": [
+                    (
+                        {"name": name, "meta": {"concept": concept}}
+                        if concept
+                        else {"name": name}
+                    )
+                    for name, concept in models.items()
+                ],
+            },
+            f,
+        )
+
+
+def _render(state: ProjectState, change: StateChange) -> str:
+    return format_event("change", {"concepts": change.concepts}, change.version)
+
+
+def test_format_event() -> None:
+    """Test the text/event-stream framing."""
+    assert format_event("ready", {"version": "v1"}, "v1") == (
+        'event: ready\nid: v1\ndata: {"version":"v1"}\n\n'
+    )
+    assert format_event("change", [1, 2]) == "event: change\ndata: [1,2]\n\n"
+
+
+def test_poll_publishes_changes_once(tmp_path: Path) -> None:
+    """Test that one poll diffs the state and queues one event per subscriber."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, {"dim_customer": "customer"})
+    cache = StateCache(config)
+    renders = []
+
+    def render(state: ProjectState, change: StateChange) -> str:
+        renders.append(change)
+        return _render(state, change)
+
+    feed = ChangeFeed(cache, render, interval=3600)
+    first, second = feed.subscribe(), feed.subscribe()
+    assert feed.version == cache.version
+    assert feed.poll() is None
+
+    # A schema file change: the concept's models and the orphans change
+    _write_schema(tmp_path, {"dim_customer": "", "fct_order": "order"})
+    (tmp_path / "models" / "marts" / "other.yml").write_text(
+        yaml.dump({"version": 2, "models": [{"name": "stg_misc"}]})
+    )
+    change = feed.poll()
+    assert change is not None
+    assert change.version == cache.version
+    assert change.concepts == ["customer", "order"]
+    assert change.domains == change.relationships == []
+    assert change.new_orphans == ["dim_customer", "stg_misc"]
+    assert change.removed_orphans == []
+    expected = Validator(config, StateBuilder(config).build())
+    expected.validate()
+    assert change.validation == expected.get_summary()
+    assert len(renders) == 1
+
+    for subscription in (first, second):
+        event = subscription.get_nowait()
+        assert event.startswith(f"event: change\nid: {change.version}\n")
+        assert json.loads(event.split("data: ")[1]) == {
+            "concepts": ["customer", "order"]
+        }
+        assert subscription.empty()
+
+    # A conceptual.yml change rebuilds the state; only the edit is reported
+    conceptual = yaml.safe_load((tmp_path / "conceptual.yml").read_text())
+    conceptual["concepts"]["customer"]["definition"] = "Someone who buys"
+    conceptual["relationships"] = [{"verb": "places", "from": "customer", "to": "x"}]
+    (tmp_path / "conceptual.yml").write_text(yaml.dump(conceptual))
+    change = feed.poll()
+    assert change is not None
+    assert change.concepts == ["customer"]
+    assert change.relationships == ["customer:places:x"]
+    assert change.new_orphans == change.removed_orphans == []
+    assert change.validation is not None and change.validation["errors"] >= 1
+    assert (feed.polls, feed.events) == (3, 2)
+
+
+def test_polling_stops_without_subscribers(tmp_path: Path) -> None:
+    """Test that the polling thread runs only while someone is subscribed."""
+    config = _write_project(tmp_path)
+    feed = ChangeFeed(StateCache(config), _render, interval=0.01)
+
+    subscription = feed.subscribe()
+    _write_schema(tmp_path, {"dim_customer": "customer"})
+    assert '"customer"' in subscription.get(timeout=10)
+
+    feed.unsubscribe(subscription)
+    assert feed.subscribers == 0
+    deadline = time.monotonic() + 10
+    while feed._thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert feed._thread is None
+    polls = feed.polls
+    time.sleep(0.05)
+    assert feed.polls == polls
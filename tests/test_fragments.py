@@ -0,0 +1,265 @@
+"""Tests for conceptual models split across fragment files."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.fragments import (
+    FragmentConflictError,
+    fragment_files,
+    load_model,
+    save_elements,
+    save_sections,
+)
+from dbt_conceptual.git import load_state_from_git_ref
+from dbt_conceptual.incremental import IncrementalStateBuilder
+from dbt_conceptual.parser import ConceptualModelParser
+from dbt_conceptual.server import create_app
+from dbt_conceptual.yaml_io import document_cache, load_yaml_file
+
+
+def _write(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.dump(data, f, sort_keys=False)
+
+
+def _write_project(root: Path) -> Config:
+    _write(
+        root / "conceptual.yml",
+        {
+            "version": 1,
+            "config": {"scan": {"gold": ["models/marts/**/*.yml"]}},
+            "metadata": {"team": "data"},
+            "domains": {"party": {"name": "Party"}},
+            "concepts": {"customer": {"name": "Customer", "domain": "party"}},
+        },
+    )
+    _write(
+        root / "conceptual" / "sales.yml",
+        {
+            "domains": {"sales": {"name": "Sales"}},
+            "concepts": {"order": {"name": "Order", "domain": "sales"}},
+            "relationships": [{"verb": "places", "from": "customer", "to": "order"}],
+        },
+    )
+    _write(
+        root / "conceptual" / "catalog" / "product.yaml",
+        {"concepts": {"product": {"name": "Product"}}},
+    )
+    (root / "conceptual" / ".draft.yml").write_text("concepts: {draft: {}}\n")
+    return Config.load(project_dir=root)
+
+
+def test_parser_merges_fragments(tmp_path: Path) -> None:
+    """Test that fragments are merged after conceptual.yml in path order."""
+    config = _write_project(tmp_path)
+    assert [p.relative_to(tmp_path).as_posix() for p in fragment_files(config)] == [
+        "conceptual/catalog/product.yaml",
+        "conceptual/sales.yml",
+    ]
+
+    state = ConceptualModelParser(config).parse()
+    assert list(state.domains) == ["party", "sales"]
+    assert list(state.concepts) == ["customer", "product", "order"]
+    assert list(state.relationships) == ["customer:places:order"]
+    assert state.metadata == {"team": "data"}
+    assert load_model(config).sources["concepts"]["order"] == (
+        tmp_path / "conceptual" / "sales.yml"
+    )
+
+
+@pytest.mark.parametrize(
+    "fragment",
+    [
+        {"domains": {"party": {"name": "Other"}}},
+        {"concepts": {"customer": {"name": "Dup"}}},
+        {"relationships": [{"verb": "places", "from": "customer", "to": "order"}]},
+    ],
+)
+def test_conflicting_definitions(tmp_path: Path, fragment: dict) -> None:
+    """Test that an element defined in two files is reported."""
+    config = _write_project(tmp_path)
+    _write(tmp_path / "conceptual" / "zz.yml", fragment)
+
+    with pytest.raises(FragmentConflictError) as exc_info:
+        ConceptualModelParser(config).parse()
+    assert len(exc_info.value.conflicts) == 1
+    assert "zz.yml" in str(exc_info.value)
+
+
+def test_fragments_are_cached_independently(tmp_path: Path) -> None:
+    """Test that only a changed fragment is parsed again."""
+    config = _write_project(tmp_path)
+    document_cache.invalidate()
+    ConceptualModelParser(config).parse()
+    before = document_cache.parses
+
+    ConceptualModelParser(config).parse()
+    assert document_cache.parses == before
+
+    _write(tmp_path / "conceptual" / "catalog" / "product.yaml", {"concepts": {}})
+    state = ConceptualModelParser(config).parse()
+    assert document_cache.parses == before + 1
+    assert "product" not in state.concepts
+
+
+def test_save_rewrites_only_changed_files(tmp_path: Path) -> None:
+    """Test that saving places elements and leaves unchanged files alone."""
+    config = _write_project(tmp_path)
+    model = load_model(config).data
+    concepts = dict(model["concepts"])
+    concepts["order"] = {"name": "Sales Order", "domain": "sales"}
+    concepts["invoice"] = {"name": "Invoice", "domain": "sales"}
+    relationships = [
+        *model["relationships"],
+        {"verb": "bills", "from": "invoice", "to": "customer"},
+    ]
+    product = tmp_path / "conceptual" / "catalog" / "product.yaml"
+    product_mtime = product.stat().st_mtime_ns
+
+    written = save_sections(
+        config,
+        domains=model["domains"],
+        concepts=concepts,
+        relationships=relationships,
+    )
+
+    sales = tmp_path / "conceptual" / "sales.yml"
+    assert written == [sales]
+    assert product.stat().st_mtime_ns == product_mtime
+    assert load_yaml_file(sales) == {
+        "domains": {"sales": {"name": "Sales"}},
+        "concepts": {
+            "order": {"name": "Sales Order", "domain": "sales"},
+            "invoice": {"name": "Invoice", "domain": "sales"},
+        },
+        "relationships": [
+            {"verb": "places", "from": "customer", "to": "order"},
+            {"verb": "bills", "from": "invoice", "to": "customer"},
+        ],
+    }
+
+    # Removing a concept rewrites its file; new domains go to conceptual.yml
+    del concepts["product"]
+    domains = {**model["domains"], "finance": {"name": "Finance"}}
+    written = save_sections(config, domains=domains, concepts=concepts)
+    assert set(written) == {product, config.conceptual_file}
+    main = load_yaml_file(config.conceptual_file)
+    assert main["config"] == {"scan": {"gold": ["models/marts/**/*.yml"]}}
+    assert list(main["domains"]) == ["party", "finance"]
+    assert load_yaml_file(product) == {}
+
+
+def test_save_elements_patches_only_their_entries(tmp_path: Path) -> None:
+    """Test that element edits are placed like save_sections() places them."""
+    config = _write_project(tmp_path)
+    sales = tmp_path / "conceptual" / "sales.yml"
+    sales.write_text("# Sales domain\n" + sales.read_text())
+    product = tmp_path / "conceptual" / "catalog" / "product.yaml"
+    product_mtime = product.stat().st_mtime_ns
+
+    written = save_elements(
+        config,
+        [
+            ("concepts", "invoice", {"name": "Invoice", "domain": "sales"}),
+            ("concepts", "order", {"name": "Sales Order", "domain": "sales"}),
+            (
+                "relationships",
+                "customer:places:order",
+                {"verb": "orders", "from": "customer", "to": "order"},
+            ),
+            ("relationships", "", {"verb": "bills", "from": "invoice", "to": "x"}),
+        ],
+    )
+    assert written == [sales]
+    assert product.stat().st_mtime_ns == product_mtime
+    assert sales.read_text().startswith("# Sales domain\n")
+    assert load_yaml_file(sales) == {
+        "domains": {"sales": {"name": "Sales"}},
+        "concepts": {
+            "order": {"name": "Sales Order", "domain": "sales"},
+            "invoice": {"name": "Invoice", "domain": "sales"},
+        },
+        "relationships": [
+            {"verb": "orders", "from": "customer", "to": "order"},
+            {"verb": "bills", "from": "invoice", "to": "x"},
+        ],
+    }
+    # The written document is cached, so reading it back doesn't parse it
+    parses = document_cache.parses
+    assert load_model(config).data["concepts"]["invoice"]["name"] == "Invoice"
+    assert document_cache.parses == parses
+
+    written = save_elements(
+        config,
+        [
+            ("concepts", "product", None),
+            ("relationships", "invoice:bills:x", None),
+            ("domains", "finance", {"name": "Finance"}),
+        ],
+    )
+    assert written == [product, sales, config.conceptual_file]
+    assert list(load_yaml_file(config.conceptual_file)["domains"]) == [
+        "party",
+        "finance",
+    ]
+    assert load_yaml_file(product) == {}
+    with pytest.raises(KeyError):
+        save_elements(config, [("concepts", "product", None)])
+
+
+def test_server_save_writes_changed_fragment(tmp_path: Path) -> None:
+    """Test that POST /api/state rewrites only the edited fragment."""
+    _write_project(tmp_path)
+    client = create_app(tmp_path).test_client()
+
+    # The first save normalizes what the API doesn't round-trip (domain
+    # display names, default cardinalities); saving again changes nothing
+    state = client.get("/api/state").get_json()
+    assert client.post("/api/state", json=state).status_code == 200
+    assert client.post("/api/state", json=state).get_json()["files"] == []
+
+    state["concepts"]["order"]["definition"] = "A purchase"
+    response = client.post("/api/state", json=state)
+    assert response.status_code == 200
+    assert response.get_json()["files"] == ["conceptual/sales.yml"]
+
+    sales = load_yaml_file(tmp_path / "conceptual" / "sales.yml")
+    assert sales["concepts"]["order"]["definition"] == "A purchase"
+    settings = client.get("/api/settings").get_json()
+    assert set(settings["domains"]) == {"party", "sales"}
+
+
+def test_fragment_change_rebuilds_incremental_state(tmp_path: Path) -> None:
+    """Test that editing a fragment falls back to a full rebuild."""
+    config = _write_project(tmp_path)
+    builder = IncrementalStateBuilder(config)
+    builder.build()
+
+    _write(tmp_path / "conceptual" / "extra.yml", {"concepts": {"refund": {}}})
+    state = builder.apply_changes(changed=["conceptual/extra.yml"])
+    assert "refund" in state.concepts
+
+
+def test_git_base_includes_fragments(tmp_path: Path) -> None:
+    """Test that the diff base merges the fragments committed at the ref."""
+    if shutil.which("git") is None:
+        pytest.skip("git not installed")
+    config = _write_project(tmp_path)
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "base")
+
+    base = load_state_from_git_ref(config, "HEAD")
+    assert set(base.concepts) == {"customer", "order", "product"}
+    assert set(base.domains) == {"party", "sales"}
+    assert "customer:places:order" in base.relationships
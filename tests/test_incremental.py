@@ -0,0 +1,194 @@
+"""Tests for the incremental state builder."""
+
+import random
+from pathlib import Path
+from typing import Optional
+
+import pytest
+import yaml
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.incremental import IncrementalStateBuilder
+from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.state import ProjectState
+from dbt_conceptual.validator import Validator
+
+CONCEPTS = ["customer", "order", "product"]
+
+
+def _write_project(root: Path) -> Config:
+    with open(root / "conceptual.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 1,
+                "domains": {"sales": {"name": "Sales"}},
+                "concepts": {
+                    c: {"name": c.title(), "domain": "sales"} for c in CONCEPTS
+                },
+            },
+            f,
+        )
+    return Config.load(project_dir=root, no_cache=True)
+
+
+def _write_schema(root: Path, rel: str, models: list[dict]) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.dump({"version": 2, "models": models}, f)
+
+
+def _model(name: str, concept: Optional[str] = None, tag: str = "sales") -> dict:
+    model: dict = {"name": name, "tags": [f"domain:{tag}"]}
+    if concept is not None:
+        model["meta"] = {"concept": concept}
+    return model
+
+
+def _assert_matches_full_rebuild(state: ProjectState, config: Config) -> None:
+    expected = StateBuilder(config).build()
+    assert state == expected
+    # Dict equality ignores order; a full rebuild's order must be kept too
+    assert list(state.models) == list(expected.models)
+    for concept_id, concept in expected.concepts.items():
+        assert state.concepts[concept_id].models == concept.models
+
+
+def test_build_matches_state_builder(tmp_path: Path) -> None:
+    """Test that the initial build is identical to StateBuilder.build()."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1", "customer")])
+    _write_schema(tmp_path, "models/marts/b.yml", [_model("m2"), _model("m1")])
+
+    state = IncrementalStateBuilder(config).build()
+    _assert_matches_full_rebuild(state, config)
+
+
+def test_modify_file_updates_in_place(tmp_path: Path) -> None:
+    """Test that editing a file replaces only its entries."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1", "customer")])
+    _write_schema(tmp_path, "models/marts/b.yml", [_model("m2"), _model("m3")])
+
+    builder = IncrementalStateBuilder(config)
+    state = builder.build()
+    untouched = state.models["m1"]
+
+    _write_schema(
+        tmp_path, "models/marts/b.yml", [_model("m2", "order"), _model("m3", tag="x")]
+    )
+    assert builder.apply_changes(changed=["models/marts/b.yml"]) is state
+
+    assert state.models["m1"] is untouched
+    assert state.concepts["order"].models == ["m2"]
+    assert [o.name for o in state.orphan_models] == ["m3"]
+    assert state.models["m3"].domain_tags == ["x"]
+    _assert_matches_full_rebuild(state, config)
+
+
+def test_add_and_delete_files(tmp_path: Path) -> None:
+    """Test file additions (anywhere in scan order) and deletions."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/b.yml", [_model("m2", "order")])
+
+    builder = IncrementalStateBuilder(config)
+    state = builder.build()
+
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1"), _model("m2")])
+    _write_schema(tmp_path, "models/marts/c.yml", [_model("m3", "order")])
+    builder.apply_changes(changed=[tmp_path / "models/marts/c.yml"])
+    builder.apply_changes(changed=[tmp_path / "models/marts/a.yml"])
+    _assert_matches_full_rebuild(state, config)
+    assert list(state.models) == ["m1", "m2", "m3"]
+
+    (tmp_path / "models/marts/a.yml").unlink()
+    builder.apply_changes(deleted=["models/marts/a.yml"])
+    _assert_matches_full_rebuild(state, config)
+    assert list(state.models) == ["m2", "m3"]
+
+
+def test_non_gold_and_excluded_files_are_ignored(tmp_path: Path) -> None:
+    """Test that changes outside the gold paths don't add models."""
+    config = _write_project(tmp_path)
+    # Configured excludes match directory names at any depth
+    config.scan_exclude = ["target"]
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1")])
+    builder = IncrementalStateBuilder(config)
+    state = builder.build()
+
+    _write_schema(tmp_path, "models/staging/s.yml", [_model("stg")])
+    _write_schema(tmp_path, "models/marts/target/t.yml", [_model("tgt")])
+    builder.apply_changes(changed=["models/staging/s.yml", "models/marts/target/t.yml"])
+
+    assert list(state.models) == ["m1"]
+    _assert_matches_full_rebuild(state, config)
+
+
+def test_changed_concepts_drive_revalidation(tmp_path: Path) -> None:
+    """Test that changed_concepts keeps incremental validation exact."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1", "customer")])
+
+    builder = IncrementalStateBuilder(config)
+    state = builder.build()
+    validator = Validator(config, state)
+    validator.validate()
+
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1"), _model("m2", "order")])
+    builder.apply_changes(changed=["models/marts/a.yml"])
+    assert builder.changed_concepts == {"customer", "order"}
+
+    issues = validator.revalidate(concepts=builder.changed_concepts)
+    assert issues == Validator(config, state).validate()
+    assert [i.context["model"] for i in issues if i.code == "W101"] == ["m1"]
+
+
+def test_conceptual_yml_change_rebuilds(tmp_path: Path) -> None:
+    """Test that a conceptual.yml change triggers a full rebuild."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1", "invoice")])
+    builder = IncrementalStateBuilder(config)
+    builder.build()
+
+    with open(tmp_path / "conceptual.yml", "w") as f:
+        yaml.dump({"version": 1, "concepts": {"invoice": {"name": "Invoice"}}}, f)
+    state = builder.apply_changes(changed=["conceptual.yml"])
+
+    assert state.concepts["invoice"].models == ["m1"]
+    _assert_matches_full_rebuild(state, config)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_random_deltas_match_full_rebuild(tmp_path: Path, seed: int) -> None:
+    """Test that random add/modify/delete sequences equal a full rebuild."""
+    rng = random.Random(seed)
+    config = _write_project(tmp_path)
+    names = [f"m{i}" for i in range(12)]
+    files = [f"models/marts/{d}/f{i}.yml" for d in ("a", "b") for i in range(4)]
+
+    def random_models() -> list[dict]:
+        return [
+            _model(
+                rng.choice(names),
+                rng.choice([None, *CONCEPTS, "ghost"]),
+                rng.choice(["sales", "ops"]),
+            )
+            for _ in range(rng.randint(0, 4))
+        ]
+
+    for rel in rng.sample(files, 4):
+        _write_schema(tmp_path, rel, random_models())
+
+    builder = IncrementalStateBuilder(config)
+    state = builder.build()
+    _assert_matches_full_rebuild(state, config)
+
+    for _ in range(25):
+        rel = rng.choice(files)
+        if (tmp_path / rel).exists() and rng.random() < 0.3:
+            (tmp_path / rel).unlink()
+            builder.apply_changes(deleted=[rel])
+        else:
+            _write_schema(tmp_path, rel, random_models())
+            builder.apply_changes(changed=[rel])
+        _assert_matches_full_rebuild(state, config)
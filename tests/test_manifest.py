@@ -0,0 +1,209 @@
+"""Tests for manifest.json model discovery."""
+
+import json
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+import yaml
+
+from dbt_conceptual.config import Config
+from dbt_conceptual.manifest import (
+    ManifestError,
+    _JsonStream,
+    iter_manifest_models,
+    iter_manifest_nodes,
+)
+from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.scanner import DbtProjectScanner
+
+
+def _model_node(name: str, path: str, **extra: object) -> dict:
+    node = {
+        "resource_type": "model",
+        "package_name": "shop",
+        "name": name,
+        "original_file_path": path,
+        "patch_path": None,
+        "description": "",
+        "meta": {},
+        "tags": [],
+        "config": {"meta": {}, "tags": []},
+        "columns": {f"col_{i}": {"name": f"col_{i}"} for i in range(5)},
+    }
+    node.update(extra)
+    return node
+
+
+def _manifest() -> dict:
+    return {
+        "metadata": {"dbt_version": "1.8.0", "project_name": "shop"},
+        "nodes": {
+            "model.shop.dim_customer": _model_node(
+                "dim_customer",
+                "models/marts/dim_customer.sql",
+                patch_path="shop://models/marts/schema.yml",
+                description="Customers",
+                meta={"concept": "customer"},
+                tags=["domain:party", "owner:crm"],
+            ),
+            # meta set via dbt_project.yml +meta / config() only
+            "model.shop.fact_orders": _model_node(
+                "fact_orders",
+                "models/marts/orders/fact_orders.sql",
+                config={
+                    "meta": {"concept": "order"},
+                    "databricks_tags": {"domain": "sales"},
+                },
+            ),
+            "model.shop.stg_orders": _model_node(
+                "stg_orders", "models/staging/stg_orders.sql"
+            ),
+            "model.utils.dim_calendar": _model_node(
+                "dim_calendar", "models/marts/dim_calendar.sql", package_name="utils"
+            ),
+            "seed.shop.countries": {
+                "resource_type": "seed",
+                "name": "countries",
+                "original_file_path": "models/marts/countries.csv",
+            },
+        },
+        "sources": {"source.shop.raw.orders": {"name": "orders", "x": "}{]["}},
+        "macros": {
+            f"macro.shop.m{i}": {"sql": '{{ "quoted \\" brace }" }}'} for i in range(50)
+        },
+        "child_map": {"a": ["b", "c"], "n": [1, 2.5, True, None]},
+    }
+
+
+def _write_project(tmppath: Path) -> None:
+    with open(tmppath / "dbt_project.yml", "w") as f:
+        yaml.dump({"name": "shop"}, f)
+    with open(tmppath / "conceptual.yml", "w") as f:
+        yaml.dump(
+            {
+                "config": {"scan": {"gold": ["models/marts/**/*.yml"]}},
+                "concepts": {
+                    "customer": {"name": "Customer", "domain": "party"},
+                    "order": {"name": "Order", "domain": "sales"},
+                },
+            },
+            f,
+        )
+    (tmppath / "target").mkdir()
+    with open(tmppath / "target" / "manifest.json", "w") as f:
+        json.dump(_manifest(), f, indent=2)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_json_stream_matches_json_loads(chunk_size: int) -> None:
+    """Test that streamed nodes equal a full json.loads at any chunk size."""
+    text = json.dumps(_manifest(), indent=1)
+    stream = _JsonStream(StringIO(text), chunk_size=chunk_size)
+
+    result: dict = {}
+    for key in stream.iter_object():
+        if key == "nodes":
+            result[key] = {}
+            for node_id in stream.iter_object():
+                result[key][node_id] = stream.read_value()
+        else:
+            stream.skip_value()
+
+    assert result["nodes"] == json.loads(text)["nodes"]
+    assert stream.peek() == ""
+
+
+def test_iter_manifest_nodes_reports_metadata() -> None:
+    """Test that metadata is passed to the callback and nodes are yielded in order."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "manifest.json"
+        path.write_text(json.dumps(_manifest()))
+
+        seen: list[dict] = []
+        ids = [uid for uid, _ in iter_manifest_nodes(path, seen.append)]
+
+        assert ids == list(_manifest()["nodes"])
+        assert seen[0]["project_name"] == "shop"
+
+
+def test_invalid_manifest_raises() -> None:
+    """Test that truncated JSON raises ManifestError."""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "manifest.json"
+        path.write_text('{"nodes": {"model.a": {"name": "a"')
+
+        with pytest.raises(ManifestError):
+            list(iter_manifest_nodes(path))
+
+
+def test_iter_manifest_models_filters_to_gold_project_models() -> None:
+    """Test that only root-project models under gold paths are emitted."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        scanner = DbtProjectScanner(Config.load(project_dir=tmppath))
+
+        models = list(
+            iter_manifest_models(
+                tmppath / "target" / "manifest.json",
+                tmppath,
+                scanner._matches_gold_paths,
+            )
+        )
+
+        assert [m["name"] for m in models] == ["dim_customer", "fact_orders"]
+        customer, orders = models
+        assert customer.to_dict() == {
+            "name": "dim_customer",
+            "description": "Customers",
+            "meta": {"concept": "customer"},
+            "path": "models/marts/schema.yml",
+            "file": str(tmppath / "models/marts/schema.yml"),
+            "tags": ["domain:party", "owner:crm"],
+            "databricks_tags": {},
+        }
+        assert orders["description"] is None
+        assert orders["meta"] == {"concept": "order"}
+        assert orders["path"] == "models/marts/orders/fact_orders.sql"
+        assert orders["databricks_tags"] == {"domain": "sales"}
+
+
+def test_state_builder_from_manifest() -> None:
+    """Test a full state build in manifest mode (no schema YAML on disk)."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+
+        config = Config.load(project_dir=tmppath, manifest="target/manifest.json")
+        assert config.scan_source == "manifest"
+
+        state = StateBuilder(config).build()
+
+        assert state.concepts["customer"].models == ["dim_customer"]
+        assert state.concepts["order"].models == ["fact_orders"]
+        assert state.models["dim_customer"].domain_tags == ["party"]
+        assert state.models["dim_customer"].owner_tag == "crm"
+        assert state.models["fact_orders"].domain_tags == ["sales"]
+        assert state.orphan_models == []
+
+
+def test_manifest_source_from_conceptual_yml_falls_back() -> None:
+    """Test that a missing manifest falls back to the schema YAML scan."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        with open(tmppath / "conceptual.yml", "w") as f:
+            yaml.dump(
+                {"config": {"scan": {"source": "manifest", "manifest": "x.json"}}}, f
+            )
+        gold_dir = tmppath / "models" / "marts"
+        gold_dir.mkdir(parents=True)
+        with open(gold_dir / "schema.yml", "w") as f:
+            yaml.dump({"models": [{"name": "dim_a"}]}, f)
+
+        config = Config.load(project_dir=tmppath)
+        assert config.manifest_file == tmppath / "x.json"
+
+        models = DbtProjectScanner(config).scan()
+        assert [m["name"] for m in models] == ["dim_a"]
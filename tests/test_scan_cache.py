@@ -0,0 +1,221 @@
+"""Tests for the persistent scan cache."""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from dbt_conceptual.cli import main
+from dbt_conceptual.config import Config
+from dbt_conceptual.scan_cache import CACHE_FORMAT_VERSION, ScanCache, cache_key
+from dbt_conceptual.scanner import DbtProjectScanner
+
+
+def _write_project(tmppath: Path) -> Path:
+    """Create a project with two gold schema files, returning one of them."""
+    with open(tmppath / "conceptual.yml", "w") as f:
+        yaml.dump({"concepts": {"customer": {"name": "Customer"}}}, f)
+
+    gold_dir = tmppath / "models" / "marts"
+    gold_dir.mkdir(parents=True)
+    with open(gold_dir / "customer.yml", "w") as f:
+        yaml.dump({"models": [{"name": "dim_customer", "meta": {"concept": "c"}}]}, f)
+    with open(gold_dir / "orders.yml", "w") as f:
+        yaml.dump({"models": [{"name": "fact_orders"}]}, f)
+    return gold_dir / "orders.yml"
+
+
+def test_warm_scan_hits_cache() -> None:
+    """Test that a second scan serves every file from the cache."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        config = Config.load(project_dir=tmppath)
+
+        cold = DbtProjectScanner(config)
+        cold_models = cold.scan()
+        assert cold.stats.cache_misses == 2
+        assert cold.stats.cache_hits == 0
+        assert (config.cache_dir / "scan.pickle").exists()
+        assert (config.cache_dir.parent / ".gitignore").exists()
+
+        warm = DbtProjectScanner(config)
+        assert warm.scan() == cold_models
+        assert warm.stats.cache_hits == 2
+        assert warm.stats.cache_misses == 0
+        assert warm.stats.parsed == 0
+
+
+def test_changed_file_is_reparsed() -> None:
+    """Test that only the modified file misses the cache."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        orders = _write_project(tmppath)
+        config = Config.load(project_dir=tmppath)
+        DbtProjectScanner(config).scan()
+
+        with open(orders, "w") as f:
+            yaml.dump({"models": [{"name": "fact_orders_v2"}]}, f)
+
+        scanner = DbtProjectScanner(config)
+        names = [m["name"] for m in scanner.scan()]
+        assert names == ["dim_customer", "fact_orders_v2"]
+        assert scanner.stats.cache_hits == 1
+        assert scanner.stats.cache_misses == 1
+
+
+def test_touched_but_unchanged_file_uses_content_hash() -> None:
+    """Test that an mtime-only change is resolved by the content hash."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        orders = _write_project(tmppath)
+        config = Config.load(project_dir=tmppath)
+        DbtProjectScanner(config).scan()
+
+        st = orders.stat()
+        os.utime(orders, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+        scanner = DbtProjectScanner(config)
+        scanner.scan()
+        assert scanner.stats.cache_hits == 2
+        assert scanner.stats.parsed == 0
+
+        # The refreshed mtime is persisted, so the next run is stat-only
+        cache = ScanCache.load(config)
+        entry = cache.get(str(orders))
+        assert entry is not None
+        assert entry.mtime_ns == orders.stat().st_mtime_ns
+
+
+def test_gold_paths_change_invalidates_cache() -> None:
+    """Test that changing gold paths discards all cached entries."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        DbtProjectScanner(Config.load(project_dir=tmppath)).scan()
+
+        config = Config.load(project_dir=tmppath, gold_paths=["models/marts"])
+        assert cache_key(config) != cache_key(Config.load(project_dir=tmppath))
+        assert ScanCache.load(config).entries == {}
+
+        scanner = DbtProjectScanner(config)
+        scanner.scan()
+        assert scanner.stats.cache_misses == 2
+
+
+def test_corrupt_cache_file_is_ignored() -> None:
+    """Test that an unreadable cache file does not break the scan."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        config = Config.load(project_dir=tmppath)
+        config.cache_dir.mkdir(parents=True)
+        (config.cache_dir / "scan.pickle").write_bytes(b"not a pickle")
+
+        scanner = DbtProjectScanner(config)
+        assert len(scanner.scan()) == 2
+        assert scanner.stats.cache_misses == 2
+
+
+class _Payload:
+    """Pickles to a call that creates a marker file when unpickled."""
+
+    def __init__(self, marker: Path):
+        self.marker = marker
+
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return (exec, (f"open({str(self.marker)!r}, 'w').close()",))
+
+
+def test_tampered_cache_file_is_not_unpickled() -> None:
+    """Test that a cache file referencing other globals runs no code."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        config = Config.load(project_dir=tmppath)
+        marker = tmppath / "pwned"
+        config.cache_dir.mkdir(parents=True)
+        (config.cache_dir / "scan.pickle").write_bytes(
+            pickle.dumps(
+                {
+                    "format": CACHE_FORMAT_VERSION,
+                    "key": cache_key(config),
+                    "entries": {"x": _Payload(marker)},
+                }
+            )
+        )
+
+        assert ScanCache.load(config).entries == {}
+        scanner = DbtProjectScanner(config)
+        assert len(scanner.scan()) == 2
+        assert scanner.stats.cache_misses == 2
+        assert not marker.exists()
+
+
+def test_no_cache_config() -> None:
+    """Test that the cache can be disabled."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        config = Config.load(project_dir=tmppath, no_cache=True)
+        assert config.scan_cache is False
+
+        scanner = DbtProjectScanner(config)
+        scanner.scan()
+        scanner.scan()
+        assert scanner.stats.parsed == 2
+        assert scanner.stats.cache_hits == 0
+        assert not config.cache_dir.exists()
+
+
+def test_scan_logs_cache_counters(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that hit/miss counters are logged at INFO (shown with -v)."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        config = Config.load(project_dir=tmppath)
+        DbtProjectScanner(config).scan()
+
+        with caplog.at_level(logging.INFO, logger="dbt_conceptual.scanner"):
+            DbtProjectScanner(config).scan()
+
+        assert "2 schema files: 2 cache hits, 0 misses" in caplog.text
+
+
+def test_cli_no_cache_flag() -> None:
+    """Test that --no-cache leaves no cache behind."""
+    runner = CliRunner()
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+
+        result = runner.invoke(
+            main, ["status", "--project-dir", str(tmppath), "--no-cache"]
+        )
+        assert result.exit_code == 0
+        assert not Config.load(project_dir=tmppath).cache_dir.exists()
+
+
+def test_cli_cache_clear() -> None:
+    """Test that 'cache clear' removes the cache directory."""
+    runner = CliRunner()
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_project(tmppath)
+        config = Config.load(project_dir=tmppath)
+        DbtProjectScanner(config).scan()
+        assert config.cache_dir.exists()
+
+        result = runner.invoke(main, ["cache", "clear", "--project-dir", str(tmppath)])
+        assert result.exit_code == 0
+        assert "Cleared scan cache" in result.output
+        assert not config.cache_dir.exists()
+
+        result = runner.invoke(main, ["cache", "clear", "--project-dir", str(tmppath)])
+        assert result.exit_code == 0
+        assert "No scan cache" in result.output
@@ -0,0 +1,105 @@
+"""Tests for the scanned model record."""
+
+import json
+import pickle
+from pathlib import Path
+
+from dbt_conceptual.scanned_model import EMPTY_MAPPING, EMPTY_TAGS, ScannedModel
+from dbt_conceptual.scanner import _extract_models
+
+
+def _extract(schema_data: dict) -> list[ScannedModel]:
+    return _extract_models(
+        schema_data, Path("/project/models/marts/schema.yml"), Path("/project")
+    )
+
+
+def test_scanned_model_has_no_instance_dict() -> None:
+    """Test that records are slotted."""
+    model = ScannedModel("dim_customer")
+    assert not hasattr(model, "__dict__")
+
+
+def test_scanned_model_mapping_access() -> None:
+    """Test dict-style access for code written against the old records."""
+    model = ScannedModel(
+        "dim_customer", meta={"concept": "customer"}, tags=["domain:party"]
+    )
+    assert model["name"] == "dim_customer"
+    assert model["meta"]["concept"] == "customer"
+    assert model.get("description") is None
+    assert model.get("missing", "default") == "default"
+    assert "tags" in model
+    assert "missing" not in model
+    assert list(model) == [
+        "name",
+        "description",
+        "meta",
+        "path",
+        "file",
+        "tags",
+        "databricks_tags",
+    ]
+
+
+def test_extract_models_shares_strings_and_sentinels() -> None:
+    """Test that models from one file share path strings and empty containers."""
+    models = _extract(
+        {"models": [{"name": "a"}, {"name": "b", "tags": ["x"], "meta": {}}]}
+    )
+    first, second = models
+    assert first.path == "models/marts/schema.yml"
+    assert first.path is second.path
+    assert first.file is second.file
+    assert first.meta is EMPTY_MAPPING
+    assert second.meta is EMPTY_MAPPING
+    assert first.tags is EMPTY_TAGS
+    assert first.databricks_tags is EMPTY_MAPPING
+    assert second.tags == ("x",)
+
+
+def test_extract_models_tag_fallbacks() -> None:
+    """Test config.tags fallback and rejection of non-list tags."""
+    first, second = _extract(
+        {
+            "models": [
+                {"name": "a", "config": {"tags": ["t"], "databricks_tags": []}},
+                {"name": "b", "tags": "not-a-list"},
+            ]
+        }
+    )
+    assert first.tags == ("t",)
+    assert first.databricks_tags is EMPTY_MAPPING
+    assert second.tags == ()
+
+
+def test_scanned_model_pickle_round_trip() -> None:
+    """Test that records survive pickling (scan cache, process pool)."""
+    model = ScannedModel(
+        "a",
+        meta={"concept": "c"},
+        path="p.yml",
+        file="/x/p.yml",
+        tags=["t"],
+        databricks_tags={"domain": "d"},
+    )
+    empty = ScannedModel("b")
+
+    restored, restored_empty = pickle.loads(pickle.dumps([model, empty]))
+    assert restored == model
+    assert restored_empty == empty
+    assert restored_empty.meta is EMPTY_MAPPING
+
+
+def test_scanned_model_to_dict_is_json_serializable() -> None:
+    """Test conversion to plain JSON-friendly types."""
+    model = ScannedModel("a", path="p.yml", file="/x/p.yml", tags=["t"])
+    assert json.loads(json.dumps(model.to_dict())) == {
+        "name": "a",
+        "description": None,
+        "meta": {},
+        "path": "p.yml",
+        "file": "/x/p.yml",
+        "tags": ["t"],
+        "databricks_tags": {},
+    }
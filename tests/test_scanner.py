@@ -3,10 +3,11 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
 import yaml
 
 from dbt_conceptual.config import Config
-from dbt_conceptual.scanner import DbtProjectScanner
+from dbt_conceptual.scanner import DbtProjectScanner, _may_declare_models
 
 
 def test_scanner_finds_schema_files() -> None:
@@ -177,3 +178,182 @@ def test_scanner_handles_empty_models_list() -> None:
 
         models = scanner.extract_models_from_schema(schema_data, schema_file)
         assert len(models) == 0
+
+
+def _write_many_schema_files(tmppath: Path, count: int) -> None:
+    """Create count schema files (plus one invalid one) under models/marts."""
+    with open(tmppath / "dbt_project.yml", "w") as f:
+        yaml.dump({"name": "test"}, f)
+
+    for i in range(count):
+        sub_dir = tmppath / "models" / "marts" / f"area_{i % 3}"
+        sub_dir.mkdir(parents=True, exist_ok=True)
+        with open(sub_dir / f"schema_{i:03d}.yml", "w") as f:
+            yaml.dump(
+                {
+                    "version": 2,
+                    "models": [
+                        {"name": f"dim_{i}_a", "meta": {"concept": f"c{i}"}},
+                        {"name": f"dim_{i}_b", "tags": ["domain:party"]},
+                    ],
+                },
+                f,
+            )
+
+    with open(tmppath / "models" / "marts" / "broken.yml", "w") as f:
+        f.write("invalid: yaml: content: [")
+
+
+def test_scanner_parallel_threads_matches_serial() -> None:
+    """Test that a threaded scan returns the same ordered output as serial."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_many_schema_files(tmppath, 20)
+
+        serial = DbtProjectScanner(Config.load(project_dir=tmppath)).scan()
+        parallel = DbtProjectScanner(Config.load(project_dir=tmppath, jobs=4)).scan()
+
+        assert len(serial) == 40
+        assert parallel == serial
+
+
+def test_scanner_parallel_processes_matches_serial() -> None:
+    """Test that a process-pool scan returns the same ordered output as serial."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_many_schema_files(tmppath, 6)
+
+        serial = DbtProjectScanner(Config.load(project_dir=tmppath)).scan()
+
+        config = Config.load(project_dir=tmppath, jobs=2)
+        config.scan_executor = "process"
+        parallel = DbtProjectScanner(config).scan()
+
+        assert parallel == serial
+
+
+def test_scanner_parallel_dedupes_overlapping_patterns() -> None:
+    """Test that overlapping gold paths are only scanned once in parallel mode."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_many_schema_files(tmppath, 3)
+
+        config = Config.load(
+            project_dir=tmppath,
+            gold_paths=["models/marts/**/*.yml", "models/marts"],
+            jobs=3,
+        )
+        models = DbtProjectScanner(config).scan()
+
+        names = [m["name"] for m in models]
+        assert len(names) == len(set(names)) == 6
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        (b"version: 2\nmodels:\n  - name: a\n", True),
+        (b"\xef\xbb\xbfmodels:\n  - name: a\n", True),
+        (b'"models": []\n', True),
+        (b"# header\n---\n{version: 2, models: [{name: a}]}\n", True),
+        (b"  version: 2\n  models:\n    - name: a\n", True),
+        (b"base: &b\n  models: []\n<<: *b\n", True),
+        ("models: []\n".encode("utf-16"), True),
+        (b"version: 2\nsources:\n  - name: raw\n", False),
+        (b"version: 2\nsemantic_models:\n  - name: a\n", False),
+        (b"version: 2\nexposures:\n  - name: a\n    depends_on: [models]\n", False),
+        (b"", False),
+    ],
+)
+def test_may_declare_models(content: bytes, expected: bool) -> None:
+    """Test the byte-level models pre-filter, including conservative cases."""
+    assert _may_declare_models(content) is expected
+
+
+def test_scanner_skips_files_without_models() -> None:
+    """Test that sources/exposures files are skipped and counted."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        gold_dir = tmppath / "models" / "marts"
+        gold_dir.mkdir(parents=True)
+        (gold_dir / "a_sources.yml").write_text(
+            "version: 2\nsources:\n  - name: raw\n    tables: [{name: t}]\n"
+        )
+        (gold_dir / "b_metrics.yml").write_text("version: 2\nmetrics: []\n")
+        (gold_dir / "c_models.yml").write_text("version: 2\nmodels:\n  - name: dim_a\n")
+        (gold_dir / "d_flow.yml").write_text("{models: [{name: dim_b}]}\n")
+
+        scanner = DbtProjectScanner(Config.load(project_dir=tmppath, no_cache=True))
+        models = scanner.scan()
+
+        assert [m["name"] for m in models] == ["dim_a", "dim_b"]
+        assert scanner.stats.files == 4
+        assert scanner.stats.skipped == 2
+        assert scanner.stats.parsed == 2
+
+
+def test_scanner_iter_models_streams_in_scan_order() -> None:
+    """Test that iter_models yields lazily and matches scan()."""
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_many_schema_files(tmppath, 5)
+        config = Config.load(project_dir=tmppath, no_cache=True)
+
+        scanner = DbtProjectScanner(config)
+        models = scanner.iter_models()
+        first = next(models)
+        # Only the first file has been parsed so far
+        assert scanner.stats.parsed == 1
+        rest = list(models)
+
+        assert [first, *rest] == DbtProjectScanner(config).scan()
+        assert scanner.stats.parsed == 5
+        assert scanner.stats.skipped == 1  # broken.yml has no models key
+
+
+def test_scanner_parallel_iter_models_bounds_in_flight_files(monkeypatch) -> None:
+    """Test that a parallel scan only parses a bounded window ahead."""
+    import dbt_conceptual.scanner as scanner_module
+
+    parsed: list[Path] = []
+    original = scanner_module._scan_schema_file
+
+    def tracking_scan(schema_file, project_dir, known_digest=None):
+        parsed.append(schema_file)
+        return original(schema_file, project_dir, known_digest)
+
+    monkeypatch.setattr(scanner_module, "_scan_schema_file", tracking_scan)
+
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_many_schema_files(tmppath, 60)
+        config = Config.load(project_dir=tmppath, jobs=2, no_cache=True)
+
+        models = DbtProjectScanner(config).iter_models()
+        next(models)
+        window = 2 * scanner_module._BATCHES_PER_WORKER
+        assert len(parsed) <= window + 1
+        assert len(list(models)) == 119
+        assert len(parsed) == 61
+
+
+def test_state_builder_consumes_iter_models(monkeypatch) -> None:
+    """Test that StateBuilder streams models instead of calling scan()."""
+    from dbt_conceptual.parser import StateBuilder
+
+    def fail_scan(self):
+        raise AssertionError("scan() should not be used by StateBuilder")
+
+    monkeypatch.setattr(DbtProjectScanner, "scan", fail_scan)
+
+    with TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_many_schema_files(tmppath, 3)
+        state = StateBuilder(Config.load(project_dir=tmppath, no_cache=True)).build()
+
+        assert len(state.models) == 6
+        assert [o.name for o in state.orphan_models] == [
+            "dim_0_b",
+            "dim_1_b",
+            "dim_2_b",
+        ]
@@ -0,0 +1,140 @@
+"""Tests for partial schema YAML loading."""
+
+from pathlib import Path
+
+import pytest
+
+from dbt_conceptual.scanner import _extract_models
+from dbt_conceptual.schema_yaml import load_schema_models
+from dbt_conceptual.yaml_io import YAMLError, load_yaml
+
+SCHEMA_DOCUMENTS = {
+    "block": """
+version: 2
+sources:
+  - name: raw
+    tables: [{name: orders}]
+models:
+  - name: dim_customer
+    description: Customer dimension
+    meta:
+      concept: customer
+      since: 2024-01-31
+      weights: [1, 2.5, null, true]
+    config:
+      tags: [gold]
+      databricks_tags: {domain: sales}
+      materialized: table
+    columns:
+      - name: customer_id
+        tests: [not_null, {unique: {severity: warn}}]
+      - name: email
+        meta: {pii: true}
+  - name: fct_orders
+    tags: [finance]
+    tests:
+      - dbt_utils.expression_is_true: {expression: "total >= 0"}
+""",
+    "flow": "{version: 2, models: [{name: a, columns: [{name: id}], meta: {k: v}}]}",
+    "anchors_in_kept_fields": """
+defaults: &defaults
+  owner: data-team
+models:
+  - name: a
+    meta: &shared {concept: customer}
+  - name: b
+    meta: *shared
+""",
+    "merge_key_in_model": """
+models:
+  - &base
+    name: base
+    config: {tags: [gold]}
+    columns: [{name: id}]
+  - <<: *base
+    name: derived
+""",
+    "duplicate_keys": """
+models:
+  - name: first
+    name: second
+    description: one
+    description: two
+""",
+    "quoted_and_odd_entries": """
+"models":
+  - "not a mapping"
+  - name:
+  - name: ok
+    description: |
+      Multi-line
+      description
+""",
+    "no_models": "version: 2\nsources: []\n",
+    "empty_models": "version: 2\nmodels: []\n",
+    "null_models_entries": "models:\n  -\n  - name: a\n",
+}
+
+
+@pytest.mark.parametrize("name", sorted(SCHEMA_DOCUMENTS))
+def test_partial_extraction_matches_full_load(name: str) -> None:
+    """Test that extracted models are identical to a full load."""
+    content = SCHEMA_DOCUMENTS[name]
+    file_path = Path("/project/models/marts/schema.yml")
+    project_dir = Path("/project")
+
+    partial = _extract_models(load_schema_models(content) or {}, file_path, project_dir)
+    full = _extract_models(load_yaml(content) or {}, file_path, project_dir)
+    assert partial == full
+
+
+def test_skipped_subtrees_are_not_built() -> None:
+    """Test that only the fields the scanner reads are loaded."""
+    data = load_schema_models(SCHEMA_DOCUMENTS["block"])
+    assert list(data) == ["models"]
+    assert set(data["models"][0]) == {"name", "description", "meta", "config"}
+    assert set(data["models"][1]) == {"name", "tags"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # Alias into a skipped subtree
+        "cols: &c [{name: id}]\nmodels:\n  - name: a\n    meta: {cols: *c}\n",
+        # Top-level merge key
+        "base: &b\n  models: [{name: a}]\n<<: *b\n",
+        # models is not a sequence
+        "models: {name: a}\n",
+        # Root is not a mapping
+        "- models\n",
+    ],
+)
+def test_falls_back_to_full_load(content: str) -> None:
+    """Test that documents the pruning can't handle are loaded in full."""
+    assert load_schema_models(content) == load_yaml(content)
+
+
+def test_empty_document() -> None:
+    """Test that an empty document loads as None, like load_yaml."""
+    assert load_schema_models(b"") is None
+    assert load_schema_models(b"# only a comment\n") is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "models:\n  - name: a\n    columns: [unclosed\n",
+        "models:\n  - name: a\n    columns:\n      - !custom_tag x\n",
+        "models:\n  - name: a\n    columns:\n      - !!python/name:os.system x\n",
+        "sources: !!python/object/apply:os.system [echo]\nmodels:\n  - name: a\n",
+        "models:\n  - name: a\n    meta: {x: !!python/object:dict {}}\n"
+        "    tests: [!!python/tuple [1]]\n",
+        "models: []\n---\nmodels: []\n",
+    ],
+)
+def test_errors_match_full_load(content: str) -> None:
+    """Test that invalid documents raise just like a full load."""
+    with pytest.raises(YAMLError):
+        load_yaml(content)
+    with pytest.raises(YAMLError):
+        load_schema_models(content)
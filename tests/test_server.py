@@ -6,6 +6,7 @@ v1.0: conceptual.yml in project root, gold-only scanning.
 import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Any
 
 import pytest
 import yaml
@@ -287,3 +288,318 @@ def test_api_state_post_updates_conceptual(temp_project):
     assert "new_concept" in saved_data["concepts"]
     # Status should not be in YAML (it's derived)
     assert "status" not in saved_data["concepts"]["new_concept"]
+
+
+def test_api_models_get(temp_project):
+    """Test GET /api/models returns scanned models as plain JSON objects."""
+    gold_dir = temp_project / "models" / "marts"
+    gold_dir.mkdir(parents=True)
+    with open(gold_dir / "schema.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 2,
+                "models": [
+                    {"name": "dim_customer", "meta": {"concept": "customer"}},
+                    {"name": "dim_other", "tags": ["domain:party"]},
+                ],
+            },
+            f,
+        )
+
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    response = client.get("/api/models")
+    assert response.status_code == 200
+
+    data = response.get_json()
+    assert [m["name"] for m in data] == ["dim_customer", "dim_other"]
+    assert data[0]["meta"] == {"concept": "customer"}
+    assert data[0]["path"] == "models/marts/schema.yml"
+    assert data[1]["meta"] == {}
+    assert data[1]["tags"] == ["domain:party"]
+
+
+def test_api_models_served_from_cached_state(
+    temp_project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that /api/models never rescans after the state is built."""
+    from dbt_conceptual.scanner import DbtProjectScanner
+
+    schema = temp_project / "models" / "marts" / "schema.yml"
+    schema.parent.mkdir(parents=True)
+    schema.write_text(yaml.dump({"version": 2, "models": [{"name": "dim_a"}]}))
+    client = create_app(temp_project).test_client()
+    assert client.get("/api/state").status_code == 200
+
+    scans = []
+    original = DbtProjectScanner.iter_file_models
+
+    def counted(self: DbtProjectScanner) -> Any:
+        scans.append(self)
+        return original(self)
+
+    monkeypatch.setattr(DbtProjectScanner, "iter_file_models", counted)
+    assert [m["name"] for m in client.get("/api/models").get_json()] == ["dim_a"]
+
+    # A schema file change is applied incrementally, not by a new scan
+    schema.write_text(
+        yaml.dump({"version": 2, "models": [{"name": "dim_a"}, {"name": "dim_b"}]})
+    )
+    names = [m["name"] for m in client.get("/api/models").get_json()]
+    assert names == ["dim_a", "dim_b"]
+
+    response = client.put(
+        "/api/concepts/customer", json={"name": "Customer", "domain": "customer"}
+    )
+    assert response.status_code == 200
+    assert len(client.get("/api/models").get_json()) == 2
+    assert scans == []
+
+
+def test_conceptual_yml_parsed_once_until_saved(temp_project: Path) -> None:
+    """Test that endpoints share one parse of conceptual.yml per version."""
+    from dbt_conceptual.yaml_io import document_cache
+
+    app = create_app(temp_project)
+    client = app.test_client()
+    before = document_cache.parses
+
+    for endpoint in ("/api/state", "/api/settings", "/api/config", "/api/state"):
+        assert client.get(endpoint).status_code == 200
+    assert document_cache.parses == before
+
+    response = client.post("/api/config", json={"scan": {"gold": ["models/**"]}})
+    assert response.status_code == 200
+    assert client.get("/api/config").get_json() == {"scan": {"gold": ["models/**"]}}
+    assert client.get("/api/settings").status_code == 200
+    assert document_cache.parses == before + 1
+
+
+def test_state_served_from_cache(temp_project: Path) -> None:
+    """Test that read endpoints share one state until the project changes."""
+    app = create_app(temp_project)
+    cache = app.config["STATE_CACHE"]
+    client = app.test_client()
+
+    for endpoint in ("/api/state", "/api/coverage", "/api/bus-matrix", "/api/state"):
+        assert client.get(endpoint).status_code == 200
+    assert cache.builds == 1
+    stats = client.get("/api/stats").get_json()
+    assert stats == cache.stats()
+    assert (stats["builds"], stats["computations"]) == (1, 2)
+
+    # Ghosts created by sync don't leak into the cached state
+    state = client.get("/api/state").get_json()
+    state["relationships"] = {
+        "customer:buys:order": {
+            "verb": "buys",
+            "from_concept": "customer",
+            "to_concept": "order",
+        }
+    }
+    assert client.post("/api/state", json=state).status_code == 200
+    synced = client.post("/api/sync").get_json()
+    assert synced["ghostConcepts"] == ["order"]
+    assert "order" not in client.get("/api/state").get_json()["concepts"]
+    assert cache.builds == 2
+
+    # Schema files written behind the server's back are picked up
+    gold_dir = temp_project / "models" / "marts"
+    gold_dir.mkdir(parents=True)
+    with open(gold_dir / "schema.yml", "w") as f:
+        yaml.dump(
+            {"models": [{"name": "dim_customer", "meta": {"concept": "customer"}}]}, f
+        )
+    data = client.get("/api/state").get_json()
+    assert data["concepts"]["customer"]["models"] == ["dim_customer"]
+    assert [m["name"] for m in client.get("/api/models").get_json()] == ["dim_customer"]
+    assert (cache.builds, cache.updates) == (2, 1)
+
+
+def test_conditional_get(temp_project: Path) -> None:
+    """Test ETags and 304 responses on the read endpoints."""
+    app = create_app(temp_project)
+    client = app.test_client()
+
+    etags = {}
+    for endpoint in (
+        "/api/state",
+        "/api/layout",
+        "/api/coverage",
+        "/api/bus-matrix",
+        "/api/models",
+    ):
+        response = client.get(endpoint)
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag, weak = response.get_etag()
+        assert etag and not weak
+        etags[endpoint] = etag
+
+        response = client.get(endpoint, headers={"If-None-Match": f'"{etag}"'})
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.get_etag() == (etag, False)
+
+    # Moving a node changes the state's and layout's tags, not the reports'
+    client.post("/api/layout", json={"positions": {"customer": {"x": 1, "y": 1}}})
+    for endpoint, modified in (
+        ("/api/state", True),
+        ("/api/layout", True),
+        ("/api/coverage", False),
+    ):
+        response = client.get(
+            endpoint, headers={"If-None-Match": f'"{etags[endpoint]}"'}
+        )
+        assert response.status_code == (200 if modified else 304)
+
+    # Editing the model changes every state-derived tag
+    state = client.get("/api/state").get_json()
+    state["concepts"]["customer"]["definition"] = "Someone who buys"
+    client.post("/api/state", json=state)
+    for endpoint in ("/api/state", "/api/coverage", "/api/bus-matrix"):
+        response = client.get(
+            endpoint, headers={"If-None-Match": f'"{etags[endpoint]}"'}
+        )
+        assert response.status_code == 200
+
+
+def test_api_state_patch(temp_project: Path) -> None:
+    """Test that PATCH writes and returns only the edited elements."""
+    app = create_app(temp_project)
+    client = app.test_client()
+    version = client.get("/api/state").get_json()["version"]
+    assert version
+
+    response = client.patch(
+        "/api/state",
+        json={
+            "baseVersion": version,
+            "operations": [
+                {
+                    "op": "upsert",
+                    "type": "concept",
+                    "id": "order",
+                    "data": {"name": "Order", "domain": "customer"},
+                },
+                {
+                    "op": "upsert",
+                    "type": "relationship",
+                    "data": {
+                        "verb": "places",
+                        "from_concept": "customer",
+                        "to_concept": "order",
+                    },
+                },
+            ],
+        },
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["version"] != version
+    assert data["files"] == ["conceptual.yml"]
+    assert data["domains"] == {}
+    assert list(data["concepts"]) == ["order"]
+    assert data["concepts"]["order"]["name"] == "Order"
+    assert list(data["relationships"]) == ["customer:places:order"]
+    assert data["hasIntegrityErrors"] is False
+
+    with open(temp_project / "conceptual.yml") as f:
+        conceptual = yaml.safe_load(f)
+    assert conceptual["concepts"]["order"] == {"name": "Order", "domain": "customer"}
+    assert conceptual["relationships"] == [
+        {"verb": "places", "from": "customer", "to": "order"}
+    ]
+    state = client.get("/api/state").get_json()
+    assert state["version"] == data["version"]
+    assert "customer:places:order" in state["relationships"]
+
+    # An edit against an older version is rejected with the current one
+    response = client.patch(
+        "/api/state",
+        json={
+            "baseVersion": version,
+            "operations": [{"op": "delete", "type": "concept", "id": "order"}],
+        },
+    )
+    assert response.status_code == 409
+    assert response.get_json()["version"] == data["version"]
+
+    for operations in (
+        [],
+        [{"op": "rename", "type": "concept", "id": "order"}],
+        [{"op": "delete", "type": "concept", "id": "missing"}],
+    ):
+        response = client.patch("/api/state", json={"operations": operations})
+        assert response.status_code == 400
+    assert "order" in client.get("/api/state").get_json()["concepts"]
+
+
+def test_api_element_put_delete(temp_project: Path) -> None:
+    """Test the per-element PUT and DELETE endpoints."""
+    app = create_app(temp_project)
+    client = app.test_client()
+    version = client.get("/api/state").get_json()["version"]
+
+    response = client.put(
+        "/api/concepts/customer",
+        json={"name": "Customer", "domain": "customer", "definition": "A buyer"},
+        headers={"If-Match": f'"{version}"'},
+    )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["concepts"]["customer"]["definition"] == "A buyer"
+
+    # The old version no longer matches
+    response = client.delete(
+        "/api/concepts/customer", headers={"If-Match": f'"{version}"'}
+    )
+    assert response.status_code == 409
+
+    response = client.delete("/api/domains/customer")
+    assert response.status_code == 200
+    assert response.get_json()["domains"] == {"customer": None}
+    with open(temp_project / "conceptual.yml") as f:
+        conceptual = yaml.safe_load(f)
+    assert "domains" not in conceptual
+    assert conceptual["concepts"]["customer"]["definition"] == "A buyer"
+
+    assert client.delete("/api/domains/customer").status_code == 400
+    assert client.put("/api/concepts/customer").status_code == 400
+
+
+def test_api_events_stream(temp_project: Path) -> None:
+    """Test that /api/events streams the version and then change events."""
+    app = create_app(temp_project)
+    feed = app.config["CHANGE_FEED"]
+    feed.interval = 3600  # Changes are picked up by polling below
+    client = app.test_client()
+    version = client.get("/api/state").get_json()["version"]
+
+    response = client.get("/api/events")
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = response.iter_encoded()
+    assert (
+        next(events)
+        == (
+            f'event: ready\nid: {version}\ndata: {{"version":"{version}"}}\n\n'
+        ).encode()
+    )
+    assert feed.subscribers == 1
+
+    client.put("/api/concepts/order", json={"name": "Order", "domain": "customer"})
+    feed.poll()
+    event = next(events).decode()
+    assert event.startswith("event: change\n")
+    data = json.loads(event.split("data: ")[1])
+    assert data["version"] == client.get("/api/state").get_json()["version"]
+    assert list(data["concepts"]) == ["order"]
+    assert data["concepts"]["order"]["name"] == "Order"
+    assert data["domains"] == data["relationships"] == {}
+    assert data["newOrphans"] == []
+    assert "validation" in data
+
+    response.close()
+    assert feed.subscribers == 0
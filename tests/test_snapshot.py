@@ -0,0 +1,236 @@
+"""Tests for binary ProjectState snapshots."""
+
+import json
+import logging
+import os
+import pickle
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from dbt_conceptual.cli import main
+from dbt_conceptual.config import Config
+from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.snapshot import (
+    DEFAULT_SNAPSHOT_PATH,
+    SNAPSHOT_FORMAT_VERSION,
+    SNAPSHOT_MAGIC,
+    load_or_build,
+    load_snapshot,
+    write_snapshot,
+)
+
+
+def _write_project(root: Path) -> Config:
+    root.mkdir(exist_ok=True)
+    with open(root / "conceptual.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 1,
+                "domains": {"sales": {"name": "Sales"}},
+                "concepts": {
+                    "customer": {"name": "Customer", "domain": "sales"},
+                    "order": {"name": "Order", "domain": "sales"},
+                },
+                "relationships": [
+                    {"name": "places", "from": "customer", "to": "order"}
+                ],
+            },
+            f,
+        )
+    gold_dir = root / "models" / "marts"
+    gold_dir.mkdir(parents=True, exist_ok=True)
+    with open(gold_dir / "customer.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 2,
+                "models": [
+                    {"name": "dim_customer", "meta": {"concept": "customer"}},
+                    {"name": "fct_visits"},
+                ],
+            },
+            f,
+        )
+    return Config.load(project_dir=root, no_cache=True)
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    """Test that a loaded snapshot equals the built state."""
+    config = _write_project(tmp_path)
+    state = StateBuilder(config).build()
+
+    path = write_snapshot(state, config)
+    assert path == tmp_path / DEFAULT_SNAPSHOT_PATH
+    assert path.read_bytes().startswith(SNAPSHOT_MAGIC)
+    assert (path.parent / ".gitignore").exists()
+
+    loaded = load_snapshot(config)
+    assert loaded == state
+    assert loaded is not None
+    assert loaded.index.concepts_for_model("dim_customer") == ["customer"]
+    (relationship,) = loaded.relationships.values()
+    assert relationship.get_status(loaded.concepts) == "complete"
+
+
+def test_survives_touch_and_relocation(tmp_path: Path) -> None:
+    """Test that new mtimes and another checkout path keep it current."""
+    config = _write_project(tmp_path / "a")
+    state = StateBuilder(config).build()
+    write_snapshot(state, config, "state.snapshot")
+
+    moved = tmp_path / "b"
+    (tmp_path / "a").rename(moved)
+    for path in moved.rglob("*.yml"):
+        os.utime(path, ns=(0, 0))
+
+    assert load_snapshot(Config.load(project_dir=moved), "state.snapshot") == state
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["modify_schema", "add_schema", "remove_schema", "modify_conceptual"],
+)
+def test_stale_snapshot_is_ignored(tmp_path: Path, change: str) -> None:
+    """Test that any source change makes the snapshot stale."""
+    config = _write_project(tmp_path)
+    write_snapshot(StateBuilder(config).build(), config)
+
+    gold_dir = tmp_path / "models" / "marts"
+    if change == "modify_schema":
+        with open(gold_dir / "customer.yml", "a") as f:
+            f.write("  - name: fct_new\n")
+    elif change == "add_schema":
+        (gold_dir / "orders.yml").write_text("models: [{name: fct_orders}]\n")
+    elif change == "remove_schema":
+        (gold_dir / "customer.yml").unlink()
+    else:
+        with open(tmp_path / "conceptual.yml", "a") as f:
+            f.write("# edited\n")
+
+    assert load_snapshot(config) is None
+    # The fallback rebuilds and refreshes the snapshot
+    rebuilt = load_or_build(config)
+    assert rebuilt == StateBuilder(config).build()
+    assert load_snapshot(config) == rebuilt
+
+
+def test_other_scan_settings_are_stale(tmp_path: Path) -> None:
+    """Test that a snapshot built with other gold paths isn't used."""
+    config = _write_project(tmp_path)
+    write_snapshot(StateBuilder(config).build(), config)
+
+    other = Config.load(project_dir=tmp_path, gold_paths=["models/**/*.yml"])
+    assert load_snapshot(other) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"not a snapshot",
+        SNAPSHOT_MAGIC + struct.pack(">H", SNAPSHOT_FORMAT_VERSION) + b"\xff\xff",
+    ],
+)
+def test_unreadable_snapshot_is_ignored(
+    tmp_path: Path, content: bytes, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that garbage files are logged and rebuilt over."""
+    config = _write_project(tmp_path)
+    path = tmp_path / "bad.snapshot"
+    path.write_bytes(content)
+
+    with caplog.at_level(logging.WARNING, logger="dbt_conceptual.snapshot"):
+        assert load_snapshot(config, path) is None
+    assert "Ignoring unreadable snapshot" in caplog.text
+
+    assert load_or_build(config, path) == StateBuilder(config).build()
+    assert load_snapshot(config, path) is not None
+
+
+class _Payload:
+    """Pickles to a call that creates a marker file when unpickled."""
+
+    def __init__(self, marker: Path):
+        self.marker = marker
+
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return (exec, (f"open({str(self.marker)!r}, 'w').close()",))
+
+
+def _snapshot_file(header: bytes, body: bytes) -> bytes:
+    preamble = SNAPSHOT_MAGIC + struct.pack(">HI", SNAPSHOT_FORMAT_VERSION, len(header))
+    return preamble + header + body
+
+
+@pytest.mark.parametrize("block", ["header", "state"])
+def test_crafted_snapshot_runs_no_code(
+    tmp_path: Path, block: str, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that pickled code in either block is rejected, not run."""
+    config = _write_project(tmp_path)
+    path = write_snapshot(StateBuilder(config).build(), config)
+    data = path.read_bytes()
+    (header_size,) = struct.unpack(">I", data[10:14])
+    header, body = data[14 : 14 + header_size], data[14 + header_size :]
+    assert json.loads(zlib.decompress(header))["sources"]
+
+    marker = tmp_path / "pwned"
+    crafted = zlib.compress(pickle.dumps(_Payload(marker)))
+    if block == "header":
+        path.write_bytes(_snapshot_file(crafted, body))
+    else:
+        path.write_bytes(_snapshot_file(header, crafted))
+
+    with caplog.at_level(logging.WARNING, logger="dbt_conceptual.snapshot"):
+        assert load_snapshot(config) is None
+    assert f"corrupt {block}" in caplog.text
+    assert not marker.exists()
+
+
+def test_cli_snapshot_and_from_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the snapshot command and --from-snapshot on other commands."""
+    _write_project(tmp_path)
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["snapshot", "--project-dir", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / DEFAULT_SNAPSHOT_PATH).exists()
+
+    # Schema files aren't scanned when the snapshot is current
+    scanned = []
+    original = StateBuilder.build
+
+    def tracking_build(self: StateBuilder) -> object:
+        scanned.append(self)
+        return original(self)
+
+    monkeypatch.setattr(StateBuilder, "build", tracking_build)
+    result = runner.invoke(
+        main, ["orphans", "--project-dir", str(tmp_path), "--from-snapshot"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "fct_visits" in result.output
+
+    result = runner.invoke(
+        main,
+        [
+            "export",
+            "--project-dir",
+            str(tmp_path),
+            "--type",
+            "status",
+            "--format",
+            "json",
+            "--from-snapshot",
+            DEFAULT_SNAPSHOT_PATH,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "customer" in result.output
+    assert scanned == []
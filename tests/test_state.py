@@ -1,6 +1,22 @@
 """Tests for state models."""
 
-from dbt_conceptual.state import ConceptState, ProjectState, RelationshipState
+import copy
+import dataclasses
+import pickle
+import random
+from typing import Any, Callable, Optional
+
+import pytest
+
+from dbt_conceptual.state import (
+    ConceptState,
+    DomainState,
+    Message,
+    ModelInfo,
+    OrphanModel,
+    ProjectState,
+    RelationshipState,
+)
 
 
 def test_concept_state_creation() -> None:
@@ -91,3 +107,349 @@ def test_project_state_creation() -> None:
     assert state.domains == {}
     assert state.orphan_models == []
     assert state.metadata == {}
+
+
+def _indexed_state() -> ProjectState:
+    state = ProjectState()
+    state.domains["sales"] = DomainState(
+        name="sales", display_name="Sales", owner="team_a"
+    )
+    state.concepts["customer"] = ConceptState(
+        name="Customer", domain="sales", owner="team_a", models=["dim_customer"]
+    )
+    state.concepts["order"] = ConceptState(
+        name="Order", domain="sales", models=["fct_orders", "dim_customer"]
+    )
+    state.concepts["invoice"] = ConceptState(name="Invoice", owner="team_b")
+    state.relationships["customer:places:order"] = RelationshipState(
+        verb="places", from_concept="customer", to_concept="order", owner="team_a"
+    )
+    return state
+
+
+def test_index_lookups() -> None:
+    """Test the reverse lookups on a freshly built state."""
+    index = _indexed_state().index
+
+    assert index.concepts_for_model("dim_customer") == ["customer", "order"]
+    assert index.concepts_for_model("missing") == []
+    assert index.concept_has_model("order", "fct_orders")
+    assert not index.concept_has_model("customer", "fct_orders")
+    assert index.concepts_in_domain("sales") == ["customer", "order"]
+    assert index.concepts_in_domain(None) == ["invoice"]
+    assert index.concept_domains() == ["sales", None]
+    assert index.relationships_for_concept("order") == ["customer:places:order"]
+    assert index.relationship_endpoints() == ["customer", "order"]
+    assert index.elements_for_owner("team_a") == [
+        ("domain", "sales"),
+        ("concept", "customer"),
+        ("relationship", "customer:places:order"),
+    ]
+    assert sorted(index.owners()) == ["team_a", "team_b"]
+
+
+def test_index_follows_mutations() -> None:
+    """Test that element, list and dict mutations update the index."""
+    state = _indexed_state()
+    index = state.index
+
+    state.concepts["invoice"].domain = "finance"
+    state.concepts["invoice"].models.append("fct_invoices")
+    state.concepts["order"].models.remove("dim_customer")
+    state.relationships["customer:places:order"].to_concept = "invoice"
+    del state.concepts["customer"]
+
+    assert index.concepts_in_domain("finance") == ["invoice"]
+    assert index.concepts_in_domain(None) == []
+    assert index.concepts_for_model("fct_invoices") == ["invoice"]
+    assert index.concepts_for_model("dim_customer") == []
+    assert index.relationships_for_concept("order") == []
+    assert index.relationships_for_concept("invoice") == ["customer:places:order"]
+    assert index.elements_for_owner("team_a") == [
+        ("domain", "sales"),
+        ("relationship", "customer:places:order"),
+    ]
+
+    # Replacing a whole collection re-indexes it
+    state.concepts = {"product": ConceptState(name="Product", models=["dim_p"])}
+    assert index.concepts_for_model("fct_invoices") == []
+    assert index.concepts_for_model("dim_p") == ["product"]
+
+
+def test_detached_elements_do_not_update_index() -> None:
+    """Test that removed elements and replaced lists stop reporting."""
+    state = _indexed_state()
+    customer = state.concepts.pop("customer")
+    old_models = state.concepts["order"].models
+    state.concepts["order"].models = ["fct_orders"]
+
+    customer.models.append("dim_other")
+    customer.owner = "team_c"
+    old_models.append("dim_stale")
+
+    assert state.index.concepts_for_model("dim_other") == []
+    assert state.index.concepts_for_model("dim_stale") == []
+    assert state.index.elements_for_owner("team_c") == []
+
+
+@pytest.mark.parametrize(
+    "clone", [copy.deepcopy, lambda s: pickle.loads(pickle.dumps(s))]
+)
+def test_index_survives_copies(clone: Callable[[Any], Any]) -> None:
+    """Test that copies get their own index."""
+    state = _indexed_state()
+    cloned = clone(state)
+    assert cloned == state
+
+    cloned.concepts["order"].models.append("fct_returns")
+    assert cloned.index.concepts_for_model("fct_returns") == ["order"]
+    assert state.index.concepts_for_model("fct_returns") == []
+
+
+def _brute_force_lookups(state: ProjectState) -> dict:
+    models: dict[str, list[str]] = {}
+    domains: dict[Optional[str], list[str]] = {}
+    for cid, c in state.concepts.items():
+        for m in dict.fromkeys(c.models):
+            models.setdefault(m, []).append(cid)
+        domains.setdefault(c.domain or None, []).append(cid)
+    incident: dict[str, list[str]] = {}
+    for rid, r in state.relationships.items():
+        for endpoint in dict.fromkeys([r.from_concept, r.to_concept]):
+            incident.setdefault(endpoint, []).append(rid)
+    owners: dict[str, list[tuple[str, str]]] = {}
+    for kind, elements in (
+        ("domain", state.domains),
+        ("concept", state.concepts),
+        ("relationship", state.relationships),
+    ):
+        for eid, e in elements.items():
+            if e.owner:
+                owners.setdefault(e.owner, []).append((kind, eid))
+    return {
+        "models": models,
+        "domains": domains,
+        "incident": incident,
+        "owners": owners,
+    }
+
+
+def _indexed_lookups(state: ProjectState) -> dict:
+    index = state.index
+    return {
+        "models": {m: index.concepts_for_model(m) for m in index._model_concepts},
+        "domains": {d: index.concepts_in_domain(d) for d in index.concept_domains()},
+        "incident": {
+            c: index.relationships_for_concept(c)
+            for c in index.relationship_endpoints()
+        },
+        "owners": {o: index.elements_for_owner(o) for o in index.owners()},
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_index_matches_brute_force_under_random_mutation(seed: int) -> None:
+    """Test that the index equals a recomputation after random edits."""
+    rng = random.Random(seed)
+    state = ProjectState()
+    ids = [f"c{i}" for i in range(6)]
+    models = [f"m{i}" for i in range(8)]
+    owners = [None, "", "team_a", "team_b"]
+
+    for _ in range(300):
+        op = rng.randrange(9)
+        concepts = list(state.concepts.values())
+        rels = list(state.relationships.values())
+        if op == 0:
+            state.concepts[rng.choice(ids)] = ConceptState(
+                name="x",
+                domain=rng.choice([None, "", "d1", "d2"]),
+                owner=rng.choice(owners),
+                models=rng.sample(models, rng.randint(0, 3)),
+            )
+        elif op == 1 and state.concepts:
+            del state.concepts[rng.choice(list(state.concepts))]
+        elif op == 2 and concepts:
+            rng.choice(concepts).models.append(rng.choice(models))
+        elif op == 3 and concepts:
+            concept = rng.choice(concepts)
+            if concept.models:
+                del concept.models[rng.randrange(len(concept.models))]
+        elif op == 4 and concepts:
+            concept = rng.choice(concepts)
+            concept.domain = rng.choice([None, "d1", "d2", "d3"])
+            concept.owner = rng.choice(owners)
+        elif op == 5:
+            a, b = rng.choice(ids), rng.choice(ids)
+            state.relationships[f"{a}:r:{b}"] = RelationshipState(
+                verb="r", from_concept=a, to_concept=b, owner=rng.choice(owners)
+            )
+        elif op == 6 and rels:
+            rel = rng.choice(rels)
+            rel.to_concept = rng.choice(ids)
+            rel.owner = rng.choice(owners)
+        elif op == 7:
+            state.domains.setdefault(
+                rng.choice(["d1", "d2"]),
+                DomainState(name="d", display_name="D", owner=rng.choice(owners)),
+            )
+        elif op == 8 and concepts:
+            rng.choice(concepts).models[:] = rng.sample(models, rng.randint(0, 3))
+
+        assert _indexed_lookups(state) == _brute_force_lookups(state)
+
+
+def _fresh_relationship_status(state: ProjectState, rel: RelationshipState) -> str:
+    for endpoint in (rel.from_concept, rel.to_concept):
+        concept = state.concepts.get(endpoint)
+        if concept is None or concept.is_ghost or not concept.domain:
+            return "stub"
+    return "complete"
+
+
+def test_status_is_memoized_and_invalidated() -> None:
+    """Test that status memos follow the fields they derive from."""
+    state = _indexed_state()
+    state.relationships["invoice:bills:order"] = RelationshipState(
+        verb="bills", from_concept="invoice", to_concept="order"
+    )
+    customer = state.concepts["customer"]
+    placed = state.relationships["customer:places:order"]
+    billed = state.relationships["invoice:bills:order"]
+
+    assert customer.status == "complete"
+    customer.models.clear()
+    assert customer.status == "draft"
+    customer.models.append("dim_customer")
+    assert customer.status == "complete"
+
+    assert placed.get_status(state.concepts) == "complete"
+    assert billed.get_status(state.concepts) == "stub"
+
+    # Only edges incident to a concept whose stub-ness changes are dropped
+    customer.models.clear()
+    customer.domain = "finance"
+    assert placed._status is not None
+    state.concepts["invoice"].domain = "finance"
+    assert billed._status is None
+    assert placed._status is not None
+    assert billed.get_status(state.concepts) == "complete"
+
+    customer.is_ghost = True
+    assert placed.get_status(state.concepts) == "stub"
+    del state.concepts["invoice"]
+    assert billed.get_status(state.concepts) == "stub"
+    state.concepts["invoice"] = ConceptState(name="Invoice", domain="finance")
+    assert billed.get_status(state.concepts) == "complete"
+    billed.from_concept = "missing"
+    assert billed.get_status(state.concepts) == "stub"
+
+    # A different concepts dict never sees the memo
+    assert placed.get_status({}) == "stub"
+    assert billed.get_status(dict(state.concepts, missing=customer)) == "stub"
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_status_matches_fresh_derivation(seed: int) -> None:
+    """Test memoized statuses against fresh derivations after random edits."""
+    rng = random.Random(seed)
+    state = ProjectState()
+    ids = [f"c{i}" for i in range(5)]
+    for a in ids:
+        for b in rng.sample(ids, 2):
+            state.relationships[f"{a}:r:{b}"] = RelationshipState(
+                verb="r", from_concept=a, to_concept=b
+            )
+
+    for _ in range(300):
+        op = rng.randrange(5)
+        concept = state.concepts.get(rng.choice(ids))
+        if op == 0:
+            state.concepts[rng.choice(ids)] = ConceptState(
+                name="x",
+                domain=rng.choice([None, "d"]),
+                models=["m"] * rng.randint(0, 1),
+            )
+        elif op == 1 and concept is not None:
+            concept.domain = rng.choice([None, "", "d", "e"])
+        elif op == 2 and concept is not None:
+            concept.is_ghost = rng.random() < 0.5
+        elif op == 3 and concept is not None:
+            if concept.models:
+                concept.models.pop()
+            else:
+                concept.models.append("m")
+        elif op == 4 and state.concepts:
+            state.concepts.pop(rng.choice(list(state.concepts)))
+
+        for concept in state.concepts.values():
+            expected = (
+                "stub"
+                if not concept.domain
+                else ("complete" if concept.models else "draft")
+            )
+            assert concept.status == expected
+        for rel in state.relationships.values():
+            assert rel.get_status(state.concepts) == _fresh_relationship_status(
+                state, rel
+            )
+
+
+@pytest.mark.parametrize(
+    "element",
+    [
+        ConceptState(name="Customer"),
+        RelationshipState(verb="places", from_concept="a", to_concept="b"),
+        DomainState(name="sales", display_name="Sales"),
+        ModelInfo(name="dim_customer", domain_tags=["sales"]),
+        OrphanModel(name="stg_orders"),
+        Message(id="msg-1", severity="info", text="Hello"),
+    ],
+    ids=lambda e: type(e).__name__,
+)
+def test_state_classes_are_slotted(element: Any) -> None:
+    """Test that elements have no __dict__ but keep the dataclass API."""
+    assert not hasattr(element, "__dict__")
+    with pytest.raises(AttributeError):
+        element.not_a_field = 1
+
+    assert dataclasses.replace(element) == element
+    assert pickle.loads(pickle.dumps(element)) == element
+    assert copy.deepcopy(element) == element
+    assert dataclasses.asdict(element) == {
+        f.name: getattr(element, f.name) for f in dataclasses.fields(element)
+    }
+
+
+def test_validation_messages_are_allocated_lazily() -> None:
+    """Test that message lists only exist once used."""
+    concept = ConceptState(name="Customer")
+    assert concept._validation_messages is None
+
+    concept.validation_messages.append("Referenced but not defined")
+    assert concept.validation_messages == ["Referenced but not defined"]
+    assert repr(concept).endswith("validation_messages=['Referenced but not defined'])")
+
+    messages = ["given"]
+    rel = RelationshipState(
+        verb="v", from_concept="a", to_concept="b", validation_messages=messages
+    )
+    assert rel.validation_messages is messages
+
+
+def test_identifiers_are_interned() -> None:
+    """Test that equal identifier strings share one object."""
+    first, second = (
+        ModelInfo(
+            name="m",
+            concept="".join(["cust", "omer"]),
+            domain_tags=["".join(["sa", "les"])],
+        )
+        for _ in range(2)
+    )
+    assert first.concept is second.concept
+    assert first.domain_tags[0] is second.domain_tags[0]
+
+    rel = RelationshipState(verb="v", from_concept="".join(["a", "b"]), to_concept="x")
+    rel.to_concept = "".join(["a", "b"])
+    assert rel.to_concept is rel.from_concept
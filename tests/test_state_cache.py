@@ -0,0 +1,408 @@
+"""Tests for the server's ProjectState cache."""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import pytest
+import yaml
+
+from dbt_conceptual import state_cache
+from dbt_conceptual.config import Config
+from dbt_conceptual.edits import EditError, Operation
+from dbt_conceptual.parser import StateBuilder
+from dbt_conceptual.scanner import DbtProjectScanner
+from dbt_conceptual.state_cache import SingleFlight, StaleVersionError, StateCache
+
+
+def _write_project(root: Path) -> Config:
+    with open(root / "conceptual.yml", "w") as f:
+        yaml.dump(
+            {
+                "version": 1,
+                "domains": {"sales": {"name": "Sales"}},
+                "concepts": {
+                    c: {"name": c.title(), "domain": "sales"}
+                    for c in ("customer", "order")
+                },
+            },
+            f,
+        )
+    return Config.load(project_dir=root, no_cache=True)
+
+
+def _write_schema(root: Path, rel: str, models: list[dict]) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.dump({"version": 2, "models": models}, f)
+
+
+def _model(name: str, concept: Optional[str] = None) -> dict:
+    model: dict = {"name": name}
+    if concept is not None:
+        model["meta"] = {"concept": concept}
+    return model
+
+
+def test_refresh_follows_source_changes(tmp_path: Path) -> None:
+    """Test that the state is reused until a source file changes."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1", "customer")])
+    cache = StateCache(config)
+
+    with cache.read() as state:
+        assert state.concepts["customer"].models == ["m1"]
+    version = cache.version
+    with cache.read() as state:
+        pass
+    assert (cache.builds, cache.updates, cache.hits) == (1, 0, 1)
+    assert cache.version == version
+
+    # Schema files are applied incrementally
+    _write_schema(tmp_path, "models/marts/b.yml", [_model("m2", "order")])
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m3")])
+    with cache.read() as state:
+        assert state == StateBuilder(config).build()
+    (tmp_path / "models/marts/b.yml").unlink()
+    with cache.read() as state:
+        assert state == StateBuilder(config).build()
+    assert (cache.builds, cache.updates) == (1, 2)
+    assert cache.version != version
+
+    # conceptual.yml changes rebuild the state
+    conceptual = yaml.safe_load((tmp_path / "conceptual.yml").read_text())
+    conceptual["concepts"]["product"] = {"name": "Product", "domain": "sales"}
+    (tmp_path / "conceptual.yml").write_text(yaml.dump(conceptual))
+    with cache.read() as state:
+        assert "product" in state.concepts
+    assert cache.builds == 2
+
+    # invalidate() forces a rebuild even if no fingerprint changed
+    cache.invalidate()
+    with cache.read() as state:
+        pass
+    assert cache.builds == 3
+
+
+def test_scanned_models_follow_state(tmp_path: Path) -> None:
+    """Test that the cached model list matches a scan without rescanning."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/b.yml", [_model("m2"), _model("m3")])
+    cache = StateCache(config)
+
+    with cache.read():
+        assert cache.scanned_models() == DbtProjectScanner(config).scan()
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1", "customer")])
+    _write_schema(tmp_path, "models/marts/b.yml", [_model("m4")])
+    with cache.read():
+        assert [m.name for m in cache.scanned_models()] == ["m1", "m4"]
+        assert cache.scanned_models() == DbtProjectScanner(config).scan()
+    assert (cache.builds, cache.updates) == (1, 1)
+
+    # In manifest mode every model comes from the manifest
+    (tmp_path / "target").mkdir()
+    (tmp_path / "target" / "manifest.json").write_text(
+        json.dumps(
+            {
+                "metadata": {"project_name": "shop"},
+                "nodes": {
+                    f"model.shop.{name}": {
+                        "resource_type": "model",
+                        "package_name": "shop",
+                        "name": name,
+                        "original_file_path": f"models/marts/{name}.sql",
+                        "meta": {"concept": "order"} if name == "m5" else {},
+                    }
+                    for name in ("m5", "m6")
+                },
+            }
+        )
+    )
+    config.scan_source = "manifest"
+    cache = StateCache(config)
+    with cache.read() as state:
+        assert state.concepts["order"].models == ["m5"]
+        assert [m.name for m in cache.scanned_models()] == ["m5", "m6"]
+        assert cache.scanned_models() == DbtProjectScanner(config).scan()
+
+
+def test_derived_values_follow_state(tmp_path: Path) -> None:
+    """Test that derived values are computed once per state."""
+    config = _write_project(tmp_path)
+    cache = StateCache(config)
+    calls = []
+
+    def count(state):
+        calls.append(1)
+        return len(state.models)
+
+    assert cache.derived("models", count) == 0
+    assert cache.derived("models", count) == 0
+    assert len(calls) == 1
+
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m1"), _model("m2")])
+    assert cache.derived("models", count) == 2
+    assert len(calls) == 2
+
+    cache.invalidate()
+    assert cache.derived("models", count) == 2
+    assert len(calls) == 3
+
+
+def test_positions_cached_until_layout_changes(tmp_path: Path) -> None:
+    """Test that the layout file is read once per version."""
+    config = _write_project(tmp_path)
+    cache = StateCache(config)
+    assert cache.positions() == {}
+
+    layout = tmp_path / "conceptual_layout.json"
+    layout.write_text('{"positions": {"customer": {"x": 1, "y": 2}}}')
+    positions = cache.positions()
+    assert positions == {"customer": {"x": 1, "y": 2}}
+    assert cache.positions() is positions
+
+    layout.write_text('{"positions": {"customer": {"x": 10, "y": 2}}}')
+    assert cache.positions()["customer"]["x"] == 10
+
+
+def test_edit_updates_state_like_a_rebuild(tmp_path: Path) -> None:
+    """Test that edits are saved and applied without rebuilding the state."""
+    config = _write_project(tmp_path)
+    fragment = tmp_path / "conceptual" / "party.yml"
+    fragment.parent.mkdir()
+    fragment.write_text(
+        yaml.dump(
+            {
+                "domains": {"party": {"name": "Party"}},
+                "concepts": {"person": {"name": "Person", "domain": "party"}},
+                "relationships": [{"verb": "places", "from": "person", "to": "order"}],
+            }
+        )
+    )
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("dim_person", "person")])
+    cache = StateCache(config)
+    cache.refresh()
+    version = cache.version
+
+    result = cache.edit(
+        [
+            Operation("upsert", "concept", "lead", {"name": "Lead", "domain": "party"}),
+            Operation("upsert", "concept", "customer", {"name": "Client"}),
+            Operation(
+                "upsert",
+                "relationship",
+                "person:places:order",
+                {"verb": "buys", "from": "person", "to": "order"},
+            ),
+            Operation("upsert", "relationship", None, {"from": "lead", "to": "person"}),
+            Operation("delete", "concept", "order"),
+        ],
+        base_version=version,
+    )
+    assert result.files == [fragment, tmp_path / "conceptual.yml"]
+    assert result.changed == {
+        "domains": [],
+        "concepts": ["lead", "customer", "order"],
+        "relationships": [
+            "person:places:order",
+            "person:buys:order",
+            "lead:relates_to:person",
+        ],
+    }
+    assert result.version == cache.version != version
+    with cache.read() as state:
+        # Same content and order, with concepts linked to their models
+        assert state == StateBuilder(config).build()
+        assert list(state.concepts) == ["customer", "person", "lead"]
+        assert state.concepts["person"].models == ["dim_person"]
+    assert (cache.builds, cache.updates) == (1, 1)
+
+    with pytest.raises(StaleVersionError) as excinfo:
+        cache.edit([Operation("delete", "concept", "lead")], base_version=version)
+    assert excinfo.value.version == cache.version
+    with pytest.raises(EditError, match="'order' not found"):
+        cache.edit([Operation("delete", "concept", "order")])
+    assert "lead" in StateBuilder(config).build().concepts
+
+
+def test_concurrent_readers_and_updates(tmp_path: Path) -> None:
+    """Test that readers never see a state while it is being updated."""
+    config = _write_project(tmp_path)
+    _write_schema(tmp_path, "models/marts/a.yml", [_model("m0", "customer")])
+    cache = StateCache(config)
+    errors: list[BaseException] = []
+    done = threading.Event()
+
+    def reader() -> None:
+        try:
+            while not done.is_set():
+                with cache.read() as state:
+                    for _ in range(100):
+                        models = list(state.concepts["customer"].models)
+                        # Every version of a.yml links one existing model
+                        assert len(models) == 1
+                        assert models[0] in state.models
+        except BaseException as e:  # pragma: no cover - reported below
+            errors.append(e)
+            done.set()
+
+    # Switch threads often, so readers run in the middle of updates
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    # Files are replaced atomically, so readers never parse a partial write
+    for i in range(1, 30):
+        _write_schema(tmp_path, "new.yml", [_model(f"m{i}", "customer")])
+        # Same-size rewrites within the timestamp resolution keep the mtime
+        os.utime(tmp_path / "new.yml", ns=(i * 10**9, i * 10**9))
+        os.replace(tmp_path / "new.yml", tmp_path / "models/marts/a.yml")
+        cache.refresh()
+    done.set()
+    for thread in threads:
+        thread.join()
+    sys.setswitchinterval(interval)
+
+    assert errors == []
+    with cache.read() as state:
+        assert state == StateBuilder(config).build()
+
+
+def _wait_for(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_concurrent_refreshes_share_one_build(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that requests arriving during a build wait for it."""
+    config = _write_project(tmp_path)
+    cache = StateCache(config)
+    release = threading.Event()
+    calls = []
+    build = cache._builder.build
+
+    def slow_build():
+        calls.append(1)
+        release.wait()
+        return build()
+
+    monkeypatch.setattr(cache._builder, "build", slow_build)
+    results: list[bool] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.refresh()))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: cache.coalesced == 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 5
+    assert len(calls) == cache.builds == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_concurrent_derived_values_computed_once(tmp_path: Path) -> None:
+    """Test that concurrent requests for a stale value share one computation."""
+    config = _write_project(tmp_path)
+    cache = StateCache(config)
+    release = threading.Event()
+
+    def compute(state):
+        release.wait()
+        return object()
+
+    values: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: values.append(cache.derived("x", compute)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: cache.derived_coalesced == 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(values) == 5 and all(value is values[0] for value in values)
+    assert cache.computations == 1
+    assert cache.derived("x", compute) is values[0]
+    assert cache.computations == 1
+
+
+def test_single_flight_shares_errors() -> None:
+    """Test that callers waiting for a failing call get its exception."""
+    flight: SingleFlight[int] = SingleFlight()
+    release = threading.Event()
+    errors: list[BaseException] = []
+
+    def fail() -> int:
+        release.wait()
+        raise ValueError("boom")
+
+    def call() -> None:
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: flight.coalesced == 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3 and all(e is errors[0] for e in errors)
+    # The failed call isn't remembered
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_edit_changes_version_with_coarse_timestamps(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that every edit gets a new version, even with unchanged stats."""
+    config = _write_project(tmp_path)
+
+    # A filesystem with a 1000 s timestamp resolution
+    def coarse(fingerprints):
+        return {
+            path: (mtime_ns // 10**12 * 10**12, size)
+            for path, (mtime_ns, size) in fingerprints.items()
+        }
+
+    for name in ("stat_fingerprints", "stat_fingerprints_of"):
+        real = getattr(state_cache, name)
+        monkeypatch.setattr(state_cache, name, lambda arg, real=real: coarse(real(arg)))
+
+    cache = StateCache(config)
+    cache.refresh()
+    versions = [cache.version]
+    # Same-size rewrites: only the version tells the states apart
+    for name in ("Client", "Patron"):
+        entry = {"name": name, "domain": "sales"}
+        result = cache.edit([Operation("upsert", "concept", "customer", entry)])
+        versions.append(result.version)
+        assert cache.version == result.version
+    assert len(set(versions)) == 3
+
+    with pytest.raises(StaleVersionError):
+        cache.edit([Operation("delete", "concept", "order")], versions[1])
+    # Reads after the edit reuse the edited state
+    with cache.read() as state:
+        assert state.concepts["customer"].name == "Patron"
+    assert cache.version == versions[-1]
+    assert cache.builds == 1
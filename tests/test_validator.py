@@ -11,6 +11,8 @@ v1.0 Validation Rules:
 
 from pathlib import Path
 
+import pytest
+
 from dbt_conceptual.config import Config, ValidationConfig
 from dbt_conceptual.state import (
     ConceptState,
@@ -249,3 +251,128 @@ def test_complete_concept_no_warnings() -> None:
         i for i in concept_issues if i.severity in (Severity.WARNING, Severity.ERROR)
     ]
     assert len(warnings_and_errors) == 0
+
+
+def _revalidation_state() -> ProjectState:
+    state = ProjectState()
+    state.domains["sales"] = DomainState(name="sales", display_name="Sales")
+    for concept_id in ("customer", "order", "product"):
+        state.concepts[concept_id] = ConceptState(
+            name=concept_id.title(),
+            domain="sales",
+            owner="team",
+            definition=f"A {concept_id}",
+            models=[f"dim_{concept_id}"],
+        )
+    for from_concept, to_concept in (("customer", "order"), ("order", "product")):
+        rel = RelationshipState(
+            verb="has", from_concept=from_concept, to_concept=to_concept
+        )
+        state.relationships[rel.name] = rel
+    state.orphan_models.append(OrphanModel(name="stg_a", path="models/a.yml"))
+    return state
+
+
+def test_revalidate_matches_full_validation() -> None:
+    """Test that revalidate() after each change equals a fresh validate()."""
+    config = Config(project_dir=Path("/tmp"))
+    state = _revalidation_state()
+    validator = Validator(config, state)
+    assert validator.validate() == Validator(config, state).validate()
+
+    def check(**changed: list[str]) -> None:
+        issues = validator.revalidate(**changed)
+        assert issues == Validator(config, state).validate()
+
+    # A concept that loses its models and definition
+    state.concepts["order"].models = []
+    state.concepts["order"].definition = None
+    check(concepts=["order"])
+
+    # A removed concept turns its relationships' endpoints into E002
+    del state.concepts["product"]
+    check(concepts=["product"])
+    assert any(i.code == "E002" for i in validator.issues)
+
+    # A removed domain is reported on each of its concepts
+    del state.domains["sales"]
+    check(domains=["sales"])
+    assert any(
+        i.context == {"concept": "customer", "domain": "sales"}
+        for i in validator.issues
+    )
+
+    # Re-adding elements moves them to the end of the state
+    state.domains["sales"] = DomainState(name="sales", display_name="Sales")
+    state.concepts["product"] = ConceptState(name="Product", domain="nowhere")
+    state.concepts["customer"] = state.concepts.pop("customer")
+    check(concepts=["product", "customer"], domains=["sales"])
+
+    rel = RelationshipState(verb="buys", from_concept="ghost", to_concept="order")
+    state.relationships[rel.name] = rel
+    check(relationships=[rel.name])
+
+    # Orphan models are compared with the previous run
+    state.orphan_models.insert(0, OrphanModel(name="stg_b", path="models/b.yml"))
+    check()
+    assert [i.context["model"] for i in validator.issues if i.code == "W101"] == [
+        "stg_b",
+        "stg_a",
+    ]
+
+
+def test_revalidate_without_validate_runs_full_validation() -> None:
+    """Test that revalidate() on a new validator validates everything."""
+    config = Config(project_dir=Path("/tmp"))
+    state = _revalidation_state()
+    issues = Validator(config, state).revalidate()
+    assert issues == Validator(config, state).validate()
+
+
+@pytest.mark.parametrize("count", [1, 2, 5])
+def test_shards_merge_into_full_validation(count: int) -> None:
+    """Test that shard issues sorted by their keys equal a full run."""
+    config = Config(project_dir=Path("/tmp"))
+    state = _revalidation_state()
+    state.concepts["draft"] = ConceptState(name="Draft", domain="nowhere")
+    rel = RelationshipState(verb="buys", from_concept="ghost", to_concept="order")
+    state.relationships[rel.name] = rel
+    state.orphan_models.extend(
+        OrphanModel(name=f"stg_{i}", path="models/x.yml") for i in range(20)
+    )
+    expected = Validator(config, state).validate()
+
+    keyed = []
+    for index in range(1, count + 1):
+        validator = Validator(config, state, shard=(index, count))
+        issues = validator.validate()
+        assert len(validator.issue_keys()) == len(issues)
+        keyed.extend(zip(validator.issue_keys(), issues))
+    keyed.sort(key=lambda item: item[0])
+    assert [issue for _, issue in keyed] == expected
+
+
+def test_invalid_shard() -> None:
+    """Test that shard numbers must be within 1..N."""
+    config = Config(project_dir=Path("/tmp"))
+    with pytest.raises(ValueError):
+        Validator(config, ProjectState(), shard=(3, 2))
+
+
+def test_iter_issues_matches_validate() -> None:
+    """Test that iter_issues() yields validate()'s issues without keeping them."""
+    config = Config(project_dir=Path("/tmp"))
+    state = _revalidation_state()
+    state.concepts["order"].models = []
+    rel = RelationshipState(verb="buys", from_concept="ghost", to_concept="order")
+    state.relationships[rel.name] = rel
+    state.relationships["x"] = RelationshipState(
+        verb="owns", from_concept="customer", to_concept="missing"
+    )
+
+    validator = Validator(config, state)
+    assert list(validator.iter_issues()) == Validator(config, state).validate()
+    assert validator.issues == []
+
+    issues = list(validator.iter_issues(fail_fast=True))
+    assert [i.severity for i in issues] == [Severity.ERROR]
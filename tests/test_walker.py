@@ -0,0 +1,236 @@
+"""Tests for gold path discovery."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from dbt_conceptual import walker
+from dbt_conceptual.config import Config
+from dbt_conceptual.scanner import DbtProjectScanner
+from dbt_conceptual.walker import (
+    GoldPathMatcher,
+    is_schema_file,
+    walk_schema_file_stats,
+    walk_schema_files,
+)
+
+
+def _touch(root: Path, *paths: str) -> None:
+    for path in paths:
+        full = root / path
+        full.parent.mkdir(parents=True, exist_ok=True)
+        full.write_text("version: 2\n")
+
+
+def _rel(root: Path, files: list[Path]) -> list[str]:
+    return [f.relative_to(root).as_posix() for f in files]
+
+
+@pytest.mark.parametrize(
+    "pattern,path,expected",
+    [
+        ("models/marts/**/*.yml", "models/marts/a.yml", True),
+        ("models/marts/**/*.yml", "models/marts/x/y/a.yml", True),
+        ("models/marts/**/*.yml", "models/marts/a.yaml", False),
+        ("models/marts/**/*.yml", "models/staging/a.yml", False),
+        ("models/*/schema.yml", "models/marts/schema.yml", True),
+        ("models/*/schema.yml", "models/marts/x/schema.yml", False),
+        ("models/mart?/*.yml", "models/marts/a.yml", True),
+        ("models/[!s]*/*.yml", "models/staging/a.yml", False),
+        ("models/[!s]*/*.yml", "models/marts/a.yml", True),
+        ("**/gold/*.yml", "models/gold/a.yml", True),
+        ("**/gold/*.yml", "gold/a.yml", True),
+        ("models/marts", "models/marts/x/a.yaml", True),
+        ("models/marts", "models/marts/x/a.sql", False),
+        ("models/marts/schema.yml", "models/marts/schema.yml", True),
+    ],
+)
+def test_matcher(pattern: str, path: str, expected: bool) -> None:
+    """Test that compiled patterns follow Path.glob semantics."""
+    assert GoldPathMatcher([pattern]).matches(path) is expected
+
+
+def test_matcher_roots_collapse_nested() -> None:
+    """Test that walk roots are the minimal set of literal prefixes."""
+    matcher = GoldPathMatcher(
+        ["models/marts/**/*.yml", "models/marts/core", "models/gold/*.yml"]
+    )
+    assert matcher.roots() == [("models", "gold"), ("models", "marts")]
+    assert GoldPathMatcher(["**/marts/*.yml"]).roots() == [()]
+
+
+def test_walk_matches_glob(tmp_path: Path) -> None:
+    """Test that the walker finds the same files as Path.glob, sorted."""
+    _touch(
+        tmp_path,
+        "models/marts/b.yml",
+        "models/marts/a.yml",
+        "models/marts/core/c.yml",
+        "models/marts/core/d.yaml",
+        "models/marts/core/e.sql",
+        "models/staging/f.yml",
+    )
+    pattern = "models/marts/**/*.yml"
+    files = list(walk_schema_files(tmp_path, [pattern]))
+    assert sorted(files) == sorted(tmp_path.glob(pattern))
+    assert _rel(tmp_path, files) == [
+        "models/marts/a.yml",
+        "models/marts/b.yml",
+        "models/marts/core/c.yml",
+    ]
+
+
+def test_walk_directory_and_file_patterns(tmp_path: Path) -> None:
+    """Test literal directory and file patterns."""
+    _touch(
+        tmp_path,
+        "models/marts/a.yml",
+        "models/marts/x/b.yaml",
+        "models/marts/x/c.sql",
+        "models/extra/schema.yml",
+    )
+    files = list(
+        walk_schema_files(tmp_path, ["models/marts", "models/extra/schema.yml"])
+    )
+    assert _rel(tmp_path, files) == [
+        "models/extra/schema.yml",
+        "models/marts/a.yml",
+        "models/marts/x/b.yaml",
+    ]
+
+
+def test_walk_prunes_excluded_directories(tmp_path: Path) -> None:
+    """Test that excluded directories are never descended into."""
+    _touch(
+        tmp_path,
+        "models/marts/a.yml",
+        "target/compiled/models/marts/a.yml",
+        "dbt_packages/pkg/models/marts/b.yml",
+        "vendor/marts/c.yml",
+    )
+    files = list(walk_schema_files(tmp_path, ["**/marts/*.yml"]))
+    assert _rel(tmp_path, files) == ["models/marts/a.yml", "vendor/marts/c.yml"]
+
+    files = list(walk_schema_files(tmp_path, ["**/marts/*.yml"], exclude=["vendor"]))
+    assert _rel(tmp_path, files) == [
+        "dbt_packages/pkg/models/marts/b.yml",
+        "models/marts/a.yml",
+        "target/compiled/models/marts/a.yml",
+    ]
+
+
+def test_default_excludes_are_anchored_to_project_root(tmp_path: Path) -> None:
+    """Test that model folders named like build directories are still walked."""
+    _touch(
+        tmp_path,
+        "logs/marts/a.yml",
+        "models/marts/logs/b.yml",
+        "models/marts/target/c.yml",
+    )
+    files = list(walk_schema_files(tmp_path, ["**/*.yml"]))
+    assert _rel(tmp_path, files) == [
+        "models/marts/logs/b.yml",
+        "models/marts/target/c.yml",
+    ]
+    matcher = GoldPathMatcher(["models/**/*.yml"])
+    assert is_schema_file(matcher, ("models", "marts", "target", "c.yml"))
+
+    # Configured names match at any depth
+    files = list(walk_schema_files(tmp_path, ["**/*.yml"], exclude=["logs"]))
+    assert _rel(tmp_path, files) == ["models/marts/target/c.yml"]
+    assert not is_schema_file(
+        matcher, ("models", "marts", "logs", "b.yml"), exclude=["logs"]
+    )
+
+
+def test_walk_without_inode_numbers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the walk where os.scandir() reports no inode numbers (Windows)."""
+    _touch(
+        tmp_path,
+        "models/marts/a.yml",
+        "models/marts/b.yml",
+        "models/marts/x/c.yml",
+        "models/marts/y/d.yml",
+    )
+    os.symlink(tmp_path / "models/marts/a.yml", tmp_path / "models/marts/z.yml")
+    os.symlink(tmp_path / "models", tmp_path / "models/marts/loop")
+
+    class NoInode:
+        def __init__(self, st: os.stat_result):
+            self._st = st
+
+        st_ino = st_dev = 0
+
+        def __getattr__(self, name: str):
+            return getattr(self._st, name)
+
+    class Entry:
+        def __init__(self, entry: os.DirEntry):
+            self._entry = entry
+            self.name, self.path = entry.name, entry.path
+
+        def is_dir(self) -> bool:
+            return self._entry.is_dir()
+
+        def stat(self) -> NoInode:
+            return NoInode(self._entry.stat())
+
+    scandir = os.scandir
+    monkeypatch.setattr(
+        walker.os, "scandir", lambda path: [Entry(e) for e in scandir(path)]
+    )
+    files = list(walk_schema_files(tmp_path, ["models/**/*.yml"]))
+    assert _rel(tmp_path, files) == [
+        "models/marts/a.yml",
+        "models/marts/b.yml",
+        "models/marts/x/c.yml",
+        "models/marts/y/d.yml",
+    ]
+
+
+def test_walk_dedupes_overlapping_patterns_and_symlinks(tmp_path: Path) -> None:
+    """Test that each file is yielded once, at its first path."""
+    _touch(tmp_path, "models/marts/a.yml")
+    os.symlink(tmp_path / "models/marts/a.yml", tmp_path / "models/marts/z.yml")
+    os.symlink(tmp_path / "models", tmp_path / "models/marts/loop")
+
+    files = list(walk_schema_files(tmp_path, ["models/marts/*.yml", "models/**/*.yml"]))
+    assert _rel(tmp_path, files) == ["models/marts/a.yml"]
+
+
+def test_walk_stats_match_walk(tmp_path: Path) -> None:
+    """Test that the stat walk yields the same files with their stat()."""
+    _touch(tmp_path, "models/marts/b.yml", "models/marts/x/a.yml", "models/a.yml")
+    patterns = ["models/marts", "models/**/*.yml"]
+
+    stats = list(walk_schema_file_stats(tmp_path, patterns))
+    assert [path for path, _ in stats] == [
+        str(path) for path in walk_schema_files(tmp_path, patterns)
+    ]
+    for path, st in stats:
+        assert (st.st_ino, st.st_size) == (os.stat(path).st_ino, os.stat(path).st_size)
+
+
+def test_walk_missing_root(tmp_path: Path) -> None:
+    """Test that patterns under missing directories yield nothing."""
+    assert list(walk_schema_files(tmp_path, ["models/marts/**/*.yml"])) == []
+
+
+def test_scanner_uses_config_exclude(tmp_path: Path) -> None:
+    """Test that config.scan.exclude reaches the scanner."""
+    _touch(tmp_path, "models/marts/a.yml", "models/marts/archive/b.yml")
+    (tmp_path / "conceptual.yml").write_text(
+        "version: 1\n"
+        "config:\n"
+        "  scan:\n"
+        "    gold: models/marts/**/*.yml\n"
+        "    exclude: [archive]\n"
+    )
+    config = Config.load(project_dir=tmp_path)
+    assert config.scan_exclude == ["archive"]
+
+    files = DbtProjectScanner(config).unique_schema_files()
+    assert _rel(tmp_path, files) == ["models/marts/a.yml"]
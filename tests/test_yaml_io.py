@@ -0,0 +1,124 @@
+"""Tests for the central YAML I/O module."""
+
+import os
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+import yaml
+
+from dbt_conceptual import yaml_io
+
+
+def test_uses_libyaml_when_available() -> None:
+    """Test that the C loader/dumper are picked when PyYAML has libyaml."""
+    if yaml.__with_libyaml__:
+        assert yaml_io.HAS_LIBYAML
+        assert yaml_io.SafeLoader is yaml.CSafeLoader
+        assert yaml_io.SafeDumper is yaml.CSafeDumper
+    else:
+        assert yaml_io.SafeLoader is yaml.SafeLoader
+
+
+def test_load_yaml_file_matches_safe_load() -> None:
+    """Test that load_yaml_file gives the same result as yaml.safe_load."""
+    content = """
+concepts:
+  customer:
+    name: Customer
+    definition: |
+      A person who buys things.
+relationships:
+  - from: customer
+    to: order
+    cardinality: "1:N"
+"""
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "conceptual.yml"
+        path.write_text(content)
+
+        assert yaml_io.load_yaml_file(path) == yaml.safe_load(content)
+
+
+def test_load_yaml_empty_document() -> None:
+    """Test that an empty document loads as None."""
+    assert yaml_io.load_yaml("") is None
+
+
+def test_load_yaml_rejects_unsafe_tags() -> None:
+    """Test that arbitrary Python object tags are refused."""
+    with pytest.raises(yaml_io.YAMLError):
+        yaml_io.load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_dump_yaml_block_style_and_key_order() -> None:
+    """Test dump defaults: block style and insertion-ordered keys."""
+    data = {"zeta": 1, "alpha": {"items": ["a", "b"]}}
+
+    text = yaml_io.dump_yaml(data)
+    assert text == "zeta: 1\nalpha:\n  items:\n  - a\n  - b\n"
+    assert yaml.safe_load(text) == data
+
+    out = StringIO()
+    assert yaml_io.dump_yaml(data, out) is None
+    assert out.getvalue() == text
+
+
+def test_document_cache_parses_once_until_changed(tmp_path: Path) -> None:
+    """Test that a file is parsed once and re-parsed only after changing."""
+    cache = yaml_io.DocumentCache()
+    path = tmp_path / "conceptual.yml"
+    path.write_text("concepts: {customer: {name: Customer}}\n")
+
+    first = cache.load(path)
+    assert cache.load(path) is first
+    assert cache.parses == 1
+
+    # A private copy doesn't parse again and doesn't touch the cached one
+    private = cache.load(path, copy=True)
+    private["concepts"]["order"] = {}
+    assert cache.parses == 1
+    assert "order" not in cache.load(path)["concepts"]
+
+    path.write_text("concepts: {order: {name: Order}}\n")
+    assert cache.load(path) == {"concepts": {"order": {"name": "Order"}}}
+    assert cache.parses == 2
+
+    cache.invalidate(path)
+    cache.load(path)
+    assert cache.parses == 3
+
+
+def test_document_cache_same_size_rewrite(tmp_path: Path) -> None:
+    """Test that a same-size rewrite is picked up through its mtime."""
+    cache = yaml_io.DocumentCache()
+    path = tmp_path / "conceptual.yml"
+    path.write_text("a: 1\n")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    assert cache.load(path) == {"a": 1}
+
+    path.write_text("a: 2\n")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert cache.load(path) == {"a": 2}
+
+
+def test_conceptual_yml_parsed_once_per_run(tmp_path: Path) -> None:
+    """Test that Config.load and the parser share one parse."""
+    from dbt_conceptual.config import Config
+    from dbt_conceptual.parser import StateBuilder
+
+    (tmp_path / "conceptual.yml").write_text(
+        "metadata: {team: data}\nconcepts: {customer: {name: Customer}}\n"
+    )
+    yaml_io.document_cache.invalidate()
+    before = yaml_io.document_cache.parses
+
+    config = Config.load(project_dir=tmp_path)
+    state = StateBuilder(config).build()
+    StateBuilder(Config.load(project_dir=tmp_path)).build()
+    assert yaml_io.document_cache.parses == before + 1
+
+    # The state doesn't alias the cached document
+    state.metadata["team"] = "other"
+    assert StateBuilder(config).build().metadata == {"team": "data"}
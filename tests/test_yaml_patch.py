@@ -0,0 +1,223 @@
+"""Tests for in-place YAML patching."""
+
+import copy
+import os
+import stat
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from dbt_conceptual.cli import sync
+from dbt_conceptual.server import create_app
+from dbt_conceptual.yaml_io import document_cache, dump_yaml, load_yaml
+from dbt_conceptual.yaml_patch import patch_yaml, write_yaml_file
+
+CONCEPTUAL = """\
+# Conceptual model, maintained by the data team
+version: 1  # schema version
+
+domains:
+  party:
+    name: Party   # people and organisations
+    color: "#E3F2FD"
+
+concepts:
+  customer:
+    name: Customer
+    domain: party
+    definition: |
+      Someone who buys from us.
+  order:
+    name: Order  # one checkout
+    tags: [sales, core]
+
+relationships:
+  - from: customer
+    to: order   # the main one
+    verb: places
+  - from: order
+    to: customer
+"""
+
+
+def _edited(edit: str) -> dict:
+    data = load_yaml(CONCEPTUAL)
+    if edit == "scalar":
+        data["concepts"]["order"]["name"] = "Sales Order"
+    elif edit == "block_scalar":
+        data["concepts"]["customer"]["definition"] = "A buyer."
+    elif edit == "flow":
+        data["concepts"]["order"]["tags"].append("orders")
+    elif edit == "add":
+        data["concepts"]["invoice"] = {"name": "Invoice", "domain": "party"}
+        data["relationships"].insert(1, {"from": "invoice", "to": "order"})
+    elif edit == "remove":
+        del data["domains"]["party"]["color"]
+        del data["relationships"][0]
+    elif edit == "compact_first_key":
+        del data["relationships"][0]["from"]
+    elif edit == "empty":
+        data["relationships"] = []
+    return data
+
+
+@pytest.mark.parametrize(
+    "edit",
+    ["scalar", "block_scalar", "flow", "add", "remove", "compact_first_key", "empty"],
+)
+def test_patch_loads_as_data_and_keeps_comments(edit: str) -> None:
+    """Test that patched text has the new data and untouched lines survive."""
+    data = _edited(edit)
+    patched = patch_yaml(CONCEPTUAL, data)
+
+    assert load_yaml(patched) == data
+    assert patched.startswith("# Conceptual model, maintained by the data team\n")
+    assert "version: 1  # schema version\n" in patched
+    assert "    name: Party   # people and organisations\n" in patched
+
+
+def test_patch_changes_only_the_edited_lines() -> None:
+    """Test that scalars are replaced within their span."""
+    patched = patch_yaml(CONCEPTUAL, _edited("scalar"))
+    assert patched == CONCEPTUAL.replace("name: Order  #", "name: Sales Order  #")
+
+    patched = patch_yaml(CONCEPTUAL, _edited("flow"))
+    assert patched == CONCEPTUAL.replace("[sales, core]", "[sales, core, orders]")
+
+    patched = patch_yaml(CONCEPTUAL, _edited("add"))
+    assert patched == CONCEPTUAL.replace(
+        "    tags: [sales, core]\n",
+        "    tags: [sales, core]\n  invoice:\n    name: Invoice\n    domain: party\n",
+    ).replace(
+        "    verb: places\n",
+        "    verb: places\n  - from: invoice\n    to: order\n",
+    )
+
+
+def test_patch_keeps_key_order_of_the_file() -> None:
+    """Test that key order alone is not written, but a changed entry's is."""
+    data = load_yaml(CONCEPTUAL)
+    data["domains"]["party"] = {"color": "#E3F2FD", "name": "Party"}
+    reordered = dict(reversed(data.items()))
+    for current in (None, load_yaml(CONCEPTUAL)):
+        assert patch_yaml(CONCEPTUAL, reordered, current=current) == CONCEPTUAL
+
+    # The entry changes as well: it is rendered in the requested order
+    data["domains"]["party"] = {"color": "#FFFFFF", "name": "Party"}
+    for current in (None, load_yaml(CONCEPTUAL)):
+        patched = patch_yaml(CONCEPTUAL, data, current=current)
+        assert list(load_yaml(patched)["domains"]["party"]) == ["color", "name"]
+        assert "    to: order   # the main one\n" in patched
+
+
+def test_patch_splits_large_sections() -> None:
+    """Test that one edit in a large section changes one line."""
+    data = {
+        "version": 1,
+        "concepts": {
+            f"concept_{i}": {"name": f"Concept {i}", "domain": "sales"}
+            for i in range(500)
+        },
+        "relationships": [
+            {"from": f"concept_{i}", "to": f"concept_{i + 1}"} for i in range(500)
+        ],
+    }
+    text = dump_yaml(data).replace("  concept_7:\n", "  # Seventh\n  concept_7:\n")
+    edited = copy.deepcopy(data)
+    edited["concepts"]["concept_250"]["name"] = "Renamed"
+    edited["relationships"][250]["verb"] = "follows"
+    del edited["relationships"][10]
+
+    patched = patch_yaml(text, edited, current=load_yaml(text))
+    assert load_yaml(patched) == edited
+    assert "  # Seventh\n" in patched
+    old_lines, new_lines = text.splitlines(), patched.splitlines()
+    assert len(set(old_lines) - set(new_lines)) == 3  # name, to:, from:
+    assert len(new_lines) == len(old_lines) - 1
+
+
+def test_unpatchable_documents_are_dumped() -> None:
+    """Test the full dump fallback for aliases and invalid YAML."""
+    data = {"a": 2, "b": 1}
+    assert patch_yaml("a: &x 1\nb: *x\n", data) == dump_yaml(data)
+    assert patch_yaml("a: [\n", data) == dump_yaml(data)
+    assert patch_yaml("- 1\n", data) == dump_yaml(data)
+
+
+def test_write_yaml_file(tmp_path: Path) -> None:
+    """Test atomic replacement, kept permissions and cache invalidation."""
+    path = tmp_path / "conceptual.yml"
+    path.write_text(CONCEPTUAL)
+    os.chmod(path, 0o640)
+    document_cache.load(path)
+
+    data = _edited("scalar")
+    assert write_yaml_file(path, data)
+    assert path.read_text() == patch_yaml(CONCEPTUAL, data)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert document_cache.load(path) == data
+    assert [p.name for p in tmp_path.iterdir()] == ["conceptual.yml"]
+
+    mtime = path.stat().st_mtime_ns
+    assert not write_yaml_file(path, data)
+    assert path.stat().st_mtime_ns == mtime
+
+    new_file = tmp_path / "new.yml"
+    assert write_yaml_file(new_file, {"version": 1})
+    assert new_file.read_text() == "version: 1\n"
+
+
+def test_write_yaml_file_keeps_line_endings_and_symlinks(tmp_path: Path) -> None:
+    """Test that CRLF files stay CRLF and symlinks are written through."""
+    target = tmp_path / "shared" / "conceptual.yml"
+    target.parent.mkdir()
+    target.write_bytes(CONCEPTUAL.replace("\n", "\r\n").encode())
+    path = tmp_path / "conceptual.yml"
+    os.symlink(target, path)
+
+    data = _edited("scalar")
+    assert write_yaml_file(path, data)
+    assert path.is_symlink()
+    assert target.read_bytes() == (
+        patch_yaml(CONCEPTUAL, data).replace("\n", "\r\n").encode()
+    )
+    assert document_cache.load(path) == data
+    assert sorted(p.name for p in target.parent.iterdir()) == ["conceptual.yml"]
+    assert not write_yaml_file(path, data)
+
+
+def test_sync_stubs_keep_comments(tmp_path: Path) -> None:
+    """Test that sync --create-stubs adds stubs without reformatting."""
+    (tmp_path / "dbt_project.yml").write_text("name: test\n")
+    conceptual_file = tmp_path / "conceptual.yml"
+    conceptual_file.write_text(CONCEPTUAL)
+    gold_dir = tmp_path / "models" / "marts"
+    gold_dir.mkdir(parents=True)
+    with open(gold_dir / "schema.yml", "w") as f:
+        yaml.dump({"version": 2, "models": [{"name": "dim_product"}]}, f)
+
+    result = CliRunner().invoke(
+        sync, ["--project-dir", str(tmp_path), "--create-stubs"]
+    )
+    assert result.exit_code == 0, result.output
+
+    text = conceptual_file.read_text()
+    assert text == CONCEPTUAL.replace(
+        "    tags: [sales, core]\n",
+        "    tags: [sales, core]\n  product:\n    name: Product\n",
+    )
+
+
+def test_server_config_save_keeps_comments(tmp_path: Path) -> None:
+    """Test that POST /api/config patches only the config section."""
+    (tmp_path / "conceptual.yml").write_text(CONCEPTUAL)
+    client = create_app(tmp_path).test_client()
+
+    response = client.post("/api/config", json={"scan": {"gold": ["models/**"]}})
+    assert response.status_code == 200
+
+    text = (tmp_path / "conceptual.yml").read_text()
+    assert text.startswith(CONCEPTUAL)
+    assert load_yaml(text)["config"] == {"scan": {"gold": ["models/**"]}}